@@ -1,28 +1,161 @@
 import counted_float.benchmarking as benchmarking
 import counted_float.config as config
 
-from ._core.counting import BuiltInData, CountedFloat, FlopCountingContext, PauseFlopCounting
+from ._core.counting import (
+    BudgetUnit,
+    BuiltInData,
+    ChromeTraceExporter,
+    CostDistribution,
+    CostRecorder,
+    CostSketch,
+    CostSummary,
+    CountedComplex,
+    CountedFloat,
+    CountedFloat32,
+    CountedFunction,
+    CountedInt,
+    CountedIterator,
+    CountedNjitFunction,
+    CounterFileSnapshot,
+    CounterFileWriter,
+    FlopBudgetExceeded,
+    FlopCountingContext,
+    FlopRegion,
+    FunctionStats,
+    PauseFlopCounting,
+    PlainFloatCounting,
+    RegionNode,
+    ScalingAnalysis,
+    ScalingFit,
+    ScalingModel,
+    StageStats,
+    StaticEstimateValidation,
+    StaticFlopEstimate,
+    SymbolicCount,
+    TimedFlopCountingContext,
+    TimingReport,
+    TracedOp,
+    analyze_ensemble,
+    analyze_scaling,
+    count_flops,
+    counted_iter,
+    counted_njit,
+    estimate_flops,
+    flop_region,
+    geometric_sizes,
+    get_function_stats,
+    get_instrumented_modules,
+    get_region_tree,
+    get_stage_stats,
+    instrument_modules,
+    iter_ensemble,
+    measure_instrumentation_overhead,
+    merge_counter_files,
+    read_counter_file,
+    register_flops,
+    reset_function_stats,
+    reset_region_tree,
+    reset_stage_stats,
+    uninstrument_modules,
+    watch_counter_files,
+)
 from ._core.counting.models import (
+    ComplexOpType,
+    CustomFlopType,
     FlopCounts,
+    FlopCountsTable,
     FlopsBenchmarkDurations,
     FlopsBenchmarkResults,
     FlopType,
     FlopWeights,
     FPUInstruction,
+    InstrumentationBackend,
+    IntOpCounts,
+    IntOpType,
+    Precision,
+    RuntimePrediction,
     SystemInfo,
+    batch_weighted_costs,
+    get_custom_flop_types,
+    register_custom_flop_type,
+    unregister_custom_flop_type,
 )
 
 __all__ = [
     "benchmarking",
     "config",
+    "BudgetUnit",
+    "ChromeTraceExporter",
+    "ComplexOpType",
+    "CostDistribution",
+    "CostRecorder",
+    "CostSketch",
+    "CostSummary",
+    "CounterFileSnapshot",
+    "CounterFileWriter",
+    "CountedComplex",
     "CountedFloat",
+    "CountedFloat32",
+    "CountedFunction",
+    "CountedInt",
+    "CountedIterator",
+    "CountedNjitFunction",
+    "CustomFlopType",
+    "FlopBudgetExceeded",
     "FlopCountingContext",
     "FlopCounts",
+    "FlopCountsTable",
+    "FlopRegion",
     "FlopsBenchmarkDurations",
     "FlopsBenchmarkResults",
     "FlopType",
     "FlopWeights",
     "FPUInstruction",
+    "FunctionStats",
+    "InstrumentationBackend",
+    "IntOpCounts",
+    "IntOpType",
     "PauseFlopCounting",
+    "PlainFloatCounting",
+    "Precision",
+    "RegionNode",
+    "RuntimePrediction",
+    "ScalingAnalysis",
+    "ScalingFit",
+    "ScalingModel",
+    "StageStats",
+    "StaticEstimateValidation",
+    "StaticFlopEstimate",
+    "SymbolicCount",
     "SystemInfo",
+    "TimedFlopCountingContext",
+    "TimingReport",
+    "TracedOp",
+    "analyze_ensemble",
+    "analyze_scaling",
+    "batch_weighted_costs",
+    "count_flops",
+    "counted_iter",
+    "counted_njit",
+    "estimate_flops",
+    "flop_region",
+    "geometric_sizes",
+    "get_custom_flop_types",
+    "get_function_stats",
+    "get_instrumented_modules",
+    "get_region_tree",
+    "get_stage_stats",
+    "instrument_modules",
+    "iter_ensemble",
+    "measure_instrumentation_overhead",
+    "merge_counter_files",
+    "read_counter_file",
+    "register_custom_flop_type",
+    "register_flops",
+    "reset_function_stats",
+    "reset_region_tree",
+    "reset_stage_stats",
+    "uninstrument_modules",
+    "unregister_custom_flop_type",
+    "watch_counter_files",
 ]
@@ -0,0 +1,30 @@
+"""
+Command-line interface:
+
+    python -m counted_float watch <counter files> [--interval <seconds>]
+
+See CounterFileWriter for writing counter files.
+"""
+
+import argparse
+
+from counted_float._core.counting._counter_file import watch_counter_files
+
+
+def main(args: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m counted_float")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    watch_parser = subparsers.add_parser(
+        "watch", help="live view of flop counts & rates, summed over counter files (see CounterFileWriter)"
+    )
+    watch_parser.add_argument("paths", nargs="+", help="counter files, e.g. of multiple processes")
+    watch_parser.add_argument("--interval", type=float, default=1.0, help="refresh interval in seconds (default: 1)")
+
+    parsed = parser.parse_args(args)
+    if parsed.command == "watch":
+        watch_counter_files(parsed.paths, interval=parsed.interval)
+
+
+if __name__ == "__main__":
+    main()
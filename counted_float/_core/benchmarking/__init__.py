@@ -1,8 +1,21 @@
 from counted_float._core.counting.models import FlopsBenchmarkResults
 
+from ._counting_overhead import benchmark_counting_overhead
 from ._flops_benchmark_suite import FlopsBenchmarkSuite
+from ._models import CountingOverheadResult, TraceReplayResult
+from ._trace_replay import TraceReplayKernel, replay_trace
 
 
-def run_flops_benchmark() -> FlopsBenchmarkResults:
+def run_flops_benchmark(
+    include_fp32: bool = False,
+    include_complex_ops: bool = False,
+    include_int_ops: bool = False,
+    include_custom_ops: bool = False,
+) -> FlopsBenchmarkResults:
     """Run the flops benchmark suite with default settings returns a FlopsBenchmarkResults object."""
-    return FlopsBenchmarkSuite().run()
+    return FlopsBenchmarkSuite().run(
+        include_fp32=include_fp32,
+        include_complex_ops=include_complex_ops,
+        include_int_ops=include_int_ops,
+        include_custom_ops=include_custom_ops,
+    )
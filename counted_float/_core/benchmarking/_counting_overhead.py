@@ -0,0 +1,83 @@
+"""
+Benchmark of the overhead of counting flops with CountedFloat vs. with PlainFloatCounting (sys.monitoring), relative
+to the same plain-float kernel without any counting:
+
+    result = benchmark_counting_overhead(n_elements=20_000)
+    result.show()
+
+The kernel is the 'distance' example of the README, which is called with lists of plain floats (uninstrumented and
+with PlainFloatCounting) or with lists of CountedFloat.  All counting is done inside a FlopCountingContext.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import sys
+from typing import Callable
+
+import numpy as np
+
+from counted_float._core.counting import CountedFloat, FlopCountingContext, PlainFloatCounting
+from counted_float._core.counting.models import Quantiles
+
+from ._models import CountingOverheadResult
+from ._time_utils import Timer
+
+
+# =================================================================================================
+#  Kernel
+# =================================================================================================
+def _distance(xs, ys):
+    s = 0.0
+    for i in range(len(xs)):
+        d = xs[i] - ys[i]
+        s += d * d
+    return math.sqrt(s)
+
+
+# =================================================================================================
+#  Benchmark
+# =================================================================================================
+def benchmark_counting_overhead(n_elements: int = 20_000, n_runs: int = 10, seed: int = 42) -> CountingOverheadResult:
+    """
+    Times the distance kernel without counting, with CountedFloat inputs and with PlainFloatCounting (Python 3.12+
+    only) and returns the measured durations per call, from which the relative overhead of both approaches follows.
+    :param n_elements: length of both input vectors of the distance kernel
+    :param n_runs: number of timed calls per approach (after 1 warm-up call)
+    :param seed: seed for generating the input vectors
+    """
+    rng = random.Random(seed)
+    xs = [rng.random() for _ in range(n_elements)]
+    ys = [rng.random() for _ in range(n_elements)]
+    xs_counted = [CountedFloat(x) for x in xs]
+    ys_counted = [CountedFloat(y) for y in ys]
+
+    def plain():
+        _distance(xs, ys)
+
+    def counted_float():
+        with FlopCountingContext():
+            _distance(xs_counted, ys_counted)
+
+    def plain_float_counting():
+        with FlopCountingContext(), PlainFloatCounting([_distance]):
+            _distance(xs, ys)
+
+    return CountingOverheadResult(
+        n_elements=n_elements,
+        ns_plain=_time_calls(plain, n_runs),
+        ns_counted_float=_time_calls(counted_float, n_runs),
+        ns_plain_float_counting=_time_calls(plain_float_counting, n_runs) if sys.version_info >= (3, 12) else None,
+    )
+
+
+def _time_calls(f: Callable[[], None], n_runs: int) -> Quantiles:
+    f()  # warm-up (e.g. analysis of code objects by PlainFloatCounting, which is cached)
+    durations = []
+    for _ in range(n_runs):
+        with Timer() as timer:
+            f()
+        durations.append(timer.t_elapsed_nsec())
+    q25, q50, q75 = np.quantile(durations, [0.25, 0.50, 0.75])
+    return Quantiles(q25=float(q25), q50=float(q50), q75=float(q75))
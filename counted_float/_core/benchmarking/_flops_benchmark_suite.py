@@ -6,11 +6,15 @@ import psutil
 from counted_float._core.compatibility import is_numba_installed, numba
 from counted_float._core.counting.models import (
     BenchmarkSettings,
+    ComplexOpType,
     FlopsBenchmarkDurations,
     FlopsBenchmarkResults,
     FlopType,
+    IntOpType,
+    Precision,
     Quantiles,
     SystemInfo,
+    get_custom_flop_types,
 )
 
 from ._flops_micro_benchmark import FlopsMicroBenchmark
@@ -26,9 +30,21 @@ class FlopsBenchmarkSuite:
         n_runs_total: int = 30,
         n_runs_warmup: int = 10,
         n_seconds_per_run_target: float = 0.5,
+        include_fp32: bool = False,
+        include_complex_ops: bool = False,
+        include_int_ops: bool = False,
+        include_custom_ops: bool = False,
     ) -> FlopsBenchmarkResults:
         """
         Run entire flops benchmarking suite and return the results as a FlopsBenchmarkResults object.
+        If include_fp32 is True, fp32 variants of all flops benchmarks are run as well, such that fp32 weights can
+        be derived on the same scale as the (default) fp64 weights.
+        If include_complex_ops is True, the complex-valued benchmarks are run as well, such that the decompositions
+        of ComplexOpType into real-valued flops can be checked against measured costs.
+        If include_int_ops is True, the integer benchmarks are run as well, such that integer weights can be derived
+        on the same scale as the flop weights.
+        If include_custom_ops is True, the benchmark kernels of all registered custom flop types (that provide one)
+        are run as well, such that measured custom weights are included in the flop weights.
         """
 
         # warn if needed
@@ -49,6 +65,55 @@ class FlopsBenchmarkSuite:
             for flop_type, benchmark in benchmarks.items()
         }
 
+        fp32_results_dict: dict[FlopType, Quantiles] | None = None
+        if include_fp32:
+            fp32_benchmarks = self.get_flops_benchmarking_suite(size=array_size, precision=Precision.FP32)
+            fp32_results_dict = {
+                flop_type: benchmark.run_many(
+                    n_runs_total=n_runs_total,
+                    n_runs_warmup=n_runs_warmup,
+                    n_seconds_per_run_target=n_seconds_per_run_target,
+                ).summary_stats()
+                for flop_type, benchmark in fp32_benchmarks.items()
+                if flop_type is not None  # baseline is shared with fp64 benchmarks
+            }
+
+        complex_results_dict: dict[ComplexOpType, Quantiles] | None = None
+        if include_complex_ops:
+            complex_benchmarks = self.get_complex_benchmarking_suite(size=array_size)
+            complex_results_dict = {
+                complex_op_type: benchmark.run_many(
+                    n_runs_total=n_runs_total,
+                    n_runs_warmup=n_runs_warmup,
+                    n_seconds_per_run_target=n_seconds_per_run_target,
+                ).summary_stats()
+                for complex_op_type, benchmark in complex_benchmarks.items()
+            }
+
+        int_results_dict: dict[IntOpType, Quantiles] | None = None
+        if include_int_ops:
+            int_benchmarks = self.get_int_benchmarking_suite(size=array_size)
+            int_results_dict = {
+                int_op_type: benchmark.run_many(
+                    n_runs_total=n_runs_total,
+                    n_runs_warmup=n_runs_warmup,
+                    n_seconds_per_run_target=n_seconds_per_run_target,
+                ).summary_stats()
+                for int_op_type, benchmark in int_benchmarks.items()
+            }
+
+        custom_results_dict: dict[str, Quantiles] | None = None
+        if include_custom_ops:
+            custom_benchmarks = self.get_custom_benchmarking_suite(size=array_size)
+            custom_results_dict = {
+                name: benchmark.run_many(
+                    n_runs_total=n_runs_total,
+                    n_runs_warmup=n_runs_warmup,
+                    n_seconds_per_run_target=n_seconds_per_run_target,
+                ).summary_stats()
+                for name, benchmark in custom_benchmarks.items()
+            }
+
         # put results in appropriate format & return
         return FlopsBenchmarkResults(
             system_info=SystemInfo(
@@ -71,6 +136,10 @@ class FlopsBenchmarkSuite:
             results_ns=FlopsBenchmarkDurations(
                 baseline=results_dict[None],
                 flops={flop_type: results_dict[flop_type] for flop_type in FlopType},
+                flops_fp32=fp32_results_dict,
+                complex_ops=complex_results_dict,
+                int_ops=int_results_dict,
+                custom_ops=custom_results_dict,
             ),
         )
 
@@ -78,11 +147,18 @@ class FlopsBenchmarkSuite:
     #  Static methods
     # -------------------------------------------------------------------------
     @staticmethod
-    def get_flops_benchmarking_suite(size: int) -> dict[FlopType | None, FlopsMicroBenchmark]:
+    def get_flops_benchmarking_suite(
+        size: int, precision: Precision = Precision.FP64
+    ) -> dict[FlopType | None, FlopsMicroBenchmark]:
         """
-        Returns a benchmark for each FlopType + None (=baseline test), of requested array size.
+        Returns a benchmark for each FlopType + None (=baseline test), of requested array size & precision.
         """
 
+        # --- floating point type -------------------------
+        # (used for constants inside the test functions, to avoid implicit conversion to float64)
+        ftype = {Precision.FP64: np.float64, Precision.FP32: np.float32}[precision]
+        name_suffix = "" if precision == Precision.FP64 else f" ({precision.value})"
+
         # --- define all test functions -------------------
         @numba.njit(parallel=False)
         def baseline(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
@@ -118,7 +194,7 @@ class FlopsBenchmarkSuite:
         @numba.njit(parallel=False)
         def flop_gte_zero(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
             for i in range(n):
-                out_i[i] = in_f1[i] >= 0.0  # assign to integer output, to avoid unnecessary conversion overhead
+                out_i[i] = in_f1[i] >= ftype(0.0)  # assign to integer output, to avoid unnecessary conversion overhead
 
         @numba.njit(parallel=False)
         def flop_rnd(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
@@ -153,7 +229,7 @@ class FlopsBenchmarkSuite:
         @numba.njit(parallel=False)
         def flop_pow2(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
             for i in range(n):
-                out_f[i] = 2 ** in_f1[i]
+                out_f[i] = ftype(2.0) ** in_f1[i]
 
         @numba.njit(parallel=False)
         def flop_log2(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
@@ -167,9 +243,9 @@ class FlopsBenchmarkSuite:
 
         # --- return in appropriate format ----------------
         return {
-            key: FlopsMicroBenchmark(name=name, f=f, size=size)
+            key: FlopsMicroBenchmark(name=name, f=f, size=size, dtype=ftype)
             for key, name, f in [
-                (key, key.long_name() if key else "baseline", f)
+                (key, (key.long_name() if key else "baseline") + name_suffix, f)
                 for key, f in [
                     (None, baseline),
                     (FlopType.ABS, flop_abs),
@@ -190,3 +266,158 @@ class FlopsBenchmarkSuite:
                 ]
             ]
         }
+
+    @staticmethod
+    def get_complex_benchmarking_suite(size: int) -> dict[ComplexOpType, FlopsMicroBenchmark]:
+        """
+        Returns a benchmark for each ComplexOpType, of requested array size, operating on complex128 arrays.
+        These share their baseline with the benchmarks returned by get_flops_benchmarking_suite().
+        """
+
+        # --- define all test functions -------------------
+        @numba.njit(parallel=False)
+        def complex_abs(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = abs(
+                    in_f1[i]
+                )  # out_f is float64 for this benchmark, to avoid unnecessary conversion overhead
+
+        @numba.njit(parallel=False)
+        def complex_minus(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = -in_f1[i]
+
+        @numba.njit(parallel=False)
+        def complex_conj(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i].conjugate()
+
+        @numba.njit(parallel=False)
+        def complex_equals(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_i[i] = in_f1[i] == in_f2[i]  # assign to integer output, to avoid unnecessary conversion overhead
+
+        @numba.njit(parallel=False)
+        def complex_add(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] + in_f2[i]
+
+        @numba.njit(parallel=False)
+        def complex_sub(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] - in_f2[i]
+
+        @numba.njit(parallel=False)
+        def complex_mul(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] * in_f2[i]
+
+        @numba.njit(parallel=False)
+        def complex_div(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] / in_f2[i]
+
+        @numba.njit(parallel=False)
+        def complex_sqrt(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = np.sqrt(in_f1[i])
+
+        @numba.njit(parallel=False)
+        def complex_pow(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] ** in_f2[i]
+
+        # --- return in appropriate format ----------------
+        return {
+            key: FlopsMicroBenchmark(
+                name=key.long_name(),
+                f=f,
+                size=size,
+                dtype=np.complex128,
+                out_dtype=np.float64 if key == ComplexOpType.ABS else None,
+            )
+            for key, f in [
+                (ComplexOpType.ABS, complex_abs),
+                (ComplexOpType.MINUS, complex_minus),
+                (ComplexOpType.CONJ, complex_conj),
+                (ComplexOpType.EQUALS, complex_equals),
+                (ComplexOpType.ADD, complex_add),
+                (ComplexOpType.SUB, complex_sub),
+                (ComplexOpType.MUL, complex_mul),
+                (ComplexOpType.DIV, complex_div),
+                (ComplexOpType.SQRT, complex_sqrt),
+                (ComplexOpType.POW, complex_pow),
+            ]
+        }
+
+    @staticmethod
+    def get_int_benchmarking_suite(size: int) -> dict[IntOpType, FlopsMicroBenchmark]:
+        """
+        Returns a benchmark for each IntOpType, of requested array size, operating on int64 arrays.
+        These share their baseline with the benchmarks returned by get_flops_benchmarking_suite().
+        """
+
+        # --- define all test functions -------------------
+        @numba.njit(parallel=False)
+        def int_add(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] + in_f2[i]
+
+        @numba.njit(parallel=False)
+        def int_mul(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] * in_f2[i]
+
+        @numba.njit(parallel=False)
+        def int_div(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] // in_f2[i]
+
+        @numba.njit(parallel=False)
+        def int_shift(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] << in_f2[i]
+
+        @numba.njit(parallel=False)
+        def int_bitwise(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_f[i] = in_f1[i] & in_f2[i]
+
+        @numba.njit(parallel=False)
+        def int_cmp(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+            for i in range(n):
+                out_i[i] = in_f1[i] < in_f2[i]
+
+        # --- return in appropriate format ----------------
+        return {
+            key: FlopsMicroBenchmark(name=key.long_name(), f=f, size=size, dtype=np.int64)
+            for key, f in [
+                (IntOpType.ADD, int_add),
+                (IntOpType.MUL, int_mul),
+                (IntOpType.DIV, int_div),
+                (IntOpType.SHIFT, int_shift),
+                (IntOpType.BITWISE, int_bitwise),
+                (IntOpType.CMP, int_cmp),
+            ]
+        }
+
+    @staticmethod
+    def get_custom_benchmarking_suite(size: int) -> dict[str, FlopsMicroBenchmark]:
+        """
+        Returns a benchmark for each registered CustomFlopType that provides a benchmark kernel, keyed by name,
+        operating on float64 arrays.  Kernels are numba-compiled, unless they are already compiled.
+        These share their baseline with the benchmarks returned by get_flops_benchmarking_suite().
+        """
+        return {
+            custom_type.name: FlopsMicroBenchmark(
+                name=custom_type.long_name(),
+                f=(
+                    custom_type.benchmark_kernel
+                    if hasattr(custom_type.benchmark_kernel, "py_func")  # already numba-compiled
+                    else numba.njit(parallel=False)(custom_type.benchmark_kernel)
+                ),
+                size=size,
+            )
+            for custom_type in get_custom_flop_types()
+            if custom_type.benchmark_kernel is not None
+        }
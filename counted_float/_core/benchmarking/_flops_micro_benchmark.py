@@ -11,10 +11,12 @@ class FlopsMicroBenchmark(MicroBenchmark):
 
     This is set up as follows:
       - we configure the benchmark with a 'size' and a function 'f'
-      - we prepare the inputs: 2 1D numpy arrays of size 'size': in_f1, in_f2
-         - initialized as random floating point numbers in range [0, 10]
+      - we prepare the inputs: 2 1D numpy arrays of size 'size' and type 'dtype': in_f1, in_f2
+         - initialized as random floating point numbers in range [0, 10]  (both real & imag part for complex dtypes)
+         - for integer dtypes: in_f1 in range [1, 2^31), in_f2 in range [1, 32), such that in_f2 can be used as
+             divisor & shift amount
       - we prepare the output arrays: of size 'size': out_f, out_i
-         - 1 output array per type of result: float, int
+         - 1 output array per type of result: float (of type 'out_dtype', defaults to 'dtype'), int
          - initialized with zeros
       - the function f will loop over a&b and write the result to c
          - the function should be implemented such that it does not use vectorized operations, we want to avoid
@@ -32,27 +34,39 @@ class FlopsMicroBenchmark(MicroBenchmark):
     operations, so we can make representative estimates of the number of FLOPS executed by instrumented algorithms.
     """
 
-    def __init__(self, name: str, f: Callable, size: int):
+    def __init__(self, name: str, f: Callable, size: int, dtype: type = np.float64, out_dtype: type | None = None):
         super().__init__(name=name)
         self.size = size
         self.f = f
+        self.dtype = dtype  # dtype of in_f1, in_f2; np.complex128 / np.int64 for complex / int benchmarks
+        self.out_dtype = out_dtype or dtype  # dtype of out_f; e.g. np.float64 for abs(complex), to avoid conversions
         self.n_operations = 0
         # input arrays
-        self.in_f1: np.ndarray = np.zeros(size, dtype=float)
-        self.in_f2: np.ndarray = np.zeros(size, dtype=float)
+        self.in_f1: np.ndarray = np.zeros(size, dtype=dtype)
+        self.in_f2: np.ndarray = np.zeros(size, dtype=dtype)
         # output arrays
-        self.out_f: np.ndarray = np.zeros(size, dtype=float)
+        self.out_f: np.ndarray = np.zeros(size, dtype=self.out_dtype)
         self.out_i: np.ndarray = np.zeros(size, dtype=int)
 
     def _prepare_benchmark(self, n_operations: int):
         self.n_operations = n_operations
         # input arrays
-        self.in_f1 = 10 * np.random.rand(self.size)
-        self.in_f2 = 10 * np.random.rand(self.size)
+        self.in_f1 = self._random_array(int_high=2**31)
+        self.in_f2 = self._random_array(int_high=32)
         # output arrays
-        self.out_f: np.ndarray = np.full(self.size, 0.0, dtype=float)
+        self.out_f: np.ndarray = np.full(self.size, 0, dtype=self.out_dtype)
         self.out_i: np.ndarray = np.full(self.size, 0, dtype=int)
 
+    def _random_array(self, int_high: int) -> np.ndarray:
+        if np.issubdtype(self.dtype, np.integer):
+            # strictly positive integers in range [1, int_high)
+            return np.random.randint(1, int_high, size=self.size).astype(self.dtype)
+        elif np.issubdtype(self.dtype, np.complexfloating):
+            # real & imaginary parts both in range [0, 10]
+            return (10 * np.random.rand(self.size) + 10j * np.random.rand(self.size)).astype(self.dtype)
+        else:
+            return (10 * np.random.rand(self.size)).astype(self.dtype)
+
     def _run_benchmark(self):
         # repeat 'f' n_operations times, each time on the same data
         for _ in range(self.n_operations):
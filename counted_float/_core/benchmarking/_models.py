@@ -29,3 +29,51 @@ class MicroBenchmarkResult(MyBaseModel):
             q50=self.get_nsec_per_op_quantile(q=0.50),
             q75=self.get_nsec_per_op_quantile(q=0.75),
         )
+
+
+class TraceReplayResult(MyBaseModel):
+    """Measured duration of a numba-compiled replay of a trace (see replay_trace), next to its weighted cost."""
+
+    n_ops: int
+    n_inputs: int
+    n_outputs: int
+    weighted_cost: float  # total weighted cost of all traced ops
+    ns: Quantiles  # duration (nsec) per replay of the trace, baseline-corrected
+    ns_baseline: Quantiles  # duration (nsec) of loading inputs & storing outputs, per replay
+
+    def ns_per_weighted_flop(self) -> float:
+        """Median measured duration per unit of weighted cost, which is constant if the cost model is accurate."""
+        return self.ns.q50 / self.weighted_cost
+
+
+class CountingOverheadResult(MyBaseModel):
+    """
+    Measured duration of a plain-float kernel without counting, with CountedFloat inputs and with PlainFloatCounting
+    (see benchmark_counting_overhead), from which the relative overhead of both counting approaches follows.
+    """
+
+    n_elements: int
+    ns_plain: Quantiles  # duration (nsec) per call of the kernel, without counting
+    ns_counted_float: Quantiles  # idem, with CountedFloat inputs
+    ns_plain_float_counting: Quantiles | None = None  # idem, with PlainFloatCounting (None if Python < 3.12)
+
+    def overhead_counted_float(self) -> float:
+        """Median duration with CountedFloat inputs, relative to the median duration without counting."""
+        return self.ns_counted_float.q50 / self.ns_plain.q50
+
+    def overhead_plain_float_counting(self) -> float | None:
+        """Median duration with PlainFloatCounting, relative to the median duration without counting."""
+        if self.ns_plain_float_counting is None:
+            return None
+        return self.ns_plain_float_counting.q50 / self.ns_plain.q50
+
+    def show(self):
+        print(f"distance kernel, {self.n_elements} elements:")
+        print(f"  {'approach':<22}{'time/call':>14}{'overhead':>10}")
+        print(f"  {'no counting':<22}{self.ns_plain.q50 / 1e6:11.3f} ms{1.0:9.1f}x")
+        print(f"  {'CountedFloat':<22}{self.ns_counted_float.q50 / 1e6:11.3f} ms{self.overhead_counted_float():9.1f}x")
+        if self.ns_plain_float_counting is not None:
+            print(
+                f"  {'PlainFloatCounting':<22}{self.ns_plain_float_counting.q50 / 1e6:11.3f} ms"
+                f"{self.overhead_plain_float_counting():9.1f}x"
+            )
@@ -0,0 +1,213 @@
+"""
+Replay of a traced sequence of CountedFloat operations as a numba-compiled kernel, to measure the actual compiled
+runtime of a counted computation and compare it with its weighted flop count.
+
+A trace (see FlopCountingContext(backend=TRACING).trace()) is converted into straight-line code, where dependencies
+between operations are reconstructed using id(...) of operands & results:
+
+    def kernel(x, out):
+        for r in range(x.shape[0]):
+            i0 = x[r, 0]                  # operands not produced by the trace itself become inputs
+            i1 = x[r, 1]
+            v0 = i0 * i1
+            v1 = v0 + i0
+            out[r, 0] = v1                # results not consumed by the trace itself become outputs
+
+Each row of the input matrix (all holding the originally traced input values) replays the full trace once.  A baseline
+kernel with identical loads & stores, but without arithmetic, is timed as well, such that the reported durations are
+baseline-corrected, as is done for the flops benchmarks.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from counted_float._core.compatibility import numba
+from counted_float._core.counting import TracedOp
+from counted_float._core.counting.models import FlopCounts, FlopType, FlopWeights, Precision, Quantiles
+
+from ._micro_benchmark import MicroBenchmark
+from ._models import TraceReplayResult
+
+_MAX_MATRIX_SIZE = 2**20  # max number of elements of input & output matrices, to stay (roughly) in cache
+_MAX_ROWS = 1000
+
+_EXPRESSIONS: dict[FlopType, str] = {
+    FlopType.ABS: "abs({a})",
+    FlopType.MINUS: "-{a}",
+    FlopType.EQUALS: "{a} == {b}",
+    FlopType.GTE: "{a} >= {b}",
+    FlopType.LTE: "{a} <= {b}",
+    FlopType.CMP_ZERO: "{a} >= {b}",
+    FlopType.RND: "np.floor({a})",
+    FlopType.ADD: "{a} + {b}",
+    FlopType.SUB: "{a} - {b}",
+    FlopType.MUL: "{a} * {b}",
+    FlopType.DIV: "{a} / {b}",
+    FlopType.SQRT: "np.sqrt({a})",
+    FlopType.POW2: "{a} ** {b}",
+    FlopType.LOG2: "np.log2({a})",
+    FlopType.POW: "{a} ** {b}",
+}
+
+
+# =================================================================================================
+#  Code generation
+# =================================================================================================
+class TraceReplayKernel:
+    """Numba-compiled straight-line replay of a trace, together with its baseline kernel and input values."""
+
+    def __init__(self, trace: list[TracedOp]):
+        if not trace:
+            raise ValueError("Cannot replay an empty trace.")
+        self.trace = trace
+        self.input_values: list[float] = []
+        self.n_outputs = 0
+        self.source, self.baseline_source = self._generate_sources(trace)
+        self.kernel = self._compile(self.source)
+        self.baseline_kernel = self._compile(self.baseline_source)
+
+    @property
+    def n_inputs(self) -> int:
+        return len(self.input_values)
+
+    def flop_counts(self) -> FlopCounts:
+        counts = FlopCounts()
+        for op in self.trace:
+            setattr(counts, op.flop_type.name, getattr(counts, op.flop_type.name) + 1)
+        return counts
+
+    def input_matrix(self, n_rows: int) -> np.ndarray:
+        return np.tile(np.array(self.input_values or [0.0], dtype=np.float64), (n_rows, 1))
+
+    # -------------------------------------------------------------------------
+    #  Internal
+    # -------------------------------------------------------------------------
+    def _generate_sources(self, trace: list[TracedOp]) -> tuple[str, str]:
+        result_vars: dict[int, str] = {}  # id(result) -> variable name
+        input_vars: dict[int, str] = {}  # id(input operand) -> variable name
+        consumed: set[str] = set()
+        op_lines: list[str] = []
+
+        for i, op in enumerate(trace):
+            args = []
+            for operand in op.operands:
+                if id(operand) in result_vars:
+                    var = result_vars[id(operand)]
+                    consumed.add(var)
+                    args.append(var)
+                elif isinstance(operand, (bool, np.bool_)):
+                    args.append(repr(bool(operand)))
+                elif isinstance(operand, (int, np.integer)):
+                    args.append(repr(int(operand)))
+                elif isinstance(operand, (float, np.floating)):
+                    if id(operand) not in input_vars:
+                        input_vars[id(operand)] = f"i{len(self.input_values)}"
+                        self.input_values.append(float(operand))
+                    args.append(input_vars[id(operand)])
+                else:
+                    raise TypeError(f"Cannot replay operand of type {type(operand).__name__} ({op}).")
+
+            args += [""] * (2 - len(args))
+            if (op.flop_type == FlopType.MUL) and _is_square(op):
+                expr = f"{args[0]} * {args[0]}"  # x**2, traced as MUL(x, 2)
+            else:
+                expr = _EXPRESSIONS[op.flop_type].format(a=args[0], b=args[1])
+            var = f"v{i}"
+            op_lines.append(f"{var} = {expr}")
+            result_vars[id(op.result)] = var
+
+        outputs = [var for var in result_vars.values() if var not in consumed]
+        load_lines = [f"{var} = x[r, {k}]" for k, var in enumerate(input_vars.values())]
+        store_lines = [f"out[r, {j}] = {var}" for j, var in enumerate(outputs)]
+        baseline_inputs = list(input_vars.values()) or ["0.0"]
+        baseline_store_lines = [
+            f"out[r, {j}] = {baseline_inputs[j % len(baseline_inputs)]}" for j in range(len(outputs))
+        ]
+
+        self.n_outputs = len(outputs)
+        return (
+            _kernel_source(load_lines + op_lines + store_lines),
+            _kernel_source(load_lines + baseline_store_lines),
+        )
+
+    @staticmethod
+    def _compile(source: str):
+        namespace = {"np": np}
+        exec(source, namespace)
+        return numba.njit(namespace["kernel"])
+
+
+def _kernel_source(body_lines: list[str]) -> str:
+    body = "\n".join(f"        {line}" for line in body_lines)
+    return f"def kernel(x, out):\n    for r in range(x.shape[0]):\n{body}\n"
+
+
+def _is_square(op: TracedOp) -> bool:
+    if len(op.operands) != 2:
+        return False
+    x, y = op.operands
+    return (type(y) is int) and (y == 2) and (float(op.result) == float(x) * float(x))
+
+
+# =================================================================================================
+#  Benchmarking
+# =================================================================================================
+class TraceReplayMicroBenchmark(MicroBenchmark):
+    """MicroBenchmark running a (baseline) trace replay kernel once per operation, on n_rows replays of the trace."""
+
+    def __init__(self, name: str, kernel, n_outputs: int, x: np.ndarray):
+        super().__init__(name=name)
+        self.kernel = kernel
+        self.x = x
+        self.out = np.zeros((x.shape[0], max(n_outputs, 1)), dtype=np.float64)
+        self.n_operations = 0
+
+    def _prepare_benchmark(self, n_operations: int):
+        self.n_operations = n_operations
+        self.out[:] = 0.0
+
+    def _run_benchmark(self):
+        for _ in range(self.n_operations):
+            self.kernel(self.x, self.out)
+
+
+def replay_trace(
+    trace: list[TracedOp],
+    weights: FlopWeights | None = None,
+    n_runs_total: int = 20,
+    n_runs_warmup: int = 5,
+    n_seconds_per_run_target: float = 0.1,
+) -> TraceReplayResult:
+    """
+    Replays a traced sequence of CountedFloat operations as a numba-compiled kernel and returns the measured
+    (baseline-corrected) duration per replay of the trace, next to its total weighted cost.
+    :param trace: list of TracedOp objects, as returned by FlopCountingContext(backend=TRACING).trace()
+    :param weights: FlopWeights to compute the total weighted cost with (default: currently configured weights)
+    """
+    replay = TraceReplayKernel(trace)
+    n_rows = max(1, min(_MAX_ROWS, _MAX_MATRIX_SIZE // max(1, replay.n_inputs + replay.n_outputs)))
+    x = replay.input_matrix(n_rows)
+
+    quantiles = dict()
+    for name, kernel in [("trace replay", replay.kernel), ("trace replay (baseline)", replay.baseline_kernel)]:
+        benchmark = TraceReplayMicroBenchmark(name, kernel, replay.n_outputs, x)
+        stats = benchmark.run_many(
+            n_runs_total=n_runs_total, n_runs_warmup=n_runs_warmup, n_seconds_per_run_target=n_seconds_per_run_target
+        ).summary_stats()
+        quantiles[name] = Quantiles(q25=stats.q25 / n_rows, q50=stats.q50 / n_rows, q75=stats.q75 / n_rows)
+
+    replay_ns, baseline_ns = quantiles["trace replay"], quantiles["trace replay (baseline)"]
+    flop_counts = replay.flop_counts()
+    return TraceReplayResult(
+        n_ops=len(trace),
+        n_inputs=replay.n_inputs,
+        n_outputs=replay.n_outputs,
+        weighted_cost=flop_counts.total_weighted_cost(weights, Precision.FP64),
+        ns=Quantiles(
+            q25=replay_ns.q25 - baseline_ns.q50,
+            q50=replay_ns.q50 - baseline_ns.q50,
+            q75=replay_ns.q75 - baseline_ns.q50,
+        ),
+        ns_baseline=baseline_ns,
+    )
@@ -1,3 +1,38 @@
+from ._backends import TracedOp, get_active_backend, get_default_backend, set_default_backend
+from ._budget import BudgetUnit, FlopBudgetExceeded
 from ._builtin_data import BuiltInData
 from ._context_managers import FlopCountingContext, PauseFlopCounting
+from ._counted_complex import CountedComplex
 from ._counted_float import CountedFloat
+from ._counted_float32 import CountedFloat32
+from ._counted_int import CountedInt
+from ._counted_iter import CountedIterator, StageStats, counted_iter, get_stage_stats, reset_stage_stats
+from ._counter_file import (
+    CounterFileSnapshot,
+    CounterFileWriter,
+    merge_counter_files,
+    read_counter_file,
+    watch_counter_files,
+)
+from ._ensemble import CostDistribution, CostSummary, analyze_ensemble, iter_ensemble
+from ._function_stats import CountedFunction, FunctionStats, count_flops, get_function_stats, reset_function_stats
+from ._import_hook import get_instrumented_modules, instrument_modules, instrument_source, uninstrument_modules
+from ._math_overrides import (
+    cmath_polar,
+    cmath_sqrt,
+    math_log2,
+    math_modules_patched,
+    math_pow,
+    math_sqrt,
+    unpatched_math_modules,
+)
+from ._monitoring import PlainFloatCounting
+from ._numba_counting import CountedNjitFunction, counted_njit
+from ._recorder import CostRecorder
+from ._regions import FlopRegion, RegionNode, flop_region, get_region_tree, reset_region_tree
+from ._register_flops import register_flops
+from ._scaling import ScalingAnalysis, ScalingFit, ScalingModel, analyze_scaling, fit_scaling, geometric_sizes
+from ._sketch import CostSketch
+from ._static_estimate import StaticEstimateValidation, StaticFlopEstimate, SymbolicCount, estimate_flops
+from ._timing import TimedFlopCountingContext, TimingReport, measure_instrumentation_overhead
+from ._trace_export import ChromeTraceExporter
@@ -0,0 +1,68 @@
+"""
+Low-overhead attribution of flops to (possibly nested) spans of execution, e.g. the production of an item by a
+counted_iter stage or a call of a @count_flops function.
+
+Spans don't create FlopCounts objects; instead, at the start & end of each span the live global counters are read as
+flat snapshot tuples (fp64 counts, fp32 counts, weighted cost of custom flop types), of which the difference is the
+inclusive delta of the span.  Spans are tracked on a stack, such that the inclusive delta of each span is also
+subtracted from the enclosing span, resulting in exclusive deltas:
+
+    start = begin_span(weights)
+    ...
+    inclusive, exclusive = end_span(weights, start)
+    cost = weighted_delta_cost(inclusive, snapshot_weights(weights))
+
+Both deltas are lists with 2*len(FlopType)+1 entries, of which the first len(FlopType) are the fp64 counts, in
+FlopType order.
+"""
+
+from __future__ import annotations
+
+import operator
+
+from ._global_counter import GLOBAL_COUNTERS
+from .models import FlopType, FlopWeights, Precision
+
+N_FLOP_TYPES = len(FlopType)
+
+_GLOBAL_COUNTERS = [GLOBAL_COUNTERS[Precision.FP64], GLOBAL_COUNTERS[Precision.FP32]]
+_LIVE_COUNTS = [counter.live_flop_counts() for counter in _GLOBAL_COUNTERS]
+
+# per active span (innermost last): summed inclusive deltas of its nested spans so far (None = no nested spans)
+_NESTED: list[list[int | float] | None] = []
+
+
+def snapshot_weights(weights: FlopWeights) -> tuple[float, ...]:
+    """Weights such that the weighted cost of a delta is its dot product with these weights."""
+    return (*weights.weight_tuple(Precision.FP64), *weights.weight_tuple(Precision.FP32), 1.0)
+
+
+def weighted_delta_cost(delta: list[int | float], weights: tuple[float, ...]) -> float:
+    return sum(map(operator.mul, delta, weights))
+
+
+def take_snapshot(weights: FlopWeights) -> tuple[int | float, ...]:
+    fp64_counts, fp32_counts = _LIVE_COUNTS
+    if fp64_counts.custom or fp32_counts.custom:
+        custom_cost = sum(counter.custom_weighted_cost(weights) for counter in _GLOBAL_COUNTERS)
+    else:
+        custom_cost = 0.0
+    return (*fp64_counts.as_tuple(), *fp32_counts.as_tuple(), custom_cost)
+
+
+def begin_span(weights: FlopWeights) -> tuple[int | float, ...]:
+    """Starts a (nested) span & returns its start snapshot, to be passed to end_span()."""
+    start = take_snapshot(weights)
+    _NESTED.append(None)
+    return start
+
+
+def end_span(weights: FlopWeights, start: tuple[int | float, ...]) -> tuple[list[int | float], list[int | float]]:
+    """Ends the innermost span & returns its (inclusive, exclusive) deltas."""
+    inclusive = list(map(operator.sub, take_snapshot(weights), start))
+    nested = _NESTED.pop()
+    if _NESTED:
+        outer = _NESTED[-1]
+        _NESTED[-1] = inclusive if outer is None else list(map(operator.add, outer, inclusive))
+    exclusive = inclusive if nested is None else list(map(operator.sub, inclusive, nested))
+    return inclusive, exclusive
@@ -0,0 +1,227 @@
+"""
+Runtime switching between InstrumentationBackends of CountedFloat.
+
+For each backend, a full set of CountedFloat & CountedFloat32 operator methods is pre-generated from the single op
+table in _counted_float.py.  Switching backends then boils down to re-installing ~20 methods on both classes, which
+is cheap enough to be done on every enter/exit of a FlopCountingContext.  The active backend is determined by the
+currently active contexts (in order of priority):
+
+  - PauseFlopCounting active                    -> DORMANT
+  - FlopCountingContext(backend=TRACING)        -> TRACING
+  - FlopCountingContext(backend=PROFILING)      -> PROFILING
+  - FlopCountingContext()                       -> COUNTING
+  - no active contexts                          -> default backend  (COUNTING, unless configured otherwise)
+
+NOTE: CountedFloat32 is not traced or profiled (TRACING & PROFILING only count its flops, in GLOBAL_COUNTER_FP32);
+other counted types (CountedComplex, CountedInt) always count.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Callable, NamedTuple
+
+from ._counted_float import CountedFloat, _count_factory_global_counter, generate_op_methods, set_op_methods
+from ._counted_float32 import CountedFloat32, _count_factory_global_counter_fp32, generate_fp32_op_methods
+from .models import FlopCounts, FlopType, InstrumentationBackend
+
+
+# =================================================================================================
+#  Sinks for tracing & profiling
+# =================================================================================================
+class TracedOp(NamedTuple):
+    """
+    A single CountedFloat operation, as recorded by the TRACING backend.  Operands & result are kept alive by
+    the trace, such that id(...) can be used to reconstruct dependencies between operations.
+    """
+
+    flop_type: FlopType
+    operands: tuple  # 1 or 2 operands, in evaluation order
+    result: object
+
+
+_TRACE_SINKS: list[list[TracedOp]] = []
+_PROFILE_SINKS: list[dict[str, FlopCounts]] = []
+
+
+# =================================================================================================
+#  Hook factories
+# =================================================================================================
+def _tracing_hook_factory(flop_type: FlopType) -> Callable:
+    count = _count_factory_global_counter(flop_type)
+
+    def hook(left, right, result):
+        count()
+        traced_op = TracedOp(flop_type, (left,) if right is None else (left, right), result)
+        for sink in _TRACE_SINKS:
+            sink.append(traced_op)
+
+    return hook
+
+
+def _profiling_hook_factory(flop_type: FlopType) -> Callable:
+    count = _count_factory_global_counter(flop_type)
+    field_name = flop_type.name
+
+    def hook(left, right, result):
+        count()
+        frame = sys._getframe(2)  # 0: hook, 1: CountedFloat method, 2: caller
+        call_site = f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+        for sink in _PROFILE_SINKS:
+            counts = sink.get(call_site)
+            if counts is None:
+                counts = sink[call_site] = FlopCounts()
+            setattr(counts, field_name, getattr(counts, field_name) + 1)
+
+    return hook
+
+
+# =================================================================================================
+#  Pre-generated methods per backend
+# =================================================================================================
+def _generate_backend_methods(backend: InstrumentationBackend) -> dict[type, dict[str, Callable]]:
+    if backend == InstrumentationBackend.COUNTING:
+        methods = generate_op_methods(count_factory=_count_factory_global_counter)
+    elif backend == InstrumentationBackend.TRACING:
+        methods = generate_op_methods(hook_factory=_tracing_hook_factory)
+    elif backend == InstrumentationBackend.PROFILING:
+        methods = generate_op_methods(hook_factory=_profiling_hook_factory)
+    else:
+        methods = generate_op_methods()
+
+    if backend == InstrumentationBackend.DORMANT:
+        methods_fp32 = generate_fp32_op_methods()
+    else:
+        methods_fp32 = generate_fp32_op_methods(count_factory=_count_factory_global_counter_fp32)
+
+    return {CountedFloat: methods, CountedFloat32: methods_fp32}
+
+
+def _set_backend_methods(methods_per_class: dict[type, dict[str, Callable]]):
+    for cls, methods in methods_per_class.items():
+        set_op_methods(methods, cls)
+
+
+_BACKEND_METHODS: dict[InstrumentationBackend, dict[type, dict[str, Callable]]] = {
+    backend: _generate_backend_methods(backend) for backend in InstrumentationBackend
+}
+
+# variants of the methods above that count using the budget-checking increment methods of the global counters
+# (see _budget.py), generated lazily while budget checks are enabled
+_BUDGETED_BACKEND_METHODS: dict[InstrumentationBackend, dict[type, dict[str, Callable]]] = dict()
+
+
+# =================================================================================================
+#  Backend selection
+# =================================================================================================
+class _BackendState:
+    default_backend: InstrumentationBackend = InstrumentationBackend.COUNTING
+    active_backend: InstrumentationBackend = InstrumentationBackend.COUNTING  # installed at import time
+    n_counting: int = 0  # number of active contexts requesting COUNTING
+    n_paused: int = 0  # number of active PauseFlopCounting contexts
+    budget_checks: bool = False  # True while any FlopCountingContext with a budget is active
+    installed_budgeted: bool = False  # True if the installed methods are budgeted variants
+
+
+def _update_backend():
+    if _BackendState.n_paused:
+        backend = InstrumentationBackend.DORMANT
+    elif _TRACE_SINKS:
+        backend = InstrumentationBackend.TRACING
+    elif _PROFILE_SINKS:
+        backend = InstrumentationBackend.PROFILING
+    elif _BackendState.n_counting:
+        backend = InstrumentationBackend.COUNTING
+    else:
+        backend = _BackendState.default_backend
+
+    budgeted = _BackendState.budget_checks and (backend != InstrumentationBackend.DORMANT)
+    if (backend != _BackendState.active_backend) or (budgeted != _BackendState.installed_budgeted):
+        if budgeted:
+            if backend not in _BUDGETED_BACKEND_METHODS:
+                _BUDGETED_BACKEND_METHODS[backend] = _generate_backend_methods(backend)
+            _set_backend_methods(_BUDGETED_BACKEND_METHODS[backend])
+        else:
+            _set_backend_methods(_BACKEND_METHODS[backend])
+        _BackendState.active_backend = backend
+        _BackendState.installed_budgeted = budgeted
+
+
+def activate_backend(backend: InstrumentationBackend, sink: list | dict | None = None):
+    """Called when a FlopCountingContext becomes active; sink is required for TRACING & PROFILING."""
+    if backend == InstrumentationBackend.COUNTING:
+        _BackendState.n_counting += 1
+    elif backend == InstrumentationBackend.TRACING:
+        if _PROFILE_SINKS:
+            raise RuntimeError("Cannot activate TRACING backend while PROFILING backend is active.")
+        _TRACE_SINKS.append(sink)
+    elif backend == InstrumentationBackend.PROFILING:
+        if _TRACE_SINKS:
+            raise RuntimeError("Cannot activate PROFILING backend while TRACING backend is active.")
+        _PROFILE_SINKS.append(sink)
+    else:
+        raise ValueError(f"Backend {backend} cannot be activated by a FlopCountingContext.")
+    _update_backend()
+
+
+def deactivate_backend(backend: InstrumentationBackend, sink: list | dict | None = None):
+    """Undoes a previous call to activate_backend(...) with the same arguments."""
+    if backend == InstrumentationBackend.COUNTING:
+        _BackendState.n_counting -= 1
+    elif backend == InstrumentationBackend.TRACING:
+        _remove_sink(_TRACE_SINKS, sink)
+    elif backend == InstrumentationBackend.PROFILING:
+        _remove_sink(_PROFILE_SINKS, sink)
+    _update_backend()
+
+
+def pause_backend():
+    """Switches to the DORMANT backend until resume_backend() is called (calls can be nested)."""
+    _BackendState.n_paused += 1
+    _update_backend()
+
+
+def resume_backend():
+    _BackendState.n_paused -= 1
+    _update_backend()
+
+
+def set_budget_checks(enabled: bool):
+    """
+    Switches to/from variants of the CountedFloat (& CountedFloat32) methods that count using the increment methods currently installed
+    on GLOBAL_COUNTER, which are replaced by budget-checking versions while budgets are active (see _budget.py).
+    """
+    _BackendState.budget_checks = enabled
+    _update_backend()
+
+
+def _remove_sink(sinks: list, sink: list | dict):
+    # remove by identity, not by equality
+    for i, s in enumerate(sinks):
+        if s is sink:
+            del sinks[i]
+            return
+
+
+# =================================================================================================
+#  Configuration
+# =================================================================================================
+def get_active_backend() -> InstrumentationBackend:
+    """Returns the InstrumentationBackend currently used by CountedFloat (& CountedFloat32)."""
+    return _BackendState.active_backend
+
+
+def get_default_backend() -> InstrumentationBackend:
+    """Returns the InstrumentationBackend used by CountedFloat while no FlopCountingContext is active."""
+    return _BackendState.default_backend
+
+
+def set_default_backend(backend: InstrumentationBackend):
+    """
+    Sets the InstrumentationBackend used by CountedFloat while no FlopCountingContext is active.  Defaults to COUNTING,
+    such that GLOBAL_COUNTER counts all flops.  Set to DORMANT to avoid any counting overhead outside of contexts.
+    """
+    if backend not in (InstrumentationBackend.DORMANT, InstrumentationBackend.COUNTING):
+        raise ValueError(f"Default backend should be DORMANT or COUNTING, got {backend}.")
+    _BackendState.default_backend = backend
+    _update_backend()
@@ -0,0 +1,205 @@
+"""
+Flop budgets of FlopCountingContexts, to cut off runaway computations:
+
+    with FlopCountingContext(budget=1e6):                                             # raises FlopBudgetExceeded
+        evaluate(candidate)
+
+    with FlopCountingContext(budget=5e5, budget_unit=BudgetUnit.WEIGHTED_COST, on_exceed=callback):
+        evaluate(candidate)                                                           # calls callback(ctx) once
+
+Budgets are checked without computing flop counts or weighted costs after each operation.  Instead, while any budget
+is active, the increment methods of the global counters are replaced by versions that also decrement a single
+countdown by the number of flops counted.  Only when the countdown reaches zero, usage is computed exactly & compared
+with all active budgets, after which the countdown is reset to the minimal number of flops that can still be counted
+before any budget could be exceeded (using the max. weight of any flop type for weighted-cost budgets).  Hence, the
+overhead is a single decrement & comparison per operation, and no overhead at all while no budgets are active.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from counted_float._core.compatibility import StrEnum
+
+from ._backends import _BackendState, set_budget_checks
+from ._global_counter import GLOBAL_COUNTERS, GlobalFlopCounter
+from .config._config import Config
+from .models import FlopType, Precision
+from .models._complex_op_type import ComplexOpType
+from .models._custom_flop_type import _CUSTOM_FLOP_TYPES
+
+if TYPE_CHECKING:
+    from ._context_managers import FlopCountingContext
+
+
+# =================================================================================================
+#  Public classes
+# =================================================================================================
+class BudgetUnit(StrEnum):
+    """Unit in which the budget of a FlopCountingContext is expressed."""
+
+    FLOPS = "flops"  # total number of flops (all precisions, incl. custom flop types)
+    WEIGHTED_COST = "weighted_cost"  # total weighted cost (see FlopCountingContext.total_weighted_cost())
+
+
+class FlopBudgetExceeded(RuntimeError):
+    """Raised when the flops counted by a FlopCountingContext exceed its budget (and no on_exceed callback is set)."""
+
+    def __init__(self, context: FlopCountingContext, budget: float, unit: BudgetUnit, usage: float):
+        super().__init__(f"Flop budget exceeded: {usage:.6g} > {budget:.6g} ({unit}).")
+        self.context = context
+        self.budget = budget
+        self.unit = unit
+        self.usage = usage
+
+
+# =================================================================================================
+#  Budget bookkeeping
+# =================================================================================================
+class _Budget:
+    """Budget of an active FlopCountingContext."""
+
+    __slots__ = ("context", "budget", "unit", "on_exceed", "exceeded")
+
+    def __init__(
+        self,
+        context: FlopCountingContext,
+        budget: float,
+        unit: BudgetUnit,
+        on_exceed: Callable[[FlopCountingContext], None] | None,
+    ):
+        self.context = context
+        self.budget = budget
+        self.unit = unit
+        self.on_exceed = on_exceed
+        self.exceeded = False  # once exceeded, a budget is not checked anymore
+
+    def usage(self) -> float:
+        if self.unit == BudgetUnit.FLOPS:
+            return sum(self.context.flop_counts(precision).total_count() for precision in Precision)
+        else:
+            return self.context.total_weighted_cost()
+
+    def flops_remaining(self, usage: float) -> int:
+        """Min. number of flops that can still be counted without exceeding the budget, +1."""
+        remaining = self.budget - usage
+        if self.unit == BudgetUnit.WEIGHTED_COST:
+            remaining /= _max_weight()
+        return max(int(remaining), 0) + 1
+
+
+_ACTIVE_BUDGETS: list[_Budget] = []
+_NO_BUDGET = 2**62
+
+# flops that can be counted before budgets need to be checked; only decremented while budgets are active
+_countdown: int = _NO_BUDGET
+
+
+def _max_weight() -> float:
+    weights = Config.current_flop_weights()
+    return max(
+        *[max(weights.weight_tuple(precision)) for precision in Precision],
+        *[weights.custom_weight(name) for name in _CUSTOM_FLOP_TYPES],
+    )
+
+
+def _check_budgets():
+    global _countdown
+    _countdown = _NO_BUDGET  # avoid re-entrant checks while computing usage or invoking callbacks
+    exceeded = []
+    for budget in list(_ACTIVE_BUDGETS):
+        usage = budget.usage()
+        if usage > budget.budget:
+            budget.exceeded = True
+            _ACTIVE_BUDGETS.remove(budget)
+            exceeded.append((budget, usage))
+        else:
+            _countdown = min(_countdown, budget.flops_remaining(usage))
+
+    for budget, usage in exceeded:
+        if budget.on_exceed is not None:
+            budget.on_exceed(budget.context)
+        else:
+            raise FlopBudgetExceeded(budget.context, budget.budget, budget.unit, usage)
+
+
+def activate_budget(budget: _Budget):
+    """Called when a FlopCountingContext with a budget becomes active (after it started counting)."""
+    if budget.exceeded:
+        return
+    _install_budgeted_counters()
+    _ACTIVE_BUDGETS.append(budget)
+    _check_budgets()
+
+
+def deactivate_budget(budget: _Budget):
+    """Called when a FlopCountingContext with a budget becomes inactive."""
+    if budget in _ACTIVE_BUDGETS:
+        _ACTIVE_BUDGETS.remove(budget)
+    if not _ACTIVE_BUDGETS:
+        _uninstall_budgeted_counters()
+
+
+# =================================================================================================
+#  Budget-checking increment methods
+# =================================================================================================
+def _budgeted(incr: Callable, n_flops: int) -> Callable:
+    def budgeted_incr():
+        global _countdown
+        incr()
+        _countdown -= n_flops
+        if _countdown <= 0:
+            _check_budgets()
+
+    return budgeted_incr
+
+
+def _budgeted_n(incr: Callable) -> Callable:
+    def budgeted_incr(name_or_flop_type, n: int = 1):
+        global _countdown
+        incr(name_or_flop_type, n)
+        _countdown -= n
+        if _countdown <= 0:
+            _check_budgets()
+
+    return budgeted_incr
+
+
+def _budgeted_methods(counter: GlobalFlopCounter) -> dict[str, Callable]:
+    methods = dict()
+    for flop_type in FlopType:
+        name = f"incr_{flop_type.name.lower()}"
+        methods[name] = _budgeted(getattr(counter, name), 1)
+    for op in ComplexOpType:
+        name = f"incr_complex_{op.name.lower()}"
+        methods[name] = _budgeted(getattr(counter, name), op.flop_counts().total_count())
+    for name in ["incr_flop_type", "incr_custom"]:
+        methods[name] = _budgeted_n(getattr(counter, name))
+    return methods
+
+
+# created once, such that the budgeted CountedFloat methods generated using them (see _backends.py) can be reused
+_BUDGETED_METHODS: dict[GlobalFlopCounter, dict[str, Callable]] = {
+    counter: _budgeted_methods(counter) for counter in GLOBAL_COUNTERS.values()
+}
+
+
+def _install_budgeted_counters():
+    if _BackendState.budget_checks:
+        return
+    # instance attributes take precedence over the class methods for all callers of GLOBAL_COUNTER.incr_...()
+    for counter, methods in _BUDGETED_METHODS.items():
+        for name, method in methods.items():
+            setattr(counter, name, method)
+    set_budget_checks(True)  # CountedFloat methods bind the increment methods when generated
+
+
+def _uninstall_budgeted_counters():
+    global _countdown
+    if not _BackendState.budget_checks:
+        return
+    for counter, methods in _BUDGETED_METHODS.items():
+        for name in methods:
+            delattr(counter, name)
+    set_budget_checks(False)
+    _countdown = _NO_BUDGET
@@ -3,8 +3,28 @@ Context manager that conveniently allows collection of flop counts for the enclo
 as well as providing .pause() and .resume() methods to control flop counting.
 """
 
-from counted_float._core.counting._global_counter import GLOBAL_COUNTER
-from counted_float._core.counting.models import FlopCounts
+from __future__ import annotations
+
+from typing import Callable
+
+from counted_float._core.counting._backends import (
+    TracedOp,
+    activate_backend,
+    deactivate_backend,
+    pause_backend,
+    resume_backend,
+)
+from counted_float._core.counting._budget import BudgetUnit, _Budget, activate_budget, deactivate_budget
+from counted_float._core.counting._global_counter import GLOBAL_COUNTER, GLOBAL_COUNTERS
+from counted_float._core.counting._math_overrides import patch_math_modules, unpatch_math_modules
+from counted_float._core.counting._trace_export import _ACTIVE_EXPORTERS, trace_begin, trace_end
+from counted_float._core.counting.models import (
+    FlopCounts,
+    FlopWeights,
+    InstrumentationBackend,
+    IntOpCounts,
+    Precision,
+)
 
 
 # =================================================================================================
@@ -16,9 +36,22 @@ class FlopCountingContext:
     operations of CountedFloat objects are counted.  So make sure all math uses this type.
 
     Flops need to be registered by either of the following:
-      - calls to register_flops(...)
+      - calls to register_flops(...)  (also for custom flop types, see register_custom_flop_type(...))
       - using CountedFloat() objects in the computations
 
+    Flops are counted separately per Precision (e.g. CountedFloat32 flops are counted as Precision.FP32).
+    Integer operations of CountedInt objects are counted separately as well, see int_op_counts().
+
+    While active (and patch_math=True), math.sqrt, math.log2, math.pow, cmath.sqrt and cmath.polar are replaced by
+    their counted versions; the original builtins are restored as soon as no context is active anymore.  Functions
+    imported before activation (e.g. 'from math import sqrt') are not affected; use counted_float.math instead.
+
+    The backend argument determines how CountedFloat operations are instrumented while the context is active
+    (see InstrumentationBackend):
+      - COUNTING      counting only  (default)
+      - TRACING       + recording of all CountedFloat operations, see trace()
+      - PROFILING     + attribution of CountedFloat flop counts to call sites, see profile()
+
     LIMITATIONS:
         - this context manager is not thread-safe
         - not _all_ floating-point operations are counted, see the docs for more details.
@@ -27,17 +60,51 @@ class FlopCountingContext:
     # -------------------------------------------------------------------------
     #  Constructor
     # -------------------------------------------------------------------------
-    def __init__(self):
+    def __init__(
+        self,
+        patch_math: bool = True,
+        backend: InstrumentationBackend = InstrumentationBackend.COUNTING,
+        budget: float | None = None,
+        budget_unit: BudgetUnit = BudgetUnit.FLOPS,
+        on_exceed: Callable[[FlopCountingContext], None] | None = None,
+    ):
+        """
+        :param budget: optional max. number of flops or weighted cost (see budget_unit) counted by this context;
+                         when exceeded, on_exceed(context) is called once, or FlopBudgetExceeded is raised if no
+                         callback is provided (see _budget.py for details)
+        """
+        # scoped patching of math & cmath modules, while active
+        self.__patch_math: bool = patch_math
+
+        # optional budget, checked while active
+        if (budget is not None) and (budget < 0):
+            raise ValueError(f"budget should be >= 0, got {budget}.")
+        self.__budget: _Budget | None = (
+            _Budget(self, budget, BudgetUnit(budget_unit), on_exceed) if budget is not None else None
+        )
+
+        # CountedFloat instrumentation, while active  (+ sinks for the TRACING & PROFILING backends)
+        if backend == InstrumentationBackend.DORMANT:
+            raise ValueError("FlopCountingContext cannot use the DORMANT backend; use PauseFlopCounting instead.")
+        self.__backend: InstrumentationBackend = InstrumentationBackend(backend)
+        self.__trace: list[TracedOp] = []
+        self.__profile: dict[str, FlopCounts] = dict()
+
         # Active/inactive flag  (toggled by __enter__ and __exit__ + by pause() and resume() methods)
         # When inactive:
         #   - current count == self.__cnt_subtotal
         # When active:
-        #   - current count == GLOBAL_COUNTER - self.__cnt_start_snapshot
+        #   - current count == GLOBAL_COUNTERS - self.__cnt_start_snapshot
+        # (all bookkeeping is done per precision)
         self.__active: bool = False
 
         # flop count bookkeeping
-        self.__cnt_subtotal: FlopCounts = FlopCounts()
-        self.__cnt_start_snapshot: FlopCounts = FlopCounts()
+        self.__cnt_subtotal: dict[Precision, FlopCounts] = {precision: FlopCounts() for precision in Precision}
+        self.__cnt_start_snapshot: dict[Precision, FlopCounts] = {precision: FlopCounts() for precision in Precision}
+
+        # int op count bookkeeping  (same logic as above, using GLOBAL_COUNTER.int_op_counts())
+        self.__int_cnt_subtotal: IntOpCounts = IntOpCounts()
+        self.__int_cnt_start_snapshot: IntOpCounts = IntOpCounts()
 
     # -------------------------------------------------------------------------
     #  Properties
@@ -45,37 +112,111 @@ class FlopCountingContext:
     def is_active(self) -> bool:
         return self.__active
 
-    def flop_counts(self) -> FlopCounts:
-        """Returns current total flop count for this context manager.  See constructor comments for details."""
+    def flop_counts(self, precision: Precision = Precision.FP64) -> FlopCounts:
+        """
+        Returns current total flop count of the requested precision for this context manager.
+        See constructor comments for details.
+        """
         if self.__active:
-            return GLOBAL_COUNTER.flop_counts() - self.__cnt_start_snapshot
+            return GLOBAL_COUNTERS[precision].flop_counts() - self.__cnt_start_snapshot[precision]
         else:
-            return self.__cnt_subtotal.copy()
+            return self.__cnt_subtotal[precision].copy()
+
+    def int_op_counts(self) -> IntOpCounts:
+        """
+        Returns current total integer operation count for this context manager.
+        """
+        if self.__active:
+            return GLOBAL_COUNTER.int_op_counts() - self.__int_cnt_start_snapshot
+        else:
+            return self.__int_cnt_subtotal.copy()
+
+    def trace(self) -> list[TracedOp]:
+        """
+        Returns all CountedFloat operations recorded so far by this context (requires backend=TRACING).
+        """
+        self.__check_backend(InstrumentationBackend.TRACING)
+        return list(self.__trace)
+
+    def profile(self) -> dict[str, FlopCounts]:
+        """
+        Returns the CountedFloat flop counts recorded so far by this context, per call site (requires
+        backend=PROFILING).  Call sites are formatted as '<filename>:<line number> (<function name>)'.
+        """
+        self.__check_backend(InstrumentationBackend.PROFILING)
+        return {call_site: counts.copy() for call_site, counts in self.__profile.items()}
+
+    def __check_backend(self, backend: InstrumentationBackend):
+        if self.__backend != backend:
+            raise ValueError(f"This functionality requires backend={backend}, got backend={self.__backend}.")
+
+    def budget_exceeded(self) -> bool:
+        """True if this context has a budget, which has been exceeded."""
+        return (self.__budget is not None) and self.__budget.exceeded
+
+    def total_weighted_cost(self, weights: FlopWeights | None = None) -> float:
+        """
+        Returns the total weighted cost of all flops counted by this context manager, summed over all precisions,
+        each using the weights of the corresponding precision.  See FlopCounts.total_weighted_cost() for details.
+        """
+        return sum(
+            self.flop_counts(precision).total_weighted_cost(weights=weights, precision=precision)
+            for precision in Precision
+        )
 
     # -------------------------------------------------------------------------
     #  Pause/Resume
     # -------------------------------------------------------------------------
     def pause(self):
         if self.__active:
-            self.__cnt_subtotal = self.flop_counts()
-            self.__cnt_start_snapshot = FlopCounts()
+            self.__cnt_subtotal = {precision: self.flop_counts(precision) for precision in Precision}
+            self.__cnt_start_snapshot = {precision: FlopCounts() for precision in Precision}
+            self.__int_cnt_subtotal = self.int_op_counts()
+            self.__int_cnt_start_snapshot = IntOpCounts()
             self.__active = False
+            if self.__budget is not None:
+                deactivate_budget(self.__budget)
+            deactivate_backend(self.__backend, self.__sink())
+            if self.__patch_math:
+                unpatch_math_modules()
 
     def resume(self):
         if not self.__active:
-            self.__cnt_start_snapshot = GLOBAL_COUNTER.flop_counts() - self.__cnt_subtotal
-            self.__cnt_subtotal = FlopCounts()
+            self.__cnt_start_snapshot = {
+                precision: GLOBAL_COUNTERS[precision].flop_counts() - self.__cnt_subtotal[precision]
+                for precision in Precision
+            }
+            self.__cnt_subtotal = {precision: FlopCounts() for precision in Precision}
+            self.__int_cnt_start_snapshot = GLOBAL_COUNTER.int_op_counts() - self.__int_cnt_subtotal
+            self.__int_cnt_subtotal = IntOpCounts()
+            activate_backend(self.__backend, self.__sink())
             self.__active = True
+            if self.__patch_math:
+                patch_math_modules()
+            if self.__budget is not None:
+                activate_budget(self.__budget)
+
+    def __sink(self) -> list | dict | None:
+        if self.__backend == InstrumentationBackend.TRACING:
+            return self.__trace
+        elif self.__backend == InstrumentationBackend.PROFILING:
+            return self.__profile
+        else:
+            return None
 
     # -------------------------------------------------------------------------
     #  Context manager interface
     # -------------------------------------------------------------------------
     def __enter__(self):
+        if _ACTIVE_EXPORTERS:
+            trace_begin("FlopCountingContext", "context")
         self.resume()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.pause()
+        if _ACTIVE_EXPORTERS:
+            trace_end("FlopCountingContext", "context", self.total_weighted_cost(), self.flop_counts().as_tuple())
 
 
 # =================================================================================================
@@ -88,8 +229,12 @@ class PauseFlopCounting:
     """
 
     def __enter__(self):
-        GLOBAL_COUNTER.pause()
+        for counter in GLOBAL_COUNTERS.values():
+            counter.pause()
+        pause_backend()  # CountedFloat & CountedFloat32 operations run without any counting overhead
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        GLOBAL_COUNTER.resume()
+        resume_backend()
+        for counter in GLOBAL_COUNTERS.values():
+            counter.resume()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from ._counted_float import CountedFloat
+from ._global_counter import GLOBAL_COUNTER
+from ._numpy_interop import array_ufunc
+
+
+class CountedComplex(complex):
+    """
+    Counterpart of CountedFloat for complex numbers.  Each complex operation is counted as its decomposition into
+    real-valued flops (see ComplexOpType), which are booked into the global counter in a single increment per op.
+
+    Just like CountedFloat, this class is 'contagious':
+      - results of operations with at least one CountedComplex operand are CountedComplex
+      - operations between a CountedFloat (left operand) and a complex number result in a CountedComplex; for a
+         plain complex left operand (e.g. 1j * cf), Python lets complex evaluate the operation without consulting
+         CountedFloat, such that it is not counted (unless the complex operand is a CountedComplex)
+      - the .real and .imag attributes are returned as CountedFloat
+    """
+
+    # -------------------------------------------------------------------------
+    #  CONSTRUCTOR
+    # -------------------------------------------------------------------------
+    def __new__(cls, real: complex | float = 0.0, imag: float | None = None):
+        if imag is None:
+            return super().__new__(cls, real)
+        else:
+            return super().__new__(cls, real, imag)
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return f"CountedComplex({super().__repr__()})"
+
+    def __hash__(self):
+        return super().__hash__()
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # make sure mixed arithmetic with numpy scalars is counted (see _numpy_interop)
+        return array_ufunc(ufunc, method, *inputs, **kwargs)
+
+    # -------------------------------------------------------------------------
+    #  PROPERTIES
+    # -------------------------------------------------------------------------
+    @property
+    def real(self) -> CountedFloat:
+        return CountedFloat(super().real)
+
+    @property
+    def imag(self) -> CountedFloat:
+        return CountedFloat(super().imag)
+
+    # -------------------------------------------------------------------------
+    #  OVERLOADED MATH OPERATIONS
+    # -------------------------------------------------------------------------
+    def __abs__(self) -> CountedFloat:
+        """abs(z)"""
+        GLOBAL_COUNTER.incr_complex_abs()
+        return CountedFloat(super().__abs__())
+
+    def __neg__(self) -> CountedComplex:
+        """-z"""
+        GLOBAL_COUNTER.incr_complex_minus()
+        return CountedComplex(super().__neg__())
+
+    def conjugate(self) -> CountedComplex:
+        """z.conjugate()"""
+        GLOBAL_COUNTER.incr_complex_conj()
+        return CountedComplex(super().conjugate())
+
+    def __eq__(self, other) -> bool:
+        """z==other or other==z"""
+        result = super().__eq__(other)
+        if result is not NotImplemented:
+            GLOBAL_COUNTER.incr_complex_equals()
+        return result
+
+    def __ne__(self, other) -> bool:
+        """z!=other or other!=z"""
+        result = super().__ne__(other)
+        if result is not NotImplemented:
+            GLOBAL_COUNTER.incr_complex_equals()
+        return result
+
+    def __add__(self, other) -> CountedComplex:
+        """z+other"""
+        result = super().__add__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_complex_add()
+        return CountedComplex(result)
+
+    def __radd__(self, other) -> CountedComplex:
+        """other+z"""
+        result = super().__radd__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_complex_add()
+        return CountedComplex(result)
+
+    def __sub__(self, other) -> CountedComplex:
+        """z-other"""
+        result = super().__sub__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_complex_sub()
+        return CountedComplex(result)
+
+    def __rsub__(self, other) -> CountedComplex:
+        """other-z"""
+        result = super().__rsub__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_complex_sub()
+        return CountedComplex(result)
+
+    def __mul__(self, other) -> CountedComplex:
+        """z*other"""
+        result = super().__mul__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_complex_mul()
+        return CountedComplex(result)
+
+    def __rmul__(self, other) -> CountedComplex:
+        """other*z"""
+        result = super().__rmul__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_complex_mul()
+        return CountedComplex(result)
+
+    def __truediv__(self, other) -> CountedComplex:
+        """z/other"""
+        result = super().__truediv__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_complex_div()
+        return CountedComplex(result)
+
+    def __rtruediv__(self, other) -> CountedComplex:
+        """other/z"""
+        result = super().__rtruediv__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_complex_div()
+        return CountedComplex(result)
+
+    def __pow__(self, other) -> CountedComplex:
+        """z**other"""
+        result = super().__pow__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        if isinstance(other, int) and int(other) == 2:
+            GLOBAL_COUNTER.incr_complex_mul()  # z^2 = z*z
+        else:
+            GLOBAL_COUNTER.incr_complex_pow()
+        return CountedComplex(result)
+
+    def __rpow__(self, other) -> CountedComplex:
+        """other**z"""
+        result = super().__rpow__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_complex_pow()
+        return CountedComplex(result)
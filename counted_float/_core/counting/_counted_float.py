@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import math
+import operator
+from dataclasses import dataclass
+from typing import Callable
 
 from ._global_counter import GLOBAL_COUNTER
-from .models import FlopCounts
+from ._numpy_interop import array_ufunc
+from .models import FlopCounts, FlopType
 
 
 class CountedFloat(float):
@@ -33,169 +36,245 @@ class CountedFloat(float):
     def __hash__(self):
         return super().__hash__()
 
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # make sure mixed arithmetic with numpy scalars is counted (see _numpy_interop)
+        return array_ufunc(ufunc, method, *inputs, **kwargs)
+
     # -------------------------------------------------------------------------
     #  OVERLOADED MATH OPERATIONS
     # -------------------------------------------------------------------------
-    def __abs__(self) -> CountedFloat:
-        """abs(x)"""
-        GLOBAL_COUNTER.incr_abs()
-        return CountedFloat(super().__abs__())
-
-    def __neg__(self) -> CountedFloat:
-        """-x"""
-        GLOBAL_COUNTER.incr_minus()
-        return CountedFloat(super().__neg__())
-
-    def __eq__(self, other) -> bool:
-        """x==other or other==x"""
-        if isinstance(other, int) and other == 0:
-            GLOBAL_COUNTER.incr_cmp_zero()
-        else:
-            GLOBAL_COUNTER.incr_equals()
-        return super().__eq__(other)
+    # generated from _OP_TABLE below & installed by set_op_methods(...), such that they can be swapped at runtime
+    # depending on the active InstrumentationBackend (see _backends.py)
 
-    def __ne__(self, other) -> bool:
-        """x!=other or other!=x"""
-        if isinstance(other, int) and other == 0:
-            GLOBAL_COUNTER.incr_cmp_zero()
-        else:
-            GLOBAL_COUNTER.incr_equals()
-        return super().__ne__(other)
 
-    def __lt__(self, other):
-        """x<other"""
-        if isinstance(other, int) and other == 0:
-            GLOBAL_COUNTER.incr_cmp_zero()
-        else:
-            GLOBAL_COUNTER.incr_lte()
-        return super().__lt__(other)
+# -------------------------------------------------------------------------
+#  interoperability with complex numbers
+# -------------------------------------------------------------------------
+def _complex_fallback(op: Callable, x: CountedFloat, other, reflected: bool):
+    """
+    Fallback for binary operations that float does not support (i.e. returned NotImplemented).  If the other operand
+    is complex, x is promoted to a CountedComplex, such that the operation is counted as a complex operation and
+    the result is a CountedComplex.  Otherwise, we return NotImplemented to let Python try the other operand.
+    """
+    if not isinstance(other, complex):
+        return NotImplemented
+
+    from ._counted_complex import CountedComplex
+
+    if reflected:
+        return op(other, CountedComplex(x))
+    else:
+        return op(CountedComplex(x), other)
 
-    def __le__(self, other):
-        """x<=other"""
-        if isinstance(other, int) and other == 0:
-            GLOBAL_COUNTER.incr_cmp_zero()
-        else:
-            GLOBAL_COUNTER.incr_lte()
-        return super().__le__(other)
 
-    def __gt__(self, other):
-        """x>other"""
-        if isinstance(other, int) and other == 0:
-            GLOBAL_COUNTER.incr_cmp_zero()
-        else:
-            GLOBAL_COUNTER.incr_gte()
-        return super().__gt__(other)
+def _as_counted_complex(value: complex):
+    from ._counted_complex import CountedComplex
 
-    def __ge__(self, other):
-        """x>=other"""
-        if isinstance(other, int) and other == 0:
-            GLOBAL_COUNTER.incr_cmp_zero()
-        else:
-            GLOBAL_COUNTER.incr_gte()
-        return super().__ge__(other)
-
-    def __round__(self, n=None) -> int:
-        """round(x, n)"""
-        if n:
-            raise ValueError("only n==None or n==0 are supported in a CountedFloat")
-        GLOBAL_COUNTER.incr_rnd()  # assuming n=0, otherwise we can't reliably count the flops
-        return super().__round__()
-
-    def __floor__(self) -> int:
-        """math.floor(x)"""
-        GLOBAL_COUNTER.incr_rnd()
-        return super().__floor__()
-
-    def __ceil__(self) -> int:
-        """math.ceil(x)"""
-        GLOBAL_COUNTER.incr_rnd()
-        return super().__ceil__()
-
-    def __add__(self, other) -> CountedFloat:
-        """x+other"""
-        GLOBAL_COUNTER.incr_add()
-        return CountedFloat(super().__add__(other))
-
-    def __radd__(self, other) -> CountedFloat:
-        """other+x"""
-        GLOBAL_COUNTER.incr_add()
-        return CountedFloat(super().__radd__(other))
-
-    def __sub__(self, other) -> CountedFloat:
-        """x-other"""
-        GLOBAL_COUNTER.incr_sub()
-        return CountedFloat(super().__sub__(other))
-
-    def __rsub__(self, other) -> CountedFloat:
-        """other-x"""
-        GLOBAL_COUNTER.incr_sub()
-        return CountedFloat(super().__rsub__(other))
-
-    def __mul__(self, other) -> CountedFloat:
-        """x*other or other*x"""
-        GLOBAL_COUNTER.incr_mul()
-        return CountedFloat(super().__mul__(other))
-
-    def __rmul__(self, other) -> CountedFloat:
-        """other*x"""
-        GLOBAL_COUNTER.incr_mul()
-        return CountedFloat(super().__rmul__(other))
-
-    def __truediv__(self, other) -> CountedFloat:
-        """x/other"""
-        GLOBAL_COUNTER.incr_div()
-        return CountedFloat(super().__truediv__(other))
-
-    def __rtruediv__(self, other) -> CountedFloat:
-        """other/x"""
-        GLOBAL_COUNTER.incr_div()
-        return CountedFloat(super().__rtruediv__(other))
-
-    def __pow__(self, other) -> CountedFloat:
-        """x**other"""
-        if isinstance(other, int) and other == 2:
-            GLOBAL_COUNTER.incr_mul()  # x^2 = x*x
-        else:
-            GLOBAL_COUNTER.incr_pow()
-        return CountedFloat(super().__pow__(other))
-
-    def __rpow__(self, other) -> CountedFloat:
-        """other**x"""
-        if isinstance(other, int) and other == 2:
-            GLOBAL_COUNTER.incr_pow2()
-        else:
-            GLOBAL_COUNTER.incr_pow()
-        return CountedFloat(super().__rpow__(other))
+    return CountedComplex(value)
 
 
 # -------------------------------------------------------------------------
-#  override some methods of math module
+#  op table
 # -------------------------------------------------------------------------
-original_math_sqrt = math.sqrt
-original_math_log2 = math.log2
+@dataclass(frozen=True)
+class _Op:
+    """Specification of 1 overloaded operation of CountedFloat (and CountedFloat32)."""
+
+    name: str  # name of the dunder method, e.g. "__add__"
+    kind: str  # one of the _TEMPLATES keys
+    doc: str
+    flop_type: FlopType
+    operator: Callable | None = None  # for complex fallback of binary operations
+    reflected: bool = False
+    special_value: int | None = None  # if other == special_value, special_flop_type is counted instead
+    special_flop_type: FlopType | None = None
+
+
+_OP_TABLE: list[_Op] = [
+    _Op("__abs__", "unary", "abs(x)", FlopType.ABS),
+    _Op("__neg__", "unary", "-x", FlopType.MINUS),
+    _Op("__eq__", "cmp", "x==other or other==x", FlopType.EQUALS, special_value=0, special_flop_type=FlopType.CMP_ZERO),
+    _Op("__ne__", "cmp", "x!=other or other!=x", FlopType.EQUALS, special_value=0, special_flop_type=FlopType.CMP_ZERO),
+    _Op("__lt__", "cmp", "x<other", FlopType.LTE, special_value=0, special_flop_type=FlopType.CMP_ZERO),
+    _Op("__le__", "cmp", "x<=other", FlopType.LTE, special_value=0, special_flop_type=FlopType.CMP_ZERO),
+    _Op("__gt__", "cmp", "x>other", FlopType.GTE, special_value=0, special_flop_type=FlopType.CMP_ZERO),
+    _Op("__ge__", "cmp", "x>=other", FlopType.GTE, special_value=0, special_flop_type=FlopType.CMP_ZERO),
+    _Op("__round__", "round", "round(x, n)", FlopType.RND),
+    _Op("__floor__", "round", "math.floor(x)", FlopType.RND),
+    _Op("__ceil__", "round", "math.ceil(x)", FlopType.RND),
+    _Op("__add__", "binary", "x+other", FlopType.ADD, operator.add),
+    _Op("__radd__", "binary", "other+x", FlopType.ADD, operator.add, reflected=True),
+    _Op("__sub__", "binary", "x-other", FlopType.SUB, operator.sub),
+    _Op("__rsub__", "binary", "other-x", FlopType.SUB, operator.sub, reflected=True),
+    _Op("__mul__", "binary", "x*other", FlopType.MUL, operator.mul),
+    _Op("__rmul__", "binary", "other*x", FlopType.MUL, operator.mul, reflected=True),
+    _Op("__truediv__", "binary", "x/other", FlopType.DIV, operator.truediv),
+    _Op("__rtruediv__", "binary", "other/x", FlopType.DIV, operator.truediv, reflected=True),
+    # x**2 = x*x  &  2**x = POW2
+    _Op("__pow__", "pow", "x**other", FlopType.POW, operator.pow, special_value=2, special_flop_type=FlopType.MUL),
+    _Op(
+        "__rpow__",
+        "pow",
+        "other**x",
+        FlopType.POW,
+        operator.pow,
+        True,
+        special_value=2,
+        special_flop_type=FlopType.POW2,
+    ),
+]
 
 
-def math_sqrt(x: float) -> float | CountedFloat:
-    if isinstance(x, CountedFloat):
-        GLOBAL_COUNTER.incr_sqrt()
-        return CountedFloat(original_math_sqrt(x))
+# -------------------------------------------------------------------------
+#  method generation
+# -------------------------------------------------------------------------
+# Methods are generated from source templates (cf. dataclasses), such that each backend gets its own straight-line
+# implementation without any runtime checks of which backend is active.  {count} is replaced by the counting code
+# of the backend (or removed entirely for backends that don't count).
+_TEMPLATES: dict[str, str] = {
+    "unary": """
+def {name}(self):
+    result = _new(_cls, _float_op(self))
+    {count}
+    return result
+""",
+    "cmp": """
+def {name}(self, other):
+    {defer}
+    result = _float_op(self, other)
+    if result is NotImplemented:
+        return result  # e.g. numpy scalars, handled by reflected operation
+    {count}
+    return result
+""",
+    "round": """
+def {name}(self, n=None):
+    if n:
+        raise ValueError("only n==None or n==0 are supported in a {cls_name}")
+    result = _float_op(self)  # assuming n=0, otherwise we can't reliably count the flops
+    {count}
+    return result
+""",
+    "binary": """
+def {name}(self, other):
+    {defer}
+    result = _float_op(self, other)
+    if result is NotImplemented:
+        return _complex_fallback(_operator, self, other, reflected={reflected})
+    result = _new(_cls, result)
+    {count}
+    return result
+""",
+    "pow": """
+def {name}(self, other):
+    {defer}
+    result = _float_op(self, other)
+    if result is NotImplemented:
+        return _complex_fallback(_operator, self, other, reflected={reflected})
+    if isinstance(result, complex):
+        result = _as_counted_complex(result)  # e.g. (-8.0)**(1/3)
+    else:
+        result = _new(_cls, result)
+    {count}
+    return result
+""",
+}
+
+
+def generate_op_methods(
+    count_factory: Callable[[FlopType], Callable[[], None]] | None = None,
+    hook_factory: Callable[[FlopType], Callable[[float, object, object], None]] | None = None,
+    cls: type[float] | None = None,
+    new: Callable[[type, float], float] = float.__new__,
+    defer_types: tuple[type, ...] = (),
+) -> dict[str, Callable]:
+    """
+    Generates all overloaded operations of CountedFloat (or of another float subclass) as specified in _OP_TABLE,
+    with counting implemented by (at most) one of the following:
+
+      - count_factory(flop_type) -> count()                           : fast path, e.g. GLOBAL_COUNTER.incr_add
+      - hook_factory(flop_type)  -> hook(left, right, result)         : operands are passed in evaluation order;
+                                                                          right is None for unary operations
+
+    If neither is provided, methods are generated without any counting code.
+
+    :param cls: class of the results (default: CountedFloat), e.g. CountedFloat32
+    :param new: new(cls, value) -> result, e.g. rounding to fp32 (default: float.__new__, bypassing cls.__new__)
+    :param defer_types: operand types for which binary operations & comparisons return NotImplemented, such that
+                          they are evaluated (& counted) by the other operand, e.g. fp64 operands of CountedFloat32
+    """
+    cls = cls or CountedFloat
+    if defer_types:
+        defer_code = (
+            "if isinstance(other, _defer_types):\n"
+            "        return NotImplemented  # evaluated & counted by the other operand"
+        )
     else:
-        return original_math_sqrt(x)
+        defer_code = ""
+
+    methods = dict()
+    for op in _OP_TABLE:
+        namespace = dict(
+            _cls=cls,
+            _new=new,
+            _defer_types=defer_types,
+            _float_op=getattr(float, op.name),
+            _operator=op.operator,
+            _complex_fallback=_complex_fallback,
+            _as_counted_complex=_as_counted_complex,
+        )
+        if count_factory is not None:
+            namespace.update(count=count_factory(op.flop_type))
+            count_code = "count()"
+            special_count_code = "count_special()"
+            if op.special_flop_type is not None:
+                namespace.update(count_special=count_factory(op.special_flop_type))
+        elif hook_factory is not None:
+            namespace.update(count=hook_factory(op.flop_type))
+            if op.kind in ("unary", "round"):
+                operands = "self, None"
+            elif op.reflected:
+                operands = "other, self"
+            else:
+                operands = "self, other"
+            count_code = f"count({operands}, result)"
+            special_count_code = f"count_special({operands}, result)"
+            if op.special_flop_type is not None:
+                namespace.update(count_special=hook_factory(op.special_flop_type))
+        else:
+            count_code = special_count_code = ""
 
+        if count_code and (op.special_flop_type is not None):
+            # NOTE: int(other) makes sure the check itself is not counted when other is a CountedInt
+            count_code = (
+                f"if isinstance(other, int) and int(other) == {op.special_value}:\n"
+                f"        {special_count_code}\n"
+                f"    else:\n"
+                f"        {count_code}"
+            )
 
-def math_log2(x: float) -> float | CountedFloat:
-    if isinstance(x, CountedFloat):
-        GLOBAL_COUNTER.incr_log2()
-        return CountedFloat(original_math_log2(x))
-    else:
-        return original_math_log2(x)
+        source = _TEMPLATES[op.kind].format(
+            name=op.name, count=count_code, reflected=op.reflected, defer=defer_code, cls_name=cls.__name__
+        )
+        exec(source, namespace)
+        method = namespace[op.name]
+        method.__doc__ = op.doc
+        method.__qualname__ = f"{cls.__name__}.{op.name}"
+        methods[op.name] = method
+
+    return methods
+
+
+def set_op_methods(methods: dict[str, Callable], cls: type[float] | None = None):
+    """Installs methods generated by generate_op_methods(...) on the CountedFloat class (or on cls)."""
+    cls = cls or CountedFloat
+    for name, method in methods.items():
+        setattr(cls, name, method)
 
 
-def math_pow(x: float, y: float) -> float | CountedFloat:
-    return x**y
+def _count_factory_global_counter(flop_type: FlopType) -> Callable[[], None]:
+    return getattr(GLOBAL_COUNTER, f"incr_{flop_type.name.lower()}")
 
 
-# override math module methods
-math.sqrt = math_sqrt
-math.log2 = math_log2
-math.pow = math_pow
+# CountedFloat counts in GLOBAL_COUNTER by default (i.e. InstrumentationBackend.COUNTING)
+set_op_methods(generate_op_methods(count_factory=_count_factory_global_counter))
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from ._counted_float import CountedFloat, generate_op_methods, set_op_methods
+from ._global_counter import GLOBAL_COUNTER_FP32
+from ._numpy_interop import array_ufunc
+from .models import FlopCounts, FlopType
+
+# operand types that make us defer to fp64 evaluation & counting; np.float64 is converted to CountedFloat by numpy's
+# __array_ufunc__ mechanism after we return NotImplemented (see _numpy_interop)
+_FP64_TYPES = (CountedFloat, np.float64)
+
+
+class CountedFloat32(float):
+    """
+    Single-precision counterpart of CountedFloat.  Values are stored as a Python float, but are always rounded to the
+    nearest fp32 value (using numpy), such that results of all operations are identical to the results of the
+    corresponding fp32 operations.  Flops are counted as Precision.FP32 flops.
+
+    Contagion rules:
+      - CountedFloat32 (op) float/int       -> CountedFloat32   (counted as fp32)
+      - CountedFloat32 (op) CountedFloat    -> CountedFloat     (counted as fp64, as numpy would do for fp32 & fp64)
+      - CountedFloat32 (op) np.float64      -> CountedFloat     (idem, see _numpy_interop)
+    """
+
+    # -------------------------------------------------------------------------
+    #  FLOP COUNTING
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get_global_flop_counts(cls) -> FlopCounts:
+        """
+        Returns the global FLOP counts for all CountedFloat32 instances.
+        """
+        return GLOBAL_COUNTER_FP32.flop_counts()
+
+    # -------------------------------------------------------------------------
+    #  CONSTRUCTOR
+    # -------------------------------------------------------------------------
+    def __new__(cls, value: float):
+        self = super().__new__(cls, np.float32(value))
+        return self
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return f"CountedFloat32({str(np.float32(self))})"
+
+    def __hash__(self):
+        return super().__hash__()
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # make sure mixed arithmetic with numpy scalars is counted (see _numpy_interop)
+        return array_ufunc(ufunc, method, *inputs, **kwargs)
+
+    # -------------------------------------------------------------------------
+    #  OVERLOADED MATH OPERATIONS
+    # -------------------------------------------------------------------------
+    # generated from the op table of CountedFloat & installed by set_op_methods(...), such that they can be swapped
+    # at runtime depending on the active InstrumentationBackend (see _backends.py)
+
+
+# -------------------------------------------------------------------------
+#  method generation
+# -------------------------------------------------------------------------
+_float32 = np.float32
+
+
+def _new_fp32(cls: type, value: float) -> CountedFloat32:
+    return float.__new__(cls, _float32(value))  # rounded to fp32, bypassing CountedFloat32.__new__
+
+
+def generate_fp32_op_methods(
+    count_factory: Callable[[FlopType], Callable[[], None]] | None = None,
+) -> dict[str, Callable]:
+    """Generates all overloaded operations of CountedFloat32 (see generate_op_methods), counting using count_factory."""
+    return generate_op_methods(count_factory=count_factory, cls=CountedFloat32, new=_new_fp32, defer_types=_FP64_TYPES)
+
+
+def _count_factory_global_counter_fp32(flop_type: FlopType) -> Callable[[], None]:
+    return getattr(GLOBAL_COUNTER_FP32, f"incr_{flop_type.name.lower()}")
+
+
+# CountedFloat32 counts in GLOBAL_COUNTER_FP32 by default (i.e. InstrumentationBackend.COUNTING)
+set_op_methods(generate_fp32_op_methods(count_factory=_count_factory_global_counter_fp32), CountedFloat32)
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import operator
+from typing import Callable
+
+from ._counted_complex import CountedComplex
+from ._counted_float import CountedFloat
+from ._counted_float32 import CountedFloat32
+from ._global_counter import GLOBAL_COUNTER
+from ._numpy_interop import array_ufunc
+from .models import IntOpCounts
+
+
+class CountedInt(int):
+    """
+    Integer counterpart of CountedFloat.  Integer operations are counted per IntOpType in the global counter
+    (see GLOBAL_COUNTER.int_op_counts() and FlopCountingContext.int_op_counts()).
+
+    Contagion rules:
+      - CountedInt (op) int                         -> CountedInt       (counted as int op)
+      - CountedInt / int                            -> CountedFloat     (counted as fp64 FlopType.DIV)
+      - CountedInt (op) float                       -> CountedFloat     (counted as fp64 flop)
+      - CountedInt (op) CountedFloat(32)/Complex    -> handled by the counted float/complex type
+      - float (op) CountedInt                       -> float            (NOT counted, float takes precedence)
+    """
+
+    # -------------------------------------------------------------------------
+    #  INT OP COUNTING
+    # -------------------------------------------------------------------------
+    @classmethod
+    def get_global_int_op_counts(cls) -> IntOpCounts:
+        """
+        Returns the global integer operation counts for all CountedInt instances.
+        """
+        return GLOBAL_COUNTER.int_op_counts()
+
+    # -------------------------------------------------------------------------
+    #  CONSTRUCTOR
+    # -------------------------------------------------------------------------
+    def __new__(cls, value: int = 0):
+        self = super().__new__(cls, value)
+        return self
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return f"CountedInt({super().__repr__()})"
+
+    def __hash__(self):
+        return super().__hash__()
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # make sure mixed arithmetic with numpy scalars is counted (see _numpy_interop)
+        return array_ufunc(ufunc, method, *inputs, **kwargs)
+
+    # -------------------------------------------------------------------------
+    #  UNCOUNTED OPERATIONS  (no-ops for integers, only preserving the type)
+    # -------------------------------------------------------------------------
+    def __pos__(self) -> CountedInt:
+        """+i"""
+        return CountedInt(self)
+
+    def __round__(self, n=None) -> CountedInt:
+        """round(i, n)"""
+        return CountedInt(super().__round__() if n is None else super().__round__(n))
+
+    def __floor__(self) -> CountedInt:
+        """math.floor(i)"""
+        return CountedInt(self)
+
+    def __ceil__(self) -> CountedInt:
+        """math.ceil(i)"""
+        return CountedInt(self)
+
+    def __trunc__(self) -> CountedInt:
+        """math.trunc(i)"""
+        return CountedInt(self)
+
+    # -------------------------------------------------------------------------
+    #  OVERLOADED MATH OPERATIONS - unary
+    # -------------------------------------------------------------------------
+    def __abs__(self) -> CountedInt:
+        """abs(i)"""
+        GLOBAL_COUNTER.incr_int_add()
+        return CountedInt(super().__abs__())
+
+    def __neg__(self) -> CountedInt:
+        """-i"""
+        GLOBAL_COUNTER.incr_int_add()
+        return CountedInt(super().__neg__())
+
+    def __invert__(self) -> CountedInt:
+        """~i"""
+        GLOBAL_COUNTER.incr_int_bitwise()
+        return CountedInt(super().__invert__())
+
+    # -------------------------------------------------------------------------
+    #  OVERLOADED MATH OPERATIONS - comparisons
+    # -------------------------------------------------------------------------
+    def __eq__(self, other) -> bool:
+        """i==other or other==i"""
+        result = super().__eq__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.eq, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_cmp()
+        return result
+
+    def __ne__(self, other) -> bool:
+        """i!=other or other!=i"""
+        result = super().__ne__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.ne, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_cmp()
+        return result
+
+    def __lt__(self, other) -> bool:
+        """i<other"""
+        result = super().__lt__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.lt, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_cmp()
+        return result
+
+    def __le__(self, other) -> bool:
+        """i<=other"""
+        result = super().__le__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.le, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_cmp()
+        return result
+
+    def __gt__(self, other) -> bool:
+        """i>other"""
+        result = super().__gt__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.gt, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_cmp()
+        return result
+
+    def __ge__(self, other) -> bool:
+        """i>=other"""
+        result = super().__ge__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.ge, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_cmp()
+        return result
+
+    # -------------------------------------------------------------------------
+    #  OVERLOADED MATH OPERATIONS - arithmetic
+    # -------------------------------------------------------------------------
+    def __add__(self, other) -> CountedInt:
+        """i+other"""
+        result = super().__add__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.add, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_add()
+        return CountedInt(result)
+
+    def __radd__(self, other) -> CountedInt:
+        """other+i"""
+        result = super().__radd__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.add, self, other, reflected=True)
+        GLOBAL_COUNTER.incr_int_add()
+        return CountedInt(result)
+
+    def __sub__(self, other) -> CountedInt:
+        """i-other"""
+        result = super().__sub__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.sub, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_add()
+        return CountedInt(result)
+
+    def __rsub__(self, other) -> CountedInt:
+        """other-i"""
+        result = super().__rsub__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.sub, self, other, reflected=True)
+        GLOBAL_COUNTER.incr_int_add()
+        return CountedInt(result)
+
+    def __mul__(self, other) -> CountedInt:
+        """i*other"""
+        result = super().__mul__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.mul, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_mul()
+        return CountedInt(result)
+
+    def __rmul__(self, other) -> CountedInt:
+        """other*i"""
+        result = super().__rmul__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.mul, self, other, reflected=True)
+        GLOBAL_COUNTER.incr_int_mul()
+        return CountedInt(result)
+
+    def __floordiv__(self, other) -> CountedInt:
+        """i//other"""
+        result = super().__floordiv__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.floordiv, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_div()
+        return CountedInt(result)
+
+    def __rfloordiv__(self, other) -> CountedInt:
+        """other//i"""
+        result = super().__rfloordiv__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.floordiv, self, other, reflected=True)
+        GLOBAL_COUNTER.incr_int_div()
+        return CountedInt(result)
+
+    def __mod__(self, other) -> CountedInt:
+        """i%other"""
+        result = super().__mod__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.mod, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_div()
+        return CountedInt(result)
+
+    def __rmod__(self, other) -> CountedInt:
+        """other%i"""
+        result = super().__rmod__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.mod, self, other, reflected=True)
+        GLOBAL_COUNTER.incr_int_div()
+        return CountedInt(result)
+
+    def __divmod__(self, other) -> tuple[CountedInt, CountedInt]:
+        """divmod(i, other)"""
+        result = super().__divmod__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(divmod, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_int_div()  # quotient & remainder are obtained using a single division
+        return CountedInt(result[0]), CountedInt(result[1])
+
+    def __rdivmod__(self, other) -> tuple[CountedInt, CountedInt]:
+        """divmod(other, i)"""
+        result = super().__rdivmod__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(divmod, self, other, reflected=True)
+        GLOBAL_COUNTER.incr_int_div()  # quotient & remainder are obtained using a single division
+        return CountedInt(result[0]), CountedInt(result[1])
+
+    def __truediv__(self, other) -> CountedFloat:
+        """i/other"""
+        result = super().__truediv__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.truediv, self, other, reflected=False)
+        GLOBAL_COUNTER.incr_div()  # true division is a floating-point operation
+        return CountedFloat(result)
+
+    def __rtruediv__(self, other) -> CountedFloat:
+        """other/i"""
+        result = super().__rtruediv__(other)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.truediv, self, other, reflected=True)
+        GLOBAL_COUNTER.incr_div()  # true division is a floating-point operation
+        return CountedFloat(result)
+
+    def __pow__(self, other, mod=None) -> CountedInt | CountedFloat:
+        """i**other  or  pow(i, other, mod)"""
+        result = super().__pow__(other, mod)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.pow, self, other, reflected=False) if mod is None else NotImplemented
+        return _count_int_pow(result, exponent=other, mod=mod)
+
+    def __rpow__(self, other, mod=None) -> CountedInt | CountedFloat:
+        """other**i  or  pow(other, i, mod)"""
+        result = super().__rpow__(other, mod)
+        if result is NotImplemented:
+            return _non_int_fallback(operator.pow, self, other, reflected=True) if mod is None else NotImplemented
+        return _count_int_pow(result, exponent=self, mod=mod)
+
+    # -------------------------------------------------------------------------
+    #  OVERLOADED MATH OPERATIONS - bitwise
+    # -------------------------------------------------------------------------
+    def __lshift__(self, other) -> CountedInt:
+        """i<<other"""
+        result = super().__lshift__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_shift()
+        return CountedInt(result)
+
+    def __rlshift__(self, other) -> CountedInt:
+        """other<<i"""
+        result = super().__rlshift__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_shift()
+        return CountedInt(result)
+
+    def __rshift__(self, other) -> CountedInt:
+        """i>>other"""
+        result = super().__rshift__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_shift()
+        return CountedInt(result)
+
+    def __rrshift__(self, other) -> CountedInt:
+        """other>>i"""
+        result = super().__rrshift__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_shift()
+        return CountedInt(result)
+
+    def __and__(self, other) -> CountedInt:
+        """i&other"""
+        result = super().__and__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_bitwise()
+        return CountedInt(result)
+
+    def __rand__(self, other) -> CountedInt:
+        """other&i"""
+        result = super().__rand__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_bitwise()
+        return CountedInt(result)
+
+    def __or__(self, other) -> CountedInt:
+        """i|other"""
+        result = super().__or__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_bitwise()
+        return CountedInt(result)
+
+    def __ror__(self, other) -> CountedInt:
+        """other|i"""
+        result = super().__ror__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_bitwise()
+        return CountedInt(result)
+
+    def __xor__(self, other) -> CountedInt:
+        """i^other"""
+        result = super().__xor__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_bitwise()
+        return CountedInt(result)
+
+    def __rxor__(self, other) -> CountedInt:
+        """other^i"""
+        result = super().__rxor__(other)
+        if result is NotImplemented:
+            return NotImplemented
+        GLOBAL_COUNTER.incr_int_bitwise()
+        return CountedInt(result)
+
+
+# -------------------------------------------------------------------------
+#  helpers
+# -------------------------------------------------------------------------
+_COUNTED_NON_INT_TYPES = (CountedFloat, CountedFloat32, CountedComplex)
+
+
+def _non_int_fallback(op: Callable, x: CountedInt, other, reflected: bool):
+    """
+    Fallback for binary operations that int does not support (i.e. returned NotImplemented).  If the other operand
+    is a plain float or complex, x is promoted to a CountedFloat, such that the operation is counted as a flop.
+    Counted float & complex types handle int operands themselves, so for those we return NotImplemented to let
+    Python try the other operand.
+    """
+    if isinstance(other, _COUNTED_NON_INT_TYPES) or not isinstance(other, (float, complex)):
+        return NotImplemented
+
+    if reflected:
+        return op(other, CountedFloat(x))
+    else:
+        return op(CountedFloat(x), other)
+
+
+def _count_int_pow(result: int | float, exponent: int, mod: int | None) -> CountedInt | CountedFloat:
+    """Counts an integer exponentiation (already computed as 'result') and returns the result as a counted type."""
+    if isinstance(result, float):
+        # negative exponent -> floating-point result
+        GLOBAL_COUNTER.incr_pow()
+        return CountedFloat(result)
+    else:
+        # exponentiation by squaring: 1 MUL per squaring + 1 MUL per additional 1-bit in the exponent
+        exponent = abs(int(exponent))
+        n_mul = max(0, exponent.bit_length() - 1) + max(0, exponent.bit_count() - 1)
+        GLOBAL_COUNTER.incr_int_pow(n_mul=n_mul, n_div=n_mul if mod is not None else 0)
+        return CountedInt(result)
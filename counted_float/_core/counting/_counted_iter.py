@@ -0,0 +1,141 @@
+"""
+Per-item cost accounting for (streaming) iterators and generator pipelines.
+
+counted_iter(iterable, stage="...") wraps an iterable, such that all flops counted while producing each item (i.e.
+during each next() call) are attributed to the stage.  Wrapped stages can be nested, as in generator pipelines:
+
+    records = counted_iter(parse(f), stage="parse")
+    results = counted_iter((transform(rec) for rec in records), stage="transform")
+    for result in results:
+        ...
+
+Attribution is exclusive: flops counted while an inner stage produces an item are attributed to the inner stage
+only, i.e. above, 'transform' only gets the flops of transform(rec), not those of parse(...).
+
+Per stage, streaming statistics are kept (number of items, total counts per FlopType, mean & quantiles of the
+weighted cost per item, using a constant-memory CostSketch), without storing per-item records, such that stages can
+wrap unbounded streams.  Statistics are accumulated per stage name across counted_iter instances, see
+get_stage_stats() & reset_stage_stats().
+"""
+
+from __future__ import annotations
+
+import operator
+from typing import Iterable, Iterator, Sequence, TypeVar
+
+from ._attribution import N_FLOP_TYPES, begin_span, end_span, snapshot_weights, weighted_delta_cost
+from ._sketch import CostSketch
+from .models import FlopCounts, FlopWeights
+
+T = TypeVar("T")
+
+
+# =================================================================================================
+#  Stage statistics
+# =================================================================================================
+class StageStats:
+    """Streaming cost statistics of a single stage, accumulated over all items produced by that stage."""
+
+    def __init__(self, stage: str, relative_accuracy: float = 0.01):
+        self.stage = stage
+        self.item_costs = CostSketch(relative_accuracy)  # weighted cost per item
+        self.total_cost: float = 0.0  # weighted cost of all items, incl. overhead of exhausting the iterator
+        self.__totals: list[int] = [0] * N_FLOP_TYPES  # fp64 counts of all items, per FlopType
+
+    @property
+    def n_items(self) -> int:
+        return self.item_costs.count
+
+    def flop_counts(self) -> FlopCounts:
+        """Total fp64 flop counts of this stage (excluding custom flop types)."""
+        return FlopCounts(*self.__totals)
+
+    def mean(self) -> float:
+        return self.item_costs.mean
+
+    def quantile(self, q: float) -> float:
+        return self.item_costs.quantile(q)
+
+    @property
+    def p50(self) -> float:
+        return self.item_costs.quantile(0.5)
+
+    @property
+    def p99(self) -> float:
+        return self.item_costs.quantile(0.99)
+
+    def _add(self, cost: float, counts_delta: Sequence[int], is_item: bool):
+        self.total_cost += cost
+        self.__totals = list(map(operator.add, self.__totals, counts_delta))
+        if is_item:
+            self.item_costs.add(cost)
+
+    def __repr__(self) -> str:
+        return (
+            f"StageStats(stage={self.stage!r}, n_items={self.n_items}, total_cost={self.total_cost:.6g}, "
+            f"mean={self.mean():.6g}, p50={self.p50:.6g}, p99={self.p99:.6g})"
+        )
+
+
+_STAGE_STATS: dict[str, StageStats] = dict()
+
+
+def get_stage_stats(stage: str | None = None) -> StageStats | dict[str, StageStats]:
+    """Returns the statistics of the given stage, or of all stages (stage=None)."""
+    if stage is None:
+        return dict(_STAGE_STATS)
+    elif stage not in _STAGE_STATS:
+        raise KeyError(f"No statistics for stage '{stage}'.")
+    return _STAGE_STATS[stage]
+
+
+def reset_stage_stats(stage: str | None = None):
+    """Removes the statistics of the given stage, or of all stages (stage=None)."""
+    if stage is None:
+        _STAGE_STATS.clear()
+    else:
+        _STAGE_STATS.pop(stage, None)
+
+
+# =================================================================================================
+#  Counted iterator
+# =================================================================================================
+class CountedIterator(Iterator[T]):
+    """Iterator wrapper attributing flops counted during each next() call to a stage, see counted_iter()."""
+
+    def __init__(self, iterable: Iterable[T], stage: str, weights: FlopWeights | None = None):
+        if weights is None:
+            from counted_float._core.counting.config import get_flop_weights
+
+            weights = get_flop_weights()
+
+        self.__iterator = iter(iterable)
+        self.__weights = weights
+        if stage not in _STAGE_STATS:
+            _STAGE_STATS[stage] = StageStats(stage)
+        self.stats = _STAGE_STATS[stage]
+
+    def __iter__(self) -> CountedIterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        start = begin_span(self.__weights)
+        is_item = False
+        try:
+            item = next(self.__iterator)
+            is_item = True
+            return item
+        finally:
+            _, exclusive = end_span(self.__weights, start)
+            cost = weighted_delta_cost(exclusive, snapshot_weights(self.__weights))
+            self.stats._add(cost, exclusive[:N_FLOP_TYPES], is_item)
+
+
+def counted_iter(iterable: Iterable[T], stage: str, weights: FlopWeights | None = None) -> CountedIterator[T]:
+    """
+    Wraps an iterable, such that the flops counted while producing each item are attributed to the given stage.
+    :param iterable: any iterable, e.g. a generator
+    :param stage: name of the stage; statistics are accumulated per stage name (see get_stage_stats())
+    :param weights: FlopWeights used for the weighted cost per item (default: currently configured weights)
+    """
+    return CountedIterator(iterable, stage, weights)
@@ -0,0 +1,322 @@
+"""
+Live export of flop counts to a small memory-mapped file, such that long-running processes can be monitored by
+other processes and counts survive crashes:
+
+    with CounterFileWriter("counts_0.cfc"):          # mirrors the global counters  (or: context=ctx)
+        run_simulation()
+
+    read_counter_file("counts_0.cfc")               ->  CounterFileSnapshot  (from any process)
+    merge_counter_files(["counts_0.cfc", ...])      ->  {Precision: FlopCounts}, summed over multiple processes
+
+    python -m counted_float watch counts_*.cfc      ->  live view of total counts & rates per FlopType
+
+Counting itself is not affected: a background thread of the writer periodically copies the counts into the mapped
+memory, which involves no system calls (the operating system writes the pages to the file).  Hence, the file lags the
+actual counts by at most one interval, also after a crash of the process.  Custom flop types & integer operations are
+not exported.
+
+FILE LAYOUT (little-endian, fixed size)
+
+    offset  size                type        field
+    ------  ------------------  ----------  -----------------------------------------------------------------
+         0                   8  bytes       magic  (b"CFCOUNTS")
+         8                   4  uint32      layout version
+        12                   4  uint32      number of flop types N
+        16                   8  uint64      pid of the writing process
+        24                   8  uint64      sequence number  (odd while an update is being written)
+        32                   8  float64     start time  (unix time, seconds)
+        40                   8  float64     time of last update  (unix time, seconds)
+        48                   4  uint32      1 if the writer was closed, 0 if still active
+        52                   4  -           reserved
+        56                 256  bytes       comma-separated flop type names, in counting order  (zero-padded)
+       312                 8*N  int64       fp64 counts
+    312+8N                 8*N  int64       fp32 counts
+
+Readers retry while the sequence number is odd or changes during reading (seqlock), such that they never observe
+partially written updates.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Iterable, TextIO
+
+from ._attribution import N_FLOP_TYPES
+from ._global_counter import GLOBAL_COUNTERS
+from .models import FlopCounts, FlopType, FlopWeights, Precision
+
+if TYPE_CHECKING:
+    from ._context_managers import FlopCountingContext
+
+_MAGIC = b"CFCOUNTS"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQddII")
+_SEQUENCE = struct.Struct("<Q")
+_SEQUENCE_OFFSET = 24
+_UPDATE = struct.Struct("<d")
+_UPDATE_OFFSET = 40
+_CLOSED = struct.Struct("<I")
+_CLOSED_OFFSET = 48
+_NAMES_SIZE = 256
+_COUNTS_OFFSET = _HEADER.size + _NAMES_SIZE
+_PRECISIONS = [Precision.FP64, Precision.FP32]
+
+
+# =================================================================================================
+#  Writer
+# =================================================================================================
+class CounterFileWriter:
+    """
+    Context manager mirroring flop counts into a memory-mapped counter file while active (see module docstring).
+    By default, the (absolute) counts of the global counters are mirrored, i.e. all flops counted by this process,
+    otherwise the counts of the provided FlopCountingContext.
+    """
+
+    def __init__(self, path: str | os.PathLike, interval: float = 0.5, context: FlopCountingContext | None = None):
+        """
+        :param path: path of the counter file to (over)write
+        :param interval: time between updates of the file by the background thread (in seconds)
+        :param context: optional FlopCountingContext of which the counts are mirrored instead of the global counters
+        """
+        if interval <= 0:
+            raise ValueError(f"interval should be > 0, got {interval}.")
+        self.path = path
+        self.interval = interval
+        self.context = context
+        self.__file = None
+        self.__mmap: mmap.mmap | None = None
+        self.__sequence: int = 0
+        self.__lock = threading.Lock()  # serializes updates by the background thread & explicit update() calls
+        self.__stop_event = threading.Event()
+        self.__thread: threading.Thread | None = None
+        self.__counts_struct = struct.Struct(f"<{2 * N_FLOP_TYPES}q")
+
+    # -------------------------------------------------------------------------
+    #  Start / Stop
+    # -------------------------------------------------------------------------
+    def is_active(self) -> bool:
+        return self.__mmap is not None
+
+    def start(self):
+        if self.is_active():
+            return
+        size = _COUNTS_OFFSET + self.__counts_struct.size
+        self.__file = open(self.path, "w+b")
+        self.__file.truncate(size)
+        self.__mmap = mmap.mmap(self.__file.fileno(), size)
+
+        names = ",".join(flop_type.name for flop_type in FlopType).encode("ascii")
+        now = time.time()
+        _HEADER.pack_into(self.__mmap, 0, _MAGIC, _VERSION, N_FLOP_TYPES, os.getpid(), 0, now, now, 0, 0)
+        self.__mmap[_HEADER.size : _HEADER.size + len(names)] = names
+        self.__sequence = 0
+        self.update()
+
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__run, name="CounterFileWriter", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        if not self.is_active():
+            return
+        self.__stop_event.set()
+        self.__thread.join()
+        self.__thread = None
+        self.update()
+        _CLOSED.pack_into(self.__mmap, _CLOSED_OFFSET, 1)
+        self.__mmap.flush()
+        self.__mmap.close()
+        self.__file.close()
+        self.__mmap, self.__file = None, None
+
+    def __run(self):
+        while not self.__stop_event.wait(self.interval):
+            self.update()
+
+    # -------------------------------------------------------------------------
+    #  Updates
+    # -------------------------------------------------------------------------
+    def update(self):
+        """Copies the current counts into the file (also called periodically by the background thread)."""
+        if self.context is not None:
+            counts = [
+                *self.context.flop_counts(Precision.FP64).as_tuple(),
+                *self.context.flop_counts(Precision.FP32).as_tuple(),
+            ]
+        else:
+            counts = [
+                *GLOBAL_COUNTERS[Precision.FP64].live_flop_counts().as_tuple(),
+                *GLOBAL_COUNTERS[Precision.FP32].live_flop_counts().as_tuple(),
+            ]
+
+        with self.__lock:
+            buffer = self.__mmap
+            self.__sequence += 1  # odd: update in progress
+            _SEQUENCE.pack_into(buffer, _SEQUENCE_OFFSET, self.__sequence)
+            self.__counts_struct.pack_into(buffer, _COUNTS_OFFSET, *counts)
+            _UPDATE.pack_into(buffer, _UPDATE_OFFSET, time.time())
+            self.__sequence += 1  # even: update complete
+            _SEQUENCE.pack_into(buffer, _SEQUENCE_OFFSET, self.__sequence)
+
+    # -------------------------------------------------------------------------
+    #  Context manager interface
+    # -------------------------------------------------------------------------
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+# =================================================================================================
+#  Reader
+# =================================================================================================
+@dataclasses.dataclass(frozen=True)
+class CounterFileSnapshot:
+    """Contents of a counter file at the time of reading (see read_counter_file())."""
+
+    path: str
+    pid: int
+    start_time: float  # unix time (s)
+    update_time: float  # unix time (s) of the last update by the writer
+    closed: bool  # True if the writer was closed properly, False if still active (or crashed)
+    counts: dict[Precision, FlopCounts]
+
+    def total_count(self) -> int:
+        """Total number of flops, over all precisions."""
+        return sum(counts.total_count() for counts in self.counts.values())
+
+    def total_weighted_cost(self, weights: FlopWeights | None = None) -> float:
+        """Total weighted cost over all precisions, see FlopCountingContext.total_weighted_cost()."""
+        return sum(counts.total_weighted_cost(weights, precision) for precision, counts in self.counts.items())
+
+
+def read_counter_file(path: str | os.PathLike, max_retries: int = 1000) -> CounterFileSnapshot:
+    """Reads a counter file written by a CounterFileWriter, possibly of another (running) process."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _COUNTS_OFFSET:  # e.g. empty, while a writer is starting
+            raise ValueError(f"Not a (fully initialized) counter file: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if buffer[:8] != _MAGIC:
+                raise ValueError(f"Not a (fully initialized) counter file: {path}")
+            _, version, n_flop_types, pid, _, start_time, _, _, _ = _HEADER.unpack_from(buffer, 0)
+            if version != _VERSION:
+                raise ValueError(f"Unsupported counter file version {version} (expected {_VERSION}): {path}")
+            names = buffer[_HEADER.size : _COUNTS_OFFSET].rstrip(b"\x00").decode("ascii").split(",")
+            counts_struct = struct.Struct(f"<{2 * n_flop_types}q")
+
+            for _ in range(max_retries):
+                (sequence,) = _SEQUENCE.unpack_from(buffer, _SEQUENCE_OFFSET)
+                if sequence % 2 == 0:
+                    values = counts_struct.unpack_from(buffer, _COUNTS_OFFSET)
+                    (update_time,) = _UPDATE.unpack_from(buffer, _UPDATE_OFFSET)
+                    (closed,) = _CLOSED.unpack_from(buffer, _CLOSED_OFFSET)
+                    if _SEQUENCE.unpack_from(buffer, _SEQUENCE_OFFSET)[0] == sequence:
+                        break
+                time.sleep(1e-4)
+            else:
+                raise TimeoutError(f"Could not obtain a consistent read of counter file {path}.")
+
+    # map counts by name, such that files remain readable if flop types are added in the future
+    counts = dict()
+    for i, precision in enumerate(_PRECISIONS):
+        precision_values = dict(zip(names, values[i * n_flop_types : (i + 1) * n_flop_types]))
+        counts[precision] = FlopCounts(
+            *[precision_values.get(flop_type.name, 0) for flop_type in FlopType],
+        )
+
+    return CounterFileSnapshot(
+        path=str(path),
+        pid=pid,
+        start_time=start_time,
+        update_time=update_time,
+        closed=bool(closed),
+        counts=counts,
+    )
+
+
+def merge_counter_files(
+    files: Iterable[str | os.PathLike | CounterFileSnapshot],
+) -> dict[Precision, FlopCounts]:
+    """Total counts per precision over multiple counter files (paths or snapshots), e.g. of parallel processes."""
+    total = {precision: FlopCounts() for precision in _PRECISIONS}
+    for file in files:
+        snapshot = file if isinstance(file, CounterFileSnapshot) else read_counter_file(file)
+        for precision, counts in snapshot.counts.items():
+            total[precision] += counts
+    return total
+
+
+# =================================================================================================
+#  Watch
+# =================================================================================================
+def watch_counter_files(
+    paths: list[str | os.PathLike],
+    interval: float = 1.0,
+    n_updates: int | None = None,
+    out: TextIO | None = None,
+):
+    """
+    Periodically prints the total counts & rates (flops/s) per FlopType, over all precisions, summed over all
+    provided counter files.  Files that don't exist (yet) or cannot be read (e.g. while a writer is (re)starting) are
+    skipped in that view.  Runs until interrupted or until n_updates views have been printed.
+    """
+    out = out or sys.stdout
+    previous: tuple[float, tuple[int, ...]] | None = None
+    i_update = 0
+    try:
+        while True:
+            snapshots = [snapshot for snapshot in map(_try_read_counter_file, paths) if snapshot is not None]
+            merged = merge_counter_files(snapshots)
+            now = time.monotonic()
+            totals = tuple(map(sum, zip(*[counts.as_tuple() for counts in merged.values()])))
+
+            rates = None
+            if previous is not None:
+                dt = now - previous[0]
+                # clamped, since totals decrease when a file disappears or a writer restarts
+                rates = [max(total - prev, 0) / dt for total, prev in zip(totals, previous[1])]
+            previous = (now, totals)
+
+            if out.isatty():
+                out.write("\033[H\033[J")  # clear screen
+            out.write(_format_view(snapshots, totals, rates))
+            out.flush()
+
+            i_update += 1
+            if (n_updates is not None) and (i_update >= n_updates):
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def _try_read_counter_file(path: str | os.PathLike) -> CounterFileSnapshot | None:
+    try:
+        return read_counter_file(path)
+    except (OSError, ValueError):  # missing, not (yet) initialized, inconsistent (TimeoutError is an OSError), ...
+        return None
+
+
+def _format_view(snapshots: list[CounterFileSnapshot], totals: tuple[int, ...], rates: list[float] | None) -> str:
+    n_active = sum(not snapshot.closed for snapshot in snapshots)
+    lines = [
+        f"{time.strftime('%H:%M:%S')}  -  {len(snapshots)} file(s), {n_active} active",
+        "",
+        f"{'flop type':<10} {'count':>16} {'flops/s':>12}",
+        f"{'-' * 10} {'-' * 16} {'-' * 12}",
+    ]
+    for i, flop_type in enumerate(FlopType):
+        rate = f"{rates[i]:>12.4g}" if rates is not None else f"{'-':>12}"
+        lines.append(f"{flop_type.name:<10} {totals[i]:>16} {rate}")
+    total_rate = f"{sum(rates):>12.4g}" if rates is not None else f"{'-':>12}"
+    lines.append(f"{'-' * 10} {'-' * 16} {'-' * 12}")
+    lines.append(f"{'TOTAL':<10} {sum(totals):>16} {total_rate}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,248 @@
+"""
+Cost distributions of data-dependent algorithms (early termination, pivoting, adaptive step sizes, ...) over an
+ensemble of inputs.  Each input is evaluated inside its own FlopCountingContext, optionally in worker processes, and
+results are accumulated in a CostDistribution as soon as they become available:
+
+    dist = analyze_ensemble(my_solver, sampler=random_problem, n_samples=1000, seed=42, n_workers=8)
+    dist.summary()                  ->  CostSummary(mean=..., q50=..., p99=..., max=..., ...)
+    dist.summary(FlopType.DIV)      ->  idem, for the number of DIV flops
+
+Inputs are either provided explicitly (any iterable of argument tuples, e.g. a generator), or drawn by a sampler
+function sampler(rng) -> argument tuple, with rng a numpy Generator seeded deterministically per sample index, such
+that results are reproducible regardless of the number of workers.
+
+For partial results while workers are still running, iterate over iter_ensemble(...), which yields the (growing)
+CostDistribution each time a sample finishes.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+
+from ._context_managers import FlopCountingContext
+from .models import FlopCounts, FlopType, FlopWeights, Precision
+
+_FLOP_TYPES = list(FlopType)
+_MAX_PENDING_PER_WORKER = 4  # max. number of submitted, unfinished samples per worker (bounds memory for generators)
+
+
+# =================================================================================================
+#  Cost distribution
+# =================================================================================================
+@dataclasses.dataclass(frozen=True)
+class CostSummary:
+    """Summary statistics of a cost distribution."""
+
+    n_samples: int
+    mean: float
+    std: float
+    min: float
+    q25: float
+    q50: float
+    q75: float
+    p99: float
+    max: float
+
+
+class CostDistribution:
+    """
+    Distribution of flop counts & weighted costs over an ensemble of inputs.  Per-FlopType statistics are based
+    on the fp64 counts; weighted costs are summed over all precisions, as is done by
+    FlopCountingContext.total_weighted_cost().
+    """
+
+    def __init__(self, weights: FlopWeights | None = None):
+        if weights is None:
+            from counted_float._core.counting.config import get_flop_weights
+
+            weights = get_flop_weights()
+
+        self.weights = weights
+        self.__indices: list[int] = []
+        self.__counts: list[list[int]] = []  # fp64 counts per sample, in FlopType order
+        self.__weighted_costs: list[float] = []
+
+    # -------------------------------------------------------------------------
+    #  Adding samples
+    # -------------------------------------------------------------------------
+    def add(self, counts: dict[Precision, FlopCounts] | FlopCounts, index: int | None = None):
+        """Adds the flop counts of a single sample (per precision, or fp64 only)."""
+        if isinstance(counts, FlopCounts):
+            counts = {Precision.FP64: counts}
+        self.__indices.append(len(self.__indices) if index is None else index)
+        fp64_counts = counts.get(Precision.FP64, FlopCounts())
+        self.__counts.append([getattr(fp64_counts, flop_type.name) for flop_type in _FLOP_TYPES])
+        self.__weighted_costs.append(
+            sum(c.total_weighted_cost(self.weights, precision) for precision, c in counts.items())
+        )
+
+    # -------------------------------------------------------------------------
+    #  Data
+    # -------------------------------------------------------------------------
+    @property
+    def n_samples(self) -> int:
+        return len(self.__weighted_costs)
+
+    @property
+    def indices(self) -> list[int]:
+        """Sample indices, in the order in which samples were added (i.e. completed)."""
+        return list(self.__indices)
+
+    def costs(self, flop_type: FlopType | None = None) -> np.ndarray:
+        """Weighted costs (flop_type=None) or fp64 counts of the given flop type, of all samples."""
+        if flop_type is None:
+            return np.array(self.__weighted_costs, dtype=np.float64)
+        else:
+            return np.array([counts[_FLOP_TYPES.index(flop_type)] for counts in self.__counts], dtype=np.int64)
+
+    def flop_types(self) -> list[FlopType]:
+        """All flop types with non-zero counts for at least one sample."""
+        return [flop_type for flop_type in _FLOP_TYPES if self.costs(flop_type).any()]
+
+    # -------------------------------------------------------------------------
+    #  Statistics
+    # -------------------------------------------------------------------------
+    def mean(self, flop_type: FlopType | None = None) -> float:
+        return float(np.mean(self.__non_empty_costs(flop_type)))
+
+    def quantile(self, q: float, flop_type: FlopType | None = None) -> float:
+        return float(np.quantile(self.__non_empty_costs(flop_type), q))
+
+    def max(self, flop_type: FlopType | None = None) -> float:
+        return float(np.max(self.__non_empty_costs(flop_type)))
+
+    def summary(self, flop_type: FlopType | None = None) -> CostSummary:
+        costs = self.__non_empty_costs(flop_type)
+        q25, q50, q75, p99 = np.quantile(costs, [0.25, 0.5, 0.75, 0.99])
+        return CostSummary(
+            n_samples=len(costs),
+            mean=float(np.mean(costs)),
+            std=float(np.std(costs)),
+            min=float(np.min(costs)),
+            q25=float(q25),
+            q50=float(q50),
+            q75=float(q75),
+            p99=float(p99),
+            max=float(np.max(costs)),
+        )
+
+    def __non_empty_costs(self, flop_type: FlopType | None) -> np.ndarray:
+        if self.n_samples == 0:
+            raise ValueError("No samples in cost distribution.")
+        return self.costs(flop_type)
+
+    # -------------------------------------------------------------------------
+    #  Visualization
+    # -------------------------------------------------------------------------
+    def show(self):
+        print(f"{self.n_samples} samples".ljust(34) + "     mean      q50      p99      max")
+        for flop_type in [None, *self.flop_types()]:
+            label = "weighted cost" if flop_type is None else flop_type.long_name()
+            s = self.summary(flop_type)
+            print(f"{label}".ljust(34) + f"{s.mean:9.4g}{s.q50:9.4g}{s.p99:9.4g}{s.max:9.4g}")
+
+
+# =================================================================================================
+#  Main API
+# =================================================================================================
+def iter_ensemble(
+    func: Callable,
+    inputs: Iterable[tuple] | None = None,
+    sampler: Callable[[np.random.Generator], tuple] | None = None,
+    n_samples: int | None = None,
+    seed: int | None = None,
+    n_workers: int = 1,
+    weights: FlopWeights | None = None,
+) -> Iterator[CostDistribution]:
+    """
+    Evaluates func for each input of an ensemble, yielding the (growing) CostDistribution each time a sample has
+    been evaluated.  See analyze_ensemble() for the meaning of all arguments.
+    """
+    distribution = CostDistribution(weights)
+    tasks = enumerate(_tasks(func, inputs, sampler, n_samples, seed))
+    if n_workers > 1:
+        max_pending = _MAX_PENDING_PER_WORKER * n_workers
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            pending: dict[Future, int] = dict()
+            while True:
+                for index, task in itertools.islice(tasks, max_pending - len(pending)):
+                    pending[executor.submit(_run_sample, *task)] = index
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    distribution.add(future.result(), index=pending.pop(future))
+                    yield distribution
+    else:
+        for index, task in tasks:
+            distribution.add(_run_sample(*task), index=index)
+            yield distribution
+
+
+def analyze_ensemble(
+    func: Callable,
+    inputs: Iterable[tuple] | None = None,
+    sampler: Callable[[np.random.Generator], tuple] | None = None,
+    n_samples: int | None = None,
+    seed: int | None = None,
+    n_workers: int = 1,
+    weights: FlopWeights | None = None,
+) -> CostDistribution:
+    """
+    Evaluates func for each input of an ensemble inside its own FlopCountingContext and returns the distribution
+    of flop counts & weighted costs.
+    :param func: function to analyze, called as func(*args) for each argument tuple of the ensemble
+    :param inputs: iterable of argument tuples (e.g. a generator); mutually exclusive with sampler
+    :param sampler: function sampler(rng) -> argument tuple, with rng a np.random.Generator; called n_samples times
+    :param n_samples: number of samples to draw using the sampler, or max. number of inputs to evaluate
+    :param seed: seed for the per-sample random generators passed to sampler
+    :param n_workers: number of worker processes (1 = evaluate all inputs in the current process); with n_workers>1,
+                       func and sampler need to be picklable (e.g. module-level functions)
+    :param weights: FlopWeights used for the weighted costs (default: currently configured weights)
+    """
+    distribution = CostDistribution(weights)
+    for distribution in iter_ensemble(func, inputs, sampler, n_samples, seed, n_workers, weights):
+        pass
+    return distribution
+
+
+# =================================================================================================
+#  Internal helpers
+# =================================================================================================
+def _tasks(
+    func: Callable,
+    inputs: Iterable[tuple] | None,
+    sampler: Callable[[np.random.Generator], tuple] | None,
+    n_samples: int | None,
+    seed: int | None,
+) -> Iterator[tuple]:
+    if (inputs is None) == (sampler is None):
+        raise ValueError("Exactly one of 'inputs' and 'sampler' should be provided.")
+    if inputs is not None:
+        for args in itertools.islice(inputs, n_samples):
+            yield func, tuple(args), None, None
+    else:
+        if n_samples is None:
+            raise ValueError("'n_samples' should be provided when using a sampler.")
+        for index in range(n_samples):
+            yield func, None, sampler, (seed, index)
+
+
+def _run_sample(
+    func: Callable,
+    args: tuple | None,
+    sampler: Callable[[np.random.Generator], tuple] | None,
+    seed: tuple[int | None, int] | None,
+) -> dict[Precision, FlopCounts]:
+    if sampler is not None:
+        base_seed, index = seed
+        rng = np.random.default_rng(np.random.SeedSequence(base_seed, spawn_key=(index,)))
+        args = sampler(rng)
+    with FlopCountingContext() as ctx:
+        func(*args)
+    return {precision: ctx.flop_counts(precision) for precision in Precision}
@@ -0,0 +1,221 @@
+"""
+Per-function cost statistics of decorated functions:
+
+    @count_flops
+    def solve(a, b):
+        ...
+
+    solve.stats.n_calls                     ->  number of calls
+    solve.stats.total_counts()              ->  FlopCounts of all calls (inclusive, i.e. incl. flops of callees)
+    solve.stats.max_counts()                ->  max. counts per FlopType of a single call
+    solve.stats.p99                         ->  99th percentile of the weighted cost of a call
+    solve.stats.histogram()                 ->  histogram of the weighted cost of a call
+
+Inclusive statistics include the flops of all functions called by the decorated function; exclusive statistics
+exclude flops attributed to other decorated functions (and counted_iter stages) called by it.  For recursive
+functions, inclusive totals only count the outermost calls, such that flops are never counted twice.
+
+Calls are accumulated into running totals using plain lists of counts (see _attribution.py), without creating
+FlopCounts objects, such that functions called millions of times can be decorated.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+import types
+from typing import Callable
+
+from ._attribution import N_FLOP_TYPES, begin_span, end_span, snapshot_weights, weighted_delta_cost
+from ._sketch import CostSketch
+from .models import FlopCounts, FlopType, FlopWeights
+
+_FLOP_TYPES = list(FlopType)
+
+
+# =================================================================================================
+#  Function statistics
+# =================================================================================================
+class FunctionStats:
+    """Cost statistics of all calls of a function decorated with @count_flops (fp64 counts, unless stated otherwise)."""
+
+    def __init__(self, name: str, relative_accuracy: float = 0.01):
+        self.name = name
+        self.n_calls: int = 0
+        self.n_outermost_calls: int = 0  # excluding recursive calls
+        self.call_costs = CostSketch(relative_accuracy)  # inclusive weighted cost per call (all precisions)
+        self.__inclusive_cost: float = 0.0  # outermost calls only
+        self.__exclusive_cost: float = 0.0
+        self.__inclusive_totals: list[int] = [0] * N_FLOP_TYPES  # outermost calls only
+        self.__exclusive_totals: list[int] = [0] * N_FLOP_TYPES
+        self.__max_counts: list[int] = [0] * N_FLOP_TYPES  # inclusive
+
+    # -------------------------------------------------------------------------
+    #  Counts
+    # -------------------------------------------------------------------------
+    def total_counts(self, inclusive: bool = True) -> FlopCounts:
+        return FlopCounts(*(self.__inclusive_totals if inclusive else self.__exclusive_totals))
+
+    def mean_counts(self, inclusive: bool = True) -> dict[FlopType, float]:
+        """
+        Mean counts per FlopType, per outermost call if inclusive (i.e. recursive calls are part of their outermost
+        call), otherwise per call.
+        """
+        totals = self.__inclusive_totals if inclusive else self.__exclusive_totals
+        n_calls = self.n_outermost_calls if inclusive else self.n_calls
+        return {flop_type: total / n_calls if n_calls else 0.0 for flop_type, total in zip(_FLOP_TYPES, totals)}
+
+    def max_counts(self) -> FlopCounts:
+        """Max. (inclusive) counts of a single call, per FlopType (not necessarily of the same call)."""
+        return FlopCounts(*self.__max_counts)
+
+    # -------------------------------------------------------------------------
+    #  Weighted costs
+    # -------------------------------------------------------------------------
+    def total_cost(self, inclusive: bool = True) -> float:
+        return self.__inclusive_cost if inclusive else self.__exclusive_cost
+
+    def mean_cost(self, inclusive: bool = True) -> float:
+        """Mean weighted cost per outermost call if inclusive, otherwise per call (see mean_counts())."""
+        n_calls = self.n_outermost_calls if inclusive else self.n_calls
+        return self.total_cost(inclusive) / n_calls if n_calls else 0.0
+
+    @property
+    def max_cost(self) -> float:
+        return self.call_costs.max
+
+    @property
+    def p50(self) -> float:
+        return self.call_costs.quantile(0.5)
+
+    @property
+    def p99(self) -> float:
+        return self.call_costs.quantile(0.99)
+
+    def histogram(self) -> list[tuple[float, float, int]]:
+        """Histogram of the inclusive weighted cost per call, with power-of-2 bins (see CostSketch.histogram())."""
+        return self.call_costs.histogram()
+
+    # -------------------------------------------------------------------------
+    #  Accumulation
+    # -------------------------------------------------------------------------
+    def _add(
+        self,
+        inclusive: list[int | float],
+        exclusive: list[int | float],
+        inclusive_cost: float,
+        exclusive_cost: float,
+        outermost: bool,
+    ):
+        self.n_calls += 1
+        self.call_costs.add(inclusive_cost)
+        self.__exclusive_cost += exclusive_cost
+        self.__exclusive_totals = list(map(operator.add, self.__exclusive_totals, exclusive[:N_FLOP_TYPES]))
+        self.__max_counts = list(map(max, self.__max_counts, inclusive[:N_FLOP_TYPES]))
+        if outermost:
+            self.n_outermost_calls += 1
+            self.__inclusive_cost += inclusive_cost
+            self.__inclusive_totals = list(map(operator.add, self.__inclusive_totals, inclusive[:N_FLOP_TYPES]))
+
+    # -------------------------------------------------------------------------
+    #  Visualization
+    # -------------------------------------------------------------------------
+    def show(self):
+        print(f"{self.name}: {self.n_calls} calls")
+        print(f"{'':<34}{'inclusive':>12}{'exclusive':>12}{'max/call':>12}")
+        print(f"{'weighted cost':<34}{self.total_cost():12.6g}{self.total_cost(False):12.6g}{self.max_cost:12.6g}")
+        rows = zip(_FLOP_TYPES, self.__inclusive_totals, self.__exclusive_totals, self.__max_counts)
+        for flop_type, inclusive, exclusive, max_count in rows:
+            if inclusive or exclusive:
+                print(f"{flop_type.long_name():<34}{inclusive:12d}{exclusive:12d}{max_count:12d}")
+        for lower, upper, count in self.histogram():
+            print(f"  cost in [{lower:.6g}, {upper:.6g})".ljust(34) + f"{count:12d}")
+
+    def __repr__(self) -> str:
+        return (
+            f"FunctionStats(name={self.name!r}, n_calls={self.n_calls}, total_cost={self.total_cost():.6g}, "
+            f"p50={self.p50:.6g}, p99={self.p99:.6g})"
+        )
+
+
+_FUNCTION_STATS: dict[str, FunctionStats] = dict()
+
+
+def get_function_stats(name: str | None = None) -> FunctionStats | dict[str, FunctionStats]:
+    """Returns the statistics of the decorated function with the given name, or of all functions (name=None)."""
+    if name is None:
+        return dict(_FUNCTION_STATS)
+    elif name not in _FUNCTION_STATS:
+        raise KeyError(f"No statistics for function '{name}'.")
+    return _FUNCTION_STATS[name]
+
+
+def reset_function_stats(name: str | None = None):
+    """Removes the statistics of the function with the given name, or of all functions (name=None)."""
+    if name is None:
+        _FUNCTION_STATS.clear()
+    else:
+        _FUNCTION_STATS.pop(name, None)
+
+
+# =================================================================================================
+#  Decorator
+# =================================================================================================
+class CountedFunction:
+    """Function wrapper accumulating cost statistics of each call; see @count_flops."""
+
+    def __init__(self, func: Callable, name: str | None = None, weights: FlopWeights | None = None):
+        if weights is None:
+            from counted_float._core.counting.config import get_flop_weights
+
+            weights = get_flop_weights()
+
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.name = name or f"{func.__module__}.{func.__qualname__}"
+        self.__weights = weights
+        self.__depth = 0  # number of active calls, for handling recursion
+
+    @property
+    def stats(self) -> FunctionStats:
+        if self.name not in _FUNCTION_STATS:
+            _FUNCTION_STATS[self.name] = FunctionStats(self.name)
+        return _FUNCTION_STATS[self.name]
+
+    def __call__(self, *args, **kwargs):
+        start = begin_span(self.__weights)
+        self.__depth += 1
+        try:
+            return self.func(*args, **kwargs)
+        finally:
+            self.__depth -= 1
+            inclusive, exclusive = end_span(self.__weights, start)
+            weights = snapshot_weights(self.__weights)
+            inclusive_cost = weighted_delta_cost(inclusive, weights)
+            if exclusive is inclusive:  # no nested spans
+                exclusive_cost = inclusive_cost
+            else:
+                exclusive_cost = weighted_delta_cost(exclusive, weights)
+            self.stats._add(inclusive, exclusive, inclusive_cost, exclusive_cost, outermost=self.__depth == 0)
+
+    def __get__(self, instance, owner=None):
+        # support decorating methods
+        return self if instance is None else types.MethodType(self, instance)
+
+
+def count_flops(
+    func: Callable | None = None, *, name: str | None = None, weights: FlopWeights | None = None
+) -> CountedFunction | Callable[[Callable], CountedFunction]:
+    """
+    Decorator accumulating per-call cost statistics of a function, available as func.stats or via
+    get_function_stats(name).  Only flops counted by the global counters are taken into account, i.e. operations on
+    CountedFloat (& co) and, inside a FlopCountingContext, math functions.
+
+    Can be used with or without arguments:  @count_flops  or  @count_flops(name="solve", weights=...)
+
+    :param name: name under which statistics are accumulated (default: '<module>.<qualname>')
+    :param weights: FlopWeights used for weighted costs (default: currently configured weights)
+    """
+    if func is not None:
+        return CountedFunction(func, name, weights)
+    return lambda f: CountedFunction(f, name, weights)
@@ -1,4 +1,5 @@
-from counted_float._core.counting.models import FlopCounts
+from counted_float._core.counting.models import FlopCounts, FlopType, FlopWeights, IntOpCounts, Precision
+from counted_float._core.counting.models._custom_flop_type import _CUSTOM_FLOP_TYPES
 
 
 class GlobalFlopCounter:
@@ -6,6 +7,10 @@ class GlobalFlopCounter:
     Global counter for FLOP operations.  Essentially this class wraps around a FlopCounts object,
     limiting access to its fields (only allowing incrementing them) and providing a way to access copies of the counts.
     On top of this, the class allows pausing and resuming counting globally.
+
+    One instance exists per Precision (see GLOBAL_COUNTERS), such that flops of each precision are counted separately.
+    Integer operations (see CountedInt) are counted in a separate IntOpCounts object of the fp64 instance
+    (GLOBAL_COUNTER), sharing the same pause/resume mechanism.
     """
 
     # -------------------------------------------------------------------------
@@ -13,6 +18,7 @@ class GlobalFlopCounter:
     # -------------------------------------------------------------------------
     def __init__(self):
         self.__counts = FlopCounts()
+        self.__int_counts = IntOpCounts()
         self.__incr = 1  # 1 if enabled, 0 if paused
 
     # -------------------------------------------------------------------------
@@ -26,6 +32,7 @@ class GlobalFlopCounter:
 
     def reset(self):
         self.__counts.reset()
+        self.__int_counts.reset()
         self.resume()
 
     def is_active(self) -> bool:
@@ -34,6 +41,24 @@ class GlobalFlopCounter:
     def flop_counts(self) -> FlopCounts:
         return self.__counts.copy()
 
+    def live_flop_counts(self) -> FlopCounts:
+        """
+        Returns the internal FlopCounts object itself (not a copy), which keeps being updated while counting.
+        For low-overhead repeated reading of the counts only; do not modify.
+        """
+        return self.__counts
+
+    def custom_weighted_cost(self, weights: FlopWeights) -> float:
+        """Weighted cost of the current counts of (registered) custom flop types only."""
+        return sum(
+            count * weights.custom_weight(name)
+            for name, count in self.__counts.custom.items()
+            if name in _CUSTOM_FLOP_TYPES
+        )
+
+    def int_op_counts(self) -> IntOpCounts:
+        return self.__int_counts.copy()
+
     def total_count(self) -> int:
         """Shorthand for self.flop_counts().total_count()"""
         return self.__counts.total_count()
@@ -93,6 +118,103 @@ class GlobalFlopCounter:
     def incr_pow(self):
         self.__counts.POW += self.__incr
 
+    def incr_custom(self, name: str, n: int = 1):
+        # custom flop types (see CustomFlopType), counted by name
+        if self.__incr:  # avoid creating zero-count entries while paused
+            custom = self.__counts.custom
+            custom[name] = custom.get(name, 0) + n
+
+    def incr_flop_type(self, flop_type: FlopType, n: int = 1):
+        # generic (slower) counterpart of the incr_... methods above, for manually registering flops
+        setattr(self.__counts, flop_type.name, getattr(self.__counts, flop_type.name) + n * self.__incr)
+
+    # -------------------------------------------------------------------------
+    #  Incrementing counts - complex operations
+    # -------------------------------------------------------------------------
+    # each method books the decomposition of 1 complex operation into real-valued flops in a single call;
+    # decompositions need to be kept in sync with ComplexOpType.flop_counts()
+    def incr_complex_abs(self):
+        counts, incr = self.__counts, self.__incr
+        counts.MUL += 2 * incr
+        counts.ADD += incr
+        counts.SQRT += incr
+
+    def incr_complex_minus(self):
+        self.__counts.MINUS += 2 * self.__incr
+
+    def incr_complex_conj(self):
+        self.__counts.MINUS += self.__incr
+
+    def incr_complex_equals(self):
+        self.__counts.EQUALS += 2 * self.__incr
+
+    def incr_complex_add(self):
+        self.__counts.ADD += 2 * self.__incr
+
+    def incr_complex_sub(self):
+        self.__counts.SUB += 2 * self.__incr
+
+    def incr_complex_mul(self):
+        counts, incr = self.__counts, self.__incr
+        counts.MUL += 4 * incr
+        counts.ADD += incr
+        counts.SUB += incr
+
+    def incr_complex_div(self):
+        counts, incr = self.__counts, self.__incr
+        counts.MUL += 6 * incr
+        counts.ADD += 2 * incr
+        counts.SUB += incr
+        counts.DIV += 2 * incr
+
+    def incr_complex_sqrt(self):
+        counts, incr = self.__counts, self.__incr
+        counts.MUL += 4 * incr
+        counts.ADD += 2 * incr
+        counts.SUB += incr
+        counts.SQRT += 3 * incr
+
+    def incr_complex_pow(self):
+        counts, incr = self.__counts, self.__incr
+        counts.MUL += 8 * incr
+        counts.ADD += 2 * incr
+        counts.SUB += incr
+        counts.SQRT += incr
+        counts.LOG2 += incr
+        counts.POW2 += incr
+
+    # -------------------------------------------------------------------------
+    #  Incrementing counts - integer operations
+    # -------------------------------------------------------------------------
+    def incr_int_add(self):
+        self.__int_counts.ADD += self.__incr
+
+    def incr_int_mul(self):
+        self.__int_counts.MUL += self.__incr
+
+    def incr_int_div(self):
+        self.__int_counts.DIV += self.__incr
+
+    def incr_int_shift(self):
+        self.__int_counts.SHIFT += self.__incr
+
+    def incr_int_bitwise(self):
+        self.__int_counts.BITWISE += self.__incr
+
+    def incr_int_cmp(self):
+        self.__int_counts.CMP += self.__incr
+
+    def incr_int_pow(self, n_mul: int, n_div: int = 0):
+        # integer exponentiation by squaring, booked as n_mul MULs (+ n_div DIVs for modular exponentiation)
+        self.__int_counts.MUL += n_mul * self.__incr
+        self.__int_counts.DIV += n_div * self.__incr
+
+
+# --- global variables through which we access the global counters ---
+GLOBAL_COUNTER = GlobalFlopCounter()  # fp64 flops
+GLOBAL_COUNTER_FP32 = GlobalFlopCounter()  # fp32 flops
 
-# --- global variable through which we access the global counter ---
-GLOBAL_COUNTER = GlobalFlopCounter()
+GLOBAL_COUNTERS: dict[Precision, GlobalFlopCounter] = {
+    Precision.FP64: GLOBAL_COUNTER,
+    Precision.FP32: GLOBAL_COUNTER_FP32,
+}
@@ -0,0 +1,317 @@
+"""
+Import hook that automatically instruments selected modules, such that flops are counted without any code changes.
+
+The AST of selected modules is rewritten at import time:
+
+    1.5             ->  __counted_float_ops__.lit(1.5)              (float & complex literals)
+    x * y           ->  __counted_float_ops__.mul(x, y)             (+, -, *, /, **)
+    -x              ->  __counted_float_ops__.neg(x)
+    x < y           ->  __counted_float_ops__.lt(x, y)              (==, !=, <, <=, >, >=; not for chained comparisons)
+    x += y          ->  x = __counted_float_ops__.iadd(x, y)        (+=, -=, *=, /=, **=; in-place)
+    a[i] += y       ->  __counted_float_ops__.iaug_item(a, i, __counted_float_ops__.iadd, y)
+    a.b += y        ->  __counted_float_ops__.iaug_attr(a, "b", __counted_float_ops__.iadd, y)
+
+where the helper functions (see _instrumented_ops.py) convert plain float operands to CountedFloat, such that the
+operations are counted as usual.
+
+The rewritten bytecode is cached in __pycache__ (as <name>.<cache_tag>.opt-counted.pyc, next to the regular .pyc
+files, respecting sys.pycache_prefix & sys.dont_write_bytecode), keyed by a hash of the source, such that re-imports
+don't pay the rewrite cost.  Non-selected modules are not affected in any way.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import marshal
+import os
+import sys
+import types
+import warnings
+from pathlib import Path
+from typing import Iterable
+
+_HELPERS = "__counted_float_ops__"
+_HELPERS_MODULE = "counted_float._core.counting._instrumented_ops"
+_CACHE_OPTIMIZATION_TAG = "counted"
+_TRANSFORM_VERSION = b"3"  # bump whenever _CountingTransformer changes, to invalidate cached bytecode
+
+
+# =================================================================================================
+#  AST transformation
+# =================================================================================================
+_BINARY_OPS: dict[type, str] = {
+    ast.Add: "add",
+    ast.Sub: "sub",
+    ast.Mult: "mul",
+    ast.Div: "truediv",
+    ast.Pow: "pow",
+}
+
+_AUGMENTED_OPS: dict[type, str] = {
+    ast.Add: "iadd",
+    ast.Sub: "isub",
+    ast.Mult: "imul",
+    ast.Div: "itruediv",
+    ast.Pow: "ipow",
+}
+
+_COMPARE_OPS: dict[type, str] = {
+    ast.Eq: "eq",
+    ast.NotEq: "ne",
+    ast.Lt: "lt",
+    ast.LtE: "le",
+    ast.Gt: "gt",
+    ast.GtE: "ge",
+}
+
+
+class _CountingTransformer(ast.NodeTransformer):
+    """Rewrites float literals & arithmetic into calls to the helper functions in _instrumented_ops.py."""
+
+    # -------------------------------------------------------------------------
+    #  Module
+    # -------------------------------------------------------------------------
+    def visit_Module(self, node: ast.Module) -> ast.Module:
+        self.generic_visit(node)
+
+        # import helpers after docstring & __future__ imports
+        i_insert = 0
+        for i, stmt in enumerate(node.body):
+            is_docstring = (
+                (i == 0)
+                and isinstance(stmt, ast.Expr)
+                and isinstance(stmt.value, ast.Constant)
+                and isinstance(stmt.value.value, str)
+            )
+            is_future_import = isinstance(stmt, ast.ImportFrom) and stmt.module == "__future__"
+            if is_docstring or is_future_import:
+                i_insert = i + 1
+        import_stmt = ast.Import(names=[ast.alias(name=_HELPERS_MODULE, asname=_HELPERS)])
+        node.body.insert(i_insert, import_stmt)
+        return node
+
+    # -------------------------------------------------------------------------
+    #  Literals
+    # -------------------------------------------------------------------------
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        if type(node.value) in (float, complex):
+            return self._helper_call(node, "lit", [node])
+        return node
+
+    def visit_MatchValue(self, node: ast.AST) -> ast.AST:
+        return node  # patterns need to remain literals
+
+    def visit_MatchSingleton(self, node: ast.AST) -> ast.AST:
+        return node
+
+    # -------------------------------------------------------------------------
+    #  Operations
+    # -------------------------------------------------------------------------
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        helper = _BINARY_OPS.get(type(node.op))
+        if helper is None:
+            return node
+        return self._helper_call(node, helper, [node.left, node.right])
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        if isinstance(node.op, ast.USub):
+            if isinstance(node.operand, ast.Constant) and type(node.operand.value) in (float, complex):
+                # negative literal, e.g. -1.5  -> not counted as a flop
+                literal = ast.copy_location(ast.Constant(value=-node.operand.value), node)
+                return self._helper_call(node, "lit", [literal])
+            self.generic_visit(node)
+            return self._helper_call(node, "neg", [node.operand])
+        self.generic_visit(node)
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if len(node.ops) != 1:
+            return node  # chained comparisons are left as-is, to preserve their semantics
+        helper = _COMPARE_OPS.get(type(node.ops[0]))
+        if helper is None:
+            return node
+        return self._helper_call(node, helper, [node.left, node.comparators[0]])
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> ast.AST:
+        self.generic_visit(node)
+        helper = _AUGMENTED_OPS.get(type(node.op))
+        target = node.target
+        if helper is None:
+            return node
+        elif isinstance(target, ast.Name):
+            value = self._helper_call(node, helper, [ast.Name(id=target.id, ctx=ast.Load()), node.value])
+            return ast.copy_location(ast.Assign(targets=[target], value=value), node)
+
+        # items & attributes: pass object & key as arguments, such that they are evaluated only once
+        op = ast.Attribute(value=ast.Name(id=_HELPERS, ctx=ast.Load()), attr=helper, ctx=ast.Load())
+        if isinstance(target, ast.Subscript):
+            call = self._helper_call(node, "iaug_item", [target.value, self._key(target.slice), op, node.value])
+        elif isinstance(target, ast.Attribute):
+            call = self._helper_call(node, "iaug_attr", [target.value, ast.Constant(value=target.attr), op, node.value])
+        else:
+            return node
+        return ast.copy_location(ast.Expr(value=call), node)
+
+    # -------------------------------------------------------------------------
+    #  Helpers
+    # -------------------------------------------------------------------------
+    @classmethod
+    def _key(cls, node: ast.expr) -> ast.expr:
+        """Converts a subscript (e.g. i:j or (i:j, k)) into an expression that is valid outside of [...]."""
+        if isinstance(node, ast.Slice):
+            bounds = [bound or ast.Constant(value=None) for bound in (node.lower, node.upper, node.step)]
+            return cls._helper_call(node, "make_slice", bounds)
+        elif isinstance(node, ast.Tuple):
+            return ast.copy_location(ast.Tuple(elts=[cls._key(elt) for elt in node.elts], ctx=ast.Load()), node)
+        return node
+
+    @staticmethod
+    def _helper_call(node: ast.AST, helper: str, args: list[ast.expr]) -> ast.Call:
+        func = ast.Attribute(value=ast.Name(id=_HELPERS, ctx=ast.Load()), attr=helper, ctx=ast.Load())
+        return ast.copy_location(ast.Call(func=func, args=args, keywords=[]), node)
+
+
+def instrument_source(source: str | bytes, filename: str = "<unknown>") -> types.CodeType:
+    """Compiles source code to an instrumented code object (see module docstring)."""
+    tree = _CountingTransformer().visit(ast.parse(source, filename))
+    ast.fix_missing_locations(tree)
+    return compile(tree, filename, "exec", dont_inherit=True)
+
+
+# =================================================================================================
+#  Bytecode cache
+# =================================================================================================
+def _source_hash(source: bytes) -> bytes:
+    return hashlib.sha256(_TRANSFORM_VERSION + b"\0" + source).digest()
+
+
+def _cache_path(source_path: str) -> str | None:
+    try:
+        return importlib.util.cache_from_source(source_path, optimization=_CACHE_OPTIMIZATION_TAG)
+    except NotImplementedError:
+        return None  # sys.implementation.cache_tag is None
+
+
+def _read_cache(cache_path: str, source_hash: bytes) -> types.CodeType | None:
+    try:
+        data = Path(cache_path).read_bytes()
+    except OSError:
+        return None
+    header = importlib.util.MAGIC_NUMBER + source_hash
+    if not data.startswith(header):
+        return None  # stale or different Python version
+    try:
+        return marshal.loads(data[len(header) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_cache(cache_path: str, source_hash: bytes, code: types.CodeType):
+    if sys.dont_write_bytecode:
+        return
+    data = importlib.util.MAGIC_NUMBER + source_hash + marshal.dumps(code)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)  # atomic
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# =================================================================================================
+#  Import machinery
+# =================================================================================================
+_SELECTED_MODULES: set[str] = set()
+
+
+class _InstrumentingLoader(importlib.machinery.SourceFileLoader):
+    """SourceFileLoader that returns instrumented code, cached separately from regular bytecode."""
+
+    def get_code(self, fullname: str) -> types.CodeType:
+        source_path = self.get_filename(fullname)
+        source = self.get_data(source_path)
+        source_hash = _source_hash(source)
+
+        cache_path = _cache_path(source_path)
+        if cache_path is not None:
+            code = _read_cache(cache_path, source_hash)
+            if code is not None:
+                return code
+
+        code = instrument_source(source, source_path)
+        if cache_path is not None:
+            _write_cache(cache_path, source_hash, code)
+        return code
+
+
+class _InstrumentingFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder that hands selected modules (& their submodules) to _InstrumentingLoader."""
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        if not _is_selected(fullname):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if (spec is None) or not isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+            return None  # e.g. extension modules; let the regular machinery handle these
+        spec.loader = _InstrumentingLoader(fullname, spec.origin)
+        return spec
+
+
+_FINDER = _InstrumentingFinder()
+
+
+def _is_selected(fullname: str) -> bool:
+    return any((fullname == name) or fullname.startswith(name + ".") for name in _SELECTED_MODULES)
+
+
+# =================================================================================================
+#  Public API
+# =================================================================================================
+def instrument_modules(module_names: Iterable[str]):
+    """
+    Makes sure the given modules (and their submodules) are instrumented when they are imported, such that all
+    float literals & arithmetic in them are counted, without any code changes.  Modules that were already imported
+    are not affected (a warning is issued); use importlib.reload(...) to instrument them anyway.
+
+    :param module_names: fully qualified module or package names, e.g. ["mypkg.solver"]
+    """
+    module_names = list(module_names)
+    _SELECTED_MODULES.update(module_names)
+    if _FINDER not in sys.meta_path:
+        sys.meta_path.insert(0, _FINDER)
+
+    already_imported = [name for name in module_names if name in sys.modules]
+    if already_imported:
+        warnings.warn(
+            f"Modules {already_imported} were already imported and will only be instrumented after reloading.",
+            stacklevel=2,
+        )
+
+
+def uninstrument_modules(module_names: Iterable[str] | None = None):
+    """
+    Undoes instrument_modules(...) for the given modules (or all modules if None) for future imports.  Modules that
+    were already imported remain instrumented until they are reloaded.
+    """
+    if module_names is None:
+        _SELECTED_MODULES.clear()
+    else:
+        _SELECTED_MODULES.difference_update(module_names)
+    if not _SELECTED_MODULES and (_FINDER in sys.meta_path):
+        sys.meta_path.remove(_FINDER)
+
+
+def get_instrumented_modules() -> list[str]:
+    """Returns the names of all modules currently selected for instrumentation."""
+    return sorted(_SELECTED_MODULES)
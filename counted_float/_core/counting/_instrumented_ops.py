@@ -0,0 +1,134 @@
+"""
+Helper functions called by modules instrumented by instrument_modules(...) (see _import_hook.py).
+
+Operands that are plain floats (or numpy fp scalars) are converted to their counted counterpart, after which the
+operation is evaluated (and counted) by the counted types.  Operations without float operands (e.g. int arithmetic,
+string concatenation, ...) are evaluated as usual.
+"""
+
+from __future__ import annotations
+
+import operator
+
+import numpy as np
+
+from ._counted_complex import CountedComplex
+from ._counted_float import CountedFloat
+from ._counted_float32 import CountedFloat32
+
+# -------------------------------------------------------------------------
+#  Conversion of operands
+# -------------------------------------------------------------------------
+_CONVERSIONS = {
+    float: CountedFloat,
+    np.float64: CountedFloat,
+    np.float32: CountedFloat32,
+    complex: CountedComplex,
+    np.complex128: CountedComplex,
+}
+
+
+def _counted(x):
+    conversion = _CONVERSIONS.get(type(x))
+    return x if conversion is None else conversion(x)
+
+
+# -------------------------------------------------------------------------
+#  Literals
+# -------------------------------------------------------------------------
+def lit(x):
+    """float or complex literal"""
+    return _counted(x)
+
+
+# -------------------------------------------------------------------------
+#  Operations
+# -------------------------------------------------------------------------
+def add(x, y):
+    return _counted(x) + _counted(y)
+
+
+def sub(x, y):
+    return _counted(x) - _counted(y)
+
+
+def mul(x, y):
+    return _counted(x) * _counted(y)
+
+
+def truediv(x, y):
+    return _counted(x) / _counted(y)
+
+
+def pow(x, y):
+    return _counted(x) ** _counted(y)
+
+
+# -------------------------------------------------------------------------
+#  In-place operations  (x += y  ->  x = iadd(x, y))
+# -------------------------------------------------------------------------
+# operator.i...() updates mutable targets (e.g. lists, numpy arrays) in place, like the original statement
+def iadd(x, y):
+    return operator.iadd(_counted(x), _counted(y))
+
+
+def isub(x, y):
+    return operator.isub(_counted(x), _counted(y))
+
+
+def imul(x, y):
+    return operator.imul(_counted(x), _counted(y))
+
+
+def itruediv(x, y):
+    return operator.itruediv(_counted(x), _counted(y))
+
+
+def ipow(x, y):
+    return operator.ipow(_counted(x), _counted(y))
+
+
+# -------------------------------------------------------------------------
+#  In-place operations on items & attributes  (a[i] += y  ->  iaug_item(a, i, iadd, y))
+# -------------------------------------------------------------------------
+# the target object & key are evaluated only once, as they are passed as arguments
+def iaug_item(obj, key, op, y):
+    obj[key] = op(obj[key], y)
+
+
+def iaug_attr(obj, name: str, op, y):
+    setattr(obj, name, op(getattr(obj, name), y))
+
+
+make_slice = slice  # a[i:j] += y  ->  iaug_item(a, make_slice(i, j, None), iadd, y)
+
+
+# -------------------------------------------------------------------------
+#  Unary operations & comparisons
+# -------------------------------------------------------------------------
+def neg(x):
+    return -_counted(x)
+
+
+def eq(x, y):
+    return _counted(x) == _counted(y)
+
+
+def ne(x, y):
+    return _counted(x) != _counted(y)
+
+
+def lt(x, y):
+    return _counted(x) < _counted(y)
+
+
+def le(x, y):
+    return _counted(x) <= _counted(y)
+
+
+def gt(x, y):
+    return _counted(x) > _counted(y)
+
+
+def ge(x, y):
+    return _counted(x) >= _counted(y)
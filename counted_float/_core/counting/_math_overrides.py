@@ -0,0 +1,147 @@
+"""
+Counted versions of some functions of the math & cmath modules, such that they are counted when called with
+CountedFloat, CountedFloat32, CountedInt or CountedComplex arguments (CountedInt being counted as fp64 flops).
+
+These functions are made available in 2 ways:
+  - explicitly, through the counted_float.math & counted_float.cmath namespaces (always counted)
+  - by temporarily patching the math & cmath modules, but ONLY while at least 1 FlopCountingContext is active.
+      Outside of any active context, the original C builtins are restored, such that uncounted code does not suffer
+      any overhead.  See patch_math_modules() & unpatch_math_modules().
+"""
+
+from __future__ import annotations
+
+import cmath
+import math
+from contextlib import contextmanager
+
+from ._counted_complex import CountedComplex
+from ._counted_float import CountedFloat
+from ._counted_float32 import CountedFloat32
+from ._counted_int import CountedInt
+from ._global_counter import GLOBAL_COUNTER, GLOBAL_COUNTER_FP32
+
+# -------------------------------------------------------------------------
+#  original builtins
+# -------------------------------------------------------------------------
+original_math_sqrt = math.sqrt
+original_math_log2 = math.log2
+original_math_pow = math.pow
+original_cmath_sqrt = cmath.sqrt
+original_cmath_polar = cmath.polar
+
+_COUNTED_TYPES = (CountedFloat, CountedFloat32, CountedInt, CountedComplex)
+
+
+# -------------------------------------------------------------------------
+#  counted math functions
+# -------------------------------------------------------------------------
+def math_sqrt(x: float) -> float | CountedFloat | CountedFloat32:
+    if isinstance(x, (CountedFloat, CountedInt)):
+        GLOBAL_COUNTER.incr_sqrt()
+        return CountedFloat(original_math_sqrt(x))
+    elif isinstance(x, CountedFloat32):
+        GLOBAL_COUNTER_FP32.incr_sqrt()
+        return CountedFloat32(original_math_sqrt(x))
+    else:
+        return original_math_sqrt(x)
+
+
+def math_log2(x: float) -> float | CountedFloat | CountedFloat32:
+    if isinstance(x, (CountedFloat, CountedInt)):
+        GLOBAL_COUNTER.incr_log2()
+        return CountedFloat(original_math_log2(x))
+    elif isinstance(x, CountedFloat32):
+        GLOBAL_COUNTER_FP32.incr_log2()
+        return CountedFloat32(original_math_log2(x))
+    else:
+        return original_math_log2(x)
+
+
+def math_pow(x: float, y: float) -> float | CountedFloat | CountedFloat32:
+    if isinstance(x, _COUNTED_TYPES) or isinstance(y, _COUNTED_TYPES):
+        return x**y  # counted by the counted types
+    else:
+        return original_math_pow(x, y)
+
+
+# -------------------------------------------------------------------------
+#  counted cmath functions
+# -------------------------------------------------------------------------
+def cmath_sqrt(z: complex) -> complex | CountedComplex:
+    if isinstance(z, (CountedComplex, CountedFloat)):
+        GLOBAL_COUNTER.incr_complex_sqrt()
+        return CountedComplex(original_cmath_sqrt(z))
+    else:
+        return original_cmath_sqrt(z)
+
+
+def cmath_polar(z: complex) -> tuple[float, float] | tuple[CountedFloat, CountedFloat]:
+    if isinstance(z, (CountedComplex, CountedFloat)):
+        GLOBAL_COUNTER.incr_complex_abs()  # phase(z) is not counted, since no FlopType represents atan2
+        r, phi = original_cmath_polar(z)
+        return CountedFloat(r), CountedFloat(phi)
+    else:
+        return original_cmath_polar(z)
+
+
+# -------------------------------------------------------------------------
+#  scoped patching of math & cmath modules
+# -------------------------------------------------------------------------
+_PATCHES: list[tuple[object, str, object, object]] = [
+    # (module, attribute name, original, counted)
+    (math, "sqrt", original_math_sqrt, math_sqrt),
+    (math, "log2", original_math_log2, math_log2),
+    (math, "pow", original_math_pow, math_pow),
+    (cmath, "sqrt", original_cmath_sqrt, cmath_sqrt),
+    (cmath, "polar", original_cmath_polar, cmath_polar),
+]
+
+_patch_depth: int = 0  # number of outstanding patch_math_modules() calls
+
+
+def patch_math_modules():
+    """
+    Replaces math & cmath functions by their counted versions.  Calls are reference-counted (e.g. for nested
+    FlopCountingContexts), such that modules are only patched on the first call.
+    """
+    global _patch_depth
+    if _patch_depth == 0:
+        for module, name, _, counted in _PATCHES:
+            setattr(module, name, counted)
+    _patch_depth += 1
+
+
+def unpatch_math_modules():
+    """
+    Undoes 1 call to patch_math_modules(); original C builtins are restored once all calls have been undone.
+    """
+    global _patch_depth
+    if _patch_depth == 0:
+        return
+    _patch_depth -= 1
+    if _patch_depth == 0:
+        for module, name, original, _ in _PATCHES:
+            setattr(module, name, original)
+
+
+def math_modules_patched() -> bool:
+    return _patch_depth > 0
+
+
+@contextmanager
+def unpatched_math_modules():
+    """
+    Temporarily restores the original C builtins, if patched, e.g. while compiling code with numba, which only
+    recognizes the originals.
+    """
+    if _patch_depth == 0:
+        yield
+        return
+    for module, name, original, _ in _PATCHES:
+        setattr(module, name, original)
+    try:
+        yield
+    finally:
+        for module, name, _, counted in _PATCHES:
+            setattr(module, name, counted)
@@ -0,0 +1,547 @@
+"""
+Counting flops of plain floats (i.e. without wrapping values in CountedFloat) using sys.monitoring (Python 3.12+).
+
+The bytecode of selected functions / modules is instrumented using INSTRUCTION & CALL events.  Since sys.monitoring
+does not expose the values on the evaluation stack, each code object is analyzed once (cached per code object) by
+simulating its evaluation stack symbolically, such that for each relevant instruction (BINARY_OP, COMPARE_OP,
+UNARY_NEGATIVE) we know where its operands come from:
+
+    - local, global or free variables           -> looked up in the frame at runtime
+    - constants                                 -> known statically
+    - results of earlier counted operations     -> float-ness remembered at runtime
+    - items of lists/tuples/arrays              -> looked up at runtime (only for list, tuple & np.ndarray)
+    - instance attributes & module attributes   -> looked up at runtime (without triggering properties)
+
+Operations are counted (as fp64 flops, in GLOBAL_COUNTER) if at least one operand is a plain float (incl. np.float64)
+and no operand is a counted type (which counts itself).  Operands that cannot be resolved are treated as non-float.
+Calls to math.sqrt, math.log2, math.pow, abs, round, math.floor & math.ceil are counted using CALL events.
+
+Irrelevant instructions are disabled after their first execution (sys.monitoring.DISABLE), such that the remaining
+overhead is limited to the instrumented operations themselves.  They are re-enabled at the start of each session
+by setting the local events of the selected code objects again; sys.monitoring.restart_events() is not used, since it
+would also re-enable events disabled by other tools (e.g. coverage).
+"""
+
+from __future__ import annotations
+
+import builtins
+import dis
+import functools
+import inspect
+import math
+import operator
+import sys
+import types
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+
+from ._counted_complex import CountedComplex
+from ._counted_float import CountedFloat
+from ._counted_float32 import CountedFloat32
+from ._counted_int import CountedInt
+from ._global_counter import GLOBAL_COUNTER
+from ._math_overrides import math_log2, math_pow, math_sqrt
+from .models import FlopType
+
+_TOOL_NAME = "counted_float"
+_COUNTED_TYPES = (CountedFloat, CountedFloat32, CountedComplex, CountedInt)
+_COUNTED_TYPES_SET = set(_COUNTED_TYPES)
+
+# -------------------------------------------------------------------------
+#  Counted instructions & functions
+# -------------------------------------------------------------------------
+_BINARY_OPS: dict[str, FlopType] = {
+    "+": FlopType.ADD,
+    "+=": FlopType.ADD,
+    "-": FlopType.SUB,
+    "-=": FlopType.SUB,
+    "*": FlopType.MUL,
+    "*=": FlopType.MUL,
+    "/": FlopType.DIV,
+    "/=": FlopType.DIV,
+    "**": FlopType.POW,
+    "**=": FlopType.POW,
+}
+
+_COMPARE_OPS: dict[str, FlopType] = {
+    "==": FlopType.EQUALS,
+    "!=": FlopType.EQUALS,
+    "<": FlopType.LTE,
+    "<=": FlopType.LTE,
+    ">": FlopType.GTE,
+    ">=": FlopType.GTE,
+}
+
+_FUNCTIONS: dict[Callable, FlopType] = {
+    math.sqrt: FlopType.SQRT,
+    math.log2: FlopType.LOG2,
+    math.pow: FlopType.POW,
+    math_sqrt: FlopType.SQRT,  # math module is patched while a FlopCountingContext is active
+    math_log2: FlopType.LOG2,
+    math_pow: FlopType.POW,
+    math.floor: FlopType.RND,
+    math.ceil: FlopType.RND,
+    abs: FlopType.ABS,
+    round: FlopType.RND,
+}
+_FLOAT_FUNCTIONS = {math.sqrt, math.log2, math.pow, math_sqrt, math_log2, math_pow}  # always returning floats
+_INT_FUNCTIONS = {math.floor, math.ceil, round}  # returning ints (for the cases we count)
+_POW_FUNCTIONS = {math.pow, math_pow}
+
+
+# =================================================================================================
+#  Static analysis of code objects
+# =================================================================================================
+# operand descriptors:  ("local", name), ("global", name), ("const", value), ("op", offset),
+#                       ("subscr", container, index), ("attr", obj, name), ("unknown",)
+_UNKNOWN = ("unknown",)
+
+
+@dataclass(frozen=True)
+class _OpSite:
+    flop_type: FlopType
+    operands: tuple[tuple, ...]
+    kind: str  # "binary", "compare", "unary", "call"
+
+
+def _analyze_code(code: types.CodeType) -> dict[int, _OpSite]:
+    """Returns all potentially counted operations in the code object, by offset."""
+    sites: dict[int, _OpSite] = dict()
+    stack: list[tuple] = []
+
+    def pop() -> tuple:
+        return stack.pop() if stack else _UNKNOWN
+
+    for instr in dis.get_instructions(code):
+        if instr.is_jump_target:
+            stack = []  # start of basic block; stack contents unknown
+        name = instr.opname
+
+        if name in ("LOAD_FAST", "LOAD_FAST_CHECK", "LOAD_FAST_AND_CLEAR", "LOAD_DEREF"):
+            stack.append(("local", instr.argval))
+        elif name == "LOAD_FAST_LOAD_FAST":
+            stack.extend(("local", var_name) for var_name in instr.argval)
+        elif name == "LOAD_CONST":
+            stack.append(("const", instr.argval))
+        elif name in ("LOAD_GLOBAL", "LOAD_NAME"):
+            pushed = [("global", instr.argval)]
+            if name == "LOAD_GLOBAL" and (instr.arg & 1):
+                pushed.append(_UNKNOWN)  # NULL
+            stack.extend(pushed)
+        elif name == "LOAD_ATTR" and not (instr.arg & 1):
+            stack.append(("attr", pop(), instr.argval))
+        elif name == "BINARY_SUBSCR":
+            index, container = pop(), pop()
+            stack.append(("subscr", container, index))
+        elif name == "BINARY_OP" and instr.argrepr in _BINARY_OPS:
+            right, left = pop(), pop()
+            sites[instr.offset] = _OpSite(_BINARY_OPS[instr.argrepr], (left, right), "binary")
+            stack.append(("op", instr.offset))
+        elif name == "COMPARE_OP" and _compare_symbol(instr.argrepr) in _COMPARE_OPS:
+            right, left = pop(), pop()
+            sites[instr.offset] = _OpSite(_COMPARE_OPS[_compare_symbol(instr.argrepr)], (left, right), "compare")
+            stack.append(_UNKNOWN)  # bool
+        elif name == "UNARY_NEGATIVE":
+            sites[instr.offset] = _OpSite(FlopType.MINUS, (pop(),), "unary")
+            stack.append(("op", instr.offset))
+        elif name == "CALL":
+            args = [pop() for _ in range(instr.arg)][::-1]
+            pop(), pop()  # callable & self/NULL
+            sites[instr.offset] = _OpSite(FlopType.POW, tuple(args), "call")  # flop type determined at runtime
+            stack.append(("op", instr.offset))
+        elif name == "COPY":
+            stack.append(stack[-instr.arg] if len(stack) >= instr.arg else _UNKNOWN)
+        elif name == "SWAP":
+            if len(stack) >= instr.arg:
+                stack[-1], stack[-instr.arg] = stack[-instr.arg], stack[-1]
+            else:
+                stack = []
+        else:
+            try:
+                effect = dis.stack_effect(instr.opcode, instr.arg, jump=False)
+            except ValueError:
+                stack = []
+                continue
+            n_pop, n_push = _pops_pushes(instr, effect)
+            for _ in range(n_pop):
+                pop()
+            stack.extend([_UNKNOWN] * n_push)
+
+    return sites
+
+
+def _compare_symbol(argrepr: str) -> str:
+    # e.g. 'bool(>)' (Python 3.13+) -> '>'
+    if argrepr.startswith("bool(") and argrepr.endswith(")"):
+        return argrepr[5:-1]
+    return argrepr
+
+
+def _pops_pushes(instr: dis.Instruction, effect: int) -> tuple[int, int]:
+    # we only know the net stack effect, so we conservatively assume the top of the stack is consumed & replaced by
+    # unknown values, except for instructions that are known to not touch the stack or to only pop values
+    if instr.opname in _STACK_NEUTRAL:
+        return 0, 0
+    elif instr.opname.startswith(("STORE_", "POP_TOP")):
+        return -effect, 0
+    else:
+        return max(0, -effect) + 1, max(0, effect) + 1
+
+
+_STACK_NEUTRAL = {
+    "NOP",
+    "RESUME",
+    "EXTENDED_ARG",
+    "JUMP_FORWARD",
+    "JUMP_BACKWARD",
+    "JUMP_BACKWARD_NO_INTERRUPT",
+    "NOT_TAKEN",
+    "CACHE",
+}
+
+
+# =================================================================================================
+#  Runtime
+# =================================================================================================
+_FLOAT = object()  # marker for (results of earlier operations that were) plain floats
+_COUNTED = object()  # marker for (results of earlier operations that were) counted types
+
+# runtime handlers, compiled once per code object (see _compile_handlers) & cached; code objects are not hashed
+# at runtime (their hash is not cached by CPython & hence expensive), we use id(code) instead
+_HANDLER_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class _Engine:
+    """Holds the runtime state while a PlainFloatCounting context is active."""
+
+    def __init__(self, codes: list[types.CodeType]):
+        self.codes = codes
+        self.tool_id: int | None = None
+        self.handlers: dict[int, dict[int, Callable]] = {id(code): _get_handlers(code) for code in codes}
+
+    # -------------------------------------------------------------------------
+    #  Start / stop
+    # -------------------------------------------------------------------------
+    def start(self):
+        monitoring = sys.monitoring
+        self.tool_id = _free_tool_id()
+        monitoring.use_tool_id(self.tool_id, _TOOL_NAME)
+        monitoring.register_callback(self.tool_id, monitoring.events.INSTRUCTION, self.on_instruction)
+        monitoring.register_callback(self.tool_id, monitoring.events.CALL, self.on_call)
+        for code in self.codes:
+            # (re-)setting local events also re-enables events of this tool disabled during earlier sessions
+            monitoring.set_local_events(self.tool_id, code, monitoring.events.INSTRUCTION | monitoring.events.CALL)
+
+    def stop(self):
+        monitoring = sys.monitoring
+        for code in self.codes:
+            monitoring.set_local_events(self.tool_id, code, monitoring.events.NO_EVENTS)
+        monitoring.register_callback(self.tool_id, monitoring.events.INSTRUCTION, None)
+        monitoring.register_callback(self.tool_id, monitoring.events.CALL, None)
+        monitoring.free_tool_id(self.tool_id)
+        self.tool_id = None
+
+    # -------------------------------------------------------------------------
+    #  Callbacks
+    # -------------------------------------------------------------------------
+    def on_instruction(self, code: types.CodeType, offset: int):
+        handler = self.handlers[id(code)].get(offset)
+        if handler is None:
+            return sys.monitoring.DISABLE  # not relevant
+        handler(sys._getframe(1))
+
+    def on_call(self, code: types.CodeType, offset: int, func: Any, arg0: Any):
+        handler = self.handlers[id(code)].get(-offset - 1)  # call handlers are stored at negative offsets
+        if handler is not None:
+            handler(sys._getframe(1), func, arg0)
+
+
+def _get_handlers(code: types.CodeType) -> dict[int, Callable]:
+    handlers = _HANDLER_CACHE.get(code)
+    if handlers is None:
+        handlers = _HANDLER_CACHE[code] = _compile_handlers(code)
+    return handlers
+
+
+# -------------------------------------------------------------------------
+#  Handler compilation
+# -------------------------------------------------------------------------
+def _compile_handlers(code: types.CodeType) -> dict[int, Callable]:
+    """
+    Returns a handler per counted operation in the code object, specialized for its operand descriptors.
+    Handlers of calls are stored at offset -offset-1.
+    """
+    result_kinds: dict[int, object] = dict()  # per offset: kind of the last result (_FLOAT, _COUNTED or None)
+    counters = {flop_type: _count_factory_late_bound(flop_type) for flop_type in FlopType}
+    handlers: dict[int, Callable] = dict()
+    for offset, site in _analyze_code(code).items():
+        resolvers = [_compile_resolver(operand, result_kinds) for operand in site.operands]
+        if site.kind == "call":
+            handlers[-offset - 1] = _call_handler(offset, resolvers, result_kinds, counters)
+        else:
+            handlers[offset] = _op_handler(offset, site, resolvers, result_kinds, counters)
+    return handlers
+
+
+def _count_factory_late_bound(flop_type: FlopType) -> Callable[[], None]:
+    # the increment method is looked up on GLOBAL_COUNTER at each call (not bound once), since handlers are cached
+    # across sessions, while budgets replace the increment methods by budget-checking versions (see _budget.py)
+    return functools.partial(operator.methodcaller(f"incr_{flop_type.name.lower()}"), GLOBAL_COUNTER)
+
+
+def _op_handler(offset: int, site: _OpSite, resolvers: list[Callable], result_kinds: dict, counters: dict):
+    count = counters[site.flop_type]
+    if site.kind == "unary":
+        (resolve,) = resolvers
+
+        def handler(frame: types.FrameType):
+            f_locals = frame.f_locals
+            kind = result_kinds[offset] = _classify((resolve(frame, f_locals),))
+            if kind is _FLOAT:
+                count()
+
+    elif site.kind == "compare":
+        resolve_left, resolve_right = resolvers
+        count_zero = counters[FlopType.CMP_ZERO]
+
+        def handler(frame: types.FrameType):
+            f_locals = frame.f_locals
+            values = (resolve_left(frame, f_locals), resolve_right(frame, f_locals))
+            if _classify(values) is _FLOAT:
+                if _is_int(values[0], 0) or _is_int(values[1], 0):
+                    count_zero()
+                else:
+                    count()
+
+    elif site.flop_type == FlopType.POW:
+        resolve_left, resolve_right = resolvers
+        count_mul, count_pow2 = counters[FlopType.MUL], counters[FlopType.POW2]
+
+        def handler(frame: types.FrameType):
+            f_locals = frame.f_locals
+            values = (resolve_left(frame, f_locals), resolve_right(frame, f_locals))
+            kind = result_kinds[offset] = _classify(values)
+            if kind is _FLOAT:
+                if _is_int(values[1], 2):
+                    count_mul()  # x**2 = x*x
+                elif _is_int(values[0], 2):
+                    count_pow2()
+                else:
+                    count()
+
+    else:
+        resolve_left, resolve_right = resolvers
+
+        def handler(frame: types.FrameType):
+            f_locals = frame.f_locals
+            kind = result_kinds[offset] = _classify((resolve_left(frame, f_locals), resolve_right(frame, f_locals)))
+            if kind is _FLOAT:
+                count()
+
+    return handler
+
+
+def _call_handler(offset: int, resolvers: list[Callable], result_kinds: dict, counters: dict):
+    resolve_arg1 = resolvers[1] if len(resolvers) > 1 else None
+
+    def handler(frame: types.FrameType, func: Any, arg0: Any):
+        try:
+            flop_type = _FUNCTIONS.get(func)
+        except TypeError:
+            flop_type = None  # unhashable callable
+        if flop_type is None:
+            result_kinds[offset] = None
+            return
+
+        values = (arg0,) if resolve_arg1 is None else (arg0, resolve_arg1(frame, frame.f_locals))
+        kind = _classify(values)
+        if func in _FLOAT_FUNCTIONS:
+            result_kinds[offset] = _FLOAT if kind is None else kind
+        elif func in _INT_FUNCTIONS:
+            result_kinds[offset] = None
+        else:
+            result_kinds[offset] = kind
+        if kind is _FLOAT:
+            if (func in _POW_FUNCTIONS) and len(values) > 1:
+                if _is_int(values[1], 2):
+                    flop_type = FlopType.MUL
+                elif _is_int(values[0], 2):
+                    flop_type = FlopType.POW2
+            counters[flop_type]()
+
+    return handler
+
+
+def _compile_resolver(operand: tuple, result_kinds: dict[int, object]) -> Callable[[types.FrameType, Mapping], Any]:
+    """Returns a function returning the runtime value of an operand (or None if it cannot be resolved)."""
+    kind = operand[0]
+    if kind == "local":
+        name = operand[1]
+        return lambda frame, f_locals: f_locals.get(name)
+    elif kind == "const":
+        value = operand[1]
+        return lambda frame, f_locals: value
+    elif kind == "op":
+        op_offset = operand[1]
+        return lambda frame, f_locals: result_kinds.get(op_offset)
+    elif kind == "global":
+        name = operand[1]
+        builtin_value = getattr(builtins, name, None)
+        return lambda frame, f_locals: frame.f_globals.get(name, builtin_value)
+    elif kind == "subscr":
+        resolve_container = _compile_resolver(operand[1], result_kinds)
+        resolve_index = _compile_resolver(operand[2], result_kinds)
+
+        def resolve_subscr(frame: types.FrameType, f_locals: Mapping) -> Any:
+            container = resolve_container(frame, f_locals)
+            if isinstance(container, (list, tuple, np.ndarray)):
+                try:
+                    return container[resolve_index(frame, f_locals)]
+                except Exception:
+                    return None
+
+        return resolve_subscr
+    elif kind == "attr":
+        resolve_obj = _compile_resolver(operand[1], result_kinds)
+        name = operand[2]
+
+        def resolve_attr(frame: types.FrameType, f_locals: Mapping) -> Any:
+            obj = resolve_obj(frame, f_locals)
+            if isinstance(obj, types.ModuleType):
+                return getattr(obj, name, None)
+            try:
+                return vars(obj).get(name)  # instance attributes only, no properties
+            except TypeError:
+                return None
+
+        return resolve_attr
+    else:
+        return lambda frame, f_locals: None
+
+
+def _classify(values: tuple) -> object | None:
+    """
+    Returns _COUNTED if any value is of a counted type (which counts itself), _FLOAT if any other value is a float and
+    None otherwise.  These markers are also used to remember the kind of results of earlier operations.
+    """
+    result = None
+    for v in values:
+        v_type = type(v)
+        if (v_type is float) or (v is _FLOAT):
+            result = _FLOAT  # fast path for the most common case
+        elif (v is None) or (v_type is int):
+            continue
+        elif (v is _COUNTED) or (v_type in _COUNTED_TYPES_SET) or isinstance(v, _COUNTED_TYPES):
+            return _COUNTED
+        elif isinstance(v, float):
+            result = _FLOAT  # e.g. np.float64
+    return result
+
+
+def _is_int(value: Any, n: int) -> bool:
+    return isinstance(value, int) and (not isinstance(value, bool)) and (value == n)
+
+
+def _free_tool_id() -> int:
+    for tool_id in range(6):
+        if sys.monitoring.get_tool(tool_id) is None:
+            return tool_id
+    raise RuntimeError("No free sys.monitoring tool id available.")
+
+
+# =================================================================================================
+#  Collecting code objects
+# =================================================================================================
+def _collect_codes(targets: Iterable) -> list[types.CodeType]:
+    codes: dict[types.CodeType, None] = dict()  # ordered set
+    for target in targets:
+        for code in _target_codes(target):
+            _add_code_recursively(code, codes)
+    return list(codes)
+
+
+def _target_codes(target: Any) -> Iterable[types.CodeType]:
+    if isinstance(target, types.CodeType):
+        yield target
+    elif isinstance(target, types.ModuleType):
+        for value in vars(target).values():
+            if getattr(value, "__module__", None) == target.__name__:
+                if inspect.isclass(value):
+                    for member in vars(value).values():
+                        yield from _function_codes(member)
+                else:
+                    yield from _function_codes(value)
+    else:
+        codes = list(_function_codes(target))
+        if not codes:
+            raise TypeError(f"Cannot instrument object of type {type(target).__name__}; expected function or module.")
+        yield from codes
+
+
+def _function_codes(obj: Any) -> Iterable[types.CodeType]:
+    if isinstance(obj, (staticmethod, classmethod)):
+        obj = obj.__func__
+    elif isinstance(obj, property):
+        for accessor in (obj.fget, obj.fset, obj.fdel):
+            if accessor is not None:
+                yield from _function_codes(accessor)
+        return
+    if inspect.ismethod(obj):
+        obj = obj.__func__
+    if callable(obj):
+        obj = inspect.unwrap(obj)
+    if inspect.isfunction(obj):
+        yield obj.__code__
+
+
+def _add_code_recursively(code: types.CodeType, codes: dict[types.CodeType, None]):
+    if code not in codes:
+        codes[code] = None
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                _add_code_recursively(const, codes)  # nested functions, lambdas, comprehensions, ...
+
+
+# =================================================================================================
+#  PlainFloatCounting
+# =================================================================================================
+class PlainFloatCounting:
+    """
+    Context manager that counts flops of plain floats in the selected functions and/or modules using sys.monitoring
+    (Python 3.12+), without the need to wrap values in CountedFloat.  Flops are counted as fp64 flops in the
+    global counter, such that they are picked up by all active FlopCountingContexts.
+
+    Usage:
+        with FlopCountingContext() as ctx, PlainFloatCounting([my_module, my_function]):
+            my_function(1.0, 2.0)
+
+    Modules are instrumented by instrumenting all functions & methods defined in them (module-level code is not
+    instrumented, since it has already been executed).  Nested functions, lambdas & comprehensions are instrumented
+    as well.  See _monitoring.py for how operands are resolved and which operations are counted.
+
+    LIMITATIONS:
+        - not thread-safe & only 1 PlainFloatCounting context can be active at the same time
+        - operands that cannot be resolved statically (e.g. results of arbitrary function calls or of properties)
+          are treated as non-float
+    """
+
+    _active: bool = False
+
+    def __init__(self, targets: Iterable):
+        if sys.version_info < (3, 12):
+            raise RuntimeError("PlainFloatCounting requires Python 3.12 or later (sys.monitoring).")
+        self.__engine = _Engine(_collect_codes(targets))
+
+    def __enter__(self):
+        if PlainFloatCounting._active:
+            raise RuntimeError("Only 1 PlainFloatCounting context can be active at the same time.")
+        self.__engine.start()
+        PlainFloatCounting._active = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.__engine.stop()
+        PlainFloatCounting._active = False
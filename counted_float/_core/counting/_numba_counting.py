@@ -0,0 +1,449 @@
+"""
+Flop counting inside numba-compiled code.
+
+@counted_njit compiles a function with numba.njit after rewriting its AST, such that each floating-point operation
+increments a counter in a hidden int64 array of shape (len(Precision), len(FlopType)):
+
+    a * b           ->  __cf_mul_mul(__cf_counts__, a, b)
+    x ** 2          ->  __cf_pow_mul(__cf_counts__, x, 2)          (special cases as in CountedFloat)
+    x < 0           ->  __cf_lt_cmp_zero(__cf_counts__, x, 0)
+    -x              ->  -__cf_tick_minus(__cf_counts__, x)
+    math.sqrt(x)    ->  math.sqrt(__cf_tick_sqrt(__cf_counts__, x))
+    s += x          ->  s = __cf_iadd_add(__cf_counts__, s, x)      (arrays are updated in place)
+    g(x)            ->  __cf_impl_g(__cf_counts__, x)              (if g is a @counted_njit function itself)
+
+The helpers are implemented as numba overloads, which decide at compile time -based on the operand types- whether
+(and in which precision) an operation is counted: only float64 & float32 operations are counted, such that e.g. integer
+index arithmetic has zero overhead.  Operations on arrays are counted once per element of the result.
+
+The counter array is allocated per call of the decorated function and merged into the global counters when the
+call returns, such that counts are picked up by FlopCountingContext as usual.
+
+Without numba installed, the instrumented function is executed as plain Python (with identical counts).
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import inspect
+import math
+import textwrap
+from typing import Any, Callable
+
+import numpy as np
+
+from counted_float._core.compatibility import is_numba_installed, numba
+
+from ._global_counter import GLOBAL_COUNTERS
+from ._math_overrides import unpatched_math_modules
+from .models import FlopType, Precision
+
+_COUNTS = "__cf_counts__"
+_FLOP_TYPES: list[FlopType] = list(FlopType)
+_PRECISIONS: list[Precision] = [Precision.FP64, Precision.FP32]  # rows of the counter array
+_COUNTS_SHAPE = (len(_PRECISIONS), len(_FLOP_TYPES))
+
+
+# =================================================================================================
+#  Counting helpers
+# =================================================================================================
+_BINARY_EXPRESSIONS: dict[str, str] = {
+    "add": "a + b",
+    "sub": "a - b",
+    "mul": "a * b",
+    "truediv": "a / b",
+    "pow": "a ** b",
+    "mathpow": "math.pow(a, b)",
+    "eq": "a == b",
+    "ne": "a != b",
+    "lt": "a < b",
+    "le": "a <= b",
+    "gt": "a > b",
+    "ge": "a >= b",
+}
+
+# in-place operations (augmented assignments): arrays are updated in place, scalars are rebound as usual
+_INPLACE_OPERATORS: dict[str, str] = {
+    "iadd": "+",
+    "isub": "-",
+    "imul": "*",
+    "itruediv": "/",
+    "ipow": "**",
+}
+
+_HELPERS: dict[str, Callable] = {}  # helper name -> python function (with numba overload, if numba is installed)
+
+
+def _helper_name(op: str, flop_type: FlopType) -> str:
+    return f"__cf_{op}_{flop_type.name.lower()}"
+
+
+def _get_helper(op: str, flop_type: FlopType) -> Callable:
+    """Returns (and creates on first use) the helper for a binary op ('add', ...), in-place op ('iadd', ...) or 'tick'."""
+    name = _helper_name(op, flop_type)
+    helper = _HELPERS.get(name)
+    if helper is None:
+        helper = _HELPERS[name] = _create_helper(op, flop_type)
+    return helper
+
+
+def _create_helper(op: str, flop_type: FlopType) -> Callable:
+    i_flop_type = _FLOP_TYPES.index(flop_type)
+
+    # --- python implementation ---
+    if op == "tick":
+
+        def helper(counts, a):
+            row = _py_precision_row(a)
+            if row is not None:
+                counts[row, i_flop_type] += np.size(a)
+            return a
+
+    elif op in _INPLACE_OPERATORS:
+        helper = _exec_template(
+            _PY_INPLACE_TEMPLATE, f"a {_INPLACE_OPERATORS[op]}= b", row=None, i_flop_type=i_flop_type
+        )
+
+    else:
+        helper = _exec_template(_PY_BINARY_TEMPLATE, _BINARY_EXPRESSIONS[op], row=None, i_flop_type=i_flop_type)
+
+    # --- numba implementation ---
+    if is_numba_installed():
+        from numba.extending import overload
+
+        if op == "tick":
+
+            @overload(helper)
+            def helper_overload(counts, a):
+                return _nb_impl(_NB_TICK_TEMPLATE, "a", (a,), i_flop_type)
+
+        elif op in _INPLACE_OPERATORS:
+            from numba.core import types
+
+            @overload(helper)
+            def helper_overload(counts, a, b):
+                operator = _INPLACE_OPERATORS[op]
+                if isinstance(a, types.Array):
+                    return _nb_impl(_NB_INPLACE_TEMPLATE, f"a {operator}= b", (a, b), i_flop_type)
+                return _nb_impl(_NB_BINARY_TEMPLATE, f"a {operator} b", (a, b), i_flop_type)
+
+        else:
+
+            @overload(helper)
+            def helper_overload(counts, a, b):
+                return _nb_impl(_NB_BINARY_TEMPLATE, _BINARY_EXPRESSIONS[op], (a, b), i_flop_type)
+
+    return helper
+
+
+# -------------------------------------------------------------------------
+#  Templates
+# -------------------------------------------------------------------------
+_PY_BINARY_TEMPLATE = """
+def helper(counts, a, b):
+    r = {expr}
+    row = _py_precision_row(a, b)
+    if row is not None:
+        counts[row, {i_flop_type}] += np.size(r)
+    return r
+"""
+
+_PY_INPLACE_TEMPLATE = """
+def helper(counts, a, b):
+    {expr}
+    row = _py_precision_row(a, b)
+    if row is not None:
+        counts[row, {i_flop_type}] += np.size(a)
+    return a
+"""
+
+_NB_BINARY_TEMPLATE = """
+def impl(counts, a, b):
+    r = {expr}
+    {count}
+    return r
+"""
+
+_NB_INPLACE_TEMPLATE = """
+def impl(counts, a, b):
+    {expr}
+    r = a
+    {count}
+    return r
+"""
+
+_NB_TICK_TEMPLATE = """
+def impl(counts, a):
+    r = {expr}
+    {count}
+    return r
+"""
+
+_NB_IMPL_CACHE: dict[tuple, Callable] = {}
+
+
+def _exec_template(template: str, expr: str, row: int | None, i_flop_type: int, is_array: bool = False) -> Callable:
+    if row is None:
+        count = "pass"
+    else:
+        count = f"counts[{row}, {i_flop_type}] += " + ("r.size" if is_array else "1")
+    namespace = {"math": math, "np": np, "_py_precision_row": _py_precision_row}
+    exec(template.format(expr=expr, count=count, i_flop_type=i_flop_type), namespace)
+    return namespace.get("helper") or namespace["impl"]
+
+
+def _nb_impl(template: str, expr: str, operand_types: tuple, i_flop_type: int) -> Callable:
+    # called by numba at compile time, with numba types of all operands
+    from numba.core import types
+
+    row = _nb_precision_row(operand_types)
+    is_array = any(isinstance(t, types.Array) for t in operand_types)
+    key = (template, expr, row, i_flop_type, is_array)
+    impl = _NB_IMPL_CACHE.get(key)
+    if impl is None:
+        impl = _NB_IMPL_CACHE[key] = _exec_template(template, expr, row, i_flop_type, is_array)
+    return impl
+
+
+# -------------------------------------------------------------------------
+#  Precision detection
+# -------------------------------------------------------------------------
+def _py_precision_row(*values: Any) -> int | None:
+    """Row of the counter array (0: fp64, 1: fp32) for operations on these values, or None if not counted."""
+    rows = []
+    for v in values:
+        if isinstance(v, (np.ndarray, np.generic)):
+            if v.dtype.kind == "f":
+                rows.append(0 if v.dtype.itemsize == 8 else 1)
+        elif isinstance(v, float):
+            rows.append(0)
+    return min(rows, default=None)  # fp64 dominates fp32
+
+
+def _nb_precision_row(operand_types: tuple) -> int | None:
+    """Compile-time counterpart of _py_precision_row, based on numba types."""
+    from numba.core import types
+
+    rows = []
+    for t in operand_types:
+        dtype = t.dtype if isinstance(t, types.Array) else t
+        if isinstance(dtype, types.Float):
+            rows.append(0 if dtype.bitwidth == 64 else 1)
+    return min(rows, default=None)
+
+
+# =================================================================================================
+#  AST transformation
+# =================================================================================================
+_BINARY_OPS: dict[type, tuple[str, FlopType]] = {  # (in-place ops: 'i' + op)
+    ast.Add: ("add", FlopType.ADD),
+    ast.Sub: ("sub", FlopType.SUB),
+    ast.Mult: ("mul", FlopType.MUL),
+    ast.Div: ("truediv", FlopType.DIV),
+    ast.Pow: ("pow", FlopType.POW),
+}
+
+_COMPARE_OPS: dict[type, tuple[str, FlopType]] = {
+    ast.Eq: ("eq", FlopType.EQUALS),
+    ast.NotEq: ("ne", FlopType.EQUALS),
+    ast.Lt: ("lt", FlopType.LTE),
+    ast.LtE: ("le", FlopType.LTE),
+    ast.Gt: ("gt", FlopType.GTE),
+    ast.GtE: ("ge", FlopType.GTE),
+}
+
+_TICK_FUNCTIONS: dict[str, FlopType] = {  # keyed by function name (without module)
+    "abs": FlopType.ABS,
+    "sqrt": FlopType.SQRT,
+    "log2": FlopType.LOG2,
+    "floor": FlopType.RND,
+    "ceil": FlopType.RND,
+    "round": FlopType.RND,
+}
+
+
+class _NumbaCountingTransformer(ast.NodeTransformer):
+    def __init__(self, namespace: dict[str, Any]):
+        self.namespace = namespace  # globals of the function; receives all helpers referenced by the rewritten code
+
+    # -------------------------------------------------------------------------
+    #  Function definition
+    # -------------------------------------------------------------------------
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
+        node.decorator_list = []
+        node.args.posonlyargs = []  # keep things simple for numba
+        node.args.args.insert(0, ast.arg(arg=_COUNTS))
+        node.body = [self.visit(stmt) for stmt in node.body]
+        return node
+
+    # -------------------------------------------------------------------------
+    #  Operations
+    # -------------------------------------------------------------------------
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        if type(node.op) not in _BINARY_OPS:
+            return node
+        op, flop_type = _BINARY_OPS[type(node.op)]
+        if op == "pow":
+            if _is_constant(node.right, 2):
+                flop_type = FlopType.MUL
+            elif _is_constant(node.left, 2):
+                flop_type = FlopType.POW2
+        return self._helper_call(node, op, flop_type, [node.left, node.right])
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if (len(node.ops) != 1) or (type(node.ops[0]) not in _COMPARE_OPS):
+            return node
+        op, flop_type = _COMPARE_OPS[type(node.ops[0])]
+        left, right = node.left, node.comparators[0]
+        if _is_constant(left, 0) or _is_constant(right, 0):
+            flop_type = FlopType.CMP_ZERO
+        return self._helper_call(node, op, flop_type, [left, right])
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.USub) and not isinstance(node.operand, ast.Constant):
+            node.operand = self._helper_call(node.operand, "tick", FlopType.MINUS, [node.operand])
+        return node
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> ast.AST:
+        self.generic_visit(node)
+        if (type(node.op) not in _BINARY_OPS) or not _is_side_effect_free(node.target):
+            return node
+        op, flop_type = _BINARY_OPS[type(node.op)]
+        if (op == "pow") and _is_constant(node.value, 2):
+            flop_type = FlopType.MUL
+        value = self._helper_call(node, f"i{op}", flop_type, [_as_load(node.target), node.value])
+        return ast.copy_location(ast.Assign(targets=[node.target], value=value), node)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        name = _call_name(node)
+
+        # --- calls to other @counted_njit functions ---
+        if isinstance(node.func, ast.Name) and isinstance(self.namespace.get(name), CountedNjitFunction):
+            impl_name = f"__cf_impl_{name}"
+            self.namespace[impl_name] = self.namespace[name].dispatcher
+            node.func = ast.copy_location(ast.Name(id=impl_name, ctx=ast.Load()), node.func)
+            node.args.insert(0, ast.Name(id=_COUNTS, ctx=ast.Load()))
+            return node
+
+        # --- math functions ---
+        if (name == "pow") and _is_attribute_of(node.func, "math") and (len(node.args) == 2):
+            return self._helper_call(node, "mathpow", FlopType.POW, node.args)
+        if (name in _TICK_FUNCTIONS) and node.args:
+            node.args[0] = self._helper_call(node.args[0], "tick", _TICK_FUNCTIONS[name], [node.args[0]])
+        return node
+
+    # -------------------------------------------------------------------------
+    #  Helpers
+    # -------------------------------------------------------------------------
+    def _helper_call(self, node: ast.AST, op: str, flop_type: FlopType, args: list[ast.expr]) -> ast.Call:
+        name = _helper_name(op, flop_type)
+        self.namespace[name] = _get_helper(op, flop_type)
+        call = ast.Call(
+            func=ast.Name(id=name, ctx=ast.Load()), args=[ast.Name(id=_COUNTS, ctx=ast.Load()), *args], keywords=[]
+        )
+        return ast.copy_location(call, node)
+
+
+def _call_name(node: ast.Call) -> str | None:
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def _is_attribute_of(node: ast.expr, module_name: str) -> bool:
+    return isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == module_name
+
+
+def _is_constant(node: ast.expr, value: int) -> bool:
+    return isinstance(node, ast.Constant) and type(node.value) in (int, float) and node.value == value
+
+
+def _is_side_effect_free(node: ast.expr) -> bool:
+    # targets of augmented assignments that can safely be evaluated twice, e.g. 's', 'a[i]', 'a[i, j+1]'
+    allowed = (ast.Name, ast.Constant, ast.Subscript, ast.Tuple, ast.BinOp, ast.expr_context, ast.operator)
+    return all(isinstance(n, allowed) for n in ast.walk(node))
+
+
+def _as_load(node: ast.expr) -> ast.expr:
+    node = _copy_ast(node)
+    for n in ast.walk(node):
+        if hasattr(n, "ctx"):
+            n.ctx = ast.Load()
+    return node
+
+
+def _copy_ast(node: ast.expr) -> ast.expr:
+    return ast.parse(ast.unparse(node), mode="eval").body
+
+
+# =================================================================================================
+#  Decorator
+# =================================================================================================
+class CountedNjitFunction:
+    """Numba-compiled function counting its flops; see @counted_njit."""
+
+    def __init__(self, py_func: Callable, numba_options: dict[str, Any]):
+        if py_func.__code__.co_freevars:
+            raise TypeError(f"@counted_njit does not support closures ({py_func.__qualname__}).")
+        functools.update_wrapper(self, py_func)
+        self.py_func = py_func
+        self.__numba_options = numba_options
+        self.__dispatcher = None
+
+    @property
+    def dispatcher(self) -> Callable:
+        """Instrumented & numba-compiled function, taking the counter array as its first argument."""
+        if self.__dispatcher is None:
+            self.__dispatcher = numba.njit(**self.__numba_options)(self._instrument())
+        return self.__dispatcher
+
+    def _instrument(self) -> Callable:
+        # compiled lazily (i.e. on first call), such that other @counted_njit functions it calls can be defined later
+        source_lines, first_line = inspect.getsourcelines(self.py_func)
+        tree = ast.parse(textwrap.dedent("".join(source_lines)))
+        ast.increment_lineno(tree, first_line - 1)
+        func_def = tree.body[0]
+        if not isinstance(func_def, ast.FunctionDef):
+            raise TypeError(f"Could not find a function definition in the source of {self.py_func.__qualname__}.")
+
+        namespace = dict(self.py_func.__globals__)
+        func_def = _NumbaCountingTransformer(namespace).visit(func_def)
+        module = ast.fix_missing_locations(ast.Module(body=[func_def], type_ignores=[]))
+        exec(compile(module, inspect.getsourcefile(self.py_func) or "<counted_njit>", "exec"), namespace)
+        return namespace[func_def.name]
+
+    def __call__(self, *args, **kwargs):
+        counts = np.zeros(_COUNTS_SHAPE, dtype=np.int64)
+        try:
+            with unpatched_math_modules():  # the call might trigger compilation for new argument types
+                return self.dispatcher(counts, *args, **kwargs)
+        finally:
+            _merge_counts(counts)
+
+
+def _merge_counts(counts: np.ndarray):
+    """Books the counts of a counter array into the global counters."""
+    for row, precision in enumerate(_PRECISIONS):
+        counter = GLOBAL_COUNTERS[precision]
+        for i_flop_type in np.flatnonzero(counts[row]):
+            counter.incr_flop_type(_FLOP_TYPES[i_flop_type], int(counts[row, i_flop_type]))
+
+
+def counted_njit(func: Callable | None = None, **numba_options) -> CountedNjitFunction | Callable:
+    """
+    Decorator compiling a function with numba.njit(**numba_options), while counting all of its float64 & float32
+    operations (scalar & element-wise array operations).  Counts are added to the global counters when the function
+    returns, such that they are picked up by any active FlopCountingContext.
+
+    Can be used with or without arguments:  @counted_njit  or  @counted_njit(fastmath=False)
+    """
+    if func is not None:
+        return CountedNjitFunction(func, numba_options)
+    return lambda f: CountedNjitFunction(f, numba_options)
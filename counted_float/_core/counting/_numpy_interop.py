@@ -0,0 +1,144 @@
+"""
+Interoperability with numpy scalars.
+
+numpy scalars (e.g. np.float64, or values taken from numpy arrays via arr[i]) are dispatched to numpy first in mixed
+expressions such as np.float64(x) * CountedFloat(y), such that, without intervention, results come back uncounted and
+as plain numpy scalars.  All counted types therefore implement __array_ufunc__ (delegating to array_ufunc below),
+which makes numpy hand over control for all ufuncs with a counted operand.
+
+For ufuncs with a counted equivalent and only scalar inputs, numpy scalars are converted to their counted
+counterpart and the operation is evaluated (and counted) by the counted types:
+
+    np.float32                      -> CountedFloat32
+    other np.floating               -> CountedFloat
+    np.integer                      -> CountedInt
+    np.complexfloating              -> CountedComplex
+
+In all other cases (arrays, reductions, 'out' arguments, ...), counted operands are converted to plain Python scalars
+and the ufunc is evaluated by numpy as usual, i.e. uncounted.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+from typing import Any, Callable
+
+import numpy as np
+
+
+# -------------------------------------------------------------------------
+#  ufunc -> counted equivalent
+# -------------------------------------------------------------------------
+def _math_sqrt(x):
+    from ._math_overrides import math_sqrt  # imported lazily to avoid circular imports
+
+    return math_sqrt(x)
+
+
+def _math_log2(x):
+    from ._math_overrides import math_log2  # imported lazily to avoid circular imports
+
+    return math_log2(x)
+
+
+_SCALAR_UFUNCS: dict[np.ufunc, Callable] = {
+    # arithmetic
+    np.add: operator.add,
+    np.subtract: operator.sub,
+    np.multiply: operator.mul,
+    np.true_divide: operator.truediv,
+    np.floor_divide: operator.floordiv,
+    np.remainder: operator.mod,
+    np.power: operator.pow,
+    np.negative: operator.neg,
+    np.positive: operator.pos,
+    np.absolute: operator.abs,
+    np.sqrt: _math_sqrt,
+    np.log2: _math_log2,
+    # comparisons
+    np.equal: operator.eq,
+    np.not_equal: operator.ne,
+    np.less: operator.lt,
+    np.less_equal: operator.le,
+    np.greater: operator.gt,
+    np.greater_equal: operator.ge,
+    # bitwise
+    np.left_shift: operator.lshift,
+    np.right_shift: operator.rshift,
+    np.bitwise_and: operator.and_,
+    np.bitwise_or: operator.or_,
+    np.bitwise_xor: operator.xor,
+    np.invert: operator.invert,
+}
+
+
+# -------------------------------------------------------------------------
+#  __array_ufunc__ implementation
+# -------------------------------------------------------------------------
+def array_ufunc(ufunc: np.ufunc, method: str, *inputs, **kwargs) -> Any:
+    """Implementation of __array_ufunc__ shared by all counted types; see module docstring for details."""
+    if method == "__call__" and not kwargs and ufunc in _SCALAR_UFUNCS and all(_is_scalar(x) for x in inputs):
+        try:
+            return _SCALAR_UFUNCS[ufunc](*[_as_counted_scalar(x) for x in inputs])
+        except (ArithmeticError, ValueError):
+            pass  # e.g. division by zero or math domain errors -> let numpy return inf/nan (+ warning) as usual
+
+    return getattr(ufunc, method)(*[_as_plain_scalar(x) for x in inputs], **kwargs)
+
+
+# -------------------------------------------------------------------------
+#  Helpers
+# -------------------------------------------------------------------------
+def _is_scalar(x) -> bool:
+    return isinstance(x, (int, float, complex, np.generic)) or (isinstance(x, np.ndarray) and x.ndim == 0)
+
+
+def _as_counted_scalar(x):
+    if isinstance(x, np.ndarray):
+        x = x[()]  # 0-d array -> numpy scalar
+    if isinstance(x, np.generic):
+        for np_type, counted_type in _numpy_to_counted_types():
+            if isinstance(x, np_type):
+                return counted_type(x.item())
+        return x.item()  # e.g. np.bool_
+    return x
+
+
+def _as_plain_scalar(x):
+    for counted_type, plain_type in _counted_to_plain_types():
+        if isinstance(x, counted_type):
+            return plain_type(x)
+    return x
+
+
+@functools.cache
+def _numpy_to_counted_types() -> tuple[tuple[type, type], ...]:
+    # imported lazily to avoid circular imports, since all counted types depend on this module
+    from ._counted_complex import CountedComplex
+    from ._counted_float import CountedFloat
+    from ._counted_float32 import CountedFloat32
+    from ._counted_int import CountedInt
+
+    return (
+        (np.float32, CountedFloat32),
+        (np.floating, CountedFloat),
+        (np.integer, CountedInt),
+        (np.complexfloating, CountedComplex),
+    )
+
+
+@functools.cache
+def _counted_to_plain_types() -> tuple[tuple[type, type], ...]:
+    # imported lazily to avoid circular imports, since all counted types depend on this module
+    from ._counted_complex import CountedComplex
+    from ._counted_float import CountedFloat
+    from ._counted_float32 import CountedFloat32
+    from ._counted_int import CountedInt
+
+    return (
+        (CountedFloat, float),
+        (CountedFloat32, float),
+        (CountedInt, int),
+        (CountedComplex, complex),
+    )
@@ -0,0 +1,173 @@
+"""
+Per-iteration cost recording for iterative algorithms (optimizers, solvers, ...), to obtain the cost per iteration
+and the cumulative cost as a function of a convergence metric, rather than just a total:
+
+    with CostRecorder() as recorder:
+        while not converged:
+            x = update(x)
+            recorder.step(metric=residual(x))
+
+    recorder.step_costs()               ->  weighted cost of each iteration
+    recorder.cost_to_converge(1e-8)     ->  cumulative weighted cost until the metric first reached 1e-8
+
+At each step(), the cumulative counts of the global counters are stored as tuples in a preallocated buffer (one entry
+per step), i.e. at O(1) cost and without creating FlopCounts objects; per-step counts are only computed (as
+differences between consecutive entries, using numpy) when requested.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from ._context_managers import FlopCountingContext
+from ._global_counter import GLOBAL_COUNTERS
+from .models import FlopCounts, FlopCountsTable, FlopType, FlopWeights, InstrumentationBackend, Precision
+
+_PRECISIONS = list(Precision)
+
+
+class CostRecorder:
+    """
+    Context manager recording the flop counts of each step of an iterative algorithm, together with an (optional)
+    convergence metric per step.  While active, flops are counted as by a FlopCountingContext (see .context).
+
+    Per-step counts are recorded per precision; custom flop types are included in the weighted costs, but not in the
+    per-step FlopCounts.
+
+    LIMITATIONS:
+        - steps can only be recorded while the recorder is active; when exiting and re-entering the recorder, any
+          flops counted in between (e.g. by other contexts) are attributed to the next step.
+    """
+
+    def __init__(
+        self,
+        max_steps: int = 1024,
+        weights: FlopWeights | None = None,
+        patch_math: bool = True,
+        backend: InstrumentationBackend = InstrumentationBackend.COUNTING,
+    ):
+        """
+        :param max_steps: number of steps for which buffers are preallocated (buffers grow automatically if needed)
+        :param weights: FlopWeights used for weighted costs (default: currently configured weights)
+        """
+        if weights is None:
+            from counted_float._core.counting.config import get_flop_weights
+
+            weights = get_flop_weights()
+
+        self.context = FlopCountingContext(patch_math=patch_math, backend=backend)
+        self.weights = weights
+
+        # row 0 = snapshot at start;  row i = cumulative global counts at the i-th call to step()
+        self.__n_steps: int = 0
+        self.__snapshots: list[tuple[tuple[int, ...], ...] | None] = [None] * (max_steps + 1)  # per precision
+        self.__custom_snapshots: list[dict[str, int] | None] = [None] * (max_steps + 1)  # None = no custom counts
+        self.__metrics: np.ndarray = np.full(max_steps, math.nan, dtype=np.float64)
+        self.__live_counts: list[FlopCounts] = [
+            GLOBAL_COUNTERS[precision].live_flop_counts() for precision in _PRECISIONS
+        ]
+
+    # -------------------------------------------------------------------------
+    #  Recording
+    # -------------------------------------------------------------------------
+    def step(self, metric: float = math.nan):
+        """Records the flops since the previous step (or since the start), with an optional convergence metric."""
+        if not self.context.is_active():
+            raise RuntimeError("CostRecorder.step() can only be called while the recorder is active.")
+        i = self.__n_steps + 1
+        if i == len(self.__snapshots):
+            self.__grow()
+        self.__snapshot(i)
+        self.__metrics[i - 1] = metric
+        self.__n_steps = i
+
+    def __snapshot(self, i: int):
+        self.__snapshots[i] = tuple([live_counts.as_tuple() for live_counts in self.__live_counts])
+        for live_counts in self.__live_counts:
+            if live_counts.custom:
+                custom = self.__custom_snapshots[i] or dict()
+                for name, count in live_counts.custom.items():
+                    custom[name] = custom.get(name, 0) + count
+                self.__custom_snapshots[i] = custom
+
+    def __grow(self):
+        n_rows = 2 * len(self.__snapshots)
+        self.__snapshots += [None] * (n_rows - len(self.__snapshots))
+        self.__custom_snapshots += [None] * (n_rows - len(self.__custom_snapshots))
+        self.__metrics = np.concatenate([self.__metrics, np.full(n_rows, math.nan)])[: n_rows - 1]
+
+    # -------------------------------------------------------------------------
+    #  Results
+    # -------------------------------------------------------------------------
+    @property
+    def n_steps(self) -> int:
+        return self.__n_steps
+
+    def metrics(self) -> np.ndarray:
+        return self.__metrics[: self.__n_steps].copy()
+
+    def step_counts_matrix(self, precision: Precision = Precision.FP64) -> np.ndarray:
+        """(n_steps, len(FlopType)) int64 matrix with the counts of each step."""
+        if self.__n_steps == 0:
+            return np.zeros((0, len(FlopType)), dtype=np.int64)
+        j = _PRECISIONS.index(precision)
+        cumulative = np.array([snapshot[j] for snapshot in self.__snapshots[: self.__n_steps + 1]], dtype=np.int64)
+        return np.diff(cumulative.reshape(-1, len(FlopType)), axis=0)
+
+    def step_counts(self, i: int, precision: Precision = Precision.FP64) -> FlopCounts:
+        """Flop counts of the i-th step (excluding custom flop types)."""
+        return FlopCounts.from_array(self.step_counts_matrix(precision)[i])
+
+    def table(self, precision: Precision = Precision.FP64) -> FlopCountsTable:
+        """Per-step counts as a FlopCountsTable, with labels 'step' & 'metric'."""
+        table = FlopCountsTable(label_names=["step", "metric"], capacity=self.__n_steps)
+        table.extend(
+            [FlopCounts.from_array(row) for row in self.step_counts_matrix(precision)],
+            step=range(self.__n_steps),
+            metric=self.metrics().tolist(),
+        )
+        return table
+
+    def step_costs(self) -> np.ndarray:
+        """Weighted cost of each step, summed over all precisions (incl. custom flop types)."""
+        costs = np.zeros(self.__n_steps, dtype=np.float64)
+        for i, (before, after) in enumerate(
+            zip(self.__custom_snapshots, self.__custom_snapshots[1 : self.__n_steps + 1])
+        ):
+            if after:
+                before = before or dict()
+                costs[i] = sum(
+                    (count - before.get(name, 0)) * self.weights.custom_weight(name)
+                    for name, count in after.items()
+                    if count != before.get(name, 0)
+                )
+        for precision in _PRECISIONS:
+            costs += self.step_counts_matrix(precision) @ self.weights.weight_vector(precision)
+        return costs
+
+    def cumulative_costs(self) -> np.ndarray:
+        """Cumulative weighted cost at the end of each step."""
+        return np.cumsum(self.step_costs())
+
+    def cost_curve(self) -> tuple[np.ndarray, np.ndarray]:
+        """(cumulative weighted cost, metric) at the end of each step, e.g. for plotting cost-to-converge curves."""
+        return self.cumulative_costs(), self.metrics()
+
+    def cost_to_converge(self, tolerance: float) -> float:
+        """Cumulative weighted cost until the metric first reached a value <= tolerance (nan if it never did)."""
+        converged = np.flatnonzero(self.metrics() <= tolerance)
+        return float(self.cumulative_costs()[converged[0]]) if len(converged) else math.nan
+
+    # -------------------------------------------------------------------------
+    #  Context manager interface
+    # -------------------------------------------------------------------------
+    def __enter__(self):
+        self.context.__enter__()
+        if self.__n_steps == 0:
+            self.__snapshot(0)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.context.__exit__(exc_type, exc_val, exc_tb)
@@ -0,0 +1,203 @@
+"""
+Named, hierarchical regions for reporting flops across larger code bases, without hand-wiring FlopCountingContexts:
+
+    with flop_region("simulation"):
+        for step in range(n_steps):
+            with flop_region("assemble"):
+                ...
+            with flop_region("solve"):
+                ...
+
+    get_region_tree().show()        ->  text report (calls, wall time, weighted cost & share per region)
+    get_region_tree().to_json()     ->  idem, as JSON
+
+Regions nest into a tree; repeated entries of a region with the same path (e.g. in a loop) are merged into a single
+node, which accumulates its number of calls, wall time, weighted cost (summed over all precisions, incl. custom flop
+types) and fp64 counts per FlopType.  Node statistics are inclusive, i.e. they include the statistics of all child
+regions (see RegionNode.exclusive_cost() for the part not covered by child regions).
+
+Regions measure what is counted by the global counters, i.e. operations on CountedFloat (& co) and, inside a
+FlopCountingContext, math functions.  Entering & exiting a region only takes snapshots of the live global counters
+(see _attribution.py), such that regions can be used inside hot loops.
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+import os
+import time
+from typing import Any
+
+from ._attribution import N_FLOP_TYPES, snapshot_weights, take_snapshot, weighted_delta_cost
+from ._trace_export import _ACTIVE_EXPORTERS, trace_begin, trace_end
+from .config._config import Config
+from .models import FlopCounts, FlopType
+
+_FLOP_TYPES = list(FlopType)
+
+
+# =================================================================================================
+#  Region tree
+# =================================================================================================
+class RegionNode:
+    """Node of the region tree, accumulating the statistics of all entries of the region with a given path."""
+
+    __slots__ = ("name", "parent", "children", "n_calls", "wall_time", "cost", "_counts")
+
+    def __init__(self, name: str, parent: RegionNode | None = None):
+        self.name = name
+        self.parent = parent
+        self.children: dict[str, RegionNode] = dict()
+        self.n_calls: int = 0
+        self.wall_time: float = 0.0  # seconds
+        self.cost: float = 0.0  # weighted cost
+        self._counts: list[int] = [0] * N_FLOP_TYPES  # fp64 counts in FlopType order
+
+    # -------------------------------------------------------------------------
+    #  Properties
+    # -------------------------------------------------------------------------
+    @property
+    def path(self) -> str:
+        """'/'-separated names of all regions from the root (excl.) down to this node (incl.)."""
+        if self.parent is None:
+            return ""
+        parent_path = self.parent.path
+        return f"{parent_path}/{self.name}" if parent_path else self.name
+
+    def flop_counts(self) -> FlopCounts:
+        return FlopCounts(*self._counts)
+
+    def exclusive_cost(self) -> float:
+        """Weighted cost of this region not covered by any of its child regions."""
+        return self.cost - sum(child.cost for child in self.children.values())
+
+    def child(self, name: str) -> RegionNode:
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = RegionNode(name, self)
+        return node
+
+    def find(self, path: str) -> RegionNode:
+        """Returns the descendant node with the given path (relative to this node)."""
+        node = self
+        for name in path.split("/"):
+            if name not in node.children:
+                raise KeyError(f"No region '{path}' in region tree.")
+            node = node.children[name]
+        return node
+
+    def walk(self):
+        """Yields (depth, node) for this node and all its descendants (depth-first, in order of first entry)."""
+        stack = [(0, self)]
+        while stack:
+            depth, node = stack.pop()
+            yield depth, node
+            stack.extend((depth + 1, child) for child in reversed(node.children.values()))
+
+    def _add(self, wall_time: float, cost: float, counts_delta: list[int | float]):
+        self.n_calls += 1
+        self.wall_time += wall_time
+        self.cost += cost
+        self._counts = list(map(operator.add, self._counts, counts_delta[:N_FLOP_TYPES]))
+
+    # -------------------------------------------------------------------------
+    #  Export
+    # -------------------------------------------------------------------------
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "path": self.path,
+            "calls": self.n_calls,
+            "wall_time_s": self.wall_time,
+            "weighted_cost": self.cost,
+            "flop_counts": {flop_type.name: count for flop_type, count in zip(_FLOP_TYPES, self._counts) if count},
+            "children": [child.to_dict() for child in self.children.values()],
+        }
+
+    def to_json(self, path: str | os.PathLike | None = None, indent: int | None = 2) -> str:
+        """Returns the tree (from this node down) as JSON, optionally also writing it to a file."""
+        s = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(s)
+        return s
+
+    def to_text(self) -> str:
+        total_cost = self.cost if self.parent is not None else sum(child.cost for child in self.children.values())
+        lines = [f"{'region':<40}{'calls':>10}{'wall [s]':>12}{'weighted cost':>16}{'%':>8}"]
+        for depth, node in self.walk():
+            if node.parent is None:
+                continue  # root
+            share = 100 * node.cost / total_cost if total_cost else 0.0
+            lines.append(
+                f"{'  ' * (depth - 1) + node.name:<40}{node.n_calls:>10}{node.wall_time:>12.4g}"
+                f"{node.cost:>16.6g}{share:>7.1f}%"
+            )
+        return "\n".join(lines)
+
+    def show(self):
+        print(self.to_text())
+
+    def __repr__(self) -> str:
+        return f"RegionNode(path={self.path!r}, n_calls={self.n_calls}, cost={self.cost:.6g})"
+
+
+_ROOT = RegionNode("")
+_CURRENT: list[RegionNode] = [_ROOT]  # innermost active region last
+
+
+def get_region_tree() -> RegionNode:
+    """Returns the root of the region tree (a node without statistics, with all top-level regions as children)."""
+    return _ROOT
+
+
+def reset_region_tree():
+    """Removes all regions; regions that are active while resetting are not recorded."""
+    global _ROOT
+    _ROOT = RegionNode("")
+    _CURRENT[:] = [_ROOT]
+
+
+# =================================================================================================
+#  Region context manager
+# =================================================================================================
+class FlopRegion:
+    """Context manager recording the flops, weighted cost & wall time of a named region; see flop_region()."""
+
+    __slots__ = ("name", "_node", "_start", "_start_time")
+
+    def __init__(self, name: str):
+        if "/" in name:
+            raise ValueError(f"Region names cannot contain '/', got '{name}'.")
+        self.name = name
+
+    def __enter__(self) -> FlopRegion:
+        node = _CURRENT[-1].child(self.name)
+        _CURRENT.append(node)
+        self._node = node
+        if _ACTIVE_EXPORTERS:
+            trace_begin(self.name, "region")
+        self._start = take_snapshot(Config.current_flop_weights())
+        self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        wall_time = time.perf_counter() - self._start_time
+        weights = Config.current_flop_weights()
+        delta = list(map(operator.sub, take_snapshot(weights), self._start))
+        cost = weighted_delta_cost(delta, snapshot_weights(weights))
+        node = self._node
+        if _CURRENT[-1] is node:
+            _CURRENT.pop()
+            node._add(wall_time, cost, delta)
+        if _ACTIVE_EXPORTERS:
+            trace_end(self.name, "region", cost, delta[:N_FLOP_TYPES])
+
+
+def flop_region(name: str) -> FlopRegion:
+    """
+    Context manager recording the flops, weighted cost & wall time of a named region in the region tree, as a child
+    of the innermost active region (see get_region_tree()).  Weighted costs use the currently configured weights.
+    """
+    return FlopRegion(name)
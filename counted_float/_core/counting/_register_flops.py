@@ -0,0 +1,20 @@
+from counted_float._core.counting._global_counter import GLOBAL_COUNTERS
+from counted_float._core.counting.models import CustomFlopType, FlopType, Precision, get_custom_flop_type
+
+
+def register_flops(flop_type: FlopType | CustomFlopType | str, n: int = 1, precision: Precision = Precision.FP64):
+    """
+    Manually register n flops of the given type in the global counter (and hence in all active FlopCountingContext
+    instances), e.g. for operations that cannot be counted automatically, such as custom kernels called from Python.
+
+    :param flop_type: built-in FlopType, registered CustomFlopType, or name of a registered CustomFlopType.
+    :param n: number of flops to register.
+    :param precision: precision of the flops; custom flop types are weighted independently of precision.
+    """
+    counter = GLOBAL_COUNTERS[precision]
+    if isinstance(flop_type, FlopType):
+        counter.incr_flop_type(flop_type, n)
+    else:
+        name = flop_type.name if isinstance(flop_type, CustomFlopType) else flop_type
+        get_custom_flop_type(name)  # raises ValueError if not registered
+        counter.incr_custom(name, n)
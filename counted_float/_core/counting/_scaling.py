@@ -0,0 +1,272 @@
+"""
+Empirical complexity analysis: a function is run at a (geometric) series of problem sizes, each inside its own
+FlopCountingContext, after which scaling laws are fitted (least squares) to the flop counts of each FlopType and to
+the total weighted cost:
+
+    POWER_LAW       a·n^b                       (fitted in log-log space; b is the empirical exponent)
+    N_LOG_N         a·n·log2(n) + b·n + c
+    POLYNOMIAL      c_0 + c_1·n + ... + c_d·n^d
+
+    analysis = analyze_scaling(my_algorithm, sizes=geometric_sizes(10, 1000, 7), setup=make_inputs)
+    analysis.exponent()              ->  e.g. 2.01
+    analysis.best_fit()              ->  e.g. ScalingFit(POWER_LAW: 3.1·n^2.01, R²=0.99998)
+    analysis.extrapolate(10**6)      ->  weighted cost at n=10^6, without running it
+
+Goodness of fit is reported as R² and as the maximum relative error over all sizes, both on the original (linear)
+scale, such that models can be compared directly.  best_fit() selects the model with the smallest maximum relative
+error, preferring models with fewer parameters when errors are (nearly) equal.
+
+Sizes can be evaluated in parallel in separate worker processes (n_workers > 1), in which case func and setup need
+to be picklable (e.g. module-level functions).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable
+
+import numpy as np
+
+from counted_float._core.compatibility import StrEnum
+
+from ._context_managers import FlopCountingContext
+from .models import FlopCounts, FlopType, FlopWeights, Precision
+
+_REL_ERROR_TOLERANCE = 1e-3  # max. relative errors within this tolerance are considered equal by best_fit()
+
+
+# =================================================================================================
+#  Fits
+# =================================================================================================
+class ScalingModel(StrEnum):
+    POWER_LAW = "power_law"
+    N_LOG_N = "n_log_n"
+    POLYNOMIAL = "polynomial"
+
+
+@dataclasses.dataclass(frozen=True)
+class ScalingFit:
+    """Least-squares fit of a scaling model to (size, cost) data, with goodness-of-fit statistics."""
+
+    model: ScalingModel
+    coefficients: tuple[float, ...]  # (a, b) for POWER_LAW, (a, b, c) for N_LOG_N, (c_0, ..., c_d) for POLYNOMIAL
+    r_squared: float
+    max_rel_error: float
+
+    @property
+    def exponent(self) -> float | None:
+        """Empirical exponent b of a POWER_LAW fit (None for other models)."""
+        return self.coefficients[1] if self.model == ScalingModel.POWER_LAW else None
+
+    @property
+    def n_params(self) -> int:
+        return len(self.coefficients)
+
+    def predict(self, n: float | np.ndarray) -> float | np.ndarray:
+        return _predict(self.model, self.coefficients, np.asarray(n, dtype=np.float64))[()]
+
+    def __str__(self) -> str:
+        if self.model == ScalingModel.POWER_LAW:
+            a, b = self.coefficients
+            formula = f"{a:.4g}·n^{b:.3f}"
+        elif self.model == ScalingModel.N_LOG_N:
+            a, b, c = self.coefficients
+            formula = f"{a:.4g}·n·log2(n) + {b:.4g}·n + {c:.4g}"
+        else:
+            formula = " + ".join(f"{c:.4g}·n^{k}" if k else f"{c:.4g}" for k, c in enumerate(self.coefficients))
+        return f"{self.model.name}: {formula}  (R²={self.r_squared:.5f}, max rel. error={self.max_rel_error:.2%})"
+
+
+def fit_scaling(sizes: Iterable[float], costs: Iterable[float], degree: int = 3) -> dict[ScalingModel, ScalingFit]:
+    """
+    Fits all scaling models to the provided (size, cost) data.  Models that cannot be fitted are omitted: POWER_LAW
+    requires strictly positive costs, N_LOG_N and POLYNOMIAL require more data points than parameters.
+    """
+    n = np.asarray(list(sizes), dtype=np.float64)
+    y = np.asarray(list(costs), dtype=np.float64)
+    if n.shape != y.shape:
+        raise ValueError(f"Got {len(n)} sizes, but {len(y)} costs.")
+
+    fits = dict()
+    if (len(n) >= 2) and np.all(y > 0) and np.all(n > 0):
+        b, log_a = np.polyfit(np.log(n), np.log(y), 1)
+        fits[ScalingModel.POWER_LAW] = (float(np.exp(log_a)), float(b))
+    if len(n) > 3:
+        fits[ScalingModel.N_LOG_N] = _lstsq(np.column_stack([n * np.log2(n), n, np.ones_like(n)]), y)
+    degree = min(degree, len(n) - 2)
+    if degree >= 1:
+        fits[ScalingModel.POLYNOMIAL] = _lstsq(np.column_stack([n**k for k in range(degree + 1)]), y)
+
+    return {model: _scaling_fit(model, coefficients, n, y) for model, coefficients in fits.items()}
+
+
+def _lstsq(basis: np.ndarray, y: np.ndarray) -> tuple[float, ...]:
+    scale = np.maximum(np.abs(basis).max(axis=0), 1e-300)  # column scaling, for numerical stability
+    coefficients, *_ = np.linalg.lstsq(basis / scale, y, rcond=None)
+    return tuple(float(c) for c in coefficients / scale)
+
+
+def _predict(model: ScalingModel, coefficients: tuple[float, ...], n: np.ndarray) -> np.ndarray:
+    if model == ScalingModel.POWER_LAW:
+        a, b = coefficients
+        return a * n**b
+    elif model == ScalingModel.N_LOG_N:
+        a, b, c = coefficients
+        return a * n * np.log2(n) + b * n + c
+    else:
+        return sum(c * n**k for k, c in enumerate(coefficients))
+
+
+def _scaling_fit(model: ScalingModel, coefficients: tuple[float, ...], n: np.ndarray, y: np.ndarray) -> ScalingFit:
+    y_fit = _predict(model, coefficients, n)
+    ss_res = float(np.sum((y - y_fit) ** 2))
+    ss_tot = float(np.sum((y - y.mean()) ** 2))
+    r_squared = 1.0 - ss_res / ss_tot if ss_tot > 0 else float(ss_res == 0)
+    rel_errors = np.abs(y_fit - y) / np.maximum(np.abs(y), 1e-300)
+    return ScalingFit(
+        model=model,
+        coefficients=coefficients,
+        r_squared=r_squared,
+        max_rel_error=float(np.where(y == y_fit, 0.0, rel_errors).max()),
+    )
+
+
+def _best_fit(fits: dict[ScalingModel, ScalingFit]) -> ScalingFit:
+    if not fits:
+        raise ValueError("No scaling model could be fitted; use more (and larger) sizes.")
+    best_error = min(fit.max_rel_error for fit in fits.values())
+    candidates = [fit for fit in fits.values() if fit.max_rel_error <= best_error + _REL_ERROR_TOLERANCE]
+    return min(candidates, key=lambda fit: (fit.n_params, fit.max_rel_error))
+
+
+# =================================================================================================
+#  Scaling analysis
+# =================================================================================================
+class ScalingAnalysis:
+    """
+    Flop counts & weighted costs measured at a series of problem sizes, with scaling laws fitted to them.
+
+    Per-FlopType fits are based on the fp64 counts; weighted costs are summed over all precisions, as is done by
+    FlopCountingContext.total_weighted_cost().
+    """
+
+    def __init__(
+        self,
+        sizes: list[int],
+        counts: list[dict[Precision, FlopCounts]],
+        weights: FlopWeights | None = None,
+        degree: int = 3,
+    ):
+        if weights is None:
+            from counted_float._core.counting.config import get_flop_weights
+
+            weights = get_flop_weights()
+
+        self.sizes: list[int] = list(sizes)
+        self.counts: list[dict[Precision, FlopCounts]] = counts
+        self.weighted_costs: list[float] = [
+            sum(c[precision].total_weighted_cost(weights, precision) for precision in Precision) for c in counts
+        ]
+        self.degree = degree
+        self.__fits: dict[FlopType | None, dict[ScalingModel, ScalingFit]] = dict()
+
+    # -------------------------------------------------------------------------
+    #  Data
+    # -------------------------------------------------------------------------
+    def flop_counts(self, precision: Precision = Precision.FP64) -> list[FlopCounts]:
+        return [c[precision] for c in self.counts]
+
+    def costs(self, flop_type: FlopType | None = None) -> list[float]:
+        """Weighted costs (flop_type=None) or fp64 counts of the given flop type, for all sizes."""
+        if flop_type is None:
+            return list(self.weighted_costs)
+        else:
+            return [getattr(c[Precision.FP64], flop_type.name) for c in self.counts]
+
+    def flop_types(self) -> list[FlopType]:
+        """All flop types with non-zero counts for at least one size."""
+        return [flop_type for flop_type in FlopType if any(self.costs(flop_type))]
+
+    # -------------------------------------------------------------------------
+    #  Fits
+    # -------------------------------------------------------------------------
+    def fits(self, flop_type: FlopType | None = None) -> dict[ScalingModel, ScalingFit]:
+        """All fitted models for the weighted cost (flop_type=None) or for the counts of a specific flop type."""
+        if flop_type not in self.__fits:
+            self.__fits[flop_type] = fit_scaling(self.sizes, self.costs(flop_type), self.degree)
+        return self.__fits[flop_type]
+
+    def best_fit(self, flop_type: FlopType | None = None) -> ScalingFit:
+        return _best_fit(self.fits(flop_type))
+
+    def exponent(self, flop_type: FlopType | None = None) -> float:
+        """Empirical scaling exponent, i.e. the exponent of the POWER_LAW fit."""
+        fits = self.fits(flop_type)
+        if ScalingModel.POWER_LAW not in fits:
+            raise ValueError("No power law could be fitted; all costs need to be strictly positive.")
+        return fits[ScalingModel.POWER_LAW].exponent
+
+    # -------------------------------------------------------------------------
+    #  Extrapolation
+    # -------------------------------------------------------------------------
+    def extrapolate(self, n: float, flop_type: FlopType | None = None, model: ScalingModel | None = None) -> float:
+        """Extrapolates the weighted cost (or counts of a flop type) to size n, using the best (or given) model."""
+        fit = self.best_fit(flop_type) if model is None else self.fits(flop_type)[ScalingModel(model)]
+        return float(fit.predict(n))
+
+    def extrapolate_counts(self, n: float) -> FlopCounts:
+        """Extrapolates the fp64 counts of all flop types to size n, each using its best fitting model."""
+        return FlopCounts(
+            **{flop_type.name: max(0, round(self.extrapolate(n, flop_type))) for flop_type in self.flop_types()}
+        )
+
+    # -------------------------------------------------------------------------
+    #  Visualization
+    # -------------------------------------------------------------------------
+    def show(self):
+        print(f"sizes: {self.sizes}")
+        for flop_type in [None, *self.flop_types()]:
+            label = "weighted cost" if flop_type is None else flop_type.long_name()
+            print(f"{label}".ljust(34) + f": {self.best_fit(flop_type)}")
+
+
+# =================================================================================================
+#  Main API
+# =================================================================================================
+def geometric_sizes(n_min: int, n_max: int, n_sizes: int = 8) -> list[int]:
+    """Geometric series of (unique, integer) problem sizes from n_min to n_max (inclusive)."""
+    return sorted({int(round(n)) for n in np.geomspace(n_min, n_max, n_sizes)})
+
+
+def analyze_scaling(
+    func: Callable,
+    sizes: Iterable[int],
+    setup: Callable[[int], tuple] | None = None,
+    n_workers: int = 1,
+    weights: FlopWeights | None = None,
+    degree: int = 3,
+) -> ScalingAnalysis:
+    """
+    Runs func at each of the provided problem sizes inside a FlopCountingContext and fits scaling laws to the results.
+    :param func: function to analyze; called as func(n), or as func(*setup(n)) if setup is provided
+    :param sizes: problem sizes, e.g. geometric_sizes(10, 1000)
+    :param setup: optional function generating the arguments of func for size n; executed without counting flops
+    :param n_workers: number of worker processes (1 = run all sizes in the current process)
+    :param weights: FlopWeights used for the weighted costs (default: currently configured weights)
+    :param degree: max. degree of the POLYNOMIAL model
+    """
+    sizes = sorted(set(sizes))
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            counts = list(executor.map(_count_flops, [func] * len(sizes), [setup] * len(sizes), sizes))
+    else:
+        counts = [_count_flops(func, setup, n) for n in sizes]
+    return ScalingAnalysis(sizes, counts, weights=weights, degree=degree)
+
+
+def _count_flops(func: Callable, setup: Callable[[int], tuple] | None, n: int) -> dict[Precision, FlopCounts]:
+    args = setup(n) if setup is not None else (n,)
+    with FlopCountingContext() as ctx:
+        func(*args)
+    return {precision: ctx.flop_counts(precision) for precision in Precision}
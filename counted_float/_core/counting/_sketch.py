@@ -0,0 +1,131 @@
+"""
+Constant-memory streaming quantile sketch for (non-negative) costs, following the DDSketch approach: values are
+counted in logarithmically spaced buckets, such that any quantile is returned with a bounded *relative* error,
+irrespective of the number of values added.  Sketches with the same relative accuracy can be merged exactly, which
+allows combining sketches of e.g. different stages, workers or processes.
+"""
+
+from __future__ import annotations
+
+import math
+
+_LOG_2 = math.log(2)
+
+
+class CostSketch:
+    """
+    Streaming summary of a stream of non-negative values (count, mean, min, max & quantiles), using constant memory.
+
+    Quantiles are accurate up to relative_accuracy (e.g. 0.01 = 1%), as long as the number of buckets does not
+    exceed max_buckets; beyond that, the lowest buckets are collapsed, affecting the accuracy of the lowest quantiles
+    only.  With the defaults, values spanning ~18 orders of magnitude can be represented without collapsing.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_buckets",
+        "count",
+        "total",
+        "min",
+        "max",
+        "_gamma",
+        "_log_gamma",
+        "_n_zero",
+        "_buckets",
+    )
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy should be in (0, 1), got {relative_accuracy}.")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._n_zero: int = 0  # number of values <= 0
+        self._buckets: dict[int, int] = dict()  # bucket k counts values in (gamma^(k-1), gamma^k]
+
+    # -------------------------------------------------------------------------
+    #  Adding values
+    # -------------------------------------------------------------------------
+    def add(self, value: float, n: int = 1):
+        """Adds a value (n times); values <= 0 are counted as 0."""
+        self.count += n
+        self.total += n * value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value > 0:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            buckets = self._buckets
+            buckets[key] = buckets.get(key, 0) + n
+            if len(buckets) > self.max_buckets:
+                self.__collapse()
+        else:
+            self._n_zero += n
+
+    def merge(self, other: CostSketch):
+        """Adds all values summarized by another sketch (with the same relative accuracy) to this sketch."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._n_zero += other._n_zero
+        for key, n in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + n
+        while len(self._buckets) > self.max_buckets:
+            self.__collapse()
+
+    def __collapse(self):
+        # merge the 2 lowest buckets
+        lowest, second = sorted(self._buckets)[:2]
+        self._buckets[second] += self._buckets.pop(lowest)
+
+    # -------------------------------------------------------------------------
+    #  Statistics
+    # -------------------------------------------------------------------------
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    def quantile(self, q: float) -> float:
+        """Estimate of the q-th quantile (0 <= q <= 1), nan if no values were added."""
+        if not 0 <= q <= 1:
+            raise ValueError(f"q should be in [0, 1], got {q}.")
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        cumulative = self._n_zero
+        if rank < cumulative:
+            return 0.0
+        for key in sorted(self._buckets):
+            cumulative += self._buckets[key]
+            if rank < cumulative:
+                value = 2 * self._gamma**key / (self._gamma + 1)  # value with minimal relative error within bucket
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def histogram(self) -> list[tuple[float, float, int]]:
+        """
+        Histogram with power-of-2 bins, as a list of (lower, upper, count) tuples of all non-empty bins, in increasing
+        order; values <= 0 are reported in a bin (0.0, 0.0, count).  Bin edges are accurate up to relative_accuracy.
+        """
+        bins: dict[int, int] = dict()
+        for key, n in self._buckets.items():
+            exponent = math.floor(key * self._log_gamma / _LOG_2 + 1e-9)  # upper bound of bucket in [2^e, 2^(e+1))
+            bins[exponent] = bins.get(exponent, 0) + n
+        histogram = [(0.0, 0.0, self._n_zero)] if self._n_zero else []
+        histogram += [(2.0**e, 2.0 ** (e + 1), bins[e]) for e in sorted(bins)]
+        return histogram
+
+    def __repr__(self) -> str:
+        return (
+            f"CostSketch(count={self.count}, mean={self.mean:.6g}, p50={self.quantile(0.5):.6g}, "
+            f"p99={self.quantile(0.99):.6g}, max={self.max:.6g})"
+        )
@@ -0,0 +1,696 @@
+"""
+Static estimation of flop counts, based on the AST of a function, without executing it.
+
+The result is a StaticFlopEstimate, which expresses the count of each FlopType as a polynomial (SymbolicCount) in
+terms of symbols derived from the source code, such as parameters used as loop bounds ('n'), lengths of iterated
+containers ('len(xs)') and iteration counts of while loops & of ranges with a non-constant step ('while_L12',
+'range_L14'):
+
+    def f(a, b, n, m):
+        s = 0.0
+        for i in range(n):
+            for j in range(m):
+                s += a[i] * b[j]
+        return s
+
+    estimate_flops(f)  ->  {MUL: m·n, ADD: m·n}
+
+Loops with bounds depending on outer loop variables (e.g. range(i, n)) are summed exactly (Faulhaber's formulas),
+also for constant steps other than 1 (e.g. range(n - 1, -1, -1)).
+
+Since no type information is available, all arithmetic is assumed to be floating-point, except for operations on
+values that are known to be integers (int constants, loop variables of range(...), names used as loop bounds or
+indices, results of len(...), int(...), ...).  For if/else constructs, the largest of both branches is taken (per
+flop type & term), such that the estimate is an upper bound for code with data-dependent branches.  Calls to
+functions other than abs, round, sum and the math.sqrt/log2/pow/floor/ceil functions are not analyzed.
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import inspect
+import math
+import textwrap
+from fractions import Fraction
+from functools import lru_cache
+from typing import Callable
+
+from .models import FlopCounts, FlopType
+
+# monomial = sorted tuple of (symbol, power)-pairs;  () represents the constant term
+_Monomial = tuple[tuple[str, int], ...]
+
+
+# =================================================================================================
+#  Symbolic counts
+# =================================================================================================
+class SymbolicCount:
+    """Immutable polynomial with rational coefficients in a number of named symbols, e.g. 'm·n + 2·n'."""
+
+    __slots__ = ("_terms",)
+
+    def __init__(self, terms: dict[_Monomial, Fraction] | None = None):
+        self._terms: dict[_Monomial, Fraction] = {m: c for m, c in (terms or {}).items() if c != 0}
+
+    # --- construction ------------------------------------
+    @classmethod
+    def constant(cls, value: int | Fraction) -> SymbolicCount:
+        return cls({(): Fraction(value)})
+
+    @classmethod
+    def symbol(cls, name: str) -> SymbolicCount:
+        return cls({((name, 1),): Fraction(1)})
+
+    # --- math --------------------------------------------
+    def __add__(self, other: SymbolicCount | int) -> SymbolicCount:
+        other = _as_symbolic(other)
+        terms = dict(self._terms)
+        for monomial, coef in other._terms.items():
+            terms[monomial] = terms.get(monomial, 0) + coef
+        return SymbolicCount(terms)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> SymbolicCount:
+        return SymbolicCount({m: -c for m, c in self._terms.items()})
+
+    def __sub__(self, other: SymbolicCount | int) -> SymbolicCount:
+        return self + (-_as_symbolic(other))
+
+    def __rsub__(self, other: int) -> SymbolicCount:
+        return _as_symbolic(other) - self
+
+    def __mul__(self, other: SymbolicCount | int | Fraction) -> SymbolicCount:
+        other = _as_symbolic(other)
+        terms: dict[_Monomial, Fraction] = {}
+        for m1, c1 in self._terms.items():
+            for m2, c2 in other._terms.items():
+                monomial = _multiply_monomials(m1, m2)
+                terms[monomial] = terms.get(monomial, 0) + c1 * c2
+        return SymbolicCount(terms)
+
+    __rmul__ = __mul__
+
+    def __pow__(self, power: int) -> SymbolicCount:
+        result = SymbolicCount.constant(1)
+        for _ in range(power):
+            result = result * self
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (int, Fraction)):
+            other = SymbolicCount.constant(other)
+        return isinstance(other, SymbolicCount) and (self._terms == other._terms)
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self._terms.items()))
+
+    def maximum(self, other: SymbolicCount) -> SymbolicCount:
+        """Term-wise maximum of coefficients; an upper bound of both polynomials if all symbols are >= 1."""
+        monomials = self._terms.keys() | other._terms.keys()
+        return SymbolicCount({m: max(self._terms.get(m, 0), other._terms.get(m, 0)) for m in monomials})
+
+    # --- substitution & evaluation -----------------------
+    def substitute(self, name: str, value: SymbolicCount) -> SymbolicCount:
+        """Replaces symbol 'name' by another polynomial."""
+        result = SymbolicCount()
+        for monomial, coef in self._terms.items():
+            power = dict(monomial).pop(name, 0)
+            rest = tuple((s, p) for s, p in monomial if s != name)
+            result = result + SymbolicCount({rest: coef}) * (value**power)
+        return result
+
+    def coefficients_in(self, name: str) -> dict[int, SymbolicCount]:
+        """Decomposes the polynomial as sum_k c_k * name^k, returning {k: c_k}."""
+        coefficients: dict[int, dict[_Monomial, Fraction]] = {}
+        for monomial, coef in self._terms.items():
+            power = dict(monomial).get(name, 0)
+            rest = tuple((s, p) for s, p in monomial if s != name)
+            coefficients.setdefault(power, {})[rest] = coef
+        return {k: SymbolicCount(terms) for k, terms in coefficients.items()}
+
+    def evaluate(self, values: dict[str, float]) -> Fraction | float:
+        result = Fraction(0)
+        for monomial, coef in self._terms.items():
+            term = coef
+            for name, power in monomial:
+                if name not in values:
+                    raise ValueError(f"No value provided for symbol '{name}'.")
+                term = term * (values[name] ** power)
+            result = result + term
+        return result
+
+    # --- inspection --------------------------------------
+    @property
+    def symbols(self) -> set[str]:
+        return {name for monomial in self._terms for name, _ in monomial}
+
+    def degree(self) -> int:
+        return max((sum(p for _, p in m) for m in self._terms), default=0)
+
+    def is_zero(self) -> bool:
+        return not self._terms
+
+    def __str__(self) -> str:
+        if not self._terms:
+            return "0"
+        monomials = sorted(self._terms, key=lambda m: (-sum(p for _, p in m), m))
+        result = ""
+        for i, monomial in enumerate(monomials):
+            coef = self._terms[monomial]
+            sign = "-" if coef < 0 else "+"
+            factors = [name if p == 1 else f"{name}^{p}" for name, p in monomial]
+            if abs(coef) != 1 or not factors:
+                factors.insert(0, str(abs(coef)))
+            term = "·".join(factors)
+            result += (("-" if sign == "-" else "") + term) if i == 0 else f" {sign} {term}"
+        return result
+
+    def __repr__(self) -> str:
+        return f"SymbolicCount({self})"
+
+
+def _as_symbolic(value: SymbolicCount | int | Fraction) -> SymbolicCount:
+    return value if isinstance(value, SymbolicCount) else SymbolicCount.constant(value)
+
+
+def _multiply_monomials(m1: _Monomial, m2: _Monomial) -> _Monomial:
+    powers = dict(m1)
+    for name, power in m2:
+        powers[name] = powers.get(name, 0) + power
+    return tuple(sorted(powers.items()))
+
+
+# -------------------------------------------------------------------------
+#  Summation
+# -------------------------------------------------------------------------
+@lru_cache
+def _bernoulli(k: int) -> Fraction:
+    # convention B_1 = -1/2
+    if k == 0:
+        return Fraction(1)
+    return -sum(math.comb(k + 1, j) * _bernoulli(j) for j in range(k)) / (k + 1)
+
+
+def _power_sum(k: int, n: SymbolicCount) -> SymbolicCount:
+    """sum_{v=0}^{n-1} v^k, as a polynomial in n (Faulhaber's formula)."""
+    result = SymbolicCount()
+    for j in range(k + 1):
+        result = result + Fraction(math.comb(k + 1, j)) * _bernoulli(j) * (n ** (k + 1 - j))
+    return result * Fraction(1, k + 1)
+
+
+def _range_length(start: SymbolicCount, stop: SymbolicCount, step: int) -> SymbolicCount:
+    """Number of iterations of range(start, stop, step); exact if start & stop are constants, otherwise ignoring
+    rounding and assuming the range is not empty."""
+    if not (start.symbols or stop.symbols):
+        return SymbolicCount.constant(len(range(int(start.evaluate({})), int(stop.evaluate({})), step)))
+    return (stop - start) * Fraction(1, step)
+
+
+def _sum_over(body: SymbolicCount, var: str, start: SymbolicCount, stop: SymbolicCount) -> SymbolicCount:
+    """sum_{var=start}^{stop-1} body, assuming start <= stop."""
+    result = SymbolicCount()
+    for k, coef in body.coefficients_in(var).items():
+        result = result + coef * (_power_sum(k, stop) - _power_sum(k, start))
+    return result
+
+
+# =================================================================================================
+#  Counts per FlopType
+# =================================================================================================
+_Counts = dict[FlopType, SymbolicCount]
+
+
+def _add_counts(*counts: _Counts) -> _Counts:
+    result: _Counts = {}
+    for c in counts:
+        for flop_type, count in c.items():
+            result[flop_type] = result.get(flop_type, SymbolicCount()) + count
+    return result
+
+
+def _map_counts(counts: _Counts, f: Callable[[SymbolicCount], SymbolicCount]) -> _Counts:
+    return {flop_type: f(count) for flop_type, count in counts.items()}
+
+
+def _max_counts(counts_1: _Counts, counts_2: _Counts) -> _Counts:
+    return {
+        flop_type: counts_1.get(flop_type, SymbolicCount()).maximum(counts_2.get(flop_type, SymbolicCount()))
+        for flop_type in counts_1.keys() | counts_2.keys()
+    }
+
+
+def _single(flop_type: FlopType) -> _Counts:
+    return {flop_type: SymbolicCount.constant(1)}
+
+
+# =================================================================================================
+#  AST analysis
+# =================================================================================================
+_BINARY_OPS: dict[type, FlopType] = {
+    ast.Add: FlopType.ADD,
+    ast.Sub: FlopType.SUB,
+    ast.Mult: FlopType.MUL,
+    ast.Div: FlopType.DIV,
+    ast.Pow: FlopType.POW,
+}
+
+_COMPARE_OPS: dict[type, FlopType] = {
+    ast.Eq: FlopType.EQUALS,
+    ast.NotEq: FlopType.EQUALS,
+    ast.Lt: FlopType.LTE,
+    ast.LtE: FlopType.LTE,
+    ast.Gt: FlopType.GTE,
+    ast.GtE: FlopType.GTE,
+}
+
+_FUNCTIONS: dict[str, FlopType] = {  # keyed by function name (without module)
+    "abs": FlopType.ABS,
+    "round": FlopType.RND,
+    "floor": FlopType.RND,
+    "ceil": FlopType.RND,
+    "sqrt": FlopType.SQRT,
+    "log2": FlopType.LOG2,
+    "pow": FlopType.POW,
+}
+
+_INT_FUNCTIONS = {"len", "int", "round", "floor", "ceil", "range"}
+
+
+class _Analyzer:
+    def __init__(self, func_def: ast.FunctionDef):
+        self.int_names: set[str] = self._initial_int_names(func_def)
+        self.loop_vars: dict[str, SymbolicCount] = {}
+
+    # -------------------------------------------------------------------------
+    #  Statements
+    # -------------------------------------------------------------------------
+    def stmts(self, stmts: list[ast.stmt]) -> _Counts:
+        return _add_counts(*[self.stmt(stmt) for stmt in stmts])
+
+    def stmt(self, stmt: ast.stmt) -> _Counts:
+        if isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+            if stmt.value is None:
+                return {}
+            counts, is_int = self.expr(stmt.value)
+            targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+            for target in targets:
+                self._mark_targets(target, is_int)
+            return counts
+        elif isinstance(stmt, ast.AugAssign):
+            counts, is_int = self.expr(stmt.value)
+            target_is_int = isinstance(stmt.target, ast.Name) and (stmt.target.id in self.int_names)
+            flop_type = _BINARY_OPS.get(type(stmt.op))
+            if (flop_type is not None) and not (is_int and target_is_int):
+                counts = _add_counts(counts, self._binary_flop(stmt.op, stmt.target, stmt.value))
+            self._mark_targets(stmt.target, is_int and target_is_int)
+            return counts
+        elif isinstance(stmt, (ast.Expr, ast.Return)):
+            return self.expr(stmt.value)[0] if stmt.value is not None else {}
+        elif isinstance(stmt, ast.For):
+            return _add_counts(
+                self._loop(stmt.target, stmt.iter, lambda: self.stmts(stmt.body)), self.stmts(stmt.orelse)
+            )
+        elif isinstance(stmt, ast.While):
+            n_iter = SymbolicCount.symbol(f"while_L{stmt.lineno}")
+            per_iteration = _add_counts(self.expr(stmt.test)[0], self.stmts(stmt.body))
+            return _add_counts(_map_counts(per_iteration, lambda c: c * n_iter), self.stmts(stmt.orelse))
+        elif isinstance(stmt, ast.If):
+            return _add_counts(self.expr(stmt.test)[0], _max_counts(self.stmts(stmt.body), self.stmts(stmt.orelse)))
+        elif isinstance(stmt, ast.With):
+            return _add_counts(*[self.expr(item.context_expr)[0] for item in stmt.items], self.stmts(stmt.body))
+        elif isinstance(stmt, ast.Try):
+            return _add_counts(self.stmts(stmt.body), self.stmts(stmt.orelse), self.stmts(stmt.finalbody))
+        else:
+            return {}  # nested function & class definitions, imports, pass, ...
+
+    def _mark_targets(self, target: ast.expr, is_int: bool):
+        if isinstance(target, ast.Name):
+            if is_int:
+                self.int_names.add(target.id)
+            else:
+                self.int_names.discard(target.id)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for elt in target.elts:
+                self._mark_targets(elt, False)
+
+    # -------------------------------------------------------------------------
+    #  Loops
+    # -------------------------------------------------------------------------
+    def _loop(self, target: ast.expr, iter_: ast.expr, body: Callable[[], _Counts]) -> _Counts:
+        counts = self.expr(iter_)[0] if not _is_call_to(iter_, "range") else {}
+
+        # --- range(...) loops --------
+        if _is_call_to(iter_, "range") and isinstance(target, ast.Name):
+            start, stop, step = self._range_bounds(iter_)
+            var = target.id
+            if step is None:
+                # non-constant step: loop variable cannot be expressed symbolically
+                self.loop_vars.pop(var, None)
+                self._mark_targets(target, True)
+                n_iter = SymbolicCount.symbol(f"range_L{iter_.lineno}")
+                return _add_counts(counts, _map_counts(body(), lambda c: c * n_iter))
+            self.loop_vars[var] = SymbolicCount.symbol(var)
+            self.int_names.add(var)
+            body_counts = body()
+            del self.loop_vars[var]
+            if _range_length(start, stop, step) == 0:
+                return counts  # empty range with constant bounds
+            if step == 1:
+                return _add_counts(counts, _map_counts(body_counts, lambda c: _sum_over(c, var, start, stop)))
+            # v = start + step*u  with u in range(0, n_iter), also for negative steps
+            n_iter = _range_length(start, stop, step)
+            substituted = SymbolicCount.symbol(var) * step + start
+            return _add_counts(
+                counts,
+                _map_counts(
+                    body_counts, lambda c: _sum_over(c.substitute(var, substituted), var, SymbolicCount(), n_iter)
+                ),
+            )
+
+        # --- other iterables ---------
+        n_iter = self._iteration_count(iter_)
+        if _is_call_to(iter_, "enumerate") and isinstance(target, ast.Tuple) and target.elts:
+            self._mark_targets(target, False)
+            self._mark_targets(target.elts[0], True)
+        else:
+            self._mark_targets(target, False)
+        return _add_counts(counts, _map_counts(body(), lambda c: c * n_iter))
+
+    def _range_bounds(self, call: ast.Call) -> tuple[SymbolicCount, SymbolicCount, int | None]:
+        """Returns (start, stop, step) of a range(...) call, with step=None if it is not a constant."""
+        args = [self.symbolic(arg) for arg in call.args]
+        if len(call.args) == 1:
+            return SymbolicCount(), args[0], 1
+        step = 1
+        if len(call.args) == 3:
+            step = _int_constant(call.args[2])
+            if step == 0:
+                raise ValueError(f"range() step must not be zero (line {call.lineno}).")
+        return args[0], args[1], step
+
+    def _iteration_count(self, iter_: ast.expr) -> SymbolicCount:
+        if isinstance(iter_, ast.Call) and iter_.args and (_call_name(iter_) in ("enumerate", "zip", "reversed")):
+            return self._iteration_count(iter_.args[0])
+        if _is_call_to(iter_, "range"):
+            start, stop, step = self._range_bounds(iter_)
+            if step is None:
+                return SymbolicCount.symbol(f"range_L{iter_.lineno}")
+            return _range_length(start, stop, step)
+        if isinstance(iter_, (ast.List, ast.Tuple, ast.Set)):
+            return SymbolicCount.constant(len(iter_.elts))
+        return SymbolicCount.symbol(f"len({ast.unparse(iter_)})")
+
+    # -------------------------------------------------------------------------
+    #  Expressions
+    # -------------------------------------------------------------------------
+    def expr(self, node: ast.expr | None) -> tuple[_Counts, bool]:
+        """Returns (counts, is_int) for the expression."""
+        if node is None:
+            return {}, False
+        if isinstance(node, ast.Constant):
+            return {}, isinstance(node.value, int)
+        elif isinstance(node, ast.Name):
+            return {}, node.id in self.int_names
+        elif isinstance(node, ast.BinOp):
+            (left_counts, left_int), (right_counts, right_int) = self.expr(node.left), self.expr(node.right)
+            counts = _add_counts(left_counts, right_counts)
+            if left_int and right_int:
+                return counts, not isinstance(node.op, ast.Div)
+            if type(node.op) in _BINARY_OPS:
+                counts = _add_counts(counts, self._binary_flop(node.op, node.left, node.right))
+            return counts, False
+        elif isinstance(node, ast.UnaryOp):
+            counts, is_int = self.expr(node.operand)
+            if isinstance(node.op, ast.USub) and not is_int and not isinstance(node.operand, ast.Constant):
+                counts = _add_counts(counts, _single(FlopType.MINUS))
+            return counts, is_int
+        elif isinstance(node, ast.Compare):
+            operands = [node.left, *node.comparators]
+            results = [self.expr(operand) for operand in operands]
+            counts = _add_counts(*[c for c, _ in results])
+            for op, (left, right), (left_int, right_int) in zip(
+                node.ops, zip(operands, operands[1:]), zip([i for _, i in results], [i for _, i in results][1:])
+            ):
+                flop_type = _COMPARE_OPS.get(type(op))
+                if (flop_type is not None) and not (left_int and right_int):
+                    if _is_zero(left) or _is_zero(right):
+                        flop_type = FlopType.CMP_ZERO
+                    counts = _add_counts(counts, _single(flop_type))
+            return counts, False
+        elif isinstance(node, ast.BoolOp):
+            return _add_counts(*[self.expr(value)[0] for value in node.values]), False
+        elif isinstance(node, ast.IfExp):
+            return (
+                _add_counts(self.expr(node.test)[0], _max_counts(self.expr(node.body)[0], self.expr(node.orelse)[0])),
+                False,
+            )
+        elif isinstance(node, ast.Call):
+            return self._call(node)
+        elif isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp)):
+            return self._comprehension(node.generators, [node.elt]), False
+        elif isinstance(node, ast.DictComp):
+            return self._comprehension(node.generators, [node.key, node.value]), False
+        elif isinstance(node, ast.Subscript):
+            return _add_counts(self.expr(node.value)[0], self.expr(node.slice)[0]), False
+        elif isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+            return _add_counts(*[self.expr(elt)[0] for elt in node.elts]), False
+        elif isinstance(node, ast.Attribute):
+            return self.expr(node.value)[0], False
+        else:
+            return {}, False
+
+    def _binary_flop(self, op: ast.operator, left: ast.expr, right: ast.expr) -> _Counts:
+        # mirrors the special cases of CountedFloat
+        if isinstance(op, ast.Pow):
+            if _is_constant(right, 2):
+                return _single(FlopType.MUL)
+            if _is_constant(left, 2):
+                return _single(FlopType.POW2)
+        return _single(_BINARY_OPS[type(op)])
+
+    def _call(self, node: ast.Call) -> tuple[_Counts, bool]:
+        name = _call_name(node)
+        counts = _add_counts(
+            *[self.expr(arg)[0] for arg in node.args], *[self.expr(kw.value)[0] for kw in node.keywords]
+        )
+        arg_ints = [self.expr(arg)[1] for arg in node.args]
+
+        if name == "sum" and node.args:
+            # sum(iterable) = 1 addition per element (starting from int 0)
+            arg = node.args[0]
+            if isinstance(arg, (ast.GeneratorExp, ast.ListComp)):
+                n_terms = self._comprehension_size(arg.generators)
+            else:
+                n_terms = self._iteration_count(arg)
+            return _add_counts(counts, {FlopType.ADD: n_terms}), False
+        if (name in _FUNCTIONS) and not (arg_ints and all(arg_ints)):
+            if (name == "pow") and len(node.args) == 2 and _is_constant(node.args[1], 2):
+                counts = _add_counts(counts, _single(FlopType.POW))  # math.pow(x, 2) is counted as POW
+            else:
+                counts = _add_counts(counts, _single(_FUNCTIONS[name]))
+        return counts, name in _INT_FUNCTIONS
+
+    def _comprehension(self, generators: list[ast.comprehension], elts: list[ast.expr]) -> _Counts:
+        if not generators:
+            return _add_counts(*[self.expr(elt)[0] for elt in elts])
+        generator, rest = generators[0], generators[1:]
+
+        def body() -> _Counts:
+            return _add_counts(*[self.expr(cond)[0] for cond in generator.ifs], self._comprehension(rest, elts))
+
+        return self._loop(generator.target, generator.iter, body)
+
+    def _comprehension_size(self, generators: list[ast.comprehension]) -> SymbolicCount:
+        """Number of elements produced by a comprehension (upper bound, ignoring if-clauses)."""
+        if not generators:
+            return SymbolicCount.constant(1)
+        generator, rest = generators[0], generators[1:]
+        marker = FlopType.ADD  # any flop type will do, to reuse _loop(...)
+        counts = self._loop(generator.target, generator.iter, lambda: {marker: self._comprehension_size(rest)})
+        return counts.get(marker, SymbolicCount())
+
+    # -------------------------------------------------------------------------
+    #  Symbolic values (loop bounds)
+    # -------------------------------------------------------------------------
+    def symbolic(self, node: ast.expr) -> SymbolicCount:
+        if isinstance(node, ast.Constant) and isinstance(node.value, int):
+            return SymbolicCount.constant(node.value)
+        if isinstance(node, ast.Name) and node.id in self.loop_vars:
+            return self.loop_vars[node.id]
+        if isinstance(node, ast.BinOp):
+            left, right = self.symbolic(node.left), self.symbolic(node.right)
+            if isinstance(node.op, ast.Add):
+                return left + right
+            if isinstance(node.op, ast.Sub):
+                return left - right
+            if isinstance(node.op, ast.Mult):
+                return left * right
+            if isinstance(node.op, ast.FloorDiv) and isinstance(node.right, ast.Constant):
+                return left * Fraction(1, node.right.value)  # approximation, ignoring rounding
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return -self.symbolic(node.operand)
+        return SymbolicCount.symbol(ast.unparse(node))
+
+    # -------------------------------------------------------------------------
+    #  Helpers
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _initial_int_names(func_def: ast.FunctionDef) -> set[str]:
+        int_names = set()
+
+        # parameters annotated as int or with int default
+        args = func_def.args
+        all_args = args.posonlyargs + args.args + args.kwonlyargs
+        defaults = [None] * (len(args.posonlyargs + args.args) - len(args.defaults)) + args.defaults + args.kw_defaults
+        for arg, default in zip(all_args, defaults):
+            is_int_annotation = isinstance(arg.annotation, ast.Name) and arg.annotation.id == "int"
+            is_int_default = isinstance(default, ast.Constant) and type(default.value) is int
+            if is_int_annotation or is_int_default:
+                int_names.add(arg.arg)
+
+        # names used in loop bounds & indices
+        for node in ast.walk(func_def):
+            if _is_call_to(node, "range"):
+                int_names.update(n.id for arg in node.args for n in ast.walk(arg) if isinstance(n, ast.Name))
+            elif isinstance(node, ast.Subscript):
+                int_names.update(n.id for n in ast.walk(node.slice) if isinstance(n, ast.Name))
+        return int_names
+
+
+def _call_name(node: ast.Call) -> str | None:
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def _int_constant(node: ast.expr) -> int | None:
+    """Value of an int constant, incl. negative constants such as -1 (or None if not a constant)."""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _int_constant(node.operand)
+        return None if value is None else -value
+    if isinstance(node, ast.Constant) and isinstance(node.value, int) and not isinstance(node.value, bool):
+        return node.value
+    return None
+
+
+def _is_call_to(node: ast.AST, name: str) -> bool:
+    return isinstance(node, ast.Call) and _call_name(node) == name
+
+
+def _is_constant(node: ast.expr, value: int) -> bool:
+    return isinstance(node, ast.Constant) and type(node.value) in (int, float) and node.value == value
+
+
+def _is_zero(node: ast.expr) -> bool:
+    return _is_constant(node, 0)
+
+
+# =================================================================================================
+#  Public API
+# =================================================================================================
+@dataclasses.dataclass(frozen=True)
+class StaticEstimateValidation:
+    """Comparison of a static flop count estimate with the flops counted during an actual run."""
+
+    estimated: FlopCounts
+    measured: FlopCounts
+
+    def differences(self) -> dict[FlopType, int]:
+        """Estimated minus measured counts, for all flop types where they differ."""
+        return {
+            flop_type: getattr(self.estimated, flop_type.name) - getattr(self.measured, flop_type.name)
+            for flop_type in FlopType
+            if getattr(self.estimated, flop_type.name) != getattr(self.measured, flop_type.name)
+        }
+
+    def is_exact(self) -> bool:
+        return not self.differences()
+
+    def relative_error(self) -> float:
+        """Relative error of the estimated total weighted cost w.r.t. the measured one."""
+        measured_cost = self.measured.total_weighted_cost()
+        estimated_cost = self.estimated.total_weighted_cost()
+        if measured_cost == 0:
+            return 0.0 if estimated_cost == 0 else math.inf
+        return (estimated_cost - measured_cost) / measured_cost
+
+
+class StaticFlopEstimate:
+    """Symbolic flop counts of a function, as obtained by estimate_flops(...)."""
+
+    def __init__(self, func: Callable, counts: dict[FlopType, SymbolicCount]):
+        self.func = func
+        self.counts: dict[FlopType, SymbolicCount] = {
+            flop_type: counts[flop_type]
+            for flop_type in FlopType
+            if not counts.get(flop_type, SymbolicCount()).is_zero()
+        }
+
+    @property
+    def symbols(self) -> list[str]:
+        """Sorted list of all symbols that need a value to evaluate the estimate."""
+        return sorted(set().union(*[count.symbols for count in self.counts.values()]))
+
+    # --- evaluation --------------------------------------
+    def evaluate(self, sizes: dict[str, float] | None = None, **kwargs: float) -> FlopCounts:
+        """
+        Evaluates the estimate for concrete values of all symbols, provided as a dict (required for symbols that
+        are not valid identifiers, e.g. 'len(xs)') and/or keyword arguments.
+        """
+        values = {**(sizes or {}), **kwargs}
+        return FlopCounts(**{flop_type.name: round(count.evaluate(values)) for flop_type, count in self.counts.items()})
+
+    def evaluate_for(self, *args, **kwargs) -> FlopCounts:
+        """Evaluates the estimate for the given arguments of the function, without calling the function."""
+        return self.evaluate(self._symbol_values(*args, **kwargs))
+
+    def validate(self, *args, **kwargs) -> StaticEstimateValidation:
+        """Compares the estimate for the given arguments with the counts of actually calling the function."""
+        from ._context_managers import FlopCountingContext
+
+        estimated = self.evaluate_for(*args, **kwargs)
+        with FlopCountingContext() as ctx:
+            self.func(*args, **kwargs)
+        return StaticEstimateValidation(estimated=estimated, measured=ctx.flop_counts())
+
+    def _symbol_values(self, *args, **kwargs) -> dict[str, float]:
+        bound = inspect.signature(self.func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        values = {}
+        for symbol in self.symbols:
+            try:
+                values[symbol] = eval(symbol, self.func.__globals__, dict(bound.arguments))
+            except Exception as e:
+                raise ValueError(
+                    f"Cannot determine value of symbol '{symbol}' from the arguments; use evaluate(...) instead."
+                ) from e
+        return values
+
+    # --- other -------------------------------------------
+    def __str__(self) -> str:
+        return " + ".join(f"({count}) {flop_type.name}" for flop_type, count in self.counts.items()) or "0"
+
+    def __repr__(self) -> str:
+        return f"StaticFlopEstimate({self})"
+
+
+def estimate_flops(func: Callable) -> StaticFlopEstimate:
+    """
+    Statically estimates the flop counts of a function, based on its source code, without executing it.
+    See module docstring of _static_estimate.py for the assumptions made.
+    """
+    source_lines, first_line = inspect.getsourcelines(inspect.unwrap(func))
+    tree = ast.parse(textwrap.dedent("".join(source_lines)))
+    ast.increment_lineno(tree, max(first_line - 1, 0))  # line numbers (e.g. of while loops) as in the source file
+    func_def = next(
+        (node for node in ast.walk(tree) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))),
+        None,
+    )
+    if func_def is None:
+        raise TypeError(f"Could not find a function definition in the source of {func!r}.")
+    return StaticFlopEstimate(func, _Analyzer(func_def).stmts(func_def.body))
@@ -0,0 +1,205 @@
+"""
+Combined measurement of wall time, CPU time & flop counts, to estimate how much faster a block of (instrumented)
+Python code would run when compiled:
+
+    with TimedFlopCountingContext() as ctx:
+        run_simulation()
+
+    report = ctx.timing_report()
+    report.wall_time_s                  ->  measured wall time (incl. instrumentation overhead)
+    report.python_time_s                ->  wall time compensated for the instrumentation overhead
+    report.predicted_compiled_time_s    ->  predicted time of the same flops in compiled code
+    report.compiled_speedup             ->  python_time_s / predicted_compiled_time_s
+    report.show()
+
+The instrumentation overhead is estimated as the number of counted flops times the overhead per operation of
+CountedFloat over plain float, measured once per process (see measure_instrumentation_overhead()).  Compiled times
+are predicted from flop counts & benchmark results (see FlopCounts.predicted_runtime()), by default the median
+prediction over all built-in benchmark results.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import statistics
+import time
+import timeit
+from typing import Callable
+
+from ._budget import BudgetUnit
+from ._context_managers import FlopCountingContext, PauseFlopCounting
+from ._counted_float import CountedFloat
+from ._global_counter import GlobalFlopCounter
+from .models import FlopsBenchmarkResults, FlopWeights, InstrumentationBackend, Precision
+
+_N_OPS_PER_MEASUREMENT = 100_000
+
+
+# =================================================================================================
+#  Instrumentation overhead
+# =================================================================================================
+_OVERHEAD_NS: float | None = None  # cached result of measure_instrumentation_overhead()
+
+
+def measure_instrumentation_overhead(refresh: bool = False) -> float:
+    """
+    Returns the estimated overhead (in nsec) of a counted CountedFloat operation compared to the same operation on
+    plain floats, measured once per process (unless refresh=True; takes ~0.1s).  The measurement does not affect the
+    counts of any active FlopCountingContext.
+    """
+    global _OVERHEAD_NS
+    if (_OVERHEAD_NS is None) or refresh:
+        x, y, a, b = CountedFloat(1.5), CountedFloat(2.5), 1.5, 2.5
+        with PauseFlopCounting():  # operator overhead of CountedFloat (w/o counting) ...
+            ns_counted_float = _ns_per_call(lambda: x + y)
+        ns_float = _ns_per_call(lambda: a + b)
+        ns_count = _ns_per_call(GlobalFlopCounter().incr_add)  # ... + the overhead of counting, in a private counter
+        ns_call = _ns_per_call(lambda: None)
+        _OVERHEAD_NS = max(ns_counted_float - ns_float, 0.0) + max(ns_count - ns_call, 0.0)
+    return _OVERHEAD_NS
+
+
+def _ns_per_call(func) -> float:
+    return 1e9 * min(timeit.repeat(func, number=_N_OPS_PER_MEASUREMENT // 5, repeat=5)) / (_N_OPS_PER_MEASUREMENT // 5)
+
+
+# =================================================================================================
+#  Timing report
+# =================================================================================================
+@dataclasses.dataclass(frozen=True)
+class TimingReport:
+    """Wall time, CPU time & flops of a block of code, with derived estimates (see TimedFlopCountingContext)."""
+
+    wall_time_s: float
+    cpu_time_s: float
+    n_flops: int  # all precisions, incl. custom flop types
+    weighted_cost: float
+    overhead_per_op_ns: float  # instrumentation overhead per counted flop
+    predicted_compiled_time_s: float  # (median) predicted time of the counted flops in compiled code
+
+    @property
+    def ops_per_second(self) -> float:
+        """Effective Python-level flop rate (counted flops per second of wall time)."""
+        return self.n_flops / self.wall_time_s if self.wall_time_s > 0 else 0.0
+
+    @property
+    def overhead_s(self) -> float:
+        """Estimated part of the wall time spent on instrumentation (capped at the wall time)."""
+        return min(self.n_flops * self.overhead_per_op_ns / 1e9, self.wall_time_s)
+
+    @property
+    def python_time_s(self) -> float:
+        """Estimated wall time without instrumentation, i.e. of the same code using plain floats."""
+        return self.wall_time_s - self.overhead_s
+
+    @property
+    def compiled_speedup(self) -> float:
+        """Estimated speed-up when compiling the code: python_time_s / predicted_compiled_time_s."""
+        return self.python_time_s / self.predicted_compiled_time_s if self.predicted_compiled_time_s > 0 else 0.0
+
+    def show(self):
+        print(f"wall time                 : {self.wall_time_s:.6g} s  (cpu time: {self.cpu_time_s:.6g} s)")
+        print(f"counted flops             : {self.n_flops}  (weighted cost: {self.weighted_cost:.6g})")
+        print(f"python-level flop rate    : {self.ops_per_second:.4g} flops/s")
+        print(f"instrumentation overhead  : {self.overhead_s:.6g} s  ({self.overhead_per_op_ns:.3g} ns/flop)")
+        print(f"python time (compensated) : {self.python_time_s:.6g} s")
+        print(f"predicted compiled time   : {self.predicted_compiled_time_s:.6g} s")
+        print(f"compiled speed-up         : {self.compiled_speedup:.4g}x")
+
+
+def _benchmarked_precision(results: FlopsBenchmarkResults, precision: Precision) -> Precision:
+    # precision of the benchmark durations used for flops of the given precision (cf. FlopWeights.for_precision())
+    if (precision == Precision.FP32) and (results.results_ns.flops_fp32 is None):
+        return Precision.FP64
+    return precision
+
+
+# =================================================================================================
+#  Context manager
+# =================================================================================================
+class TimedFlopCountingContext(FlopCountingContext):
+    """
+    FlopCountingContext that also measures the wall time & CPU time while active (excluding paused periods), see
+    timing_report().
+    """
+
+    def __init__(
+        self,
+        patch_math: bool = True,
+        backend: InstrumentationBackend = InstrumentationBackend.COUNTING,
+        budget: float | None = None,
+        budget_unit: BudgetUnit = BudgetUnit.FLOPS,
+        on_exceed: Callable[[FlopCountingContext], None] | None = None,
+    ):
+        super().__init__(
+            patch_math=patch_math, backend=backend, budget=budget, budget_unit=budget_unit, on_exceed=on_exceed
+        )
+        self.__wall_time: float = 0.0
+        self.__cpu_time: float = 0.0
+        self.__start_times: tuple[float, float] | None = None
+
+    # -------------------------------------------------------------------------
+    #  Timing
+    # -------------------------------------------------------------------------
+    def wall_time(self) -> float:
+        """Wall time (seconds) while active."""
+        if self.__start_times is not None:
+            return self.__wall_time + (time.perf_counter() - self.__start_times[0])
+        return self.__wall_time
+
+    def cpu_time(self) -> float:
+        """CPU time (seconds) of the current process while active."""
+        if self.__start_times is not None:
+            return self.__cpu_time + (time.process_time() - self.__start_times[1])
+        return self.__cpu_time
+
+    def resume(self):
+        was_active = self.is_active()
+        super().resume()
+        if not was_active:
+            self.__start_times = (time.perf_counter(), time.process_time())
+
+    def pause(self):
+        if self.is_active():
+            self.__wall_time, self.__cpu_time = self.wall_time(), self.cpu_time()
+            self.__start_times = None
+        super().pause()
+
+    # -------------------------------------------------------------------------
+    #  Report
+    # -------------------------------------------------------------------------
+    def timing_report(
+        self,
+        results: FlopsBenchmarkResults | dict[str, FlopsBenchmarkResults] | None = None,
+        weights: FlopWeights | None = None,
+    ) -> TimingReport:
+        """
+        :param results: benchmark results used to predict the compiled time (median over multiple results if a dict
+                          is provided; default: all built-in benchmark results).  FP32 flops are predicted
+                          using FP64 durations for results without FP32 benchmarks.
+        :param weights: FlopWeights used for the weighted cost (default: currently configured weights)
+        """
+        if results is None:
+            from counted_float._core.counting._builtin_data import BuiltInData
+
+            results = BuiltInData.benchmarks()
+        elif isinstance(results, FlopsBenchmarkResults):
+            results = {"": results}
+
+        all_counts = {precision: self.flop_counts(precision) for precision in Precision}
+        predicted_ns = statistics.median(
+            sum(
+                counts.predicted_runtime(result, _benchmarked_precision(result, precision)).ns.q50
+                for precision, counts in all_counts.items()
+                if counts.total_count() > 0
+            )
+            for result in results.values()
+        )
+        return TimingReport(
+            wall_time_s=self.wall_time(),
+            cpu_time_s=self.cpu_time(),
+            n_flops=sum(counts.total_count() for counts in all_counts.values()),
+            weighted_cost=self.total_weighted_cost(weights),
+            overhead_per_op_ns=measure_instrumentation_overhead(),
+            predicted_compiled_time_s=predicted_ns / 1e9,
+        )
@@ -0,0 +1,165 @@
+"""
+Timeline export of flop regions & FlopCountingContexts in the Chrome trace-event format (JSON), which can be viewed
+in Perfetto (https://ui.perfetto.dev) or chrome://tracing:
+
+    with ChromeTraceExporter("trace.json"):
+        with flop_region("assemble"):
+            ...
+
+While an exporter is active, it records
+  - a span for each flop_region() and FlopCountingContext (with its flop counts & weighted cost as arguments)
+  - counter tracks with the cumulative weighted cost & the rate per FlopType (flops/s, all precisions), sampled at
+    span boundaries (at most once per counter_interval) and whenever sample_counters() is called.
+
+Events are buffered in memory and appended to the file in chunks, such that exporters can be active during long
+runs.  The file is written as a JSON array that is only terminated when the exporter is closed; trace viewers also
+accept unterminated arrays, such that the trace of a crashed or still running process can be viewed as well.
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+import os
+import threading
+import time
+from typing import Any
+
+from ._attribution import N_FLOP_TYPES, snapshot_weights, take_snapshot, weighted_delta_cost
+from .config._config import Config
+from .models import FlopType
+
+_FLOP_TYPE_NAMES = [flop_type.name for flop_type in FlopType]
+
+# exporters currently active (checked by flop regions & FlopCountingContext before emitting spans)
+_ACTIVE_EXPORTERS: list[ChromeTraceExporter] = []
+
+
+class ChromeTraceExporter:
+    """Context manager writing a Chrome trace-event JSON file of all flop regions & contexts while active."""
+
+    def __init__(self, path: str | os.PathLike, buffer_size: int = 10_000, counter_interval: float = 0.01):
+        """
+        :param path: path of the JSON file to (over)write
+        :param buffer_size: number of events buffered in memory before they are appended to the file
+        :param counter_interval: min. time between 2 samples of the counter tracks (in seconds)
+        """
+        self.path = path
+        self.buffer_size = buffer_size
+        self.counter_interval = counter_interval
+        self.__file = None
+        self.__buffer: list[str] = []
+        self.__n_events: int = 0
+        self.__pid = os.getpid()
+        self.__t0_ns: int = 0
+        self.__start_snapshot: tuple[int | float, ...] = ()
+        self.__last_sample: tuple[float, tuple[int | float, ...]] | None = None  # (time in s, snapshot)
+        self.__rate_flop_types: set[int] = set()  # indices of flop types with non-zero counts so far
+
+    # -------------------------------------------------------------------------
+    #  Events
+    # -------------------------------------------------------------------------
+    @property
+    def n_events(self) -> int:
+        """Number of events recorded so far (written or buffered)."""
+        return self.__n_events + len(self.__buffer)
+
+    def begin(self, name: str, category: str = "region", args: dict[str, Any] | None = None):
+        """Starts a span (on the current thread), which should be ended by a matching end()."""
+        self.__emit("B", name, category, args)
+        self.__maybe_sample_counters()
+
+    def end(self, name: str, category: str = "region", args: dict[str, Any] | None = None):
+        """Ends the most recently started span on the current thread; args are merged with those of begin()."""
+        self.__maybe_sample_counters()
+        self.__emit("E", name, category, args)
+
+    def sample_counters(self):
+        """Samples the counter tracks (cumulative weighted cost & rates per FlopType) now."""
+        now = time.perf_counter()
+        weights = Config.current_flop_weights()
+        snapshot = take_snapshot(weights)
+        cumulative = list(map(operator.sub, snapshot, self.__start_snapshot))
+        self.__emit(
+            "C", "weighted cost", "counters", {"cumulative": weighted_delta_cost(cumulative, snapshot_weights(weights))}
+        )
+
+        last_time, last_snapshot = self.__last_sample or (now, snapshot)
+        if now > last_time:
+            delta = list(map(operator.sub, snapshot, last_snapshot))
+            per_type = list(map(operator.add, delta[:N_FLOP_TYPES], delta[N_FLOP_TYPES : 2 * N_FLOP_TYPES]))
+            self.__rate_flop_types.update(i for i, count in enumerate(per_type) if count)
+            rates = {_FLOP_TYPE_NAMES[i]: per_type[i] / (now - last_time) for i in sorted(self.__rate_flop_types)}
+            if rates:
+                self.__emit("C", "flops/s", "counters", rates)
+        self.__last_sample = (now, snapshot)
+
+    def __maybe_sample_counters(self):
+        if (self.__last_sample is None) or (time.perf_counter() - self.__last_sample[0] >= self.counter_interval):
+            self.sample_counters()
+
+    def __emit(self, phase: str, name: str, category: str, args: dict[str, Any] | None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": phase,
+            "ts": (time.perf_counter_ns() - self.__t0_ns) / 1000,  # µs
+            "pid": self.__pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.__buffer.append(json.dumps(event))
+        if len(self.__buffer) >= self.buffer_size:
+            self.flush()
+
+    # -------------------------------------------------------------------------
+    #  File handling
+    # -------------------------------------------------------------------------
+    def flush(self):
+        """Appends all buffered events to the file."""
+        if self.__file is None or not self.__buffer:
+            return
+        separator = ",\n" if self.__n_events else "\n"
+        self.__file.write(separator + ",\n".join(self.__buffer))
+        self.__file.flush()
+        self.__n_events += len(self.__buffer)
+        self.__buffer.clear()
+
+    def is_active(self) -> bool:
+        return self.__file is not None
+
+    def __enter__(self) -> ChromeTraceExporter:
+        self.__file = open(self.path, "w")
+        self.__file.write("[")
+        self.__n_events = 0
+        self.__t0_ns = time.perf_counter_ns()
+        self.__start_snapshot = take_snapshot(Config.current_flop_weights())
+        self.__last_sample = None
+        self.__buffer.append(
+            json.dumps({"name": "process_name", "ph": "M", "pid": self.__pid, "args": {"name": "counted_float"}})
+        )
+        _ACTIVE_EXPORTERS.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _ACTIVE_EXPORTERS.remove(self)
+        self.sample_counters()
+        self.flush()
+        self.__file.write("\n]\n")
+        self.__file.close()
+        self.__file = None
+
+
+# =================================================================================================
+#  Hooks for flop regions & contexts
+# =================================================================================================
+def trace_begin(name: str, category: str):
+    for exporter in _ACTIVE_EXPORTERS:
+        exporter.begin(name, category)
+
+
+def trace_end(name: str, category: str, cost: float, counts: list[int] | tuple[int, ...]):
+    args = {"weighted cost": cost, **{type_name: count for type_name, count in zip(_FLOP_TYPE_NAMES, counts) if count}}
+    for exporter in _ACTIVE_EXPORTERS:
+        exporter.end(name, category, args)
@@ -1,3 +1,4 @@
+from .._backends import get_active_backend, get_default_backend, set_default_backend
 from ._config import get_flop_weights, set_flop_weights
 from ._defaults import (
     get_default_consensus_flop_weights,
@@ -34,6 +34,14 @@ class Config:
         """
         return cls.__weights.model_copy()
 
+    @classmethod
+    def current_flop_weights(cls) -> FlopWeights:
+        """
+        Get the currently configured flop weights without making a copy, for internal read-only use (e.g. in
+        FlopCounts.total_weighted_cost()), such that cached weight tuples & vectors are reused across calls.
+        """
+        return cls.__weights
+
 
 # =================================================================================================
 #  Functional accessors
@@ -1,5 +1,14 @@
 from ._base import MyBaseModel
-from ._flop_counts import FlopCounts
+from ._complex_op_type import ComplexOpType
+from ._custom_flop_type import (
+    CustomFlopType,
+    get_custom_flop_type,
+    get_custom_flop_types,
+    register_custom_flop_type,
+    unregister_custom_flop_type,
+)
+from ._flop_counts import FlopCounts, batch_weighted_costs
+from ._flop_counts_table import FlopCountsTable
 from ._flop_type import FlopType
 from ._flop_weights import FlopWeights
 from ._flops_benchmark_result import (
@@ -7,7 +16,12 @@ from ._flops_benchmark_result import (
     FlopsBenchmarkDurations,
     FlopsBenchmarkResults,
     Quantiles,
+    RuntimePrediction,
     SystemInfo,
 )
 from ._fpu_instruction import FPUInstruction
 from ._fpu_specs import InstructionLatencies
+from ._instrumentation_backend import InstrumentationBackend
+from ._int_op_counts import IntOpCounts
+from ._int_op_type import IntOpType
+from ._precision import Precision
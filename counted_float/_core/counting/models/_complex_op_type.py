@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from counted_float._core.compatibility import StrEnum
+
+from ._flop_counts import FlopCounts
+
+
+class ComplexOpType(StrEnum):
+    """
+    Enum describing the different types of complex-valued operations that are counted by CountedComplex.
+    Each of them is booked as its decomposition into real-valued flops (see flop_counts()).
+
+    Enum                Math                    Decomposition                           Flops
+    Member              Operation               (z = a+bi, w = c+di)
+    -------             ----------              --------------                          ------
+
+    ABS                 abs(z)                  sqrt(a*a + b*b)                         2 MUL + ADD + SQRT
+    MINUS               -z                      (-a) + (-b)i                            2 MINUS
+    CONJ                conj(z)                 a + (-b)i                               MINUS
+    EQUALS              z == w                  (a == c) & (b == d)                     2 EQUALS
+    ADD                 z + w                   (a+c) + (b+d)i                          2 ADD
+    SUB                 z - w                   (a-c) + (b-d)i                          2 SUB
+    MUL                 z * w                   (ac-bd) + (ad+bc)i                      4 MUL + ADD + SUB
+    DIV                 z / w                   ((ac+bd) + (bc-ad)i) / (cc+dd)          6 MUL + 2 ADD + SUB + 2 DIV
+    SQRT                sqrt(z)                 sqrt((|z|+a)/2) + sqrt((|z|-a)/2)i      4 MUL + 2 ADD + SUB + 3 SQRT
+    POW                 z ** w                  exp(w * log(z))                         8 MUL + 2 ADD + SUB + SQRT
+                                                                                          + LOG2 + POW2
+
+    NOTES:
+      - POW is modelled as |z| + LOG2 (log(z)), a complex MUL (w*log(z)) and POW2 + 2 MUL (exp(u+vi)).  The
+         trigonometric functions needed for arg(z), cos(v) and sin(v) are not represented by any FlopType and are
+         hence not counted.
+      - z ** 2 is counted as z * z.
+    """
+
+    ABS = "abs(z)"
+    MINUS = "-z"
+    CONJ = "conj(z)"
+    EQUALS = "z==w"
+    ADD = "z+w"
+    SUB = "z-w"
+    MUL = "z*w"
+    DIV = "z/w"
+    SQRT = "sqrt(z)"
+    POW = "z^w"
+
+    def long_name(self) -> str:
+        return f"ComplexOpType.{self.name:<6}  [{self.value}]"
+
+    def flop_counts(self) -> FlopCounts:
+        """Returns the decomposition of this complex operation into real-valued flops."""
+        return _COMPLEX_OP_DECOMPOSITION[self].copy()
+
+
+# =================================================================================================
+#  Decomposition of complex operations into real-valued flops
+# =================================================================================================
+_COMPLEX_OP_DECOMPOSITION: dict[ComplexOpType, FlopCounts] = {
+    ComplexOpType.ABS: FlopCounts(MUL=2, ADD=1, SQRT=1),
+    ComplexOpType.MINUS: FlopCounts(MINUS=2),
+    ComplexOpType.CONJ: FlopCounts(MINUS=1),
+    ComplexOpType.EQUALS: FlopCounts(EQUALS=2),
+    ComplexOpType.ADD: FlopCounts(ADD=2),
+    ComplexOpType.SUB: FlopCounts(SUB=2),
+    ComplexOpType.MUL: FlopCounts(MUL=4, ADD=1, SUB=1),
+    ComplexOpType.DIV: FlopCounts(MUL=6, ADD=2, SUB=1, DIV=2),
+    ComplexOpType.SQRT: FlopCounts(MUL=4, ADD=2, SUB=1, SQRT=3),
+    ComplexOpType.POW: FlopCounts(MUL=8, ADD=2, SUB=1, SQRT=1, LOG2=1, POW2=1),
+}
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Callable
+
+from ._flop_type import FlopType
+
+
+@dataclasses.dataclass(frozen=True)
+class CustomFlopType:
+    """
+    User-defined operation category, to be used for domain-specific expensive operations (e.g. special functions or
+    custom kernels called from Python) that should be counted & weighted alongside the built-in FlopTypes.
+
+    Instances are created & registered using register_custom_flop_type(...) and are counted using
+    register_flops(...).  Counts are kept per name in FlopCounts.custom.
+
+    Attributes:
+        name:               unique name, used as key in FlopCounts.custom & FlopWeights.weights_custom
+        weight:             default weight (same scale as FlopWeights), used unless overridden in FlopWeights
+        benchmark_kernel:   optional numba-compilable kernel with signature (n, in_f1, in_f2, out_f, out_i),
+                              applying the operation n times (see FlopsBenchmarkSuite)
+        description:        optional short description of the operation, e.g. "erf(x)"
+    """
+
+    name: str
+    weight: float
+    benchmark_kernel: Callable | None = None
+    description: str = ""
+
+    def long_name(self) -> str:
+        return f"CustomFlopType.{self.name:<9}  [{self.description or self.name}]"
+
+
+# =================================================================================================
+#  Registry
+# =================================================================================================
+_CUSTOM_FLOP_TYPES: dict[str, CustomFlopType] = dict()
+
+
+def register_custom_flop_type(
+    name: str,
+    weight: float,
+    benchmark_kernel: Callable | None = None,
+    description: str = "",
+) -> CustomFlopType:
+    """
+    Register a custom flop type, such that it can be counted using register_flops(...) and is taken into account
+    in FlopCounts.as_dict(), FlopCounts.total_weighted_cost() and FlopWeights.  Registering a name that is already
+    registered replaces the previous registration.
+    """
+    if not name.isidentifier():
+        raise ValueError(f"Custom flop type name should be a valid identifier, got '{name}'.")
+    if name in FlopType.__members__:
+        raise ValueError(f"Custom flop type name '{name}' clashes with built-in FlopType.{name}.")
+    if weight < 0:
+        raise ValueError(f"Custom flop type weight should be non-negative, got {weight}.")
+
+    custom_flop_type = CustomFlopType(
+        name=name, weight=weight, benchmark_kernel=benchmark_kernel, description=description
+    )
+    _CUSTOM_FLOP_TYPES[name] = custom_flop_type
+    return custom_flop_type
+
+
+def unregister_custom_flop_type(name: str):
+    """Remove a custom flop type from the registry."""
+    if name not in _CUSTOM_FLOP_TYPES:
+        raise ValueError(f"Custom flop type '{name}' is not registered.")
+    del _CUSTOM_FLOP_TYPES[name]
+
+
+def get_custom_flop_types() -> list[CustomFlopType]:
+    """Returns all currently registered custom flop types, in order of registration."""
+    return list(_CUSTOM_FLOP_TYPES.values())
+
+
+def get_custom_flop_type(name: str) -> CustomFlopType:
+    """Returns the registered custom flop type with the given name."""
+    try:
+        return _CUSTOM_FLOP_TYPES[name]
+    except KeyError:
+        raise ValueError(f"Custom flop type '{name}' is not registered.") from None
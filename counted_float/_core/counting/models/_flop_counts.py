@@ -1,9 +1,23 @@
 from __future__ import annotations
 
 import dataclasses
+import operator
+from typing import TYPE_CHECKING, Iterable, Sequence
 
+import numpy as np
+
+from ._custom_flop_type import CustomFlopType, get_custom_flop_types
 from ._flop_type import FlopType
 from ._flop_weights import FlopWeights
+from ._precision import Precision
+
+if TYPE_CHECKING:
+    from ._flops_benchmark_result import FlopsBenchmarkResults, RuntimePrediction
+
+# names of the counting fields of FlopCounts, in FlopType order (= field order, such that they can be passed
+# positionally) + fast getter returning all counts as a tuple
+_FIELD_NAMES: tuple[str, ...] = tuple(flop_type.name for flop_type in FlopType)
+_get_counts = operator.attrgetter(*_FIELD_NAMES)
 
 
 @dataclasses.dataclass(slots=True)
@@ -13,6 +27,9 @@ class FlopCounts:
     the FlopWeights class, for two reasons:
         - there's no need for (de)serialization, hence no usage of Pydantic
         - we want to minimize overhead of flop counting, hence use no dict in favor of explicit fields per flop type
+
+    Counts of user-defined flop types (see CustomFlopType) are kept in the 'custom' dict, keyed by name; entries
+    with zero count are omitted.
     """
 
     # --- Counting fields ---------------------------------
@@ -32,44 +49,211 @@ class FlopCounts:
     LOG2: int = 0
     POW: int = 0
 
+    # --- Custom flop types -------------------------------
+    custom: dict[str, int] = dataclasses.field(default_factory=dict)
+
     # --- math --------------------------------------------
     def __add__(self, other: FlopCounts) -> FlopCounts:
-        return FlopCounts(**{attr: getattr(self, attr) + getattr(other, attr) for attr in self.field_names()})
+        return FlopCounts(
+            *map(operator.add, _get_counts(self), _get_counts(other)),
+            custom=self._merge_custom(self.custom, other.custom, sign=1),
+        )
 
     def __sub__(self, other: FlopCounts) -> FlopCounts:
-        return FlopCounts(**{attr: getattr(self, attr) - getattr(other, attr) for attr in self.field_names()})
+        return FlopCounts(
+            *map(operator.sub, _get_counts(self), _get_counts(other)),
+            custom=self._merge_custom(self.custom, other.custom, sign=-1),
+        )
+
+    def __iadd__(self, other: FlopCounts) -> FlopCounts:
+        for attr, count in zip(_FIELD_NAMES, _get_counts(other)):
+            if count:
+                setattr(self, attr, getattr(self, attr) + count)
+        if other.custom:
+            self.custom = self._merge_custom(self.custom, other.custom, sign=1)
+        return self
+
+    def __isub__(self, other: FlopCounts) -> FlopCounts:
+        for attr, count in zip(_FIELD_NAMES, _get_counts(other)):
+            if count:
+                setattr(self, attr, getattr(self, attr) - count)
+        if other.custom:
+            self.custom = self._merge_custom(self.custom, other.custom, sign=-1)
+        return self
+
+    def __mul__(self, factor: int) -> FlopCounts:
+        if not isinstance(factor, (int, np.integer)):
+            return NotImplemented
+        factor = int(factor)
+        return FlopCounts(
+            *[count * factor for count in _get_counts(self)],
+            custom={name: count * factor for name, count in self.custom.items() if factor != 0},
+        )
+
+    __rmul__ = __mul__
+
+    def __imul__(self, factor: int) -> FlopCounts:
+        if not isinstance(factor, (int, np.integer)):
+            return NotImplemented
+        factor = int(factor)
+        for attr, count in zip(_FIELD_NAMES, _get_counts(self)):
+            setattr(self, attr, count * factor)
+        self.custom = {name: count * factor for name, count in self.custom.items() if factor != 0}
+        return self
+
+    @staticmethod
+    def _merge_custom(custom_1: dict[str, int], custom_2: dict[str, int], sign: int) -> dict[str, int]:
+        if not custom_2:
+            return dict(custom_1)  # fast path, mostly no custom flop types are used
+        merged = {name: custom_1.get(name, 0) + sign * custom_2.get(name, 0) for name in custom_1.keys() | custom_2}
+        return {name: count for name, count in merged.items() if count != 0}
 
     # --- extract info ------------------------------------
-    def as_dict(self) -> dict[FlopType, int]:
-        """Return the flop counts as a dictionary with FlopType keys."""
-        return {flop_type: getattr(self, flop_type.name) for flop_type in FlopType}
+    def as_dict(self) -> dict[FlopType | CustomFlopType, int]:
+        """Return the flop counts as a dictionary with FlopType keys, followed by all registered CustomFlopTypes."""
+        return {
+            **{flop_type: getattr(self, flop_type.name) for flop_type in FlopType},
+            **{custom_type: self.custom.get(custom_type.name, 0) for custom_type in get_custom_flop_types()},
+        }
 
     def total_count(self) -> int:
         """Sum of all flop counts."""
-        return sum(getattr(self, attr) for attr in self.field_names())
+        return sum(_get_counts(self)) + sum(self.custom.values())
 
-    def total_weighted_cost(self, weights: FlopWeights | None = None) -> float:
+    def total_weighted_cost(self, weights: FlopWeights | None = None, precision: Precision = Precision.FP64) -> float:
         """
         Returns a weighted total count of all flops (counterpart of the unweighted total_count() method),
         using the provided weights in the computations.
         When omitted, the currently configured weights (see Config class) will be used.
+        The precision argument indicates the precision of the counted flops and selects the corresponding weights.
+        Custom flop types are weighted using FlopWeights.custom_weight(), irrespective of precision.
         """
         if not weights:
-            from counted_float._core.counting.config import get_flop_weights
+            from counted_float._core.counting.config._config import Config
+
+            weights = Config.current_flop_weights()  # read-only use, no need for a copy
+
+        cost = sum(map(operator.mul, _get_counts(self), weights.weight_tuple(precision)))
+        if self.custom:
+            cost += sum(count * weights.custom_weight(name) for name, count in self.custom.items())
+        return cost
+
+    def predicted_runtime(
+        self, results: FlopsBenchmarkResults, precision: Precision = Precision.FP64
+    ) -> RuntimePrediction:
+        """
+        Predicts the (compiled) execution time of these flops on the machine on which the provided benchmark results
+        were obtained, using absolute, baseline-corrected durations per flop (see FlopsBenchmarkResults).  Custom
+        flop types without benchmark results are not included in the prediction (see RuntimePrediction.n_unknown).
+        """
+        from ._flops_benchmark_result import Quantiles, RuntimePrediction
+
+        flop_durations = results.flop_durations_ns(precision)
+        custom_durations = results.custom_flop_durations_ns()
+        ns_by_flop_type = {
+            flop_type: getattr(self, flop_type.name) * flop_durations[flop_type].q50 for flop_type in FlopType
+        }
+        ns_custom = {
+            name: count * custom_durations[name].q50 for name, count in self.custom.items() if name in custom_durations
+        }
+        n_unknown = sum(count for name, count in self.custom.items() if name not in custom_durations)
 
-            weights = get_flop_weights()
+        def total(q: str) -> float:
+            return sum(getattr(self, ft.name) * getattr(flop_durations[ft], q) for ft in FlopType) + sum(
+                count * getattr(custom_durations[name], q)
+                for name, count in self.custom.items()
+                if name in custom_durations
+            )
 
-        return sum([getattr(self, flop_type.name) * weights.weights[flop_type] for flop_type in FlopType])
+        return RuntimePrediction(
+            ns=Quantiles(q25=total("q25"), q50=total("q50"), q75=total("q75")),
+            ns_by_flop_type=ns_by_flop_type,
+            ns_custom=ns_custom,
+            n_unknown=n_unknown,
+        )
+
+    def predicted_runtimes(
+        self, results: dict[str, FlopsBenchmarkResults] | None = None, precision: Precision = Precision.FP64
+    ) -> dict[str, RuntimePrediction]:
+        """
+        Counterpart of predicted_runtime() for multiple benchmark results, e.g. of different machines, which default
+        to all built-in benchmark results (see BuiltInData.benchmarks()).
+        """
+        if results is None:
+            from counted_float._core.counting._builtin_data import BuiltInData
+
+            results = BuiltInData.benchmarks()
+        return {key: self.predicted_runtime(key_results, precision) for key, key_results in results.items()}
+
+    # --- array conversion --------------------------------
+    def as_tuple(self) -> tuple[int, ...]:
+        """Counts of all built-in flop types as a tuple, in FlopType order (custom flop types not included)."""
+        return _get_counts(self)
+
+    def as_array(self) -> np.ndarray:
+        """Counts of all built-in flop types as an int64 array, in FlopType order (custom flop types not included)."""
+        return np.array(_get_counts(self), dtype=np.int64)
+
+    @classmethod
+    def from_array(cls, counts: np.ndarray | Sequence[int]) -> FlopCounts:
+        """Inverse of as_array()."""
+        if len(counts) != len(_FIELD_NAMES):
+            raise ValueError(f"Expected {len(_FIELD_NAMES)} counts (one per FlopType), got {len(counts)}.")
+        return FlopCounts(*[int(count) for count in counts])
+
+    @staticmethod
+    def to_matrix(all_counts: Iterable[FlopCounts], custom_names: Sequence[str] = ()) -> np.ndarray:
+        """
+        Stacks the counts of many FlopCounts objects into an int64 matrix with one row per FlopCounts object and one
+        column per FlopType, followed by one column per requested custom flop type name.
+        """
+        return np.array(
+            [(*_get_counts(counts), *[counts.custom.get(name, 0) for name in custom_names]) for counts in all_counts],
+            dtype=np.int64,
+        ).reshape(-1, len(_FIELD_NAMES) + len(custom_names))
 
     # --- other -------------------------------------------
     def reset(self):
         """Reset all counts to 0"""
-        for attr in self.field_names():
+        for attr in _FIELD_NAMES:
             setattr(self, attr, 0)
+        self.custom.clear()
 
     def copy(self) -> FlopCounts:
-        return FlopCounts(**dataclasses.asdict(self))
+        return FlopCounts(*_get_counts(self), custom=dict(self.custom))
 
     @classmethod
     def field_names(cls) -> list[str]:
-        return [field.name for field in dataclasses.fields(cls)]
+        """Names of the fields counting built-in flop types (i.e. excluding 'custom')."""
+        return list(_FIELD_NAMES)
+
+
+# =================================================================================================
+#  Batch evaluation
+# =================================================================================================
+def batch_weighted_costs(
+    counts: Sequence[FlopCounts] | np.ndarray,
+    weights: Sequence[FlopWeights] | np.ndarray,
+    precision: Precision = Precision.FP64,
+) -> np.ndarray:
+    """
+    Computes the total weighted cost of many flop counts for many sets of weights, using a single matrix product.
+    :param counts: sequence of FlopCounts or int matrix of shape (n_counts, len(FlopType)), see FlopCounts.to_matrix()
+    :param weights: sequence of FlopWeights or matrix of shape (n_weights, len(FlopType)), see FlopWeights.to_matrix()
+    :param precision: precision of the counted flops, selecting the corresponding weights
+    :return: matrix of shape (n_counts, n_weights) with the total weighted cost of each (counts, weights) pair
+    """
+    if isinstance(counts, np.ndarray):
+        counts_matrix, custom_names = counts, []
+    else:
+        custom_names = sorted({name for c in counts for name in c.custom})
+        counts_matrix = FlopCounts.to_matrix(counts, custom_names)
+
+    if isinstance(weights, np.ndarray):
+        if custom_names:
+            raise ValueError("Weights of custom flop types can only be determined when passing FlopWeights objects.")
+        weight_matrix = weights
+    else:
+        weight_matrix = FlopWeights.to_matrix(weights, precision, custom_names)
+
+    return counts_matrix @ weight_matrix.T
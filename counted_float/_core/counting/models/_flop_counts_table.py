@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import csv
+import os
+from pathlib import Path
+from typing import Any, Hashable, Iterable, Sequence
+
+import numpy as np
+
+from ._flop_counts import FlopCounts
+from ._flop_type import FlopType
+from ._flop_weights import FlopWeights
+from ._precision import Precision
+
+_FLOP_TYPE_NAMES = [flop_type.name for flop_type in FlopType]
+_CUSTOM_PREFIX = "custom:"
+_LABEL_PREFIX = "label:"
+_INITIAL_CAPACITY = 1024
+
+
+class FlopCountsTable:
+    """
+    Columnar container of many FlopCounts objects (e.g. per iteration, per region or per input size), with one int64
+    column per FlopType (+ one per custom flop type encountered) and any number of label columns.
+
+    Counts are stored in a single (n_rows, len(FlopType)) int64 matrix with amortized O(1) append, such that large
+    sweeps can be aggregated efficiently using numpy.  Tables can be saved & loaded as .npz, as CSV, or as a
+    directory of .npy files, which are memory-mapped when loading (see save() & load()).
+
+        table = FlopCountsTable(label_names=["n", "iteration"])
+        table.append(ctx.flop_counts(), n=100, iteration=3)
+        table.weighted_costs()                  # float64 array with one weighted cost per row
+        table.groupby("n").sum()                # FlopCounts, summed over all groups
+    """
+
+    def __init__(self, label_names: Sequence[str] = (), capacity: int = _INITIAL_CAPACITY):
+        self.__label_names: list[str] = list(label_names)
+        self.__n_rows: int = 0
+        self.__counts: np.ndarray = np.zeros((max(capacity, 1), len(FlopType)), dtype=np.int64)
+        self.__custom: dict[str, np.ndarray] = dict()
+        self.__labels: dict[str, list | np.ndarray] = {name: [] for name in self.__label_names}
+
+    # -------------------------------------------------------------------------
+    #  Adding rows
+    # -------------------------------------------------------------------------
+    def append(self, counts: FlopCounts, **labels: Any):
+        """Appends a row (amortized O(1)); labels not provided are set to None."""
+        unknown = labels.keys() - set(self.__label_names)
+        if unknown:
+            raise ValueError(f"Unknown label(s) {sorted(unknown)}; table has labels {self.__label_names}.")
+
+        if self.__n_rows == len(self.__counts):
+            self.__grow()
+        row = self.__n_rows
+        self.__counts[row] = counts.as_array()
+        for name, count in counts.custom.items():
+            self.__custom_column(name)[row] = count
+        for name in self.__label_names:
+            self.__label_list(name).append(labels.get(name))
+        self.__n_rows += 1
+
+    def extend(self, all_counts: Iterable[FlopCounts], **labels: Iterable[Any]):
+        """Appends multiple rows, with labels provided as iterables of the same length as all_counts."""
+        label_iters = {name: iter(values) for name, values in labels.items()}
+        for counts in all_counts:
+            self.append(counts, **{name: next(values) for name, values in label_iters.items()})
+
+    def __grow(self):
+        capacity = 2 * len(self.__counts)
+        self.__counts = _resized(self.__counts, capacity)
+        self.__custom = {name: _resized(column, capacity) for name, column in self.__custom.items()}
+
+    def __custom_column(self, name: str) -> np.ndarray:
+        if name not in self.__custom:
+            self.__custom[name] = np.zeros(len(self.__counts), dtype=np.int64)
+        return self.__custom[name]
+
+    def __label_list(self, name: str) -> list:
+        if isinstance(self.__labels[name], np.ndarray):
+            self.__labels[name] = self.__labels[name][: self.__n_rows].tolist()  # e.g. memory-mapped after loading
+        return self.__labels[name]
+
+    # -------------------------------------------------------------------------
+    #  Data access
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self.__n_rows
+
+    @property
+    def label_names(self) -> list[str]:
+        return list(self.__label_names)
+
+    @property
+    def custom_names(self) -> list[str]:
+        return sorted(self.__custom)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """(n_rows, len(FlopType)) int64 matrix of counts of all built-in flop types (view, not a copy)."""
+        return self.__counts[: self.__n_rows]
+
+    def column(self, flop_type: FlopType | str) -> np.ndarray:
+        """Counts of a FlopType or of a custom flop type (by name), of all rows (view, not a copy)."""
+        if isinstance(flop_type, FlopType):
+            return self.__counts[: self.__n_rows, _FLOP_TYPE_NAMES.index(flop_type.name)]
+        elif flop_type in self.__custom:
+            return self.__custom[flop_type][: self.__n_rows]
+        else:
+            return np.zeros(self.__n_rows, dtype=np.int64)
+
+    def labels(self, name: str) -> np.ndarray:
+        if name not in self.__labels:
+            raise KeyError(f"Unknown label '{name}'; table has labels {self.__label_names}.")
+        return np.asarray(self.__labels[name][: self.__n_rows])
+
+    def row(self, i: int) -> FlopCounts:
+        if not -self.__n_rows <= i < self.__n_rows:
+            raise IndexError(f"Row index {i} out of range for table with {self.__n_rows} rows.")
+        i %= self.__n_rows
+        return FlopCounts(
+            *[int(count) for count in self.__counts[i]],
+            custom={name: int(column[i]) for name, column in self.__custom.items() if column[i] != 0},
+        )
+
+    def __iter__(self):
+        return (self.row(i) for i in range(self.__n_rows))
+
+    # -------------------------------------------------------------------------
+    #  Aggregation
+    # -------------------------------------------------------------------------
+    def sum(self) -> FlopCounts:
+        """Sum of all rows."""
+        return FlopCounts(
+            *[int(count) for count in self.counts.sum(axis=0)],
+            custom={name: int(total) for name in self.__custom if (total := self.column(name).sum()) != 0},
+        )
+
+    def cumsum(self) -> FlopCountsTable:
+        """Table with the same labels and the cumulative sum of all counts up to and including each row."""
+        return self.__derived_table(
+            self.label_names,
+            np.cumsum(self.counts, axis=0),
+            {name: np.cumsum(self.column(name)) for name in self.__custom},
+            {name: self.labels(name) for name in self.__label_names},
+        )
+
+    def groupby(self, by: str) -> FlopCountsTable:
+        """Table with one row per unique value of label 'by' (in order of first appearance), with summed counts."""
+        group_keys: dict[Hashable, int] = dict()
+        group_indices = np.array(
+            [group_keys.setdefault(key, len(group_keys)) for key in self.labels(by).tolist()], dtype=np.intp
+        )
+        n_groups = len(group_keys)
+
+        def group_sum(column: np.ndarray) -> np.ndarray:
+            result = np.zeros((n_groups,) + column.shape[1:], dtype=np.int64)
+            np.add.at(result, group_indices, column)
+            return result
+
+        return self.__derived_table(
+            [by],
+            group_sum(self.counts),
+            {name: group_sum(self.column(name)) for name in self.__custom},
+            {by: np.array(list(group_keys), dtype=self.labels(by).dtype)},
+        )
+
+    def weighted_costs(self, weights: FlopWeights | None = None, precision: Precision = Precision.FP64) -> np.ndarray:
+        """Total weighted cost of each row (see FlopCounts.total_weighted_cost())."""
+        if not weights:
+            from counted_float._core.counting.config._config import Config
+
+            weights = Config.current_flop_weights()
+
+        costs = self.counts @ weights.weight_vector(precision)
+        for name in self.__custom:
+            costs += self.column(name) * weights.custom_weight(name)
+        return costs
+
+    @staticmethod
+    def __derived_table(
+        label_names: list[str], counts: np.ndarray, custom: dict[str, np.ndarray], labels: dict[str, np.ndarray]
+    ) -> FlopCountsTable:
+        table = FlopCountsTable(label_names, capacity=len(counts))
+        table.__n_rows = len(counts)
+        table.__counts = counts
+        table.__custom = custom
+        table.__labels = dict(labels)  # arrays (e.g. memory-mapped); converted to lists only when appending
+        return table
+
+    # -------------------------------------------------------------------------
+    #  Export & import
+    # -------------------------------------------------------------------------
+    def __columns(self) -> dict[str, np.ndarray]:
+        # all columns, keyed by file-safe names, with labels converted to non-object dtypes (numbers or strings)
+        return {
+            "counts": np.ascontiguousarray(self.counts),
+            **{_CUSTOM_PREFIX + name: self.column(name) for name in self.custom_names},
+            **{_LABEL_PREFIX + name: _non_object_array(self.labels(name)) for name in self.__label_names},
+        }
+
+    @classmethod
+    def __from_columns(cls, columns: dict[str, np.ndarray]) -> FlopCountsTable:
+        label_names = [key.removeprefix(_LABEL_PREFIX) for key in columns if key.startswith(_LABEL_PREFIX)]
+        return cls.__derived_table(
+            label_names,
+            columns["counts"],
+            {key.removeprefix(_CUSTOM_PREFIX): columns[key] for key in columns if key.startswith(_CUSTOM_PREFIX)},
+            {name: columns[_LABEL_PREFIX + name] for name in label_names},
+        )
+
+    def save_npz(self, path: str | os.PathLike, compressed: bool = True):
+        save = np.savez_compressed if compressed else np.savez
+        save(path, **{key.replace(":", "__"): column for key, column in self.__columns().items()})
+
+    @classmethod
+    def load_npz(cls, path: str | os.PathLike) -> FlopCountsTable:
+        with np.load(path, allow_pickle=False) as data:
+            return cls.__from_columns({key.replace("__", ":", 1): data[key] for key in data.files})
+
+    def save(self, directory: str | os.PathLike):
+        """Saves the table as a directory with one .npy file per column (see load())."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for key, column in self.__columns().items():
+            np.save(directory / f"{key.replace(':', '__')}.npy", column, allow_pickle=False)
+
+    @classmethod
+    def load(cls, directory: str | os.PathLike, mmap: bool = True) -> FlopCountsTable:
+        """
+        Loads a table saved with save().  With mmap=True, columns are memory-mapped (read-only) rather than loaded,
+        such that aggregations only read the data they need; appending rows copies the counts into memory.
+        """
+        columns = dict()
+        for path in sorted(Path(directory).glob("*.npy")):
+            column = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+            columns[path.stem.replace("__", ":", 1)] = column
+        if "counts" not in columns:
+            raise FileNotFoundError(f"No FlopCountsTable found in '{directory}'.")
+        return cls.__from_columns(columns)
+
+    def to_csv(self, path: str | os.PathLike):
+        columns = self.__columns()
+        header = self.__label_names + _FLOP_TYPE_NAMES + [_CUSTOM_PREFIX + name for name in self.custom_names]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for i in range(self.__n_rows):
+                writer.writerow(
+                    [columns[_LABEL_PREFIX + name][i] for name in self.__label_names]
+                    + columns["counts"][i].tolist()
+                    + [columns[_CUSTOM_PREFIX + name][i] for name in self.custom_names]
+                )
+
+    @classmethod
+    def from_csv(cls, path: str | os.PathLike) -> FlopCountsTable:
+        """Loads a table written by to_csv().  Label values are parsed as int or float where possible."""
+        with open(path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = list(reader)
+
+        label_names = header[: header.index(_FLOP_TYPE_NAMES[0])]
+        custom_names = [key.removeprefix(_CUSTOM_PREFIX) for key in header if key.startswith(_CUSTOM_PREFIX)]
+        n_labels = len(label_names)
+        counts = np.array([row[n_labels:] for row in rows], dtype=np.int64).reshape(len(rows), -1)
+        return cls.__derived_table(
+            label_names,
+            np.ascontiguousarray(counts[:, : len(FlopType)]),
+            {name: counts[:, len(FlopType) + j].copy() for j, name in enumerate(custom_names)},
+            {
+                name: np.array([_parse_label(row[j]) for row in rows], dtype=object)
+                for j, name in enumerate(label_names)
+            },
+        )
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+def _resized(array: np.ndarray, n_rows: int) -> np.ndarray:
+    resized = np.zeros((n_rows,) + array.shape[1:], dtype=array.dtype)
+    resized[: len(array)] = array
+    return resized
+
+
+def _non_object_array(values: np.ndarray) -> np.ndarray:
+    if values.dtype == object:
+        return values.astype(str)  # e.g. mixed types or None values, which cannot be saved without pickling
+    return values
+
+
+def _parse_label(value: str) -> int | float | str:
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
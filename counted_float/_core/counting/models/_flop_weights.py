@@ -1,16 +1,46 @@
 from __future__ import annotations
 
 import math
-from typing import Iterable
+import operator
+from functools import lru_cache
+from typing import Iterable, Sequence
 
-from pydantic import field_serializer, field_validator
+import numpy as np
+from pydantic import field_serializer, field_validator, model_serializer
 
 from ._base import MyBaseModel
+from ._custom_flop_type import _CUSTOM_FLOP_TYPES, get_custom_flop_type
 from ._flop_type import FlopType
+from ._int_op_type import IntOpType
+from ._precision import Precision
+
+_get_weights = operator.itemgetter(*FlopType)
+
+
+@lru_cache(maxsize=64)
+def _weight_vector(weight_tuple: tuple[float | int, ...]) -> np.ndarray:
+    # keyed by the weight values, such that in-place modifications of weights dicts are never served stale vectors
+    weight_vector = np.array(weight_tuple, dtype=np.float64)
+    weight_vector.flags.writeable = False  # shared by all callers
+    return weight_vector
+
+
+class _CustomName(str):
+    """Name of a custom flop type, displayed like CustomFlopType.long_name(), also if it is not registered."""
+
+    def long_name(self) -> str:
+        if self in _CUSTOM_FLOP_TYPES:
+            return _CUSTOM_FLOP_TYPES[self].long_name()
+        return f"CustomFlopType.{self:<9}  [{self}]"
 
 
 class FlopWeights(MyBaseModel):
-    weights: dict[FlopType, float | int]
+    weights: dict[FlopType, float | int]  # weights of fp64 flops
+    weights_fp32: dict[FlopType, float | int] | None = None  # weights of fp32 flops (optional, same scale as fp64)
+    weights_int: dict[IntOpType, float | int] | None = None  # weights of integer ops (optional, same scale as fp64)
+    # weights of custom flop types, overriding their registered weights; names need not be registered in this process
+    # (e.g. when loading saved benchmark results), custom_weight() only falls back to the registry for missing names
+    weights_custom: dict[str, float | int] | None = None
 
     # -------------------------------------------------------------------------
     #  Helpers
@@ -19,31 +49,120 @@ class FlopWeights(MyBaseModel):
         """Round all weights to the nearest integer, with minimum of 1."""
         return FlopWeights(
             weights={k: max(1, round(v)) for k, v in self.weights.items()},
+            weights_fp32={k: max(1, round(v)) for k, v in self.weights_fp32.items()} if self.weights_fp32 else None,
+            weights_int={k: max(1, round(v)) for k, v in self.weights_int.items()} if self.weights_int else None,
+            weights_custom=(
+                {k: max(1, round(v)) for k, v in self.weights_custom.items()} if self.weights_custom else None
+            ),
         )
 
+    def for_precision(self, precision: Precision) -> dict[FlopType, float | int]:
+        """
+        Returns the weights to be used for flops of the requested precision.  If no fp32-specific weights are
+        available, the fp64 weights are returned for Precision.FP32 as well.
+        """
+        if precision == Precision.FP32 and self.weights_fp32 is not None:
+            return self.weights_fp32
+        else:
+            return self.weights
+
+    def weight_tuple(self, precision: Precision = Precision.FP64) -> tuple[float | int, ...]:
+        """Weights of the requested precision as a tuple, in FlopType order."""
+        return _get_weights(self.for_precision(precision))
+
+    def weight_vector(self, precision: Precision = Precision.FP64) -> np.ndarray:
+        """Weights of the requested precision as a read-only float64 array, in FlopType order (cached)."""
+        return _weight_vector(self.weight_tuple(precision))
+
+    @staticmethod
+    def to_matrix(
+        all_weights: Iterable[FlopWeights], precision: Precision = Precision.FP64, custom_names: Sequence[str] = ()
+    ) -> np.ndarray:
+        """
+        Stacks the weights of the requested precision of many FlopWeights objects into a float64 matrix with one row
+        per FlopWeights object and one column per FlopType, followed by one column per requested custom flop type.
+        """
+        return np.array(
+            [(*w.weight_tuple(precision), *[w.custom_weight(name) for name in custom_names]) for w in all_weights],
+            dtype=np.float64,
+        ).reshape(-1, len(FlopType) + len(custom_names))
+
+    def custom_weight(self, name: str) -> float | int:
+        """
+        Returns the weight of the custom flop type with the given name: the override in weights_custom if present,
+        otherwise the weight provided when registering the custom flop type.
+        """
+        if self.weights_custom is not None and name in self.weights_custom:
+            return self.weights_custom[name]
+        else:
+            return get_custom_flop_type(name).weight
+
     # -------------------------------------------------------------------------
     #  Validation
     # -------------------------------------------------------------------------
-    @field_validator("weights")
+    @field_validator("weights", "weights_fp32")
     @classmethod
-    def check_all_flop_types_present(cls, v: dict[FlopType, float | int]) -> dict[FlopType, float | int]:
+    def check_all_flop_types_present(cls, v: dict[FlopType, float | int] | None) -> dict[FlopType, float | int] | None:
         # make sure all FlopType enum members are present
+        if v is None:
+            return v
         missing = [member for member in FlopType if member not in v]
         if missing:
             raise ValueError(f"Missing weights for flop types: {missing}")
         return v
 
-    @field_serializer("weights")
-    def serialize_weights(self, weights: dict[FlopType, float | int]) -> dict[str, float | int]:
+    @field_validator("weights_int")
+    @classmethod
+    def check_all_int_op_types_present(
+        cls, v: dict[IntOpType, float | int] | None
+    ) -> dict[IntOpType, float | int] | None:
+        # make sure all IntOpType enum members are present
+        if v is None:
+            return v
+        missing = [member for member in IntOpType if member not in v]
+        if missing:
+            raise ValueError(f"Missing weights for int op types: {missing}")
+        return v
+
+    @field_serializer("weights", "weights_fp32", "weights_int")
+    def serialize_weights(
+        self, weights: dict[FlopType, float | int] | dict[IntOpType, float | int] | None
+    ) -> dict[str, float | int] | None:
         # make sure we serialize using the enum values as keys
+        if weights is None:
+            return None
         return {k.value: v for k, v in weights.items()}
 
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler) -> dict:
+        # omit optional weights if not present, such that fp64-only weights serialize as before
+        data = handler(self)
+        for key in ["weights_fp32", "weights_int", "weights_custom"]:
+            if data.get(key, 0) is None:
+                del data[key]
+        return data
+
     # -------------------------------------------------------------------------
     #  Custom visualization
     # -------------------------------------------------------------------------
     def show(self):
+        if self.weights_fp32 is None:
+            self._show_weights(self.weights)
+        else:
+            for precision in Precision:
+                print(f"{precision.name}: ", end="")
+                self._show_weights(self.for_precision(precision))
+        if self.weights_int is not None:
+            print("INT: ", end="")
+            self._show_weights(self.weights_int)
+        if self.weights_custom is not None:
+            print("CUSTOM: ", end="")
+            self._show_weights({_CustomName(name): w for name, w in self.weights_custom.items()})
+
+    @staticmethod
+    def _show_weights(weights: dict):
         print("{")
-        for k, v in self.weights.items():
+        for k, v in weights.items():
             if isinstance(v, float):
                 print(f"    {k.long_name()}".ljust(40) + f": {v:9.5f}")
             else:
@@ -58,28 +177,81 @@ class FlopWeights(MyBaseModel):
         """Computes geo-mean of a collection of FlopWeights instances."""
         all_flop_weights = list(all_flop_weights)
         return FlopWeights(
-            weights={
-                flop_type: pow(
-                    math.prod(fw.weights[flop_type] for fw in all_flop_weights),
-                    1 / len(all_flop_weights),
-                )  # take geometric mean of all weights for this flop_type
-                for flop_type in FlopType
-            }
+            weights=cls._geo_mean_weights([fw.weights for fw in all_flop_weights]),
+            weights_fp32=(
+                cls._geo_mean_weights([fw.weights_fp32 for fw in all_flop_weights])
+                if all(fw.weights_fp32 is not None for fw in all_flop_weights)
+                else None  # only compute fp32 geo-mean if all instances have fp32 weights
+            ),
+            weights_int=(
+                cls._geo_mean_weights([fw.weights_int for fw in all_flop_weights], IntOpType)
+                if all(fw.weights_int is not None for fw in all_flop_weights)
+                else None  # only compute int geo-mean if all instances have int weights
+            ),
+            weights_custom=(
+                cls._geo_mean_weights(
+                    [fw.weights_custom for fw in all_flop_weights],
+                    set.intersection(*[set(fw.weights_custom) for fw in all_flop_weights]),
+                )
+                if all(fw.weights_custom is not None for fw in all_flop_weights)
+                else None  # only compute custom geo-mean if all instances have custom weights (common names only)
+            ),
         )
 
+    @staticmethod
+    def _geo_mean_weights(all_weights: list[dict], op_types: Iterable = FlopType) -> dict:
+        return {
+            op_type: pow(
+                math.prod(weights[op_type] for weights in all_weights),
+                1 / len(all_weights),
+            )  # take geometric mean of all weights for this op_type
+            for op_type in op_types
+        }
+
     @classmethod
-    def from_abs_flop_costs(cls, flop_costs: dict[FlopType, float]) -> FlopWeights:
+    def from_abs_flop_costs(
+        cls,
+        flop_costs: dict[FlopType, float],
+        flop_costs_fp32: dict[FlopType, float] | None = None,
+        int_op_costs: dict[IntOpType, float] | None = None,
+        custom_flop_costs: dict[str, float] | None = None,
+    ) -> FlopWeights:
         """
         Computes FlopWeights based on absolute costs (in clock cycles, nanoseconds, ...) of each flop type.
         As a reference duration, we take the geometric mean of the costs for EQUALS, ADD, SUB, and MUL operations.
+        If provided, fp32, integer op and custom flop type costs are normalized using the same (fp64) reference duration,
+        such that all weights can be directly compared.
         """
 
         # step 1) compute reference duration
-        ref_cost = (
-            flop_costs[FlopType.EQUALS] * flop_costs[FlopType.ADD] * flop_costs[FlopType.SUB] * flop_costs[FlopType.MUL]
-        ) ** (1 / 4)
+        ref_cost = cls.reference_cost(flop_costs)
 
         # step 2) normalize and construct FlopWeights object
         return FlopWeights(
             weights={flop_type: flop_cost / ref_cost for flop_type, flop_cost in flop_costs.items()},
+            weights_fp32=(
+                {flop_type: flop_cost / ref_cost for flop_type, flop_cost in flop_costs_fp32.items()}
+                if flop_costs_fp32 is not None
+                else None
+            ),
+            weights_int=(
+                {int_op_type: int_op_cost / ref_cost for int_op_type, int_op_cost in int_op_costs.items()}
+                if int_op_costs is not None
+                else None
+            ),
+            weights_custom=(
+                {name: cost / ref_cost for name, cost in custom_flop_costs.items()}
+                if custom_flop_costs is not None
+                else None
+            ),
         )
+
+    @staticmethod
+    def reference_cost(flop_costs: dict[FlopType, float]) -> float:
+        """
+        Returns the reference cost w.r.t. which absolute flop costs are normalized to obtain flop weights,
+        computed as the geometric mean of the costs for EQUALS, ADD, SUB, and MUL operations.
+        """
+        return (
+            flop_costs[FlopType.EQUALS] * flop_costs[FlopType.ADD] * flop_costs[FlopType.SUB] * flop_costs[FlopType.MUL]
+        ) ** (1 / 4)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from ._base import MyBaseModel
+from ._complex_op_type import ComplexOpType
 from ._flop_type import FlopType
 from ._flop_weights import FlopWeights
+from ._int_op_type import IntOpType
+from ._precision import Precision
 
 
 # =================================================================================================
@@ -38,10 +41,30 @@ class Quantiles(MyBaseModel):
     q75: float
 
 
+class RuntimePrediction(MyBaseModel):
+    """
+    Predicted (compiled) execution time of a set of flops, based on the absolute durations of FlopsBenchmarkResults.
+    Quantiles are obtained by summing the corresponding quantiles of all flops (i.e. assuming fully correlated
+    durations), such that the q25-q75 band is a conservative indication of the uncertainty.
+    """
+
+    ns: Quantiles  # total predicted duration (nsec)
+    ns_by_flop_type: dict[FlopType, float]  # median predicted duration (nsec) per flop type, excl. custom flop types
+    ns_custom: dict[str, float] = dict()  # median predicted duration (nsec) per custom flop type
+    n_unknown: int = 0  # number of flops without benchmark results (custom flop types), not included in the prediction
+
+    def seconds(self) -> Quantiles:
+        return Quantiles(q25=self.ns.q25 / 1e9, q50=self.ns.q50 / 1e9, q75=self.ns.q75 / 1e9)
+
+
 class FlopsBenchmarkDurations(MyBaseModel):
     # baseline + flops benchmarking results in nanoseconds per <array_size> flops
     baseline: Quantiles
     flops: dict[FlopType, Quantiles]
+    flops_fp32: dict[FlopType, Quantiles] | None = None  # only present if fp32 flops were benchmarked
+    complex_ops: dict[ComplexOpType, Quantiles] | None = None  # only present if complex ops were benchmarked
+    int_ops: dict[IntOpType, Quantiles] | None = None  # only present if int ops were benchmarked
+    custom_ops: dict[str, Quantiles] | None = None  # only present if custom flop types were benchmarked
 
 
 class FlopsBenchmarkResults(MyBaseModel):
@@ -56,6 +79,8 @@ class FlopsBenchmarkResults(MyBaseModel):
            1) first of all, we only consider median values of the benchmark results
            2) compute duration for each flop type _minus_ baseline duration per <array_size> flops
            3) convert to flop weights by taking a few simple flop types as reference (see FlopWeights implementation)
+        If fp32 flops, int ops and/or custom flop types were benchmarked, the corresponding weights are included,
+        on the same scale as the fp64 weights.
         """
 
         # step 1) collect median values for all results
@@ -64,6 +89,75 @@ class FlopsBenchmarkResults(MyBaseModel):
 
         # step 2) surplus durations for each flop type, on top of baseline duration
         flop_durations_ns = {flop_type: median_flops_ns[flop_type] - median_baseline_ns for flop_type in FlopType}
+        flop_durations_ns_fp32 = None
+        if self.results_ns.flops_fp32 is not None:
+            flop_durations_ns_fp32 = {
+                flop_type: self.results_ns.flops_fp32[flop_type].q50 - median_baseline_ns for flop_type in FlopType
+            }
+        int_op_durations_ns = None
+        if self.results_ns.int_ops is not None:
+            int_op_durations_ns = {
+                int_op_type: self.results_ns.int_ops[int_op_type].q50 - median_baseline_ns for int_op_type in IntOpType
+            }
+        custom_flop_durations_ns = None
+        if self.results_ns.custom_ops is not None:
+            custom_flop_durations_ns = {
+                name: quantiles.q50 - median_baseline_ns for name, quantiles in self.results_ns.custom_ops.items()
+            }
 
         # step 3) convert to FlopWeights
-        return FlopWeights.from_abs_flop_costs(flop_costs=flop_durations_ns)
+        return FlopWeights.from_abs_flop_costs(
+            flop_costs=flop_durations_ns,
+            flop_costs_fp32=flop_durations_ns_fp32,
+            int_op_costs=int_op_durations_ns,
+            custom_flop_costs=custom_flop_durations_ns,
+        )
+
+    def flop_durations_ns(self, precision: Precision = Precision.FP64) -> dict[FlopType, Quantiles]:
+        """
+        Returns absolute durations (nsec) of a single flop of each type, i.e. benchmark durations minus median baseline
+        duration, divided by the array size of the benchmark.  Negative durations (within measurement noise of
+        the baseline) are clipped to 0.
+        """
+        if precision == Precision.FP64:
+            flops_ns = self.results_ns.flops
+        elif self.results_ns.flops_fp32 is not None:
+            flops_ns = self.results_ns.flops_fp32
+        else:
+            raise ValueError(f"No {precision} flops were benchmarked.")
+        return {flop_type: self._per_op_durations(quantiles) for flop_type, quantiles in flops_ns.items()}
+
+    def custom_flop_durations_ns(self) -> dict[str, Quantiles]:
+        """Counterpart of flop_durations_ns() for custom flop types (empty if these were not benchmarked)."""
+        return {name: self._per_op_durations(q) for name, q in (self.results_ns.custom_ops or dict()).items()}
+
+    def _per_op_durations(self, quantiles: Quantiles) -> Quantiles:
+        median_baseline_ns = self.results_ns.baseline.q50
+        array_size = self.benchmark_settings.array_size
+        return Quantiles(
+            q25=max(0.0, quantiles.q25 - median_baseline_ns) / array_size,
+            q50=max(0.0, quantiles.q50 - median_baseline_ns) / array_size,
+            q75=max(0.0, quantiles.q75 - median_baseline_ns) / array_size,
+        )
+
+    @property
+    def complex_op_weights(self) -> dict[ComplexOpType, float] | None:
+        """
+        Returns measured weights for each complex op type, normalized in the same way as flop_weights, such that
+        they can be directly compared to the weighted cost of the decomposition of each op into real-valued flops:
+
+            results.complex_op_weights[op]   <-->   op.flop_counts().total_weighted_cost(results.flop_weights)
+
+        Returns None if complex ops were not benchmarked.
+        """
+        if self.results_ns.complex_ops is None:
+            return None
+
+        # surplus durations on top of baseline duration, for both flops (reference) & complex ops
+        median_baseline_ns = self.results_ns.baseline.q50
+        flop_durations_ns = {k: v.q50 - median_baseline_ns for k, v in self.results_ns.flops.items()}
+        complex_op_durations_ns = {k: v.q50 - median_baseline_ns for k, v in self.results_ns.complex_ops.items()}
+
+        # normalize using same reference cost as flop_weights
+        ref_cost = FlopWeights.reference_cost(flop_durations_ns)
+        return {complex_op_type: duration / ref_cost for complex_op_type, duration in complex_op_durations_ns.items()}
@@ -0,0 +1,25 @@
+from counted_float._core.compatibility import StrEnum
+
+
+class InstrumentationBackend(StrEnum):
+    """
+    Enum describing the available implementations of the CountedFloat operators, which are swapped at runtime
+    (see _backends.py) depending on which FlopCountingContexts are active.
+
+    Enum                Behavior
+    Member
+    -------             ---------
+
+    DORMANT             no counting, only contagion (zero counting overhead)
+    COUNTING            counting in GLOBAL_COUNTER  (default)
+    TRACING             counting + recording every operation & its operands  (see FlopCountingContext.trace())
+    PROFILING           counting + attributing counts to call sites  (see FlopCountingContext.profile())
+    """
+
+    DORMANT = "dormant"
+    COUNTING = "counting"
+    TRACING = "tracing"
+    PROFILING = "profiling"
+
+    def long_name(self) -> str:
+        return f"InstrumentationBackend.{self.name:<9}  [{self.value}]"
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import dataclasses
+
+from ._flop_weights import FlopWeights
+from ._int_op_type import IntOpType
+
+
+@dataclasses.dataclass(slots=True)
+class IntOpCounts:
+    """
+    Class to keep track of integer operation counts per int op type.  Integer counterpart of FlopCounts.
+    """
+
+    # --- Counting fields ---------------------------------
+    ADD: int = 0
+    MUL: int = 0
+    DIV: int = 0
+    SHIFT: int = 0
+    BITWISE: int = 0
+    CMP: int = 0
+
+    # --- math --------------------------------------------
+    def __add__(self, other: IntOpCounts) -> IntOpCounts:
+        return IntOpCounts(**{attr: getattr(self, attr) + getattr(other, attr) for attr in self.field_names()})
+
+    def __sub__(self, other: IntOpCounts) -> IntOpCounts:
+        return IntOpCounts(**{attr: getattr(self, attr) - getattr(other, attr) for attr in self.field_names()})
+
+    # --- extract info ------------------------------------
+    def as_dict(self) -> dict[IntOpType, int]:
+        """Return the int op counts as a dictionary with IntOpType keys."""
+        return {int_op_type: getattr(self, int_op_type.name) for int_op_type in IntOpType}
+
+    def total_count(self) -> int:
+        """Sum of all int op counts."""
+        return sum(getattr(self, attr) for attr in self.field_names())
+
+    def total_weighted_cost(self, weights: FlopWeights | None = None) -> float:
+        """
+        Returns a weighted total count of all int ops (counterpart of the unweighted total_count() method),
+        using the integer weights of the provided FlopWeights, such that the result is on the same scale as
+        FlopCounts.total_weighted_cost().
+        When omitted, the currently configured weights (see Config class) will be used.
+        """
+        if not weights:
+            from counted_float._core.counting.config import get_flop_weights
+
+            weights = get_flop_weights()
+
+        if weights.weights_int is None:
+            raise ValueError(
+                "No integer weights available in provided FlopWeights; "
+                + "obtain them using run_flops_benchmark(include_int_ops=True)."
+            )
+
+        return sum([getattr(self, int_op_type.name) * weights.weights_int[int_op_type] for int_op_type in IntOpType])
+
+    # --- other -------------------------------------------
+    def reset(self):
+        """Reset all counts to 0"""
+        for attr in self.field_names():
+            setattr(self, attr, 0)
+
+    def copy(self) -> IntOpCounts:
+        return IntOpCounts(**dataclasses.asdict(self))
+
+    @classmethod
+    def field_names(cls) -> list[str]:
+        return [field.name for field in dataclasses.fields(cls)]
@@ -0,0 +1,33 @@
+from counted_float._core.compatibility import StrEnum
+
+
+class IntOpType(StrEnum):
+    """
+    Enum describing the different types of integer operations, each of which are counted separately (by CountedInt)
+    and can potentially have different weights.  Weights are expressed on the same scale as the flop weights.
+
+    Enum                Math                                    ~corresponding
+    Member              Operation(s)                            x86 instruction(s)
+    -------             ----------                              -------------------
+
+    ADD                 i + j, i - j, -i, abs(i)                ADD, SUB, NEG
+    MUL                 i * j                                   IMUL
+    DIV                 i // j, i % j, divmod(i, j)             IDIV
+    SHIFT               i << j, i >> j                          SHL, SAR
+    BITWISE             i & j, i | j, i ^ j, ~i                 AND, OR, XOR, NOT
+    CMP                 i == j, i < j, i >= j, ...              CMP
+
+    NOTES:
+      - i ** j (j >= 0) is counted as the number of MULs needed for exponentiation by squaring.
+      - i / j is a floating-point operation and is counted as FlopType.DIV.
+    """
+
+    ADD = "i+j"
+    MUL = "i*j"
+    DIV = "i//j"
+    SHIFT = "i<<j"
+    BITWISE = "i&j"
+    CMP = "i<j"
+
+    def long_name(self) -> str:
+        return f"IntOpType.{self.name:<8}  [{self.value}]"
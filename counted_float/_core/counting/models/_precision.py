@@ -0,0 +1,18 @@
+from counted_float._core.compatibility import StrEnum
+
+
+class Precision(StrEnum):
+    """
+    Enum describing the floating-point precisions in which flops can be executed.  Flops are counted separately
+    per precision and can have precision-specific weights.
+
+    Enum                Type                    Counted by
+    Member
+    -------             -----                   -----------
+
+    FP64                IEEE 754 binary64       CountedFloat
+    FP32                IEEE 754 binary32       CountedFloat32
+    """
+
+    FP64 = "fp64"
+    FP32 = "fp32"
@@ -1,6 +1,17 @@
-from counted_float._core.benchmarking import FlopsBenchmarkResults, run_flops_benchmark
+from counted_float._core.benchmarking import (
+    CountingOverheadResult,
+    FlopsBenchmarkResults,
+    TraceReplayResult,
+    benchmark_counting_overhead,
+    replay_trace,
+    run_flops_benchmark,
+)
 
 __all__ = [
+    "CountingOverheadResult",
     "FlopsBenchmarkResults",
+    "TraceReplayResult",
+    "benchmark_counting_overhead",
+    "replay_trace",
     "run_flops_benchmark",
 ]
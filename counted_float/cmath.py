@@ -0,0 +1,23 @@
+"""
+Drop-in replacement for the cmath module, with counted versions of sqrt & polar, regardless of whether a
+FlopCountingContext is active.  All other attributes are taken from the cmath module as-is.
+
+Usage:
+    from counted_float import cmath
+    from counted_float.cmath import sqrt
+"""
+
+import cmath as _cmath
+
+from counted_float._core.counting import cmath_polar as polar
+from counted_float._core.counting import cmath_sqrt as sqrt
+
+
+def __getattr__(name: str):
+    return getattr(_cmath, name)
+
+
+__all__ = [
+    "polar",
+    "sqrt",
+]
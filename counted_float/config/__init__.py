@@ -1,15 +1,21 @@
 from counted_float._core.counting.config import (
+    get_active_backend,
+    get_default_backend,
     get_default_consensus_flop_weights,
     get_default_empirical_flop_weights,
     get_default_theoretical_flop_weights,
     get_flop_weights,
+    set_default_backend,
     set_flop_weights,
 )
 
 __all__ = [
+    "get_active_backend",
+    "get_default_backend",
     "get_default_consensus_flop_weights",
     "get_default_empirical_flop_weights",
     "get_default_theoretical_flop_weights",
     "get_flop_weights",
+    "set_default_backend",
     "set_flop_weights",
 ]
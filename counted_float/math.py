@@ -0,0 +1,25 @@
+"""
+Drop-in replacement for the math module, with counted versions of sqrt, log2 & pow, regardless of whether a
+FlopCountingContext is active.  All other attributes are taken from the math module as-is.
+
+Usage:
+    from counted_float import math
+    from counted_float.math import sqrt
+"""
+
+import math as _math
+
+from counted_float._core.counting import math_log2 as log2
+from counted_float._core.counting import math_pow as pow
+from counted_float._core.counting import math_sqrt as sqrt
+
+
+def __getattr__(name: str):
+    return getattr(_math, name)
+
+
+__all__ = [
+    "log2",
+    "pow",
+    "sqrt",
+]
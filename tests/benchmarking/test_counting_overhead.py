@@ -0,0 +1,52 @@
+import math
+import sys
+
+import pytest
+
+from counted_float._core.benchmarking._counting_overhead import _distance, benchmark_counting_overhead
+from counted_float._core.benchmarking._models import CountingOverheadResult
+from counted_float._core.counting import FlopCountingContext, PlainFloatCounting
+from counted_float._core.counting.models import FlopCounts, Quantiles
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="sys.monitoring requires Python 3.12+")
+def test_distance_kernel_plain_float_counting():
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as ctx, PlainFloatCounting([_distance]):
+        result = _distance([1.0, 2.0], [4.0, 6.0])
+
+    # --- assert ------------------------------------------
+    assert result == 5.0
+    assert ctx.flop_counts() == FlopCounts(SUB=2, MUL=2, ADD=2, SQRT=1)
+
+
+def test_benchmark_counting_overhead():
+    # --- act ---------------------------------------------
+    result = benchmark_counting_overhead(n_elements=100, n_runs=3)
+
+    # --- assert ------------------------------------------
+    assert result.n_elements == 100
+    assert result.overhead_counted_float() > 1.0
+    if sys.version_info >= (3, 12):
+        assert result.overhead_plain_float_counting() > 1.0
+    else:
+        assert result.overhead_plain_float_counting() is None
+
+
+def test_counting_overhead_result_show(capsys):
+    # --- arrange -----------------------------------------
+    result = CountingOverheadResult(
+        n_elements=10,
+        ns_plain=Quantiles(q25=1e6, q50=1e6, q75=1e6),
+        ns_counted_float=Quantiles(q25=2e7, q50=2e7, q75=2e7),
+        ns_plain_float_counting=Quantiles(q25=5e7, q50=5e7, q75=5e7),
+    )
+
+    # --- act ---------------------------------------------
+    result.show()
+
+    # --- assert ------------------------------------------
+    output = capsys.readouterr().out
+    assert math.isclose(result.overhead_counted_float(), 20.0)
+    assert "20.0x" in output
+    assert "50.0x" in output
@@ -1,8 +1,19 @@
+import math
+
+import numpy as np
 import pytest
 
 from counted_float._core.benchmarking._flops_benchmark_suite import FlopsBenchmarkSuite
 from counted_float._core.benchmarking._flops_micro_benchmark import FlopsMicroBenchmark
-from counted_float._core.counting.models import FlopsBenchmarkResults, FlopType
+from counted_float._core.counting.models import (
+    ComplexOpType,
+    FlopsBenchmarkResults,
+    FlopType,
+    IntOpType,
+    Precision,
+    register_custom_flop_type,
+    unregister_custom_flop_type,
+)
 
 
 def test_flops_benchmarking_suite_get():
@@ -33,3 +44,130 @@ def test_flops_benchmarking_suite_run():
 
     # --- assert ------------------------------------------
     assert isinstance(result, FlopsBenchmarkResults)
+
+
+@pytest.mark.parametrize("precision", [Precision.FP64, Precision.FP32])
+def test_flops_benchmarking_suite_get_precision(precision: Precision):
+    # --- arrange -----------------------------------------
+    suite = FlopsBenchmarkSuite()
+
+    # --- act ---------------------------------------------
+    benchmarks = suite.get_flops_benchmarking_suite(size=123, precision=precision)
+
+    # --- assert ------------------------------------------
+    assert set(benchmarks.keys()) == set(FlopType) | {None}
+    assert all(
+        [v.dtype == {Precision.FP64: np.float64, Precision.FP32: np.float32}[precision] for v in benchmarks.values()]
+    )
+    assert len({v.name for v in benchmarks.values()}) == len(benchmarks)
+
+
+def test_flops_benchmarking_suite_run_fp32():
+    # --- arrange -----------------------------------------
+    suite = FlopsBenchmarkSuite()
+
+    # --- act ---------------------------------------------
+    result = suite.run(
+        array_size=10,
+        n_runs_total=4,
+        n_runs_warmup=2,
+        n_seconds_per_run_target=0.001,
+        include_fp32=True,
+    )  # override defaults to keep test short
+
+    # --- assert ------------------------------------------
+    assert set(result.results_ns.flops_fp32.keys()) == set(FlopType)
+    assert result.results_ns.complex_ops is None
+
+
+def test_flops_benchmarking_suite_get_complex():
+    # --- arrange -----------------------------------------
+    suite = FlopsBenchmarkSuite()
+
+    # --- act ---------------------------------------------
+    benchmarks = suite.get_complex_benchmarking_suite(size=123)
+
+    # --- assert ------------------------------------------
+    assert set(benchmarks.keys()) == set(ComplexOpType)
+    assert all([isinstance(v, FlopsMicroBenchmark) for v in benchmarks.values()])
+    assert all([v.size == 123 for v in benchmarks.values()])
+    assert benchmarks[ComplexOpType.ABS].out_dtype == np.float64  # real result, no conversion to complex
+    assert benchmarks[ComplexOpType.ADD].out_dtype == np.complex128
+
+
+def test_flops_benchmarking_suite_run_complex():
+    # --- arrange -----------------------------------------
+    suite = FlopsBenchmarkSuite()
+
+    # --- act ---------------------------------------------
+    result = suite.run(
+        array_size=10,
+        n_runs_total=4,
+        n_runs_warmup=2,
+        n_seconds_per_run_target=0.001,
+        include_complex_ops=True,
+    )  # override defaults to keep test short
+
+    # --- assert ------------------------------------------
+    assert set(result.results_ns.complex_ops.keys()) == set(ComplexOpType)
+    assert result.results_ns.flops_fp32 is None
+
+
+def test_flops_benchmarking_suite_get_int():
+    # --- arrange -----------------------------------------
+    suite = FlopsBenchmarkSuite()
+
+    # --- act ---------------------------------------------
+    benchmarks = suite.get_int_benchmarking_suite(size=123)
+
+    # --- assert ------------------------------------------
+    assert set(benchmarks.keys()) == set(IntOpType)
+    assert all([isinstance(v, FlopsMicroBenchmark) for v in benchmarks.values()])
+    assert all([v.size == 123 for v in benchmarks.values()])
+
+
+def test_flops_benchmarking_suite_run_int():
+    # --- arrange -----------------------------------------
+    suite = FlopsBenchmarkSuite()
+
+    # --- act ---------------------------------------------
+    result = suite.run(
+        array_size=10,
+        n_runs_total=4,
+        n_runs_warmup=2,
+        n_seconds_per_run_target=0.001,
+        include_int_ops=True,
+    )  # override defaults to keep test short
+
+    # --- assert ------------------------------------------
+    assert set(result.results_ns.int_ops.keys()) == set(IntOpType)
+    assert result.results_ns.complex_ops is None
+
+
+def test_flops_benchmarking_suite_run_custom():
+    # --- arrange -----------------------------------------
+    def erf_kernel(n: int, in_f1: np.ndarray, in_f2: np.ndarray, out_f: np.ndarray, out_i: np.ndarray):
+        for i in range(n):
+            out_f[i] = math.erf(in_f1[i])
+
+    register_custom_flop_type("ERF", weight=20, benchmark_kernel=erf_kernel)
+    register_custom_flop_type("NO_KERNEL", weight=1)
+    suite = FlopsBenchmarkSuite()
+
+    # --- act ---------------------------------------------
+    try:
+        benchmarks = suite.get_custom_benchmarking_suite(size=123)
+        result = suite.run(
+            array_size=10,
+            n_runs_total=4,
+            n_runs_warmup=2,
+            n_seconds_per_run_target=0.001,
+            include_custom_ops=True,
+        )  # override defaults to keep test short
+    finally:
+        unregister_custom_flop_type("ERF")
+        unregister_custom_flop_type("NO_KERNEL")
+
+    # --- assert ------------------------------------------
+    assert set(benchmarks.keys()) == {"ERF"}
+    assert set(result.results_ns.custom_ops.keys()) == {"ERF"}
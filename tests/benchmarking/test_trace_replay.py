@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from counted_float._core.benchmarking._models import TraceReplayResult
+from counted_float._core.benchmarking._trace_replay import TraceReplayKernel, replay_trace
+from counted_float._core.counting import CountedFloat, FlopCountingContext
+from counted_float._core.counting.models import FlopCounts, InstrumentationBackend
+
+
+def _traced_computation() -> tuple[list, float]:
+    xs = [CountedFloat(1.0 + i) for i in range(5)]
+    with FlopCountingContext(backend=InstrumentationBackend.TRACING) as ctx:
+        s = 0.0
+        for x in xs:
+            s += x**2 / 3.0
+        result = s**0.5 - abs(-xs[0])
+    return ctx.trace(), float(result)
+
+
+def test_trace_replay_kernel():
+    # --- arrange -----------------------------------------
+    trace, expected_result = _traced_computation()
+
+    # --- act ---------------------------------------------
+    replay = TraceReplayKernel(trace)
+    x = replay.input_matrix(n_rows=3)
+    out = np.zeros((3, replay.n_outputs))
+    replay.kernel(x, out)
+
+    # --- assert ------------------------------------------
+    assert replay.n_inputs == 5 + 3  # xs, 0.0, 3.0, 0.5
+    assert replay.n_outputs == 1
+    assert replay.flop_counts() == FlopCounts(MUL=5, DIV=5, ADD=5, POW=1, MINUS=1, ABS=1, SUB=1)
+    assert "i0 * i0" in replay.source  # x**2 replayed as MUL
+    np.testing.assert_allclose(out[:, 0], expected_result)
+
+
+def test_trace_replay_kernel_empty_trace():
+    # --- act & assert ------------------------------------
+    with pytest.raises(ValueError):
+        TraceReplayKernel([])
+
+
+def test_replay_trace():
+    # --- arrange -----------------------------------------
+    trace, _ = _traced_computation()
+
+    # --- act ---------------------------------------------
+    result = replay_trace(trace, n_runs_total=4, n_runs_warmup=1, n_seconds_per_run_target=0.01)
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, TraceReplayResult)
+    assert result.n_ops == len(trace)
+    assert result.weighted_cost == pytest.approx(FlopCounts(**_count_by_type(trace)).total_weighted_cost())
+    assert result.ns_baseline.q50 > 0
+    assert result.ns_per_weighted_flop() == result.ns.q50 / result.weighted_cost
+
+
+def _count_by_type(trace) -> dict[str, int]:
+    counts = {}
+    for op in trace:
+        counts[op.flop_type.name] = counts.get(op.flop_type.name, 0) + 1
+    return counts
@@ -1,6 +1,13 @@
 import pytest
 
-from counted_float._core.counting._global_counter import GLOBAL_COUNTER, GlobalFlopCounter
+from counted_float._core.counting._backends import set_default_backend
+from counted_float._core.counting._global_counter import GLOBAL_COUNTER, GLOBAL_COUNTER_FP32, GlobalFlopCounter
+from counted_float._core.counting.models import (
+    CustomFlopType,
+    InstrumentationBackend,
+    register_custom_flop_type,
+    unregister_custom_flop_type,
+)
 
 
 @pytest.fixture
@@ -15,3 +22,45 @@ def global_counter() -> GlobalFlopCounter:
 
     # cleanup
     GLOBAL_COUNTER.reset()
+
+
+@pytest.fixture
+def global_counter_fp32() -> GlobalFlopCounter:
+    """Fixture that gives access to the global fp32 flop counter, ensuring it is reset BEFORE & AFTER each test."""
+
+    # prepare
+    GLOBAL_COUNTER_FP32.reset()
+
+    # yield
+    yield GLOBAL_COUNTER_FP32
+
+    # cleanup
+    GLOBAL_COUNTER_FP32.reset()
+
+
+@pytest.fixture
+def custom_flop_type() -> CustomFlopType:
+    """Fixture that registers a custom flop type 'ERF' (weight 20) for the duration of the test."""
+
+    # prepare
+    custom_flop_type = register_custom_flop_type("ERF", weight=20, description="erf(x)")
+
+    # yield
+    yield custom_flop_type
+
+    # cleanup
+    unregister_custom_flop_type("ERF")
+
+
+@pytest.fixture
+def dormant_default_backend() -> None:
+    """Fixture that sets the default instrumentation backend to DORMANT for the duration of the test."""
+
+    # prepare
+    set_default_backend(InstrumentationBackend.DORMANT)
+
+    # yield
+    yield
+
+    # cleanup
+    set_default_backend(InstrumentationBackend.COUNTING)
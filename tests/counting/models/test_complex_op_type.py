@@ -0,0 +1,29 @@
+from counted_float._core.counting.models import ComplexOpType, FlopCounts
+
+
+def test_complex_op_type_long_name():
+    # --- act ---------------------------------------------
+    all_long_names = {op.long_name() for op in ComplexOpType}
+
+    # --- assert ------------------------------------------
+    assert len(all_long_names) == len(ComplexOpType), "long names should be unique"
+
+
+def test_complex_op_type_flop_counts():
+    # --- act ---------------------------------------------
+    all_flop_counts = {op: op.flop_counts() for op in ComplexOpType}
+
+    # --- assert ------------------------------------------
+    assert all(isinstance(fc, FlopCounts) for fc in all_flop_counts.values())
+    assert all(fc.total_count() > 0 for fc in all_flop_counts.values())
+    assert all_flop_counts[ComplexOpType.MUL] == FlopCounts(MUL=4, ADD=1, SUB=1)
+    assert all_flop_counts[ComplexOpType.ABS] == FlopCounts(MUL=2, ADD=1, SQRT=1)
+
+
+def test_complex_op_type_flop_counts_returns_copy():
+    # --- act ---------------------------------------------
+    fc = ComplexOpType.ADD.flop_counts()
+    fc.reset()
+
+    # --- assert ------------------------------------------
+    assert ComplexOpType.ADD.flop_counts().total_count() == 2
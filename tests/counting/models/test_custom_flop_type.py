@@ -0,0 +1,55 @@
+import pytest
+
+from counted_float._core.counting.models import (
+    CustomFlopType,
+    get_custom_flop_type,
+    get_custom_flop_types,
+    register_custom_flop_type,
+    unregister_custom_flop_type,
+)
+
+
+def test_custom_flop_type_registry():
+    # --- act ---------------------------------------------
+    erf = register_custom_flop_type("ERF", weight=20, description="erf(x)")
+    registered = get_custom_flop_types()
+    erf_lookup = get_custom_flop_type("ERF")
+    unregister_custom_flop_type("ERF")
+
+    # --- assert ------------------------------------------
+    assert isinstance(erf, CustomFlopType)
+    assert registered == [erf]
+    assert erf_lookup is erf
+    assert erf.long_name() == "CustomFlopType.ERF        [erf(x)]"
+    assert get_custom_flop_types() == []
+
+
+def test_custom_flop_type_re_register(custom_flop_type):
+    # --- act ---------------------------------------------
+    erf_new = register_custom_flop_type("ERF", weight=30)
+
+    # --- assert ------------------------------------------
+    assert get_custom_flop_types() == [erf_new]
+    assert get_custom_flop_type("ERF").weight == 30
+
+
+@pytest.mark.parametrize(
+    "name, weight",
+    [
+        ("ADD", 1.0),  # clashes with FlopType.ADD
+        ("erf(x)", 1.0),  # not an identifier
+        ("ERF", -1.0),  # negative weight
+    ],
+)
+def test_custom_flop_type_invalid_registration(name: str, weight: float):
+    # --- act & assert ------------------------------------
+    with pytest.raises(ValueError):
+        register_custom_flop_type(name, weight=weight)
+
+
+def test_custom_flop_type_unknown():
+    # --- act & assert ------------------------------------
+    with pytest.raises(ValueError):
+        get_custom_flop_type("UNKNOWN")
+    with pytest.raises(ValueError):
+        unregister_custom_flop_type("UNKNOWN")
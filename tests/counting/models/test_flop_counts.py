@@ -1,13 +1,16 @@
 import dataclasses
 import random
 
-from counted_float import FlopWeights
+import numpy as np
+import pytest
+
+from counted_float import BuiltInData, FlopWeights
 from counted_float._core.counting.config import get_flop_weights
-from counted_float._core.counting.models import FlopCounts, FlopType
+from counted_float._core.counting.models import FlopCounts, FlopType, Precision, batch_weighted_costs
 
 
 def test_flop_counts_field_names():
-    """Test if FlopCounts .field_names() is correct and identical to FlopType names."""
+    """Test if FlopCounts .field_names() is correct and identical to FlopType names (+ 'custom' dataclass field)."""
 
     # --- arrange -----------------------------------------
     flop_type_names = {flop_type.name for flop_type in FlopType}
@@ -17,7 +20,7 @@ def test_flop_counts_field_names():
     flop_count_field_names_2 = set(FlopCounts.field_names())
 
     # --- assert ------------------------------------------
-    assert flop_count_field_names_1 == flop_type_names
+    assert flop_count_field_names_1 == flop_type_names | {"custom"}
     assert flop_count_field_names_2 == flop_type_names
 
 
@@ -170,3 +173,155 @@ def test_flop_counts_total_weighted_cost_custom():
 
     # --- assert ------------------------------------------
     assert total_weighted_cost == expected_total_cost
+
+
+def test_flop_counts_total_weighted_cost_precision():
+    # --- arrange -----------------------------------------
+    flop_counts = FlopCounts(**{attr: random.randint(0, 10_000) for attr in FlopCounts.field_names()})
+    custom_weights = FlopWeights(
+        weights={flop_type: i for i, flop_type in enumerate(FlopType, start=1)},
+        weights_fp32={flop_type: 2 * i for i, flop_type in enumerate(FlopType, start=1)},
+    )
+
+    # --- act ---------------------------------------------
+    cost_fp64 = flop_counts.total_weighted_cost(weights=custom_weights)
+    cost_fp32 = flop_counts.total_weighted_cost(weights=custom_weights, precision=Precision.FP32)
+
+    # --- assert ------------------------------------------
+    assert cost_fp32 == 2 * cost_fp64
+
+
+def test_flop_counts_custom_math(custom_flop_type):
+    # --- arrange -----------------------------------------
+    fc_1 = FlopCounts(ADD=1, custom={"ERF": 2})
+    fc_2 = FlopCounts(MUL=3, custom={"ERF": 5, "OTHER": 7})
+
+    # --- act ---------------------------------------------
+    fc_sum = fc_1 + fc_2
+    fc_diff = fc_sum - fc_2
+    fc_copy = fc_sum.copy()
+    fc_copy.reset()
+
+    # --- assert ------------------------------------------
+    assert fc_sum == FlopCounts(ADD=1, MUL=3, custom={"ERF": 7, "OTHER": 7})
+    assert fc_diff == fc_1  # zero-count entries are omitted
+    assert fc_sum.total_count() == 18
+    assert fc_copy == FlopCounts()
+    assert fc_sum.custom == {"ERF": 7, "OTHER": 7}, "copy() should not share the custom dict"
+
+
+def test_flop_counts_custom_as_dict_and_cost(custom_flop_type):
+    # --- arrange -----------------------------------------
+    flop_counts = FlopCounts(ADD=2, custom={"ERF": 3})
+    weights = FlopWeights(weights={flop_type: 1 for flop_type in FlopType})
+    weights_override = FlopWeights(weights={flop_type: 1 for flop_type in FlopType}, weights_custom={"ERF": 100})
+
+    # --- act ---------------------------------------------
+    counts_as_dict = flop_counts.as_dict()
+    cost = flop_counts.total_weighted_cost(weights)
+    cost_override = flop_counts.total_weighted_cost(weights_override)
+
+    # --- assert ------------------------------------------
+    assert counts_as_dict[custom_flop_type] == 3
+    assert counts_as_dict[FlopType.ADD] == 2
+    assert cost == 2 + 3 * 20  # registered weight
+    assert cost_override == 2 + 3 * 100  # overridden weight
+
+
+def test_flop_counts_predicted_runtime():
+    # --- arrange -----------------------------------------
+    flop_counts = FlopCounts(ADD=1000, DIV=10, custom={"UNKNOWN": 5})
+    results = BuiltInData.benchmarks()["apple_m3_max"]
+    durations = results.flop_durations_ns()
+
+    # --- act ---------------------------------------------
+    prediction = flop_counts.predicted_runtime(results)
+
+    # --- assert ------------------------------------------
+    assert prediction.ns.q50 == pytest.approx(1000 * durations[FlopType.ADD].q50 + 10 * durations[FlopType.DIV].q50)
+    assert prediction.ns.q25 <= prediction.ns.q50 <= prediction.ns.q75
+    assert prediction.ns_by_flop_type[FlopType.ADD] == pytest.approx(1000 * durations[FlopType.ADD].q50)
+    assert prediction.n_unknown == 5
+    assert prediction.seconds().q50 == pytest.approx(prediction.ns.q50 / 1e9)
+
+
+def test_flop_counts_predicted_runtimes():
+    # --- arrange -----------------------------------------
+    flop_counts = FlopCounts(ADD=1000, MUL=1000)
+
+    # --- act ---------------------------------------------
+    predictions = flop_counts.predicted_runtimes()
+
+    # --- assert ------------------------------------------
+    assert set(predictions.keys()) == {"apple_m3_max", "intel_i5_7200u", "intel_i7_1265u"}
+    assert all(prediction.ns.q50 > 0 for prediction in predictions.values())
+
+
+def test_flop_counts_in_place_math(custom_flop_type):
+    # --- arrange -----------------------------------------
+    fc = FlopCounts(ADD=1, MUL=2, custom={"ERF": 1})
+    fc_id = id(fc)
+
+    # --- act ---------------------------------------------
+    fc += FlopCounts(ADD=10, SQRT=3, custom={"ERF": 2})
+    fc -= FlopCounts(MUL=1)
+    fc *= 2
+
+    # --- assert ------------------------------------------
+    assert id(fc) == fc_id
+    assert fc == FlopCounts(ADD=22, MUL=2, SQRT=6, custom={"ERF": 6})
+
+
+def test_flop_counts_scalar_mul():
+    # --- arrange -----------------------------------------
+    fc = FlopCounts(ADD=1, DIV=3)
+
+    # --- act ---------------------------------------------
+    fc_3 = 3 * fc
+    fc_0 = fc * np.int64(0)
+
+    # --- assert ------------------------------------------
+    assert fc_3 == FlopCounts(ADD=3, DIV=9)
+    assert fc_0 == FlopCounts()
+    assert fc == FlopCounts(ADD=1, DIV=3)
+    with pytest.raises(TypeError):
+        _ = fc * 1.5
+
+
+def test_flop_counts_as_array():
+    # --- arrange -----------------------------------------
+    fc = FlopCounts(**{attr: random.randint(0, 10_000) for attr in FlopCounts.field_names()})
+
+    # --- act ---------------------------------------------
+    array = fc.as_array()
+
+    # --- assert ------------------------------------------
+    assert array.dtype == np.int64
+    assert list(array) == [getattr(fc, flop_type.name) for flop_type in FlopType]
+    assert FlopCounts.from_array(array) == fc
+    with pytest.raises(ValueError):
+        FlopCounts.from_array([1, 2, 3])
+
+
+def test_batch_weighted_costs(custom_flop_type):
+    # --- arrange -----------------------------------------
+    all_counts = [
+        FlopCounts(**{attr: random.randint(0, 10_000) for attr in FlopCounts.field_names()}) for _ in range(10)
+    ]
+    all_counts[3].custom["ERF"] = 5
+    all_weights = [
+        FlopWeights(weights={flop_type: random.uniform(0.5, 50) for flop_type in FlopType}) for _ in range(4)
+    ]
+
+    # --- act ---------------------------------------------
+    costs = batch_weighted_costs(all_counts, all_weights)
+    costs_from_matrices = batch_weighted_costs(FlopCounts.to_matrix(all_counts), FlopWeights.to_matrix(all_weights))
+
+    # --- assert ------------------------------------------
+    assert costs.shape == (10, 4)
+    for i, counts in enumerate(all_counts):
+        for j, weights in enumerate(all_weights):
+            assert costs[i, j] == pytest.approx(counts.total_weighted_cost(weights))
+    assert costs_from_matrices[3, 0] == pytest.approx(costs[3, 0] - 5 * 20)  # custom counts not in matrix
+    with pytest.raises(ValueError):
+        batch_weighted_costs(all_counts, FlopWeights.to_matrix(all_weights))
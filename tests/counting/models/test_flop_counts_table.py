@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from counted_float._core.counting.models import FlopCounts, FlopCountsTable, FlopType, FlopWeights
+
+
+@pytest.fixture
+def sample_table() -> FlopCountsTable:
+    table = FlopCountsTable(label_names=["n", "name"], capacity=2)  # small capacity, to test growing
+    for i in range(5):
+        table.append(FlopCounts(ADD=i, MUL=2 * i), n=10 * (i % 2), name=f"row_{i}")
+    return table
+
+
+def test_flop_counts_table_append(sample_table: FlopCountsTable):
+    # --- act ---------------------------------------------
+    n_rows = len(sample_table)
+    row_3 = sample_table.row(3)
+    last_row = sample_table.row(-1)
+
+    # --- assert ------------------------------------------
+    assert n_rows == 5
+    assert row_3 == FlopCounts(ADD=3, MUL=6)
+    assert last_row == FlopCounts(ADD=4, MUL=8)
+    assert sample_table.counts.shape == (5, len(FlopType))
+    assert list(sample_table.column(FlopType.MUL)) == [0, 2, 4, 6, 8]
+    assert list(sample_table.labels("n")) == [0, 10, 0, 10, 0]
+    assert list(sample_table) == [FlopCounts(ADD=i, MUL=2 * i) for i in range(5)]
+    with pytest.raises(ValueError):
+        sample_table.append(FlopCounts(), unknown=1)
+    with pytest.raises(IndexError):
+        sample_table.row(5)
+
+
+def test_flop_counts_table_custom(custom_flop_type):
+    # --- arrange -----------------------------------------
+    table = FlopCountsTable()
+    weights = FlopWeights(weights={flop_type: 1 for flop_type in FlopType})
+
+    # --- act ---------------------------------------------
+    table.append(FlopCounts(ADD=1))
+    table.append(FlopCounts(ADD=1, custom={"ERF": 2}))
+
+    # --- assert ------------------------------------------
+    assert table.custom_names == ["ERF"]
+    assert list(table.column("ERF")) == [0, 2]
+    assert table.row(1) == FlopCounts(ADD=1, custom={"ERF": 2})
+    assert table.sum() == FlopCounts(ADD=2, custom={"ERF": 2})
+    assert list(table.weighted_costs(weights)) == [1, 1 + 2 * 20]
+
+
+def test_flop_counts_table_aggregation(sample_table: FlopCountsTable):
+    # --- act ---------------------------------------------
+    total = sample_table.sum()
+    cumulative = sample_table.cumsum()
+    grouped = sample_table.groupby("n")
+
+    # --- assert ------------------------------------------
+    assert total == FlopCounts(ADD=10, MUL=20)
+    assert list(cumulative.column(FlopType.ADD)) == [0, 1, 3, 6, 10]
+    assert list(cumulative.labels("name")) == [f"row_{i}" for i in range(5)]
+    assert grouped.label_names == ["n"]
+    assert list(grouped.labels("n")) == [0, 10]
+    assert grouped.row(0) == FlopCounts(ADD=0 + 2 + 4, MUL=12)
+    assert grouped.row(1) == FlopCounts(ADD=1 + 3, MUL=8)
+
+
+def test_flop_counts_table_weighted_costs(sample_table: FlopCountsTable):
+    # --- arrange -----------------------------------------
+    weights = FlopWeights(weights={flop_type: i for i, flop_type in enumerate(FlopType, start=1)})
+
+    # --- act ---------------------------------------------
+    costs = sample_table.weighted_costs(weights)
+
+    # --- assert ------------------------------------------
+    assert list(costs) == [row.total_weighted_cost(weights) for row in sample_table]
+
+
+@pytest.mark.parametrize("file_format", ["npz", "csv", "npy"])
+def test_flop_counts_table_save_load(sample_table: FlopCountsTable, tmp_path, file_format: str):
+    # --- act ---------------------------------------------
+    if file_format == "npz":
+        sample_table.save_npz(tmp_path / "table.npz")
+        loaded = FlopCountsTable.load_npz(tmp_path / "table.npz")
+    elif file_format == "csv":
+        sample_table.to_csv(tmp_path / "table.csv")
+        loaded = FlopCountsTable.from_csv(tmp_path / "table.csv")
+    else:
+        sample_table.save(tmp_path / "table")
+        loaded = FlopCountsTable.load(tmp_path / "table")
+
+    # --- assert ------------------------------------------
+    assert len(loaded) == 5
+    assert sorted(loaded.label_names) == ["n", "name"]
+    assert list(loaded) == list(sample_table)
+    assert loaded.labels("n").tolist() == [0, 10, 0, 10, 0]
+    assert loaded.labels("name").tolist() == [f"row_{i}" for i in range(5)]
+
+
+def test_flop_counts_table_mmap_append(sample_table: FlopCountsTable, tmp_path):
+    # --- arrange -----------------------------------------
+    sample_table.save(tmp_path / "table")
+    loaded = FlopCountsTable.load(tmp_path / "table", mmap=True)
+
+    # --- act ---------------------------------------------
+    counts_mmap = _is_mmap(loaded.counts)
+    labels_mmap = _is_mmap(loaded.labels("name")) and _is_mmap(loaded.cumsum().labels("name"))
+    loaded.append(FlopCounts(DIV=1), n=20, name="new")
+
+    # --- assert ------------------------------------------
+    assert counts_mmap
+    assert labels_mmap  # label columns are not loaded until rows are appended
+    assert len(loaded) == 6
+    assert loaded.sum() == FlopCounts(ADD=10, MUL=20, DIV=1)
+    assert loaded.labels("name").tolist()[-1] == "new"
+    assert len(FlopCountsTable.load(tmp_path / "table")) == 5  # file not modified
+
+
+def _is_mmap(array: np.ndarray) -> bool:
+    # True if the array is (a view of) a memory-mapped array
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
@@ -1,7 +1,10 @@
 import pytest
 
+from counted_float._core.counting.models._flop_counts import FlopCounts
 from counted_float._core.counting.models._flop_type import FlopType
 from counted_float._core.counting.models._flop_weights import FlopWeights
+from counted_float._core.counting.models._int_op_type import IntOpType
+from counted_float._core.counting.models._precision import Precision
 
 
 @pytest.fixture
@@ -72,3 +75,219 @@ def test_flop_weights_show(sample_flop_weights_dict_by_str):
 
     # --- act ---------------------------------------------
     flop_weights.show()
+
+
+# =================================================================================================
+#  Per-precision weights
+# =================================================================================================
+def test_flop_weights_fp32_serialization(sample_flop_weights_dict_by_str):
+    # --- arrange -----------------------------------------
+    weights_fp32 = {k: 2 * v for k, v in sample_flop_weights_dict_by_str.items()}
+    flop_weights = FlopWeights(weights=sample_flop_weights_dict_by_str, weights_fp32=weights_fp32)
+
+    # --- act ---------------------------------------------
+    result = flop_weights.model_dump()
+    flop_weights_roundtrip = FlopWeights.model_validate_json(flop_weights.model_dump_json())
+
+    # --- assert ------------------------------------------
+    assert result == dict(weights=sample_flop_weights_dict_by_str, weights_fp32=weights_fp32)
+    assert flop_weights_roundtrip == flop_weights
+
+
+def test_flop_weights_fp32_incorrect_construction(sample_flop_weights_dict_by_enum):
+    # --- arrange -----------------------------------------
+    weights_fp32 = dict(sample_flop_weights_dict_by_enum)
+    del weights_fp32[FlopType.DIV]
+
+    # --- act & assert ------------------------------------
+    with pytest.raises(ValueError):
+        _ = FlopWeights(weights=sample_flop_weights_dict_by_enum, weights_fp32=weights_fp32)
+
+
+def test_flop_weights_for_precision(sample_flop_weights_dict_by_enum):
+    # --- arrange -----------------------------------------
+    weights_fp32 = {k: 2 * v for k, v in sample_flop_weights_dict_by_enum.items()}
+    fw_fp64_only = FlopWeights(weights=sample_flop_weights_dict_by_enum)
+    fw_both = FlopWeights(weights=sample_flop_weights_dict_by_enum, weights_fp32=weights_fp32)
+
+    # --- act & assert ------------------------------------
+    assert fw_fp64_only.for_precision(Precision.FP64) == sample_flop_weights_dict_by_enum
+    assert fw_fp64_only.for_precision(Precision.FP32) == sample_flop_weights_dict_by_enum  # fallback to fp64
+    assert fw_both.for_precision(Precision.FP64) == sample_flop_weights_dict_by_enum
+    assert fw_both.for_precision(Precision.FP32) == weights_fp32
+
+
+def test_flop_weights_fp32_geo_mean_round_show(sample_flop_weights_dict_by_enum):
+    # --- arrange -----------------------------------------
+    fw_1 = FlopWeights(
+        weights=sample_flop_weights_dict_by_enum,
+        weights_fp32={k: 2.2 * v for k, v in sample_flop_weights_dict_by_enum.items()},
+    )
+    fw_2 = FlopWeights(
+        weights=sample_flop_weights_dict_by_enum,
+        weights_fp32={k: 8.8 * v for k, v in sample_flop_weights_dict_by_enum.items()},
+    )
+
+    # --- act ---------------------------------------------
+    fw_mean = FlopWeights.as_geo_mean([fw_1, fw_2])
+    fw_mean_rounded = fw_mean.round()
+    fw_mean_fp64_only = FlopWeights.as_geo_mean([fw_1, FlopWeights(weights=sample_flop_weights_dict_by_enum)])
+    fw_mean_rounded.show()
+
+    # --- assert ------------------------------------------
+    assert fw_mean.weights_fp32 == pytest.approx({k: 4.4 * v for k, v in sample_flop_weights_dict_by_enum.items()})
+    assert fw_mean_rounded.weights_fp32 == {k: round(4.4 * v) for k, v in sample_flop_weights_dict_by_enum.items()}
+    assert fw_mean_fp64_only.weights_fp32 is None
+
+
+def test_flop_weights_from_abs_flop_costs_fp32():
+    # --- arrange -----------------------------------------
+    flop_costs = {flop_type: 10.0 for flop_type in FlopType}
+    flop_costs_fp32 = {flop_type: 5.0 for flop_type in FlopType}
+
+    # --- act ---------------------------------------------
+    flop_weights = FlopWeights.from_abs_flop_costs(flop_costs, flop_costs_fp32)
+
+    # --- assert ------------------------------------------
+    assert all(w == pytest.approx(1.0) for w in flop_weights.weights.values())
+    assert all(w == pytest.approx(0.5) for w in flop_weights.weights_fp32.values())  # same scale as fp64
+
+
+def test_flop_weights_int_serialization_and_validation(sample_flop_weights_dict_by_str):
+    # --- arrange -----------------------------------------
+    weights_int = {int_op_type.value: i for i, int_op_type in enumerate(IntOpType, start=1)}
+    weights_int_incomplete = {k: v for k, v in weights_int.items() if k != IntOpType.DIV.value}
+
+    # --- act ---------------------------------------------
+    flop_weights = FlopWeights(weights=sample_flop_weights_dict_by_str, weights_int=weights_int)
+    result = flop_weights.model_dump()
+
+    # --- assert ------------------------------------------
+    assert result == dict(weights=sample_flop_weights_dict_by_str, weights_int=weights_int)
+    assert FlopWeights.model_validate(result) == flop_weights
+    with pytest.raises(ValueError):
+        _ = FlopWeights(weights=sample_flop_weights_dict_by_str, weights_int=weights_int_incomplete)
+
+
+def test_flop_weights_int_geo_mean_round_show(sample_flop_weights_dict_by_enum):
+    # --- arrange -----------------------------------------
+    fw_1 = FlopWeights(
+        weights=sample_flop_weights_dict_by_enum,
+        weights_int={int_op_type: 0.6 for int_op_type in IntOpType},
+    )
+    fw_2 = FlopWeights(
+        weights=sample_flop_weights_dict_by_enum,
+        weights_int={int_op_type: 2.4 for int_op_type in IntOpType},
+    )
+
+    # --- act ---------------------------------------------
+    fw_mean = FlopWeights.as_geo_mean([fw_1, fw_2])
+    fw_mean_rounded = fw_mean.round()
+    fw_mean_no_int = FlopWeights.as_geo_mean([fw_1, FlopWeights(weights=sample_flop_weights_dict_by_enum)])
+    fw_mean.show()
+
+    # --- assert ------------------------------------------
+    assert fw_mean.weights_int == pytest.approx({int_op_type: 1.2 for int_op_type in IntOpType})
+    assert fw_mean_rounded.weights_int == {int_op_type: 1 for int_op_type in IntOpType}
+    assert fw_mean_no_int.weights_int is None
+
+
+def test_flop_weights_from_abs_flop_costs_int():
+    # --- arrange -----------------------------------------
+    flop_costs = {flop_type: 10.0 for flop_type in FlopType}
+    int_op_costs = {int_op_type: 20.0 for int_op_type in IntOpType}
+
+    # --- act ---------------------------------------------
+    flop_weights = FlopWeights.from_abs_flop_costs(flop_costs, int_op_costs=int_op_costs)
+
+    # --- assert ------------------------------------------
+    assert flop_weights.weights_fp32 is None
+    assert all(w == pytest.approx(2.0) for w in flop_weights.weights_int.values())  # same scale as fp64
+
+
+def test_flop_weights_custom(sample_flop_weights_dict_by_enum, custom_flop_type):
+    # --- act ---------------------------------------------
+    fw_default = FlopWeights(weights=sample_flop_weights_dict_by_enum)
+    fw_override = FlopWeights(weights=sample_flop_weights_dict_by_enum, weights_custom={"ERF": 12.6})
+    fw_override.show()
+
+    # --- assert ------------------------------------------
+    assert fw_default.custom_weight("ERF") == 20
+    assert fw_override.custom_weight("ERF") == 12.6
+    assert fw_override.round().weights_custom == {"ERF": 13}
+    assert FlopWeights.model_validate(fw_override.model_dump()) == fw_override
+    assert FlopWeights.as_geo_mean([fw_override, fw_override]).weights_custom == pytest.approx({"ERF": 12.6})
+    assert "weights_custom" not in fw_default.model_dump()
+    with pytest.raises(ValueError):
+        fw_default.custom_weight("UNKNOWN")  # neither registered nor overridden
+
+
+def test_flop_weights_custom_unregistered(sample_flop_weights_dict_by_enum):
+    # --- arrange -----------------------------------------
+    data = FlopWeights(weights=sample_flop_weights_dict_by_enum, weights_custom={"UNKNOWN": 1.5}).model_dump()
+
+    # --- act ---------------------------------------------
+    flop_weights = FlopWeights.model_validate(data)  # e.g. loaded in a process that did not register 'UNKNOWN'
+    flop_weights.show()
+
+    # --- assert ------------------------------------------
+    assert flop_weights.custom_weight("UNKNOWN") == 1.5
+    assert flop_weights.round().weights_custom == {"UNKNOWN": 2}
+
+
+def test_flop_weights_weight_vector(sample_flop_weights_dict_by_enum):
+    # --- arrange -----------------------------------------
+    flop_weights = FlopWeights(weights=sample_flop_weights_dict_by_enum)
+
+    # --- act ---------------------------------------------
+    vector_1 = flop_weights.weight_vector()
+    vector_2 = flop_weights.weight_vector(Precision.FP32)  # falls back to fp64 weights
+
+    # --- assert ------------------------------------------
+    assert list(vector_1) == list(range(1, len(FlopType) + 1))
+    assert flop_weights.weight_tuple() == tuple(range(1, len(FlopType) + 1))
+    assert list(vector_2) == list(vector_1)
+    assert flop_weights.weight_vector() is vector_1  # cached
+    assert not vector_1.flags.writeable
+    with pytest.raises(ValueError):
+        vector_1[0] = 42.0
+
+
+def test_flop_weights_weight_vector_modified(sample_flop_weights_dict_by_enum):
+    # --- arrange -----------------------------------------
+    flop_weights = FlopWeights(weights=dict(sample_flop_weights_dict_by_enum))
+    vector_before = flop_weights.weight_vector()
+    flop_weights_copy = flop_weights.model_copy(update={"weights": {flop_type: 1 for flop_type in FlopType}})
+    counts = FlopCounts(ADD=10)
+    cost_before = counts.total_weighted_cost(flop_weights)
+
+    # --- act ---------------------------------------------
+    flop_weights.weights[FlopType.ADD] = 100  # in-place
+    cost_in_place = counts.total_weighted_cost(flop_weights)
+    vector_in_place = flop_weights.weight_vector()
+    flop_weights.weights = {flop_type: 2 for flop_type in FlopType}  # re-assigned
+
+    # --- assert ------------------------------------------
+    assert cost_before == 10 * sample_flop_weights_dict_by_enum[FlopType.ADD]
+    assert cost_in_place == 1000
+    assert vector_before[list(FlopType).index(FlopType.ADD)] == sample_flop_weights_dict_by_enum[FlopType.ADD]
+    assert vector_in_place[list(FlopType).index(FlopType.ADD)] == 100
+    assert set(flop_weights.weight_vector()) == {2.0}
+    assert set(flop_weights_copy.weight_vector()) == {1.0}
+
+
+def test_flop_weights_to_matrix(sample_flop_weights_dict_by_enum):
+    # --- arrange -----------------------------------------
+    fw_1 = FlopWeights(weights=sample_flop_weights_dict_by_enum)
+    fw_2 = FlopWeights(
+        weights=sample_flop_weights_dict_by_enum,
+        weights_fp32={flop_type: 0.5 for flop_type in FlopType},
+    )
+
+    # --- act ---------------------------------------------
+    matrix = FlopWeights.to_matrix([fw_1, fw_2], Precision.FP32)
+
+    # --- assert ------------------------------------------
+    assert matrix.shape == (2, len(FlopType))
+    assert list(matrix[0]) == list(fw_1.weight_vector())
+    assert set(matrix[1]) == {0.5}
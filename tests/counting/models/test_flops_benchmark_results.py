@@ -1,4 +1,6 @@
-from counted_float import BuiltInData, FlopsBenchmarkResults
+import pytest
+
+from counted_float import BuiltInData, ComplexOpType, FlopsBenchmarkResults, FlopType, IntOpType, Precision
 
 
 def test_flops_benchmark_results_show():
@@ -9,3 +11,78 @@ def test_flops_benchmark_results_show():
 
     # --- act ---------------------------------------------
     flops_benchmark_results.show()
+
+
+def test_flops_benchmark_results_complex_op_weights():
+    # --- arrange -----------------------------------------
+    flops_benchmark_results: FlopsBenchmarkResults = list(BuiltInData.benchmarks().values()).pop()
+    results_ns = flops_benchmark_results.results_ns
+    results_ns_with_complex = results_ns.model_copy(
+        update=dict(complex_ops={op: results_ns.flops[FlopType.ADD] for op in ComplexOpType})
+    )
+    results_with_complex = flops_benchmark_results.model_copy(update=dict(results_ns=results_ns_with_complex))
+
+    # --- act ---------------------------------------------
+    weights_none = flops_benchmark_results.complex_op_weights
+    weights = results_with_complex.complex_op_weights
+
+    # --- assert ------------------------------------------
+    assert weights_none is None
+    assert set(weights.keys()) == set(ComplexOpType)
+    assert all(w == pytest.approx(flops_benchmark_results.flop_weights.weights[FlopType.ADD]) for w in weights.values())
+
+
+def test_flops_benchmark_results_int_weights():
+    # --- arrange -----------------------------------------
+    flops_benchmark_results: FlopsBenchmarkResults = list(BuiltInData.benchmarks().values()).pop()
+    results_ns = flops_benchmark_results.results_ns
+    results_ns_with_int = results_ns.model_copy(
+        update=dict(int_ops={op: results_ns.flops[FlopType.ADD] for op in IntOpType})
+    )
+    results_with_int = flops_benchmark_results.model_copy(update=dict(results_ns=results_ns_with_int))
+
+    # --- act ---------------------------------------------
+    weights_none = flops_benchmark_results.flop_weights.weights_int
+    weights = results_with_int.flop_weights.weights_int
+
+    # --- assert ------------------------------------------
+    assert weights_none is None
+    assert set(weights.keys()) == set(IntOpType)
+    assert all(w == pytest.approx(flops_benchmark_results.flop_weights.weights[FlopType.ADD]) for w in weights.values())
+
+
+def test_flops_benchmark_results_custom_weights_unregistered():
+    # --- arrange -----------------------------------------
+    flops_benchmark_results: FlopsBenchmarkResults = list(BuiltInData.benchmarks().values()).pop()
+    results_ns = flops_benchmark_results.results_ns
+    results_ns_with_custom = results_ns.model_copy(
+        update=dict(custom_ops={"NOT_REGISTERED": results_ns.flops[FlopType.ADD]})
+    )
+    data = flops_benchmark_results.model_copy(update=dict(results_ns=results_ns_with_custom)).model_dump_json()
+
+    # --- act ---------------------------------------------
+    loaded = FlopsBenchmarkResults.model_validate_json(data)
+    weights = loaded.flop_weights
+
+    # --- assert ------------------------------------------
+    assert weights.custom_weight("NOT_REGISTERED") == pytest.approx(weights.weights[FlopType.ADD])
+
+
+def test_flops_benchmark_results_flop_durations_ns():
+    # --- arrange -----------------------------------------
+    flops_benchmark_results: FlopsBenchmarkResults = list(BuiltInData.benchmarks().values()).pop()
+    results_ns = flops_benchmark_results.results_ns
+    array_size = flops_benchmark_results.benchmark_settings.array_size
+
+    # --- act ---------------------------------------------
+    durations = flops_benchmark_results.flop_durations_ns()
+
+    # --- assert ------------------------------------------
+    assert set(durations.keys()) == set(FlopType)
+    assert durations[FlopType.DIV].q50 == pytest.approx(
+        (results_ns.flops[FlopType.DIV].q50 - results_ns.baseline.q50) / array_size
+    )
+    assert all(0 <= q.q25 <= q.q50 <= q.q75 for q in durations.values())
+    assert flops_benchmark_results.custom_flop_durations_ns() == dict()
+    with pytest.raises(ValueError):
+        flops_benchmark_results.flop_durations_ns(Precision.FP32)
@@ -0,0 +1,9 @@
+from counted_float._core.counting.models import InstrumentationBackend
+
+
+def test_instrumentation_backend_long_name():
+    # --- act ---------------------------------------------
+    all_long_names = {backend.long_name() for backend in InstrumentationBackend}
+
+    # --- assert ------------------------------------------
+    assert len(all_long_names) == len(InstrumentationBackend), "long names should be unique"
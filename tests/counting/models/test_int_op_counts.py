@@ -0,0 +1,62 @@
+import pytest
+
+from counted_float import FlopWeights
+from counted_float._core.counting.models import FlopType, IntOpCounts, IntOpType
+
+
+def test_int_op_counts_field_names():
+    """Test if IntOpCounts .field_names() is identical to IntOpType names."""
+
+    # --- act & assert ------------------------------------
+    assert set(IntOpCounts.field_names()) == {int_op_type.name for int_op_type in IntOpType}
+
+
+def test_int_op_counts_add_sub():
+    # --- arrange -----------------------------------------
+    ic_1 = IntOpCounts(ADD=1, MUL=2, CMP=3)
+    ic_2 = IntOpCounts(ADD=10, DIV=20, SHIFT=30, BITWISE=40)
+
+    # --- act ---------------------------------------------
+    ic_sum = ic_1 + ic_2
+    ic_diff = ic_sum - ic_1
+
+    # --- assert ------------------------------------------
+    assert ic_sum == IntOpCounts(ADD=11, MUL=2, DIV=20, SHIFT=30, BITWISE=40, CMP=3)
+    assert ic_diff == ic_2
+
+
+def test_int_op_counts_as_dict_total_reset_copy():
+    # --- arrange -----------------------------------------
+    ic = IntOpCounts(ADD=1, MUL=2, DIV=3, SHIFT=4, BITWISE=5, CMP=6)
+
+    # --- act ---------------------------------------------
+    as_dict = ic.as_dict()
+    total = ic.total_count()
+    ic_copy = ic.copy()
+    ic.reset()
+
+    # --- assert ------------------------------------------
+    assert as_dict == {
+        IntOpType.ADD: 1,
+        IntOpType.MUL: 2,
+        IntOpType.DIV: 3,
+        IntOpType.SHIFT: 4,
+        IntOpType.BITWISE: 5,
+        IntOpType.CMP: 6,
+    }
+    assert total == 21
+    assert ic.total_count() == 0
+    assert ic_copy.total_count() == 21
+
+
+def test_int_op_counts_total_weighted_cost():
+    # --- arrange -----------------------------------------
+    ic = IntOpCounts(ADD=1, DIV=2)
+    flop_weights = {flop_type: 1 for flop_type in FlopType}
+    weights = FlopWeights(weights=flop_weights, weights_int={int_op_type: 3 for int_op_type in IntOpType})
+    weights_no_int = FlopWeights(weights=flop_weights)
+
+    # --- act & assert ------------------------------------
+    assert ic.total_weighted_cost(weights) == 9
+    with pytest.raises(ValueError):
+        _ = ic.total_weighted_cost(weights_no_int)
@@ -0,0 +1,9 @@
+from counted_float._core.counting.models import IntOpType
+
+
+def test_int_op_type_long_name():
+    # --- act ---------------------------------------------
+    all_long_names = {op.long_name() for op in IntOpType}
+
+    # --- assert ------------------------------------------
+    assert len(all_long_names) == len(IntOpType), "long names should be unique"
@@ -0,0 +1,217 @@
+import math
+import operator
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from counted_float._core.counting._backends import (
+    _BACKEND_METHODS,
+    get_active_backend,
+    get_default_backend,
+    set_default_backend,
+)
+from counted_float._core.counting._context_managers import FlopCountingContext, PauseFlopCounting
+from counted_float._core.counting._counted_complex import CountedComplex
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_float32 import CountedFloat32
+from counted_float._core.counting.models import FlopCounts, FlopType, InstrumentationBackend, Precision
+
+_OPERATIONS: list[Callable] = [
+    operator.abs,
+    operator.neg,
+    lambda x: x == 0,
+    lambda x: x != 1.5,
+    lambda x: x < 2.0,
+    lambda x: x >= 0.5,
+    round,
+    math.floor,
+    math.ceil,
+    lambda x: x + 1.5,
+    lambda x: 1.5 + x,
+    lambda x: x - 1.5,
+    lambda x: 1.5 - x,
+    lambda x: x * 1.5,
+    lambda x: 1.5 * x,
+    lambda x: x / 1.5,
+    lambda x: 1.5 / x,
+    lambda x: x**2,
+    lambda x: 2**x,
+    lambda x: x**1.5,
+    lambda x: (-x) ** 0.5,
+    lambda x: x * 1j,
+]
+
+
+# =================================================================================================
+#  Backend selection
+# =================================================================================================
+def test_backends_default():
+    # --- assert ------------------------------------------
+    assert get_default_backend() == InstrumentationBackend.COUNTING
+    assert get_active_backend() == InstrumentationBackend.COUNTING
+
+
+def test_backends_set_default_invalid():
+    # --- act / assert ------------------------------------
+    with pytest.raises(ValueError):
+        set_default_backend(InstrumentationBackend.TRACING)
+
+
+def test_backends_selection(dormant_default_backend):
+    # --- act ---------------------------------------------
+    backend_outside = get_active_backend()
+    with FlopCountingContext():
+        backend_counting = get_active_backend()
+        with PauseFlopCounting():
+            backend_paused = get_active_backend()
+        with FlopCountingContext(backend=InstrumentationBackend.TRACING):
+            backend_tracing = get_active_backend()
+        backend_counting_again = get_active_backend()
+    backend_after = get_active_backend()
+
+    # --- assert ------------------------------------------
+    assert backend_outside == InstrumentationBackend.DORMANT
+    assert backend_counting == InstrumentationBackend.COUNTING
+    assert backend_paused == InstrumentationBackend.DORMANT
+    assert backend_tracing == InstrumentationBackend.TRACING
+    assert backend_counting_again == InstrumentationBackend.COUNTING
+    assert backend_after == InstrumentationBackend.DORMANT
+
+
+def test_backends_tracing_and_profiling_exclusive():
+    # --- act / assert ------------------------------------
+    with FlopCountingContext(backend=InstrumentationBackend.TRACING):
+        with pytest.raises(RuntimeError):
+            with FlopCountingContext(backend=InstrumentationBackend.PROFILING):
+                pass
+    assert get_active_backend() == InstrumentationBackend.COUNTING
+
+
+def test_backends_context_dormant_invalid():
+    # --- act / assert ------------------------------------
+    with pytest.raises(ValueError):
+        FlopCountingContext(backend=InstrumentationBackend.DORMANT)
+
+
+# =================================================================================================
+#  Behavior per backend
+# =================================================================================================
+@pytest.mark.parametrize("cls", [CountedFloat, CountedFloat32])
+@pytest.mark.parametrize("backend", list(InstrumentationBackend))
+@pytest.mark.parametrize("op", _OPERATIONS)
+def test_backends_identical_results(cls: type, backend: InstrumentationBackend, op: Callable):
+    # --- arrange -----------------------------------------
+    x = cls(1.25)
+    counting_methods = _BACKEND_METHODS[InstrumentationBackend.COUNTING][cls]
+
+    # --- act ---------------------------------------------
+    result_counting = op(x)
+    for name, method in _BACKEND_METHODS[backend][cls].items():
+        setattr(cls, name, method)
+    try:
+        result = op(x)
+    finally:
+        for name, method in counting_methods.items():
+            setattr(cls, name, method)
+
+    # --- assert ------------------------------------------
+    assert type(result) is type(result_counting)
+    assert complex(result) == complex(result_counting)
+
+
+@pytest.mark.parametrize("cls", [CountedFloat, CountedFloat32])
+def test_backends_dormant_no_counting(cls: type, global_counter, global_counter_fp32, dormant_default_backend):
+    # --- arrange -----------------------------------------
+    x = cls(1.25)
+
+    # --- act ---------------------------------------------
+    results = [op(x) for op in _OPERATIONS[:-1]]  # complex ops are counted by CountedComplex
+    flop_counts = [global_counter.flop_counts(), global_counter_fp32.flop_counts()]
+
+    # --- assert ------------------------------------------
+    assert all(isinstance(r, (cls, CountedComplex, bool, int)) for r in results)
+    assert all(counts.total_count() == 0 for counts in flop_counts)
+
+
+def test_backends_dormant_inside_pause(global_counter):
+    # --- arrange -----------------------------------------
+    x = CountedFloat(1.25)
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc:
+        _ = x + x
+        with PauseFlopCounting():
+            result = x * x
+        _ = x - x
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, CountedFloat)
+    assert fcc.flop_counts() == FlopCounts(ADD=1, SUB=1)
+
+
+def test_backends_dormant_inside_pause_fp32():
+    # --- arrange -----------------------------------------
+    x = CountedFloat32(1.25)
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc:
+        _ = x + x
+        with PauseFlopCounting():
+            assert CountedFloat32.__mul__ is _BACKEND_METHODS[InstrumentationBackend.DORMANT][CountedFloat32]["__mul__"]
+            result = x * 0.1
+        _ = x - x
+
+    # --- assert ------------------------------------------
+    assert type(result) is CountedFloat32
+    assert result == float(np.float32(1.25) * np.float32(0.1))
+    assert fcc.flop_counts(Precision.FP32) == FlopCounts(ADD=1, SUB=1)
+
+
+def test_backends_tracing():
+    # --- arrange -----------------------------------------
+    x = CountedFloat(1.5)
+    y = CountedFloat(2.5)
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext(backend=InstrumentationBackend.TRACING) as fcc:
+        z = x * y
+        w = 1.0 - z
+        _ = w**2
+    trace = fcc.trace()
+    flop_counts = fcc.flop_counts()
+
+    # --- assert ------------------------------------------
+    assert [traced_op.flop_type for traced_op in trace] == [FlopType.MUL, FlopType.SUB, FlopType.MUL]
+    assert trace[0].operands == (x, y) and trace[0].result is z
+    assert trace[1].operands == (1.0, z) and trace[1].result is w  # reflected -> evaluation order
+    assert trace[2].operands[0] is w
+    assert flop_counts == FlopCounts(MUL=2, SUB=1)
+
+
+def test_backends_profiling():
+    # --- arrange -----------------------------------------
+    x = CountedFloat(1.5)
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext(backend=InstrumentationBackend.PROFILING) as fcc:
+        for _ in range(3):
+            _ = x * x
+        _ = x + x
+    profile = fcc.profile()
+
+    # --- assert ------------------------------------------
+    assert len(profile) == 2
+    assert all("test_backends.py" in call_site and "(test_backends_profiling)" in call_site for call_site in profile)
+    assert sorted(counts.total_count() for counts in profile.values()) == [1, 3]
+    assert sum(profile.values(), FlopCounts()) == fcc.flop_counts()
+
+
+def test_backends_trace_requires_tracing_backend():
+    # --- act / assert ------------------------------------
+    with FlopCountingContext() as fcc:
+        pass
+    with pytest.raises(ValueError):
+        fcc.trace()
+    with pytest.raises(ValueError):
+        fcc.profile()
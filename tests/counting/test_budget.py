@@ -0,0 +1,96 @@
+import math
+
+import pytest
+
+from counted_float._core.counting._backends import get_active_backend
+from counted_float._core.counting._budget import BudgetUnit, FlopBudgetExceeded
+from counted_float._core.counting._context_managers import FlopCountingContext
+from counted_float._core.counting._counted_complex import CountedComplex
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._global_counter import GLOBAL_COUNTER
+from counted_float._core.counting._register_flops import register_flops
+from counted_float._core.counting.config import get_flop_weights, set_flop_weights
+from counted_float._core.counting.models import FlopType, FlopWeights, InstrumentationBackend
+
+
+def _runaway(n: int):
+    x = CountedFloat(1.0)
+    for _ in range(n):
+        x = x + 1.0
+    return x
+
+
+def test_budget_not_exceeded():
+    # --- act ---------------------------------------------
+    with FlopCountingContext(budget=100) as ctx:
+        _runaway(100)
+
+    # --- assert ------------------------------------------
+    assert not ctx.budget_exceeded()
+    assert "incr_add" not in vars(GLOBAL_COUNTER)  # budget-checking methods are uninstalled again
+
+
+def test_budget_exceeded_raises():
+    # --- act ---------------------------------------------
+    with pytest.raises(FlopBudgetExceeded) as exc_info:
+        with FlopCountingContext(budget=100) as ctx:
+            _runaway(1_000_000)
+
+    # --- assert ------------------------------------------
+    assert exc_info.value.context is ctx
+    assert exc_info.value.usage == 101  # cut off at the first flop exceeding the budget
+    assert ctx.flop_counts().ADD == 101
+    assert ctx.budget_exceeded()
+    assert get_active_backend() == InstrumentationBackend.COUNTING
+
+
+def test_budget_weighted_cost_callback():
+    # --- arrange -----------------------------------------
+    weights = get_flop_weights()
+    set_flop_weights(FlopWeights(weights={flop_type: 1 for flop_type in FlopType} | {FlopType.DIV: 10}))
+    exceeded = []
+
+    # --- act ---------------------------------------------
+    try:
+        with FlopCountingContext(budget=50, budget_unit=BudgetUnit.WEIGHTED_COST, on_exceed=exceeded.append) as ctx:
+            x = CountedFloat(1.0)
+            for _ in range(10):
+                x = x / 3.0 + 1.0  # weighted cost 11 per iteration
+    finally:
+        set_flop_weights(weights)
+
+    # --- assert ------------------------------------------
+    assert exceeded == [ctx]  # called only once
+    assert ctx.total_weighted_cost(FlopWeights(weights={flop_type: 1 for flop_type in FlopType})) == 20
+
+
+def test_budget_other_flop_sources():
+    # --- act & assert ------------------------------------
+    with pytest.raises(FlopBudgetExceeded):
+        with FlopCountingContext(budget=10):
+            _ = math.sqrt(CountedFloat(2.0))  # patched math function
+            register_flops(FlopType.MUL, 5)
+            _ = CountedComplex(1.0, 2.0) * CountedComplex(3.0, 4.0)  # 6 flops
+
+    with pytest.raises(FlopBudgetExceeded):
+        with FlopCountingContext(budget=1000):
+            register_flops(FlopType.MUL, 1001)
+
+
+def test_budget_nested_contexts():
+    # --- act ---------------------------------------------
+    with FlopCountingContext(budget=1000) as outer:
+        with pytest.raises(FlopBudgetExceeded) as exc_info:
+            with FlopCountingContext(budget=10):
+                _runaway(100)
+        _runaway(100)
+
+    # --- assert ------------------------------------------
+    assert exc_info.value.budget == 10
+    assert not outer.budget_exceeded()
+    assert outer.flop_counts().ADD == 111
+
+
+def test_budget_invalid():
+    with pytest.raises(ValueError):
+        FlopCountingContext(budget=-1)
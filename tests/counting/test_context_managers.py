@@ -2,6 +2,9 @@ import pytest
 
 from counted_float._core.counting._context_managers import FlopCountingContext, PauseFlopCounting
 from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_float32 import CountedFloat32
+from counted_float._core.counting._counted_int import CountedInt
+from counted_float._core.counting.models import FlopCounts, FlopType, FlopWeights, IntOpCounts, Precision
 
 
 # =================================================================================================
@@ -193,3 +196,58 @@ def test_pause_flop_counting():
     assert flop_counts_1.total_count() == 1
     assert flop_counts_2.total_count() == 1
     assert flop_counts_3.total_count() == 0
+
+
+# =================================================================================================
+#  Per-precision counting
+# =================================================================================================
+def test_flop_counting_context_precision():
+    # --- arrange -----------------------------------------
+    cf = CountedFloat(1.0)
+    cf32 = CountedFloat32(2.0)
+    weights = FlopWeights(
+        weights={flop_type: 1 for flop_type in FlopType},
+        weights_fp32={flop_type: 10 for flop_type in FlopType},
+    )
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc:
+        _ = cf + cf
+        _ = cf32 * cf32
+        with PauseFlopCounting():
+            _ = cf32 - cf32  # should not be counted
+        fcc.pause()
+        _ = cf32 / cf32  # should not be counted
+        fcc.resume()
+        _ = cf32 + cf32
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(ADD=1)
+    assert fcc.flop_counts(Precision.FP64) == FlopCounts(ADD=1)
+    assert fcc.flop_counts(Precision.FP32) == FlopCounts(MUL=1, ADD=1)
+    assert fcc.total_weighted_cost(weights=weights) == 1 + 2 * 10
+
+
+# =================================================================================================
+#  Integer op counting
+# =================================================================================================
+def test_flop_counting_context_int_op_counts():
+    # --- arrange -----------------------------------------
+    ci = CountedInt(5)
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc1:
+        _ = ci + ci
+        with FlopCountingContext() as fcc2:
+            _ = ci * ci
+            with PauseFlopCounting():
+                _ = ci // 2  # should not be counted
+        fcc1.pause()
+        _ = ci << 2  # should not be counted in fcc1
+        fcc1.resume()
+        _ = ci < 3
+
+    # --- assert ------------------------------------------
+    assert fcc1.int_op_counts() == IntOpCounts(ADD=1, MUL=1, CMP=1)
+    assert fcc2.int_op_counts() == IntOpCounts(MUL=1)
+    assert fcc1.flop_counts().total_count() == 0
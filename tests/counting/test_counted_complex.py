@@ -0,0 +1,233 @@
+import cmath
+import operator
+from typing import Callable
+
+import pytest
+
+from counted_float import cmath as counted_cmath
+from counted_float._core.counting import _instrumented_ops
+from counted_float._core.counting._counted_complex import CountedComplex
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting.models import ComplexOpType, FlopCounts
+
+
+# =================================================================================================
+#  CountedComplex - Construction & other basics
+# =================================================================================================
+def test_counted_complex_construction_and_equality():
+    # --- arrange -----------------------------------------
+    c = 1.5 - 2.5j
+
+    # --- act ---------------------------------------------
+    cc_1 = CountedComplex(c)
+    cc_2 = CountedComplex(1.5, -2.5)
+    cc_3 = CountedComplex(CountedFloat(1.5), CountedFloat(-2.5))
+    cc_4 = CountedComplex()
+
+    # --- assert ------------------------------------------
+    assert cc_1 == c
+    assert cc_2 == c
+    assert cc_3 == c
+    assert cc_4 == 0
+    assert all(isinstance(cc, CountedComplex) for cc in [cc_1, cc_2, cc_3, cc_4])
+    assert isinstance(cc_1, complex)
+
+
+@pytest.mark.parametrize("c", [0j, 1 + 2j, -3.5j, complex(cmath.pi, -cmath.e)])
+def test_counted_complex_hash_str_repr(c: complex):
+    # --- arrange -----------------------------------------
+    cc = CountedComplex(c)
+
+    # --- act & assert ------------------------------------
+    assert hash(cc) == hash(c)
+    assert str(cc) == f"CountedComplex({repr(c)})"
+    assert repr(cc) == f"CountedComplex({repr(c)})"
+
+
+def test_counted_complex_real_imag():
+    # --- arrange -----------------------------------------
+    cc = CountedComplex(1.5, -2.5)
+
+    # --- act ---------------------------------------------
+    re, im = cc.real, cc.imag
+
+    # --- assert ------------------------------------------
+    assert isinstance(re, CountedFloat)
+    assert isinstance(im, CountedFloat)
+    assert (re, im) == (1.5, -2.5)
+
+
+# =================================================================================================
+#  CountedComplex - Correct math operations & contagion
+# =================================================================================================
+@pytest.mark.parametrize(
+    "op", [operator.add, operator.sub, operator.mul, operator.truediv, operator.pow], ids=lambda op: op.__name__
+)
+@pytest.mark.parametrize("other", [2, 0.5, 1.5 - 0.5j, CountedFloat(0.5), CountedComplex(1.5 - 0.5j)])
+def test_counted_complex_math_binary(op: Callable, other):
+    # --- arrange -----------------------------------------
+    c = 1.25 + 0.75j
+    cc = CountedComplex(c)
+
+    # --- act ---------------------------------------------
+    cc_left = op(cc, other)
+    cc_right = op(other, cc)
+
+    # --- assert ------------------------------------------
+    assert isinstance(cc_left, CountedComplex)
+    assert isinstance(cc_right, CountedComplex)
+    assert cc_left == pytest.approx(op(c, complex(other)))
+    assert cc_right == pytest.approx(op(complex(other), c))
+
+
+@pytest.mark.parametrize(
+    "op", [operator.add, operator.sub, operator.mul, operator.truediv, operator.pow], ids=lambda op: op.__name__
+)
+def test_counted_float_complex_contagion(op: Callable):
+    # --- arrange -----------------------------------------
+    f = 1.25
+    c = 0.5 - 0.75j
+    cf = CountedFloat(f)
+    cc = CountedComplex(c)
+
+    # --- act ---------------------------------------------
+    result_left = op(cf, c)
+    result_counted_left = op(cf, cc)
+    result_counted_right = op(cc, cf)
+
+    # --- assert ------------------------------------------
+    assert isinstance(result_left, CountedComplex)
+    assert isinstance(result_counted_left, CountedComplex)
+    assert isinstance(result_counted_right, CountedComplex)
+    assert result_left == pytest.approx(op(f, c))
+    assert result_counted_left == pytest.approx(op(f, c))
+    assert result_counted_right == pytest.approx(op(c, f))
+
+
+@pytest.mark.parametrize(
+    "op_name, complex_op_type",
+    [
+        ("add", ComplexOpType.ADD),
+        ("sub", ComplexOpType.SUB),
+        ("mul", ComplexOpType.MUL),
+        ("truediv", ComplexOpType.DIV),
+        ("pow", ComplexOpType.POW),
+    ],
+)
+def test_counted_float_complex_contagion_instrumented(op_name: str, complex_op_type: ComplexOpType, global_counter):
+    # --- arrange -----------------------------------------
+    op = getattr(_instrumented_ops, op_name)  # as called by modules instrumented with instrument_modules(...)
+    c = 0.5 - 0.75j
+    cf = CountedFloat(1.25)
+
+    # --- act ---------------------------------------------
+    result_left = op(cf, c)
+    result_right = op(c, cf)  # plain complex left operand
+    counts = global_counter.flop_counts()
+
+    # --- assert ------------------------------------------
+    assert counts == complex_op_type.flop_counts() + complex_op_type.flop_counts()
+    assert isinstance(result_left, CountedComplex)
+    assert isinstance(result_right, CountedComplex)
+    assert result_right == pytest.approx(getattr(operator, op_name)(c, 1.25))
+
+
+@pytest.mark.parametrize("f", [-8.0, -0.5])
+def test_counted_float_pow_complex_result(f: float):
+    # --- arrange -----------------------------------------
+    cf = CountedFloat(f)
+
+    # --- act ---------------------------------------------
+    result = cf**0.5
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, CountedComplex)
+    assert result == pytest.approx(f**0.5)
+
+
+def test_counted_complex_math_unary():
+    # --- arrange -----------------------------------------
+    c = 3 - 4j
+    cc = CountedComplex(c)
+
+    # --- act ---------------------------------------------
+    cc_abs = abs(cc)
+    cc_neg = -cc
+    cc_conj = cc.conjugate()
+    cc_sqrt = counted_cmath.sqrt(cc)
+    cc_polar = counted_cmath.polar(cc)
+
+    # --- assert ------------------------------------------
+    assert isinstance(cc_abs, CountedFloat) and cc_abs == abs(c)
+    assert isinstance(cc_neg, CountedComplex) and cc_neg == -c
+    assert isinstance(cc_conj, CountedComplex) and cc_conj == c.conjugate()
+    assert isinstance(cc_sqrt, CountedComplex) and cc_sqrt == cmath.sqrt(c)
+    assert all(isinstance(v, CountedFloat) for v in cc_polar) and cc_polar == cmath.polar(c)
+
+
+def test_cmath_uncounted_types_unaffected():
+    # --- act ---------------------------------------------
+    result_sqrt = cmath.sqrt(-4.0)
+    result_polar = cmath.polar(1j)
+
+    # --- assert ------------------------------------------
+    assert not isinstance(result_sqrt, CountedComplex)
+    assert not any(isinstance(v, CountedFloat) for v in result_polar)
+
+
+# =================================================================================================
+#  CountedComplex - Correct counting
+# =================================================================================================
+@pytest.mark.parametrize(
+    "complex_op_type, f",
+    [
+        (ComplexOpType.ABS, lambda z, w: abs(z)),
+        (ComplexOpType.MINUS, lambda z, w: -z),
+        (ComplexOpType.CONJ, lambda z, w: z.conjugate()),
+        (ComplexOpType.EQUALS, lambda z, w: z == w),
+        (ComplexOpType.EQUALS, lambda z, w: z != w),
+        (ComplexOpType.ADD, lambda z, w: z + w),
+        (ComplexOpType.ADD, lambda z, w: w + z),
+        (ComplexOpType.SUB, lambda z, w: z - w),
+        (ComplexOpType.SUB, lambda z, w: w - z),
+        (ComplexOpType.MUL, lambda z, w: z * w),
+        (ComplexOpType.MUL, lambda z, w: w * z),
+        (ComplexOpType.MUL, lambda z, w: z**2),
+        (ComplexOpType.DIV, lambda z, w: z / w),
+        (ComplexOpType.DIV, lambda z, w: w / z),
+        (ComplexOpType.SQRT, lambda z, w: counted_cmath.sqrt(z)),
+        (ComplexOpType.POW, lambda z, w: z**w),
+        (ComplexOpType.POW, lambda z, w: w**z),
+    ],
+)
+def test_counted_complex_counts(complex_op_type: ComplexOpType, f: Callable, global_counter):
+    # --- arrange -----------------------------------------
+    z = CountedComplex(1.5, -2.5)
+    w = 0.5 + 0.25j
+
+    # --- act ---------------------------------------------
+    _ = f(z, w)
+
+    # --- assert ------------------------------------------
+    assert global_counter.flop_counts() == complex_op_type.flop_counts()
+
+
+def test_counted_complex_counts_mixed(global_counter):
+    # --- arrange -----------------------------------------
+    cf = CountedFloat(2.0)
+    cc = CountedComplex(1.5, -2.5)
+
+    # --- act ---------------------------------------------
+    _ = cf * cc  # complex MUL
+    _ = cc + cf  # complex ADD
+    _ = cf - 1j  # complex SUB
+    _ = cc.real * cf  # MUL
+
+    # --- assert ------------------------------------------
+    expected = (
+        ComplexOpType.MUL.flop_counts()
+        + ComplexOpType.ADD.flop_counts()
+        + ComplexOpType.SUB.flop_counts()
+        + FlopCounts(MUL=1)
+    )
+    assert global_counter.flop_counts() == expected
@@ -3,6 +3,7 @@ from typing import Callable
 
 import pytest
 
+from counted_float import math as counted_math
 from counted_float._core.counting._counted_float import CountedFloat
 from counted_float._core.counting.models import FlopCounts
 
@@ -446,7 +447,7 @@ def test_counted_float_math_sqrt(f: float):
 
     # --- act ---------------------------------------------
     f_sqrt = math.sqrt(f)
-    cf_sqrt = math.sqrt(cf)
+    cf_sqrt = counted_math.sqrt(cf)
 
     # --- assert ------------------------------------------
     assert isinstance(cf_sqrt, CountedFloat)
@@ -460,7 +461,7 @@ def test_counted_float_math_log2(f: float):
 
     # --- act ---------------------------------------------
     f_log2 = math.log2(f)
-    cf_log2 = math.log2(cf)
+    cf_log2 = counted_math.log2(cf)
 
     # --- assert ------------------------------------------
     assert isinstance(cf_log2, CountedFloat)
@@ -758,13 +759,13 @@ def test_counted_float_counts_pow_2(global_counter):
     cf = CountedFloat(1.23456)
 
     # --- act ---------------------------------------------
-    _ = math.pow(f, cf)  # POW
-    _ = math.pow(cf, f)  # POW
-    _ = math.pow(math.pow(cf, f), f)  # 2 x POW
-    _ = math.pow(math.pow(f, cf), f)  # 2 x POW
-    _ = math.pow(cf, cf)  # POW
-    _ = math.pow(2, cf)  # POW2
-    _ = math.pow(cf, 2)  # MUL
+    _ = counted_math.pow(f, cf)  # POW
+    _ = counted_math.pow(cf, f)  # POW
+    _ = counted_math.pow(counted_math.pow(cf, f), f)  # 2 x POW
+    _ = counted_math.pow(counted_math.pow(f, cf), f)  # 2 x POW
+    _ = counted_math.pow(cf, cf)  # POW
+    _ = counted_math.pow(2, cf)  # POW2
+    _ = counted_math.pow(cf, 2)  # MUL
 
     # --- assert ------------------------------------------
     assert global_counter.total_count() == 9
@@ -778,7 +779,7 @@ def test_counted_float_counts_sqrt(global_counter):
     cf = CountedFloat(1.23456)
 
     # --- act ---------------------------------------------
-    _ = math.sqrt(cf)
+    _ = counted_math.sqrt(cf)
 
     # --- assert ------------------------------------------
     assert global_counter.total_count() == 1
@@ -790,7 +791,7 @@ def test_counted_float_counts_log2(global_counter):
     cf = CountedFloat(1.23456)
 
     # --- act ---------------------------------------------
-    _ = math.log2(cf)
+    _ = counted_math.log2(cf)
 
     # --- assert ------------------------------------------
     assert global_counter.total_count() == 1
@@ -0,0 +1,127 @@
+import math
+import operator
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from counted_float import math as counted_math
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_float32 import CountedFloat32
+from counted_float._core.counting.models import FlopCounts
+
+
+# =================================================================================================
+#  CountedFloat32 - Construction & other basics
+# =================================================================================================
+@pytest.mark.parametrize("f", [-1.0, 0.0, 0.1, math.pi, 1e-50, 1e30])
+def test_counted_float32_construction_rounds_to_fp32(f: float):
+    # --- act ---------------------------------------------
+    cf = CountedFloat32(f)
+
+    # --- assert ------------------------------------------
+    assert isinstance(cf, float)
+    assert isinstance(cf, CountedFloat32)
+    assert not isinstance(cf, CountedFloat)
+    assert float(cf) == float(np.float32(f))
+
+
+@pytest.mark.parametrize("f", [-1.0, 0.0, 0.1, math.pi])
+def test_counted_float32_hash_str_repr(f: float):
+    # --- arrange -----------------------------------------
+    cf = CountedFloat32(f)
+
+    # --- act & assert ------------------------------------
+    assert hash(cf) == hash(float(np.float32(f)))
+    assert str(cf) == f"CountedFloat32({str(np.float32(f))})"
+    assert repr(cf) == f"CountedFloat32({str(np.float32(f))})"
+
+
+# =================================================================================================
+#  CountedFloat32 - Correct math operations & contagion
+# =================================================================================================
+@pytest.mark.parametrize("op", [operator.add, operator.sub, operator.mul, operator.truediv], ids=lambda op: op.__name__)
+@pytest.mark.parametrize("f1, f2", [(0.1, 0.2), (math.pi, math.e), (1.0, 3.0)])
+def test_counted_float32_math_matches_numpy_fp32(op: Callable, f1: float, f2: float):
+    # --- arrange -----------------------------------------
+    cf1, cf2 = CountedFloat32(f1), CountedFloat32(f2)
+    np1, np2 = np.float32(f1), np.float32(f2)
+
+    # --- act ---------------------------------------------
+    result = op(cf1, cf2)
+    expected = op(np1, np2)
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, CountedFloat32)
+    assert float(result) == float(expected)
+
+
+def test_counted_float32_math_sqrt_matches_numpy_fp32():
+    # --- arrange -----------------------------------------
+    cf = CountedFloat32(2.0)
+
+    # --- act ---------------------------------------------
+    result = counted_math.sqrt(cf)
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, CountedFloat32)
+    assert float(result) == float(np.sqrt(np.float32(2.0)))
+
+
+@pytest.mark.parametrize(
+    "op", [operator.add, operator.sub, operator.mul, operator.truediv, operator.pow], ids=lambda op: op.__name__
+)
+def test_counted_float32_contagion(op: Callable):
+    # --- arrange -----------------------------------------
+    cf32 = CountedFloat32(1.5)
+    cf64 = CountedFloat(2.5)
+
+    # --- act & assert ------------------------------------
+    assert isinstance(op(cf32, 2), CountedFloat32)
+    assert isinstance(op(2.0, cf32), CountedFloat32)
+    assert isinstance(op(cf32, cf64), CountedFloat)
+    assert isinstance(op(cf64, cf32), CountedFloat)
+
+
+# =================================================================================================
+#  CountedFloat32 - Correct counting
+# =================================================================================================
+def test_counted_float32_counts(global_counter, global_counter_fp32):
+    # --- arrange -----------------------------------------
+    cf = CountedFloat32(1.23456)
+
+    # --- act ---------------------------------------------
+    _ = cf + 1.0
+    _ = 2.0 * cf
+    _ = cf / cf
+    _ = cf - 3
+    _ = -cf
+    _ = abs(cf)
+    _ = cf < 0
+    _ = cf >= 1.0
+    _ = round(cf)
+    _ = cf**2
+    _ = 2**cf
+    _ = counted_math.sqrt(cf)
+    _ = counted_math.log2(cf)
+
+    # --- assert ------------------------------------------
+    assert global_counter.total_count() == 0
+    assert global_counter_fp32.flop_counts() == FlopCounts(
+        ADD=1, MUL=2, DIV=1, SUB=1, MINUS=1, ABS=1, CMP_ZERO=1, GTE=1, RND=1, POW2=1, SQRT=1, LOG2=1
+    )
+
+
+def test_counted_float32_mixed_precision_counted_as_fp64(global_counter, global_counter_fp32):
+    # --- arrange -----------------------------------------
+    cf32 = CountedFloat32(1.5)
+    cf64 = CountedFloat(2.5)
+
+    # --- act ---------------------------------------------
+    _ = cf32 + cf64
+    _ = cf64 * cf32
+    _ = cf32 < cf64
+
+    # --- assert ------------------------------------------
+    assert global_counter_fp32.total_count() == 0
+    assert global_counter.flop_counts() == FlopCounts(ADD=1, MUL=1, GTE=1)
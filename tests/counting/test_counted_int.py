@@ -0,0 +1,179 @@
+import math
+import operator
+from typing import Callable
+
+import pytest
+
+from counted_float import math as counted_math
+from counted_float._core.counting._counted_complex import CountedComplex
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_float32 import CountedFloat32
+from counted_float._core.counting._counted_int import CountedInt
+from counted_float._core.counting.models import FlopCounts, IntOpCounts
+
+
+# =================================================================================================
+#  CountedInt - Construction & other basics
+# =================================================================================================
+@pytest.mark.parametrize("i", [0, 1, -7, 2**70])
+def test_counted_int_construction_hash_str_repr(i: int):
+    # --- act ---------------------------------------------
+    ci = CountedInt(i)
+
+    # --- assert ------------------------------------------
+    assert isinstance(ci, int)
+    assert int(ci) == i
+    assert hash(ci) == hash(i)
+    assert str(ci) == f"CountedInt({i})"
+    assert repr(ci) == f"CountedInt({i})"
+
+
+def test_counted_int_uncounted_ops(global_counter):
+    # --- arrange -----------------------------------------
+    ci = CountedInt(7)
+
+    # --- act ---------------------------------------------
+    results = [+ci, round(ci), math.floor(ci), math.ceil(ci), math.trunc(ci)]
+
+    # --- assert ------------------------------------------
+    assert all(isinstance(r, CountedInt) and r == 7 for r in results)
+    assert global_counter.int_op_counts() == IntOpCounts(CMP=len(results))  # only the '==' checks are counted
+
+
+# =================================================================================================
+#  CountedInt - Correct math operations & contagion
+# =================================================================================================
+@pytest.mark.parametrize(
+    "op",
+    [
+        operator.add,
+        operator.sub,
+        operator.mul,
+        operator.floordiv,
+        operator.mod,
+        operator.pow,
+        operator.lshift,
+        operator.rshift,
+        operator.and_,
+        operator.or_,
+        operator.xor,
+    ],
+    ids=lambda op: op.__name__,
+)
+@pytest.mark.parametrize("i1, i2", [(7, 3), (-13, 5), (2, 10)])
+def test_counted_int_math_binary(op: Callable, i1: int, i2: int):
+    # --- act ---------------------------------------------
+    result_left = op(CountedInt(i1), i2)
+    result_right = op(i1, CountedInt(i2))
+    result_both = op(CountedInt(i1), CountedInt(i2))
+
+    # --- assert ------------------------------------------
+    for result in [result_left, result_right, result_both]:
+        assert isinstance(result, CountedInt)
+        assert result == op(i1, i2)
+
+
+def test_counted_int_math_unary_divmod_truediv():
+    # --- arrange -----------------------------------------
+    ci = CountedInt(-7)
+
+    # --- act ---------------------------------------------
+    results_int = [-ci, abs(ci), ~ci, *divmod(ci, 3), *divmod(30, ci), pow(ci, 3, 5)]
+    results_float = [ci / 2, 2 / ci, ci**-1]
+
+    # --- assert ------------------------------------------
+    assert all(isinstance(r, CountedInt) for r in results_int)
+    assert all(isinstance(r, CountedFloat) for r in results_float)
+    assert results_int == [7, 7, 6, -3, 2, -5, -5, pow(-7, 3, 5)]
+    assert results_float == [-3.5, 2 / -7, 1 / -7]
+
+
+@pytest.mark.parametrize(
+    "op", [operator.add, operator.sub, operator.mul, operator.truediv, operator.pow], ids=lambda op: op.__name__
+)
+@pytest.mark.parametrize(
+    "other, expected_type",
+    [
+        (0.5, CountedFloat),
+        (CountedFloat(0.5), CountedFloat),
+        (CountedFloat32(0.5), CountedFloat32),
+        (0.5 + 0.5j, CountedComplex),
+        (CountedComplex(0.5 + 0.5j), CountedComplex),
+    ],
+)
+def test_counted_int_contagion(op: Callable, other, expected_type: type):
+    # --- arrange -----------------------------------------
+    ci = CountedInt(3)
+
+    # --- act ---------------------------------------------
+    result = op(ci, other)
+
+    # --- assert ------------------------------------------
+    assert isinstance(result, expected_type)
+    assert result == pytest.approx(op(3, other))
+
+
+# =================================================================================================
+#  CountedInt - Correct counting
+# =================================================================================================
+@pytest.mark.parametrize(
+    "expected, f",
+    [
+        (IntOpCounts(ADD=1), lambda i, j: i + j),
+        (IntOpCounts(ADD=1), lambda i, j: j + i),
+        (IntOpCounts(ADD=1), lambda i, j: i - j),
+        (IntOpCounts(ADD=1), lambda i, j: -i),
+        (IntOpCounts(ADD=1), lambda i, j: abs(i)),
+        (IntOpCounts(MUL=1), lambda i, j: i * j),
+        (IntOpCounts(MUL=1), lambda i, j: i**2),
+        (IntOpCounts(MUL=3), lambda i, j: i**5),
+        (IntOpCounts(MUL=2), lambda i, j: j**i),
+        (IntOpCounts(MUL=3, DIV=3), lambda i, j: pow(i, 5, 7)),
+        (IntOpCounts(DIV=1), lambda i, j: i // j),
+        (IntOpCounts(DIV=1), lambda i, j: i % j),
+        (IntOpCounts(DIV=1), lambda i, j: divmod(i, j)),
+        (IntOpCounts(SHIFT=1), lambda i, j: i << j),
+        (IntOpCounts(SHIFT=1), lambda i, j: j >> i),
+        (IntOpCounts(BITWISE=1), lambda i, j: i & j),
+        (IntOpCounts(BITWISE=1), lambda i, j: i | j),
+        (IntOpCounts(BITWISE=1), lambda i, j: j ^ i),
+        (IntOpCounts(BITWISE=1), lambda i, j: ~i),
+        (IntOpCounts(CMP=1), lambda i, j: i == j),
+        (IntOpCounts(CMP=1), lambda i, j: i != j),
+        (IntOpCounts(CMP=1), lambda i, j: i < j),
+        (IntOpCounts(CMP=1), lambda i, j: j <= i),
+        (IntOpCounts(CMP=1), lambda i, j: i > j),
+        (IntOpCounts(CMP=1), lambda i, j: i >= j),
+    ],
+)
+def test_counted_int_counts(expected: IntOpCounts, f: Callable, global_counter):
+    # --- arrange -----------------------------------------
+    i = CountedInt(3)
+    j = 2
+
+    # --- act ---------------------------------------------
+    _ = f(i, j)
+
+    # --- assert ------------------------------------------
+    assert global_counter.int_op_counts() == expected
+    assert global_counter.flop_counts().total_count() == 0
+
+
+def test_counted_int_counts_flops(global_counter, global_counter_fp32):
+    # --- arrange -----------------------------------------
+    ci = CountedInt(3)
+
+    # --- act ---------------------------------------------
+    _ = ci / 2  # fp64 DIV
+    _ = ci**-2  # fp64 POW
+    _ = ci + 0.5  # fp64 ADD
+    _ = CountedFloat(0.5) * ci  # fp64 MUL
+    _ = CountedFloat(0.5) ** CountedInt(2)  # fp64 MUL, no int op for checking the exponent
+    _ = ci < CountedFloat(0.5)  # fp64 LTE
+    _ = counted_math.sqrt(ci)  # fp64 SQRT
+    _ = ci - CountedFloat32(0.5)  # fp32 SUB
+
+    # --- assert ------------------------------------------
+    assert global_counter.int_op_counts().total_count() == 0
+    assert global_counter.flop_counts() == FlopCounts(DIV=1, POW=1, ADD=1, MUL=2, GTE=1, SQRT=1)
+    assert global_counter_fp32.flop_counts() == FlopCounts(SUB=1)
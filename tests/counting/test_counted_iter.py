@@ -0,0 +1,107 @@
+import pytest
+
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_float32 import CountedFloat32
+from counted_float._core.counting._counted_iter import counted_iter, get_stage_stats, reset_stage_stats
+from counted_float._core.counting._register_flops import register_flops
+from counted_float._core.counting.models import FlopCounts, FlopType, FlopWeights
+
+_UNIT_WEIGHTS = FlopWeights(weights={flop_type: 1 for flop_type in FlopType})
+
+
+@pytest.fixture(autouse=True)
+def clean_stage_stats():
+    reset_stage_stats()
+    yield
+    reset_stage_stats()
+
+
+def _parse(n: int):
+    for i in range(n):
+        yield CountedFloat(i) * 2.0  # 1 MUL per item
+
+
+def _transform(records):
+    for rec in records:
+        x = rec
+        for _ in range(int(rec)):  # data-dependent: 2*i ADDs for item i
+            x = x + 1.0
+        yield x
+
+
+def test_counted_iter_single_stage():
+    # --- act ---------------------------------------------
+    items = list(counted_iter(_parse(10), stage="parse", weights=_UNIT_WEIGHTS))
+
+    # --- assert ------------------------------------------
+    stats = get_stage_stats("parse")
+    assert len(items) == 10
+    assert stats.n_items == 10
+    assert stats.flop_counts() == FlopCounts(MUL=10)
+    assert stats.total_cost == 10
+    assert stats.mean() == 1
+    assert stats.p50 == pytest.approx(1)
+
+
+def test_counted_iter_pipeline_exclusive():
+    # --- arrange -----------------------------------------
+    records = counted_iter(_parse(11), stage="parse", weights=_UNIT_WEIGHTS)
+    results = counted_iter(_transform(records), stage="transform", weights=_UNIT_WEIGHTS)
+
+    # --- act ---------------------------------------------
+    for _ in results:
+        pass
+
+    # --- assert ------------------------------------------
+    parse_stats, transform_stats = get_stage_stats("parse"), get_stage_stats("transform")
+    assert parse_stats.flop_counts() == FlopCounts(MUL=11)
+    assert transform_stats.flop_counts() == FlopCounts(ADD=sum(2 * i for i in range(11)))
+    assert transform_stats.n_items == 11
+    assert transform_stats.item_costs.max == 20
+    assert transform_stats.p50 == pytest.approx(10, rel=0.02)
+    assert transform_stats.p99 == pytest.approx(18, rel=0.02)  # item costs 0, 2, ..., 20
+    assert set(get_stage_stats()) == {"parse", "transform"}
+
+
+def test_counted_iter_accumulates_per_stage():
+    # --- act ---------------------------------------------
+    for _ in range(3):
+        list(counted_iter(_parse(2), stage="parse", weights=_UNIT_WEIGHTS))
+
+    # --- assert ------------------------------------------
+    assert get_stage_stats("parse").n_items == 6
+
+
+def test_counted_iter_precision_and_custom(custom_flop_type):
+    # --- arrange -----------------------------------------
+    def items():
+        yield CountedFloat32(1.0) * CountedFloat32(2.0)
+        register_flops(custom_flop_type, 2)
+        yield None
+
+    # --- act ---------------------------------------------
+    list(counted_iter(items(), stage="mixed", weights=_UNIT_WEIGHTS))
+
+    # --- assert ------------------------------------------
+    stats = get_stage_stats("mixed")
+    assert stats.flop_counts() == FlopCounts()  # fp64 only
+    assert stats.total_cost == 1 + 2 * 20
+    assert stats.item_costs.min == 1
+    assert stats.item_costs.max == 40
+
+
+def test_counted_iter_exception():
+    # --- arrange -----------------------------------------
+    def failing():
+        yield CountedFloat(1.0) + 1.0
+        raise ValueError("boom")
+
+    iterator = counted_iter(failing(), stage="failing", weights=_UNIT_WEIGHTS)
+
+    # --- act & assert ------------------------------------
+    next(iterator)
+    with pytest.raises(ValueError):
+        next(iterator)
+    assert get_stage_stats("failing").n_items == 1
+    with pytest.raises(KeyError):
+        get_stage_stats("unknown")
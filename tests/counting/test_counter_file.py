@@ -0,0 +1,159 @@
+import io
+import struct
+import subprocess
+import sys
+
+import pytest
+
+from counted_float._core.counting._context_managers import FlopCountingContext
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_float32 import CountedFloat32
+from counted_float._core.counting._counter_file import (
+    CounterFileWriter,
+    merge_counter_files,
+    read_counter_file,
+    watch_counter_files,
+)
+from counted_float._core.counting._global_counter import GLOBAL_COUNTER
+from counted_float._core.counting.models import FlopCounts, Precision
+
+
+def _workload(n: int):
+    x = CountedFloat(1.0)
+    y = CountedFloat32(1.0)
+    for _ in range(n):
+        x = x * 2.0
+        y = y + 1.0
+
+
+def test_counter_file_context(tmp_path):
+    # --- arrange -----------------------------------------
+    path = tmp_path / "counts.cfc"
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as ctx:
+        with CounterFileWriter(path, interval=0.01, context=ctx) as writer:
+            _workload(10)
+            writer.update()
+            snapshot_active = read_counter_file(path)
+            _workload(5)
+
+    snapshot = read_counter_file(path)
+
+    # --- assert ------------------------------------------
+    assert not writer.is_active()
+    assert not snapshot_active.closed
+    assert snapshot_active.counts[Precision.FP64] == FlopCounts(MUL=10)
+    assert snapshot.closed
+    assert snapshot.counts[Precision.FP64] == FlopCounts(MUL=15)
+    assert snapshot.counts[Precision.FP32] == FlopCounts(ADD=15)
+    assert snapshot.total_count() == 30
+    assert snapshot.start_time <= snapshot.update_time
+
+
+def test_counter_file_global_counters(tmp_path):
+    # --- arrange -----------------------------------------
+    path = tmp_path / "counts.cfc"
+
+    # --- act ---------------------------------------------
+    with CounterFileWriter(path):
+        _workload(10)
+        expected = GLOBAL_COUNTER.flop_counts()
+        expected.custom.clear()
+
+    # --- assert ------------------------------------------
+    assert read_counter_file(path).counts[Precision.FP64] == expected
+
+
+def test_counter_file_other_processes(tmp_path):
+    # --- arrange -----------------------------------------
+    paths = [tmp_path / f"counts_{i}.cfc" for i in range(2)]
+    script = (
+        "import sys\n"
+        "from counted_float import CountedFloat, CounterFileWriter, FlopCountingContext\n"
+        "with FlopCountingContext() as ctx, CounterFileWriter(sys.argv[1], context=ctx):\n"
+        "    x = CountedFloat(1.0)\n"
+        "    for _ in range(int(sys.argv[2])):\n"
+        "        x = x + 1.0\n"
+    )
+
+    # --- act ---------------------------------------------
+    for path, n in zip(paths, [100, 200]):
+        subprocess.run([sys.executable, "-c", script, str(path), str(n)], check=True)
+
+    merged = merge_counter_files(paths)
+
+    # --- assert ------------------------------------------
+    assert merged[Precision.FP64] == FlopCounts(ADD=300)
+    assert merged[Precision.FP32] == FlopCounts()
+    assert read_counter_file(paths[0]).pid != read_counter_file(paths[1]).pid
+
+
+def test_watch_counter_files(tmp_path):
+    # --- arrange -----------------------------------------
+    path = tmp_path / "counts.cfc"
+    out = io.StringIO()
+    with FlopCountingContext() as ctx, CounterFileWriter(path, context=ctx):
+        _workload(10)
+
+    # --- act ---------------------------------------------
+    watch_counter_files([path, tmp_path / "missing.cfc"], interval=0.01, n_updates=2, out=out)
+
+    # --- assert ------------------------------------------
+    views = out.getvalue().split(" file(s), ")[1:]
+    assert len(views) == 2
+    assert views[0].startswith("0 active")
+    assert "MUL                      10            -" in views[0]
+    assert "TOTAL                    20            0" in views[1]
+
+
+def test_watch_counter_files_skips_invalid_files(tmp_path):
+    # --- arrange -----------------------------------------
+    path = tmp_path / "counts.cfc"
+    empty_path = tmp_path / "empty.cfc"
+    empty_path.write_bytes(b"")
+    partial_path = tmp_path / "partial.cfc"
+    partial_path.write_bytes(bytes(1000))  # not yet initialized
+    with FlopCountingContext() as ctx, CounterFileWriter(path, context=ctx):
+        _workload(10)
+
+    class _UnlinkingOutput(io.StringIO):
+        def write(self, s: str) -> int:
+            path.unlink(missing_ok=True)  # file disappears after the first view
+            return super().write(s)
+
+    out = _UnlinkingOutput()
+
+    # --- act ---------------------------------------------
+    watch_counter_files([path, empty_path, partial_path], interval=0.01, n_updates=2, out=out)
+
+    # --- assert ------------------------------------------
+    views = out.getvalue().split(" file(s), ")[1:]
+    assert views[0].startswith("0 active")
+    assert "TOTAL                    20" in views[0]
+    assert "TOTAL                     0            0" in views[1]  # rates clamped at 0
+
+
+def test_read_counter_file_invalid(tmp_path):
+    # --- arrange -----------------------------------------
+    path = tmp_path / "counts.cfc"
+    with CounterFileWriter(path):
+        pass
+
+    # --- act & assert ------------------------------------
+    with open(path, "r+b") as f:
+        f.seek(24)
+        f.write(struct.pack("<Q", 3))  # odd sequence number: update in progress
+    with pytest.raises(TimeoutError):
+        read_counter_file(path, max_retries=3)
+
+    path.write_bytes(b"not a counter file")
+    with pytest.raises(ValueError):
+        read_counter_file(path)
+
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        read_counter_file(path)
+
+    with pytest.raises(ValueError):
+        CounterFileWriter(path, interval=0)
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._ensemble import CostDistribution, analyze_ensemble, iter_ensemble
+from counted_float._core.counting.models import FlopCounts, FlopType, FlopWeights, Precision
+
+
+# =================================================================================================
+#  Functions under test  (module-level, such that they can be pickled for worker processes)
+# =================================================================================================
+def _halve_until_small(x: float):
+    x = CountedFloat(x)
+    while x > 1.0:
+        x = x / 2
+    return x
+
+
+def _sample_large_value(rng: np.random.Generator) -> tuple:
+    return (float(rng.uniform(1.0, 1e6)),)
+
+
+_UNIT_WEIGHTS = FlopWeights(weights={flop_type: 1 for flop_type in FlopType})
+
+
+# =================================================================================================
+#  CostDistribution
+# =================================================================================================
+def test_cost_distribution():
+    # --- arrange ---
+    dist = CostDistribution(_UNIT_WEIGHTS)
+
+    # --- act ---
+    for n in range(1, 101):
+        dist.add(FlopCounts(ADD=n, MUL=2 * n))
+    dist.add({Precision.FP64: FlopCounts(), Precision.FP32: FlopCounts(DIV=1)})
+
+    # --- assert ---
+    assert dist.n_samples == 101
+    assert dist.flop_types() == [FlopType.ADD, FlopType.MUL]
+    assert dist.max() == 300
+    assert dist.max(FlopType.ADD) == 100
+    assert dist.mean(FlopType.MUL) == pytest.approx(2 * 5050 / 101)
+    summary = dist.summary()
+    assert summary.n_samples == 101
+    assert summary.min == 1  # fp32 flops are included in the weighted cost
+    assert summary.q50 == dist.quantile(0.5) == 150
+    assert summary.q25 <= summary.q50 <= summary.q75 <= summary.p99 <= summary.max
+
+
+def test_cost_distribution_empty():
+    # --- act & assert ---
+    with pytest.raises(ValueError):
+        CostDistribution(_UNIT_WEIGHTS).summary()
+
+
+# =================================================================================================
+#  analyze_ensemble / iter_ensemble
+# =================================================================================================
+def test_analyze_ensemble_inputs():
+    # --- arrange ---
+    inputs = ((2.0**k,) for k in range(10))
+
+    # --- act ---
+    dist = analyze_ensemble(_halve_until_small, inputs=inputs, weights=_UNIT_WEIGHTS)
+
+    # --- assert ---
+    assert list(dist.costs(FlopType.DIV)) == list(range(10))
+    assert list(dist.costs(FlopType.GTE)) == [k + 1 for k in range(10)]
+    assert dist.indices == list(range(10))
+    assert dist.max() == 9 + 10
+
+
+def test_analyze_ensemble_sampler_reproducible():
+    # --- act ---
+    dist_1 = analyze_ensemble(_halve_until_small, sampler=_sample_large_value, n_samples=20, seed=1)
+    dist_2 = analyze_ensemble(_halve_until_small, sampler=_sample_large_value, n_samples=20, seed=1, n_workers=2)
+
+    # --- assert ---
+    assert dist_2.n_samples == 20
+    costs_2 = dict(zip(dist_2.indices, dist_2.costs(FlopType.DIV)))
+    assert list(dist_1.costs(FlopType.DIV)) == [costs_2[i] for i in range(20)]
+    assert dist_1.summary(FlopType.DIV).max <= 20  # 1e6 < 2^20
+
+
+def test_iter_ensemble_partial_results():
+    # --- act ---
+    n_samples_seen = [dist.n_samples for dist in iter_ensemble(_halve_until_small, inputs=[(8.0,)] * 5)]
+
+    # --- assert ---
+    assert n_samples_seen == [1, 2, 3, 4, 5]
+
+
+def test_analyze_ensemble_invalid_arguments():
+    # --- act & assert ---
+    with pytest.raises(ValueError):
+        analyze_ensemble(_halve_until_small)
+    with pytest.raises(ValueError):
+        analyze_ensemble(_halve_until_small, sampler=_sample_large_value)
@@ -0,0 +1,137 @@
+import pytest
+
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_iter import reset_stage_stats
+from counted_float._core.counting._function_stats import count_flops, get_function_stats, reset_function_stats
+from counted_float._core.counting.models import FlopCounts, FlopType, FlopWeights
+
+_UNIT_WEIGHTS = FlopWeights(weights={flop_type: 1 for flop_type in FlopType})
+
+
+@pytest.fixture(autouse=True)
+def clean_function_stats():
+    reset_function_stats()
+    yield
+    reset_function_stats()
+    reset_stage_stats()
+
+
+@count_flops(name="inner", weights=_UNIT_WEIGHTS)
+def _inner(x: CountedFloat, n: int) -> CountedFloat:
+    for _ in range(n):
+        x = x * 2.0
+    return x
+
+
+@count_flops(name="outer", weights=_UNIT_WEIGHTS)
+def _outer(x: CountedFloat, n: int) -> CountedFloat:
+    return _inner(x + 1.0, n) / 2.0
+
+
+@count_flops(name="factorial", weights=_UNIT_WEIGHTS)
+def _factorial(x: CountedFloat) -> CountedFloat:
+    return x if x <= 1.0 else x * _factorial(x - 1.0)
+
+
+def test_count_flops_calls():
+    # --- act ---------------------------------------------
+    for n in [1, 2, 3, 10]:
+        _inner(CountedFloat(1.0), n)
+
+    # --- assert ------------------------------------------
+    stats = _inner.stats
+    assert stats is get_function_stats("inner")
+    assert stats.n_calls == 4
+    assert stats.total_counts() == FlopCounts(MUL=16)
+    assert stats.mean_counts()[FlopType.MUL] == 4
+    assert stats.max_counts() == FlopCounts(MUL=10)
+    assert stats.total_cost() == 16
+    assert stats.max_cost == 10
+    assert stats.histogram() == [(1.0, 2.0, 1), (2.0, 4.0, 2), (8.0, 16.0, 1)]
+
+
+def test_count_flops_nested_inclusive_exclusive():
+    # --- act ---------------------------------------------
+    _outer(CountedFloat(1.0), 5)
+
+    # --- assert ------------------------------------------
+    stats = get_function_stats("outer")
+    assert stats.total_counts() == FlopCounts(ADD=1, MUL=5, DIV=1)
+    assert stats.total_counts(inclusive=False) == FlopCounts(ADD=1, DIV=1)
+    assert stats.total_cost(inclusive=False) == 2
+    assert get_function_stats("inner").total_counts() == FlopCounts(MUL=5)
+
+
+def test_count_flops_recursive():
+    # --- act ---------------------------------------------
+    _factorial(CountedFloat(4.0))  # 4 calls;  3x MUL & SUB, 4x LTE
+
+    # --- assert ------------------------------------------
+    stats = _factorial.stats
+    assert stats.n_calls == 4
+    assert stats.total_counts() == FlopCounts(LTE=4, SUB=3, MUL=3)  # not counted twice
+    assert stats.total_counts(inclusive=False) == FlopCounts(LTE=4, SUB=3, MUL=3)
+    assert stats.max_counts() == FlopCounts(LTE=4, SUB=3, MUL=3)  # outermost call
+    assert stats.call_costs.min == 1  # innermost call
+
+
+def test_count_flops_recursive_means():
+    # --- arrange -----------------------------------------
+    @count_flops(name="rsum", weights=_UNIT_WEIGHTS)
+    def _rsum(xs: list[CountedFloat]) -> CountedFloat:
+        return xs[0] if len(xs) == 1 else xs[0] + _rsum(xs[1:])
+
+    # --- act ---------------------------------------------
+    _rsum([CountedFloat(1.0)] * 4)  # 4 calls, 3 ADDs
+    _rsum([CountedFloat(1.0)] * 2)  # 2 calls, 1 ADD
+
+    # --- assert ------------------------------------------
+    stats = _rsum.stats
+    assert (stats.n_calls, stats.n_outermost_calls) == (6, 2)
+    assert stats.mean_counts()[FlopType.ADD] == 2  # per outermost call
+    assert stats.mean_cost() == 2
+    assert stats.mean_counts(inclusive=False)[FlopType.ADD] == 4 / 6  # per call
+    assert stats.mean_cost(inclusive=False) == 4 / 6
+
+
+def test_count_flops_method_and_exception():
+    # --- arrange -----------------------------------------
+    class Solver:
+        @count_flops(weights=_UNIT_WEIGHTS)
+        def solve(self, x: CountedFloat) -> CountedFloat:
+            x = x + 1.0
+            if x > 10.0:
+                raise ValueError("too large")
+            return x
+
+    solver = Solver()
+
+    # --- act ---------------------------------------------
+    solver.solve(CountedFloat(1.0))
+    with pytest.raises(ValueError):
+        solver.solve(CountedFloat(100.0))
+
+    # --- assert ------------------------------------------
+    stats = solver.solve.stats
+    assert stats.name.endswith("Solver.solve")
+    assert stats.n_calls == 2
+    assert stats.total_counts() == FlopCounts(ADD=2, GTE=2)
+    with pytest.raises(KeyError):
+        get_function_stats("unknown")
+
+
+def test_count_flops_weights_modified_in_place():
+    # --- arrange -----------------------------------------
+    weights = FlopWeights(weights={flop_type: 1 for flop_type in FlopType})
+
+    @count_flops(name="add", weights=weights)
+    def _add(x: CountedFloat) -> CountedFloat:
+        return x + 1.0
+
+    # --- act ---------------------------------------------
+    _add(CountedFloat(1.0))
+    weights.weights[FlopType.ADD] = 100
+    _add(CountedFloat(1.0))
+
+    # --- assert ------------------------------------------
+    assert _add.stats.total_cost() == 101
@@ -0,0 +1,329 @@
+import importlib
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from counted_float._core.counting import _import_hook
+from counted_float._core.counting._context_managers import FlopCountingContext
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._import_hook import (
+    get_instrumented_modules,
+    instrument_modules,
+    instrument_source,
+    uninstrument_modules,
+)
+from counted_float._core.counting.models import FlopCounts
+
+# =================================================================================================
+#  Fixtures
+# =================================================================================================
+_SOLVER_SOURCE = '''
+"""Module docstring."""
+
+from __future__ import annotations
+
+
+def distance(xs, ys):
+    s = 0.0
+    for i in range(len(xs)):
+        d = xs[i] - ys[i]
+        s += d * d
+    return s**0.5
+
+
+def scaled(x):
+    return -1.5 * x
+
+
+def classify(x):
+    k = 0
+    for i in range(3):
+        k += i * 2  # int ops, not counted
+    if x < 0:
+        return k
+    return -x
+
+
+def literal():
+    return 2.5
+
+
+def accumulate(out, x):
+    out += x
+    return out
+
+
+def accumulate_item(out, indices, x):
+    out[indices.pop()] += x  # indices are popped only once
+    return out
+
+
+def scale_slice(out, x):
+    out[1:] *= x
+    return out
+
+
+class Accumulator:
+    def __init__(self):
+        self.total = 0
+
+    def add(self, x):
+        self.total += x
+        return self
+
+
+def match_literal(x):
+    match x:
+        case 1.5:
+            return "one and a half"
+        case _:
+            return "other"
+'''
+
+_UTILS_SOURCE = """
+def distance(xs, ys):
+    s = 0.0
+    for i in range(len(xs)):
+        d = xs[i] - ys[i]
+        s += d * d
+    return s**0.5
+"""
+
+
+@pytest.fixture
+def tmp_package(tmp_path: Path):
+    """Creates an importable package 'cf_test_pkg' with modules 'solver' & 'utils' and cleans up afterwards."""
+
+    # prepare
+    pkg_dir = tmp_path / "cf_test_pkg"
+    pkg_dir.mkdir()
+    (pkg_dir / "__init__.py").write_text("")
+    (pkg_dir / "solver.py").write_text(_SOLVER_SOURCE)
+    (pkg_dir / "utils.py").write_text(_UTILS_SOURCE)
+    sys.path.insert(0, str(tmp_path))
+
+    # yield
+    yield pkg_dir
+
+    # cleanup
+    uninstrument_modules()
+    sys.path.remove(str(tmp_path))
+    for name in [name for name in sys.modules if name.startswith("cf_test_pkg")]:
+        del sys.modules[name]
+    importlib.invalidate_caches()
+
+
+def _fresh_import(name: str):
+    sys.modules.pop(name, None)
+    return importlib.import_module(name)
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+def test_instrument_modules_counts_plain_floats(tmp_package: Path):
+    # --- arrange ---
+    instrument_modules(["cf_test_pkg.solver"])
+    solver = _fresh_import("cf_test_pkg.solver")
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        result = solver.distance([1.0, 2.0, 3.0], [0.5, 0.5, 0.5])
+
+    # --- assert ---
+    assert isinstance(result, CountedFloat)
+    assert ctx.flop_counts() == FlopCounts(SUB=3, MUL=3, ADD=3, POW=1)
+
+
+def test_instrument_modules_literals_and_ints(tmp_package: Path):
+    # --- arrange ---
+    instrument_modules(["cf_test_pkg.solver"])
+    solver = _fresh_import("cf_test_pkg.solver")
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        lit = solver.literal()
+        scaled = solver.scaled(2.0)
+        classified = solver.classify(3.0)
+        matched = solver.match_literal(1.5)
+
+    # --- assert ---
+    assert isinstance(lit, CountedFloat) and (lit == 2.5)
+    assert scaled == -3.0
+    assert classified == -3.0
+    assert matched == "one and a half"
+    assert ctx.flop_counts() == FlopCounts(MUL=1, CMP_ZERO=1, MINUS=1)
+
+
+def test_instrument_modules_augmented_assignment_in_place(tmp_package: Path):
+    # --- arrange ---
+    instrument_modules(["cf_test_pkg.solver"])
+    solver = _fresh_import("cf_test_pkg.solver")
+    arr = np.zeros(3)
+    lst = [1.0]
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        arr_result = solver.accumulate(arr, np.ones(3))
+        lst_result = solver.accumulate(lst, [2.0])
+        s = solver.accumulate(1.0, 2.0)
+
+    # --- assert ---
+    assert arr_result is arr
+    assert list(arr) == [1.0, 1.0, 1.0]  # caller's array updated in place
+    assert lst_result is lst
+    assert lst == [1.0, 2.0]  # caller's list extended in place
+    assert isinstance(s, CountedFloat) and (s == 3.0)
+    assert ctx.flop_counts() == FlopCounts(ADD=1)
+
+
+def test_instrument_modules_augmented_assignment_item(tmp_package: Path):
+    # --- arrange ---
+    instrument_modules(["cf_test_pkg.solver"])
+    solver = _fresh_import("cf_test_pkg.solver")
+    arr = np.zeros(3)
+    lst = [1.0, 2.0]
+    indices = [0, 2]
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        arr_result = solver.accumulate_item(arr, indices, 1.5)
+        lst_result = solver.accumulate_item(lst, [1], 0.5)
+        scaled = solver.scale_slice(lst, 2)
+
+    # --- assert ---
+    assert arr_result is arr
+    assert list(arr) == [0.0, 0.0, 1.5]
+    assert indices == [0]
+    assert lst_result is lst
+    assert scaled is lst
+    assert lst == [1.0, 2.5, 2.5]  # list slice repeated in place, not multiplied
+    assert ctx.flop_counts() == FlopCounts(ADD=2)
+
+
+def test_instrument_modules_augmented_assignment_attribute(tmp_package: Path):
+    # --- arrange ---
+    instrument_modules(["cf_test_pkg.solver"])
+    solver = _fresh_import("cf_test_pkg.solver")
+    acc = solver.Accumulator()
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        result = acc.add(1.5).add(2.5)
+
+    # --- assert ---
+    assert result is acc
+    assert isinstance(acc.total, CountedFloat) and (acc.total == 4.0)
+    assert ctx.flop_counts() == FlopCounts(ADD=2)
+
+
+def test_non_selected_modules_untouched(tmp_package: Path):
+    # --- arrange ---
+    instrument_modules(["cf_test_pkg.solver"])
+    utils = _fresh_import("cf_test_pkg.utils")
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        result = utils.distance([1.0, 2.0, 3.0], [0.5, 0.5, 0.5])
+
+    # --- assert ---
+    assert type(result) is float
+    assert ctx.flop_counts().total_count() == 0
+
+
+def test_instrument_package_includes_submodules(tmp_package: Path):
+    # --- arrange ---
+    instrument_modules(["cf_test_pkg"])
+    utils = _fresh_import("cf_test_pkg.utils")
+
+    # --- act ---
+    result = utils.distance([1.0], [0.5])
+
+    # --- assert ---
+    assert isinstance(result, CountedFloat)
+    assert get_instrumented_modules() == ["cf_test_pkg"]
+
+
+def test_bytecode_cache(tmp_package: Path, monkeypatch):
+    # --- arrange ---
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    instrument_modules(["cf_test_pkg.solver"])
+    _fresh_import("cf_test_pkg.solver")
+    cache_path = Path(_import_hook._cache_path(str(tmp_package / "solver.py")))
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("source should not be rewritten again")
+
+    # --- act ---
+    monkeypatch.setattr(_import_hook, "instrument_source", _fail)
+    solver = _fresh_import("cf_test_pkg.solver")
+
+    # --- assert ---
+    assert cache_path.exists()
+    assert ".opt-counted." in cache_path.name
+    assert isinstance(solver.literal(), CountedFloat)
+
+
+def test_bytecode_cache_invalidated_by_source_change(tmp_package: Path, monkeypatch):
+    # --- arrange ---
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    instrument_modules(["cf_test_pkg.solver"])
+    _fresh_import("cf_test_pkg.solver")
+
+    # --- act ---
+    (tmp_package / "solver.py").write_text(_SOLVER_SOURCE.replace("2.5", "3.5"))
+    solver = _fresh_import("cf_test_pkg.solver")
+
+    # --- assert ---
+    assert solver.literal() == 3.5
+
+
+def test_uninstrument_modules(tmp_package: Path):
+    # --- arrange ---
+    instrument_modules(["cf_test_pkg.solver"])
+
+    # --- act ---
+    uninstrument_modules(["cf_test_pkg.solver"])
+    solver = _fresh_import("cf_test_pkg.solver")
+
+    # --- assert ---
+    assert type(solver.literal()) is float
+    assert get_instrumented_modules() == []
+    assert _import_hook._FINDER not in sys.meta_path
+
+
+def test_instrument_already_imported_module_warns(tmp_package: Path):
+    # --- arrange ---
+    importlib.import_module("cf_test_pkg.utils")
+
+    # --- act & assert ---
+    with pytest.warns(UserWarning, match="already imported"):
+        instrument_modules(["cf_test_pkg.utils"])
+
+
+@pytest.mark.parametrize(
+    "source, expected_counts",
+    [
+        ("y = x + 1.0", FlopCounts(ADD=1)),
+        ("y = x * x - x / 2", FlopCounts(MUL=1, SUB=1, DIV=1)),
+        ("y = x\ny -= 1", FlopCounts(SUB=1)),
+        ("y = 1 < x < 3", FlopCounts()),  # chained comparison, not instrumented
+        ("y = x >= 1", FlopCounts(GTE=1)),
+        ("y = -x", FlopCounts(MINUS=1)),
+        ("y = -2.0", FlopCounts()),
+        ("y = 3 + 4", FlopCounts()),
+    ],
+)
+def test_instrument_source(source: str, expected_counts: FlopCounts):
+    # --- arrange ---
+    code = instrument_source(source)
+    namespace = {"x": 2.0}
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        exec(code, namespace)
+
+    # --- assert ---
+    assert ctx.flop_counts() == expected_counts
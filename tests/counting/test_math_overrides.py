@@ -0,0 +1,169 @@
+import cmath
+import math
+import timeit
+
+import pytest
+
+from counted_float._core.counting._context_managers import FlopCountingContext
+from counted_float._core.counting._counted_complex import CountedComplex
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._math_overrides import (
+    math_modules_patched,
+    math_pow,
+    math_sqrt,
+    original_cmath_polar,
+    original_cmath_sqrt,
+    original_math_log2,
+    original_math_pow,
+    original_math_sqrt,
+)
+from counted_float._core.counting.models import ComplexOpType, FlopCounts
+
+
+# =================================================================================================
+#  Scoped patching
+# =================================================================================================
+def test_math_modules_not_patched_outside_context():
+    # --- assert ------------------------------------------
+    assert not math_modules_patched()
+    assert math.sqrt is original_math_sqrt
+    assert math.log2 is original_math_log2
+    assert math.pow is original_math_pow
+    assert cmath.sqrt is original_cmath_sqrt
+    assert cmath.polar is original_cmath_polar
+
+
+def test_math_modules_patched_inside_context():
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc:
+        patched_while = math_modules_patched()
+        result = math.sqrt(CountedFloat(4.0))
+        _ = cmath.sqrt(CountedComplex(-4.0))
+    patched_after = math_modules_patched()
+
+    # --- assert ------------------------------------------
+    assert patched_while
+    assert not patched_after
+    assert isinstance(result, CountedFloat) and result == 2.0
+    assert fcc.flop_counts() == FlopCounts(SQRT=1) + ComplexOpType.SQRT.flop_counts()
+    assert math.sqrt is original_math_sqrt
+
+
+def test_math_modules_patching_nested_and_paused():
+    # --- arrange -----------------------------------------
+    fcc_outer = FlopCountingContext()
+    fcc_inner = FlopCountingContext()
+
+    # --- act ---------------------------------------------
+    with fcc_outer:
+        with fcc_inner:
+            patched_inner = math_modules_patched()
+        patched_outer = math_modules_patched()
+        fcc_outer.pause()
+        patched_paused = math_modules_patched()
+        fcc_outer.resume()
+        patched_resumed = math_modules_patched()
+    patched_after = math_modules_patched()
+
+    # --- assert ------------------------------------------
+    assert patched_inner
+    assert patched_outer
+    assert not patched_paused
+    assert patched_resumed
+    assert not patched_after
+
+
+def test_math_modules_patching_restored_after_exception():
+    # --- act ---------------------------------------------
+    with pytest.raises(ZeroDivisionError):
+        with FlopCountingContext():
+            _ = 1 / 0
+
+    # --- assert ------------------------------------------
+    assert math.sqrt is original_math_sqrt
+
+
+def test_math_modules_patching_opt_out():
+    # --- act ---------------------------------------------
+    with FlopCountingContext(patch_math=False) as fcc:
+        patched = math_modules_patched()
+        result = math.sqrt(CountedFloat(4.0))
+
+    # --- assert ------------------------------------------
+    assert not patched
+    assert not isinstance(result, CountedFloat)
+    assert fcc.flop_counts().total_count() == 0
+
+
+# =================================================================================================
+#  counted_float.math & counted_float.cmath namespaces
+# =================================================================================================
+def test_counted_math_namespace(global_counter):
+    # --- arrange -----------------------------------------
+    from counted_float import math as counted_math
+
+    # --- act ---------------------------------------------
+    result_sqrt = counted_math.sqrt(CountedFloat(4.0))
+    result_log2 = counted_math.log2(CountedFloat(8.0))
+    result_floor = counted_math.floor(2.5)  # pass-through to the math module
+    flop_counts = global_counter.flop_counts()
+
+    # --- assert ------------------------------------------
+    assert isinstance(result_sqrt, CountedFloat) and result_sqrt == 2.0
+    assert isinstance(result_log2, CountedFloat) and result_log2 == 3.0
+    assert result_floor == 2
+    assert counted_math.pi == math.pi
+    assert flop_counts == FlopCounts(SQRT=1, LOG2=1)
+
+
+def test_counted_cmath_namespace(global_counter):
+    # --- arrange -----------------------------------------
+    from counted_float import cmath as counted_cmath
+
+    # --- act ---------------------------------------------
+    result_sqrt = counted_cmath.sqrt(CountedComplex(-4.0))
+    result_phase = counted_cmath.phase(1j)  # pass-through to the cmath module
+    flop_counts = global_counter.flop_counts()
+
+    # --- assert ------------------------------------------
+    assert isinstance(result_sqrt, CountedComplex) and result_sqrt == 2j
+    assert result_phase == cmath.phase(1j)
+    assert flop_counts == ComplexOpType.SQRT.flop_counts()
+
+
+def test_from_import_is_counted(global_counter):
+    # --- arrange -----------------------------------------
+    from counted_float.math import sqrt
+
+    # --- act ---------------------------------------------
+    _ = sqrt(CountedFloat(2.0))
+
+    # --- assert ------------------------------------------
+    assert global_counter.flop_counts().SQRT == 1
+
+
+@pytest.mark.parametrize("x, y", [(2.0, 3.0), (2, 3), (4.0, 0.5)])
+def test_math_pow_uncounted_types_unaffected(x, y):
+    # --- act ---------------------------------------------
+    result = math_pow(x, y)
+
+    # --- assert ------------------------------------------
+    assert type(result) is float
+    assert result == original_math_pow(x, y)
+
+
+# =================================================================================================
+#  Overhead
+# =================================================================================================
+def test_math_uncounted_code_zero_overhead():
+    """Outside of any context, math.sqrt is the C builtin, so uncounted code should not be slowed down at all."""
+
+    # --- act ---------------------------------------------
+    t_builtin = min(timeit.repeat("sqrt(2.0)", globals=dict(sqrt=original_math_sqrt), number=10_000, repeat=5))
+    t_math = min(timeit.repeat("math.sqrt(2.0)", globals=dict(math=math), number=10_000, repeat=5))
+    t_wrapped = min(timeit.repeat("sqrt(2.0)", globals=dict(sqrt=math_sqrt), number=10_000, repeat=5))
+
+    # --- assert ------------------------------------------
+    assert math.sqrt is original_math_sqrt
+    assert t_math < t_wrapped  # attribute lookup is cheaper than a Python-level isinstance-checking wrapper
+    assert t_builtin < t_wrapped
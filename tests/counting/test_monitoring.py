@@ -0,0 +1,244 @@
+import math
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from counted_float._core.counting._budget import FlopBudgetExceeded
+from counted_float._core.counting._context_managers import FlopCountingContext
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._global_counter import GLOBAL_COUNTER
+from counted_float._core.counting._monitoring import PlainFloatCounting, _analyze_code
+from counted_float._core.counting.models import FlopCounts, FlopType
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 12), reason="sys.monitoring requires Python 3.12+")
+
+
+# =================================================================================================
+#  Helpers
+# =================================================================================================
+class _Point:
+    def __init__(self, x: float):
+        self.x = x
+
+
+def _distance(xs, ys):
+    s = 0.0
+    for i in range(len(xs)):
+        d = xs[i] - ys[i]
+        s += d * d
+    return math.sqrt(s)
+
+
+def _mixed(a, b, n, p):
+    k = 0
+    for i in range(n):
+        k += i * 2  # int ops, not counted
+    c = -a if a > 0 else a
+    return c / b + p.x**2 + 2**a + math.pow(a, b) + abs(b) + math.log2(4.0) + round(a)
+
+
+def _outer(a):
+    def inner(b):
+        return b * b
+
+    return inner(a) + sum([v * a for v in (1.0, 2.0)])
+
+
+# =================================================================================================
+#  Static analysis
+# =================================================================================================
+def test_analyze_code_operands():
+    # --- act ---------------------------------------------
+    sites = _analyze_code(_distance.__code__)
+    binary_sites = [site for site in sites.values() if site.kind == "binary"]
+
+    # --- assert ------------------------------------------
+    assert {site.flop_type for site in binary_sites} == {FlopType.SUB, FlopType.MUL, FlopType.ADD}
+    sub_site = next(site for site in binary_sites if site.flop_type == FlopType.SUB)
+    assert sub_site.operands == (
+        ("subscr", ("local", "xs"), ("local", "i")),
+        ("subscr", ("local", "ys"), ("local", "i")),
+    )
+
+
+# =================================================================================================
+#  Counting
+# =================================================================================================
+def test_plain_float_counting_matches_counted_float():
+    # --- arrange -----------------------------------------
+    xs = [0.1 * i for i in range(10)]
+    ys = [0.3 * i for i in range(10)]
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc_counted:
+        _distance([CountedFloat(x) for x in xs], [CountedFloat(y) for y in ys])
+    with FlopCountingContext() as fcc_plain, PlainFloatCounting([_distance]):
+        result = _distance(xs, ys)
+
+    # --- assert ------------------------------------------
+    assert type(result) is float
+    assert fcc_plain.flop_counts() == fcc_counted.flop_counts() == FlopCounts(SUB=10, MUL=10, ADD=10, SQRT=1)
+
+
+def test_plain_float_counting_flop_types():
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc, PlainFloatCounting([_mixed]):
+        _mixed(1.5, 2.5, 3, _Point(0.5))
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(
+        CMP_ZERO=1,  # a > 0
+        MINUS=1,  # -a
+        DIV=1,  # c / b
+        MUL=1,  # p.x**2
+        POW2=1,  # 2**a
+        POW=1,  # math.pow(a, b)
+        ABS=1,  # abs(b)
+        LOG2=1,  # math.log2(4.0)
+        RND=1,  # round(a)
+        ADD=6,
+    )
+
+
+def test_plain_float_counting_nested_code():
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc, PlainFloatCounting([_outer]):
+        _outer(3.0)
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(MUL=3)  # inner(a) + sum(...): results of calls are not resolved
+
+
+def test_plain_float_counting_numpy_elements():
+    # --- arrange -----------------------------------------
+    xs = np.array([1.0, 2.0, 3.0])
+    ys = np.array([0.0, 0.0, 0.0])
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc, PlainFloatCounting([_distance]):
+        _distance(xs, ys)
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(SUB=3, MUL=3, ADD=3, SQRT=1)
+
+
+def test_plain_float_counting_module():
+    # --- arrange -----------------------------------------
+    module = types.ModuleType("my_module")
+    exec("def f(x):\n    return x * x + 1.0\n\nclass C:\n    def g(self, x):\n        return x / 2.0\n", vars(module))
+
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc, PlainFloatCounting([module]):
+        module.f(3.0)
+        module.C().g(3.0)
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(MUL=1, ADD=1, DIV=1)
+
+
+def test_plain_float_counting_no_double_counting():
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc, PlainFloatCounting([_distance]):
+        _distance([CountedFloat(1.0)], [0.5])
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(SUB=1, MUL=1, ADD=1, SQRT=1)
+
+
+def test_plain_float_counting_scoped():
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc:
+        _distance([1.0], [0.5])  # before: not counted
+        with PlainFloatCounting([_distance]):
+            _outer(1.0)  # not selected: not counted
+            _distance([1.0], [0.5])
+        _distance([1.0], [0.5])  # after: not counted
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(SUB=1, MUL=1, ADD=1, SQRT=1)
+
+
+def test_plain_float_counting_repeated_sessions():
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc:
+        for _ in range(2):
+            with PlainFloatCounting([_distance]):
+                _distance([1.0], [0.5])
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(SUB=2, MUL=2, ADD=2, SQRT=2)
+
+
+def test_plain_float_counting_keeps_events_of_other_tools_disabled():
+    # --- arrange -----------------------------------------
+    monitoring = sys.monitoring
+    tool_id = next(i for i in range(6) if monitoring.get_tool(i) is None)
+    offsets = []
+
+    def on_instruction(code, offset):
+        offsets.append(offset)
+        return monitoring.DISABLE
+
+    monitoring.use_tool_id(tool_id, "other_tool")
+    try:
+        monitoring.register_callback(tool_id, monitoring.events.INSTRUCTION, on_instruction)
+        monitoring.set_local_events(tool_id, _mixed.__code__, monitoring.events.INSTRUCTION)
+        _mixed(1.0, 2.0, 1, _Point(3.0))
+        n_offsets = len(offsets)
+
+        # --- act -----------------------------------------
+        with PlainFloatCounting([_distance]):
+            _distance([1.0], [0.5])
+        _mixed(1.0, 2.0, 1, _Point(3.0))
+
+    finally:
+        monitoring.set_local_events(tool_id, _mixed.__code__, monitoring.events.NO_EVENTS)
+        monitoring.register_callback(tool_id, monitoring.events.INSTRUCTION, None)
+        monitoring.free_tool_id(tool_id)
+
+    # --- assert ------------------------------------------
+    assert n_offsets > 0
+    assert len(offsets) == n_offsets  # not re-enabled by PlainFloatCounting
+
+
+def _sum_of_squares(n: int) -> float:
+    s = 0.0
+    for i in range(n):
+        s += float(i) * 0.5
+    return s
+
+
+def test_plain_float_counting_budget():
+    # --- arrange -----------------------------------------
+    with PlainFloatCounting([_sum_of_squares]):
+        _sum_of_squares(1)  # handlers are compiled & cached while no budget is active
+
+    # --- act ---------------------------------------------
+    with pytest.raises(FlopBudgetExceeded) as exc_info:
+        with FlopCountingContext(budget=100) as ctx, PlainFloatCounting([_sum_of_squares]):
+            _sum_of_squares(1000)
+
+    with FlopCountingContext() as ctx_after, PlainFloatCounting([_sum_of_squares]):
+        _sum_of_squares(1000)
+
+    # --- assert ------------------------------------------
+    assert exc_info.value.context is ctx
+    assert exc_info.value.usage == 101  # cut off at the first flop exceeding the budget
+    assert ctx_after.flop_counts() == FlopCounts(MUL=1000, ADD=1000)
+    assert "incr_add" not in vars(GLOBAL_COUNTER)  # budget-checking methods are uninstalled again
+
+
+def test_plain_float_counting_single_active():
+    # --- act / assert ------------------------------------
+    with PlainFloatCounting([_distance]):
+        with pytest.raises(RuntimeError):
+            with PlainFloatCounting([_outer]):
+                pass
+
+
+def test_plain_float_counting_invalid_target():
+    # --- act / assert ------------------------------------
+    with pytest.raises(TypeError):
+        PlainFloatCounting([42])
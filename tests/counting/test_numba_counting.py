@@ -0,0 +1,201 @@
+import math
+
+import numpy as np
+import pytest
+
+from counted_float._core.compatibility import is_numba_installed
+from counted_float._core.counting._context_managers import FlopCountingContext, PauseFlopCounting
+from counted_float._core.counting._math_overrides import math_modules_patched, unpatched_math_modules
+from counted_float._core.counting._numba_counting import _COUNTS_SHAPE, CountedNjitFunction, counted_njit
+from counted_float._core.counting.models import FlopCounts, Precision
+
+requires_numba = pytest.mark.skipif(not is_numba_installed(), reason="numba not installed")
+
+
+# =================================================================================================
+#  Functions under test
+# =================================================================================================
+@counted_njit
+def _square(x):
+    return x * x
+
+
+@counted_njit
+def _distance(xs, ys):
+    s = 0.0
+    for i in range(len(xs)):
+        d = xs[i] - ys[i]
+        s += d**2
+        if d < 0:
+            s -= _square(d)
+    return math.sqrt(s)
+
+
+@counted_njit(fastmath=False)
+def _arrays(a, b):
+    c = a * b + 1.0
+    c[0] += 2.0
+    return -c
+
+
+@counted_njit
+def _accumulate(out, x):
+    out += x
+    out *= 2.0
+
+
+@counted_njit
+def _int_only(n):
+    k = 0
+    for i in range(n):
+        k += i * 2
+    return k
+
+
+@counted_njit
+def _mixed_precision(x32, y64):
+    return x32 * x32, x32 * y64, abs(x32) + 2**y64
+
+
+# =================================================================================================
+#  Tests
+# =================================================================================================
+@requires_numba
+def test_counted_njit_scalars():
+    # --- arrange ---
+    xs, ys = np.arange(5.0), np.full(5, 2.0)
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        result = _distance(xs, ys)
+
+    # --- assert ---
+    assert result == pytest.approx(math.sqrt(10 - 5))
+    assert ctx.flop_counts() == FlopCounts(SUB=5 + 2, MUL=5 + 2, ADD=5, CMP_ZERO=5, SQRT=1)
+
+
+@requires_numba
+def test_counted_njit_arrays():
+    # --- arrange ---
+    a, b = np.arange(4.0), np.full(4, 2.0)
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        result = _arrays(a, b)
+
+    # --- assert ---
+    np.testing.assert_array_equal(result, [-3.0, -3.0, -5.0, -7.0])
+    assert ctx.flop_counts() == FlopCounts(MUL=4, ADD=4 + 1, MINUS=4)
+
+
+@requires_numba
+def test_counted_njit_augmented_assignment_in_place():
+    # --- arrange ---
+    a = np.zeros(3)
+
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        _accumulate(a, np.ones(3))
+
+    # --- assert ---
+    np.testing.assert_array_equal(a, [2.0, 2.0, 2.0])  # caller's array updated in place
+    assert ctx.flop_counts() == FlopCounts(ADD=3, MUL=3)
+
+
+def test_counted_njit_augmented_assignment_in_place_python_fallback():
+    # --- arrange ---
+    instrumented = _accumulate._instrument()
+    counts = np.zeros(_COUNTS_SHAPE, dtype=np.int64)
+    a = np.zeros(3)
+
+    # --- act ---
+    instrumented(counts, a, np.ones(3))
+
+    # --- assert ---
+    np.testing.assert_array_equal(a, [2.0, 2.0, 2.0])
+    assert counts.sum() == 6
+
+
+@requires_numba
+def test_counted_njit_ints_not_counted():
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        result = _int_only(10)
+
+    # --- assert ---
+    assert result == 90
+    assert ctx.flop_counts().total_count() == 0
+
+
+@requires_numba
+def test_counted_njit_precision():
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        _mixed_precision(np.float32(1.5), 2.0)
+
+    # --- assert ---
+    assert ctx.flop_counts(Precision.FP32) == FlopCounts(MUL=1, ABS=1)
+    assert ctx.flop_counts(Precision.FP64) == FlopCounts(MUL=1, ADD=1, POW2=1)
+
+
+@requires_numba
+def test_counted_njit_paused():
+    # --- act ---
+    with FlopCountingContext() as ctx:
+        with PauseFlopCounting():
+            _square(3.0)
+
+    # --- assert ---
+    assert ctx.flop_counts().total_count() == 0
+
+
+def test_counted_njit_python_fallback():
+    # --- arrange ---
+    instrumented = _distance._instrument()  # plain python function, as executed when numba is not installed
+    counts = np.zeros(_COUNTS_SHAPE, dtype=np.int64)
+
+    # --- act ---
+    with unpatched_math_modules():
+        result = instrumented(counts, np.arange(5.0), np.full(5, 2.0))
+
+    # --- assert ---
+    assert result == pytest.approx(math.sqrt(5))
+    assert counts.sum() == 5 + 5 + 5 + 5 + 1 + 2 + 2  # SUB, MUL, ADD, CMP_ZERO, SQRT + _square & -=
+
+
+def test_counted_njit_decorator():
+    # --- act ---
+    square = _square
+
+    # --- assert ---
+    assert isinstance(square, CountedNjitFunction)
+    assert square.__name__ == "_square"
+
+
+def test_counted_njit_closure_not_supported():
+    # --- arrange ---
+    factor = 2.0
+
+    def scale(x):
+        return factor * x
+
+    # --- act & assert ---
+    with pytest.raises(TypeError):
+        counted_njit(scale)
+
+
+def test_unpatched_math_modules():
+    # --- act ---
+    with FlopCountingContext():
+        patched_before = math_modules_patched() and (math.sqrt is not _math_sqrt_builtin)
+        with unpatched_math_modules():
+            unpatched = math.sqrt is _math_sqrt_builtin
+        patched_after = math.sqrt is not _math_sqrt_builtin
+
+    # --- assert ---
+    assert patched_before
+    assert unpatched
+    assert patched_after
+
+
+_math_sqrt_builtin = math.sqrt
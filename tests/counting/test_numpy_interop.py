@@ -0,0 +1,169 @@
+import operator
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from counted_float._core.counting._counted_complex import CountedComplex
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_float32 import CountedFloat32
+from counted_float._core.counting._counted_int import CountedInt
+from counted_float._core.counting.models import FlopCounts, FlopType
+
+_OPERATORS: dict[Callable, FlopType] = {
+    operator.add: FlopType.ADD,
+    operator.sub: FlopType.SUB,
+    operator.mul: FlopType.MUL,
+    operator.truediv: FlopType.DIV,
+    operator.pow: FlopType.POW,
+    operator.eq: FlopType.EQUALS,
+    operator.ne: FlopType.EQUALS,
+    operator.lt: FlopType.LTE,
+    operator.le: FlopType.LTE,
+    operator.gt: FlopType.GTE,
+    operator.ge: FlopType.GTE,
+}
+
+_COMPARISONS = {operator.eq, operator.ne, operator.lt, operator.le, operator.gt, operator.ge}
+
+
+# =================================================================================================
+#  Mixed numpy scalar & counted type arithmetic - test matrix
+# =================================================================================================
+@pytest.mark.parametrize("op", list(_OPERATORS.keys()), ids=lambda op: op.__name__)
+@pytest.mark.parametrize("counted_left", [True, False])
+@pytest.mark.parametrize(
+    "np_type, counted_type, expected_type, fp32",
+    [
+        (np.float64, CountedFloat, CountedFloat, False),
+        (np.float32, CountedFloat, CountedFloat, False),
+        (np.float64, CountedFloat32, CountedFloat, False),
+        (np.float32, CountedFloat32, CountedFloat32, True),
+    ],
+)
+def test_numpy_scalar_interop(
+    op: Callable,
+    counted_left: bool,
+    np_type: type,
+    counted_type: type,
+    expected_type: type,
+    fp32: bool,
+    global_counter,
+    global_counter_fp32,
+):
+    # --- arrange -----------------------------------------
+    x_counted = counted_type(3.0)
+    x_np = np_type(2.0)
+    flop_type = _OPERATORS[op]
+
+    # --- act ---------------------------------------------
+    if counted_left:
+        result = op(x_counted, x_np)
+        expected_value = op(3.0, 2.0)
+    else:
+        result = op(x_np, x_counted)
+        expected_value = op(2.0, 3.0)
+    counter, other_counter = (global_counter_fp32, global_counter) if fp32 else (global_counter, global_counter_fp32)
+    flop_counts, other_flop_counts = counter.flop_counts(), other_counter.flop_counts()
+
+    # --- assert ------------------------------------------
+    if op in _COMPARISONS:
+        assert isinstance(result, bool)
+        assert result == expected_value
+    else:
+        assert isinstance(result, expected_type)
+        assert result == pytest.approx(expected_value)
+
+    if flop_type in (FlopType.LTE, FlopType.GTE):
+        # mirrored comparisons (x<y <-> y>x) can be counted as either LTE or GTE, depending on dispatching
+        assert flop_counts.LTE + flop_counts.GTE == flop_counts.total_count() == 1
+    else:
+        assert flop_counts == FlopCounts(**{flop_type.name: 1})
+    assert other_flop_counts.total_count() == 0
+
+
+# =================================================================================================
+#  Other numpy scalar types & functions
+# =================================================================================================
+@pytest.mark.parametrize(
+    "op", [operator.add, operator.mul, operator.floordiv, operator.lshift, operator.and_], ids=lambda op: op.__name__
+)
+def test_numpy_int_interop(op: Callable, global_counter):
+    # --- act ---------------------------------------------
+    result_left = op(CountedInt(7), np.int64(2))
+    result_right = op(np.int64(7), CountedInt(2))
+    int_op_counts = global_counter.int_op_counts()
+
+    # --- assert ------------------------------------------
+    assert isinstance(result_left, CountedInt) and int(result_left) == op(7, 2)
+    assert isinstance(result_right, CountedInt) and int(result_right) == op(7, 2)
+    assert int_op_counts.total_count() == 2
+
+
+def test_numpy_complex_interop(global_counter):
+    # --- act ---------------------------------------------
+    result_left = CountedFloat(2.0) * np.complex128(1 + 1j)
+    result_right = np.complex128(1 + 1j) * CountedFloat(2.0)
+
+    # --- assert ------------------------------------------
+    assert isinstance(result_left, CountedComplex) and result_left == 2 + 2j
+    assert isinstance(result_right, CountedComplex) and result_right == 2 + 2j
+
+
+def test_numpy_array_elements(global_counter):
+    # --- arrange -----------------------------------------
+    arr = np.array([1.0, 2.0, 3.0])
+    w = CountedFloat(2.0)
+
+    # --- act ---------------------------------------------
+    total = CountedFloat(0.0)
+    for i in range(len(arr)):
+        total = arr[i] * w + total
+    flop_counts = global_counter.flop_counts()
+
+    # --- assert ------------------------------------------
+    assert isinstance(total, CountedFloat)
+    assert total == 12.0
+    assert flop_counts == FlopCounts(MUL=3, ADD=3)
+
+
+def test_numpy_ufuncs_on_counted_scalars(global_counter):
+    # --- act ---------------------------------------------
+    result_sqrt = np.sqrt(CountedFloat(4.0))
+    result_log2 = np.log2(CountedFloat(8.0))
+    result_neg = np.negative(CountedFloat(1.0))
+    flop_counts = global_counter.flop_counts()
+
+    # --- assert ------------------------------------------
+    assert isinstance(result_sqrt, CountedFloat) and result_sqrt == 2.0
+    assert isinstance(result_log2, CountedFloat) and result_log2 == 3.0
+    assert isinstance(result_neg, CountedFloat) and result_neg == -1.0
+    assert flop_counts == FlopCounts(SQRT=1, LOG2=1, MINUS=1)
+
+
+def test_numpy_arrays_unaffected(global_counter):
+    # --- arrange -----------------------------------------
+    arr = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+
+    # --- act ---------------------------------------------
+    result_left = CountedFloat(2.0) * arr
+    result_right = arr * CountedFloat(2.0)
+    flop_counts = global_counter.flop_counts()
+
+    # --- assert ------------------------------------------
+    assert isinstance(result_left, np.ndarray) and result_left.dtype == np.float32
+    assert isinstance(result_right, np.ndarray) and result_right.dtype == np.float32
+    assert list(result_left) == [2.0, 4.0, 6.0]
+    assert flop_counts.total_count() == 0
+
+
+def test_numpy_scalar_domain_errors():
+    # --- act ---------------------------------------------
+    with pytest.warns(RuntimeWarning):
+        result_div = np.float64(1.0) / CountedFloat(0.0)
+    with pytest.warns(RuntimeWarning):
+        result_sqrt = np.sqrt(CountedFloat(-1.0))
+
+    # --- assert ------------------------------------------
+    assert result_div == np.inf
+    assert np.isnan(result_sqrt)
@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+import pytest
+
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_float32 import CountedFloat32
+from counted_float._core.counting._recorder import CostRecorder
+from counted_float._core.counting._register_flops import register_flops
+from counted_float._core.counting.models import FlopCounts, FlopType, FlopWeights, Precision
+
+_UNIT_WEIGHTS = FlopWeights(weights={flop_type: 1 for flop_type in FlopType})
+
+
+def _newton_sqrt_2(recorder: CostRecorder, n_steps: int):
+    x = CountedFloat(1.0)
+    for _ in range(n_steps):
+        x = (x + 2 / x) / 2  # ADD, DIV, DIV
+        recorder.step(metric=abs(float(x) ** 2 - 2))
+
+
+def test_cost_recorder_steps():
+    # --- act ---------------------------------------------
+    with CostRecorder(max_steps=2, weights=_UNIT_WEIGHTS) as recorder:  # small buffer, to test growing
+        _newton_sqrt_2(recorder, n_steps=6)
+
+    # --- assert ------------------------------------------
+    assert recorder.n_steps == 6
+    assert recorder.step_counts(0) == FlopCounts(ADD=1, DIV=2)
+    assert recorder.step_counts_matrix().shape == (6, len(FlopType))
+    assert list(recorder.step_costs()) == [3] * 6
+    assert list(recorder.cumulative_costs()) == [3, 6, 9, 12, 15, 18]
+    assert recorder.context.flop_counts() == FlopCounts(ADD=6, DIV=12)
+    assert np.all(np.diff(recorder.metrics()[:4]) < 0)
+
+
+def test_cost_recorder_cost_to_converge():
+    # --- act ---------------------------------------------
+    with CostRecorder(weights=_UNIT_WEIGHTS) as recorder:
+        _newton_sqrt_2(recorder, n_steps=6)
+
+    # --- assert ------------------------------------------
+    cumulative_costs, metrics = recorder.cost_curve()
+    assert list(cumulative_costs) == [3, 6, 9, 12, 15, 18]
+    assert recorder.cost_to_converge(1e-10) == 12  # 4 Newton iterations
+    assert math.isnan(recorder.cost_to_converge(-1.0))
+
+
+def test_cost_recorder_precision_and_custom(custom_flop_type):
+    # --- act ---------------------------------------------
+    with CostRecorder(weights=_UNIT_WEIGHTS) as recorder:
+        _ = CountedFloat32(1.0) * CountedFloat32(2.0)
+        recorder.step()
+        register_flops(custom_flop_type, 2)
+        _ = CountedFloat(1.0) + 1.0
+        recorder.step()
+
+    # --- assert ------------------------------------------
+    assert recorder.step_counts(0, Precision.FP32) == FlopCounts(MUL=1)
+    assert recorder.step_counts(1) == FlopCounts(ADD=1)
+    assert list(recorder.step_costs()) == [1, 1 + 2 * 20]
+    assert math.isnan(recorder.metrics()[0])
+
+
+def test_cost_recorder_table():
+    # --- arrange -----------------------------------------
+    with CostRecorder() as recorder:
+        _newton_sqrt_2(recorder, n_steps=3)
+
+    # --- act ---------------------------------------------
+    table = recorder.table()
+
+    # --- assert ------------------------------------------
+    assert len(table) == 3
+    assert list(table.labels("step")) == [0, 1, 2]
+    assert list(table.labels("metric")) == list(recorder.metrics())
+    assert table.sum() == FlopCounts(ADD=3, DIV=6)
+
+
+def test_cost_recorder_inactive():
+    # --- arrange -----------------------------------------
+    recorder = CostRecorder()
+
+    # --- act & assert ------------------------------------
+    with pytest.raises(RuntimeError):
+        recorder.step()
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._regions import flop_region, get_region_tree, reset_region_tree
+from counted_float._core.counting.config import get_flop_weights, set_flop_weights
+from counted_float._core.counting.models import FlopCounts, FlopType, FlopWeights
+
+
+@pytest.fixture(autouse=True)
+def clean_region_tree():
+    weights = get_flop_weights()
+    set_flop_weights(FlopWeights(weights={flop_type: 1 for flop_type in FlopType}))
+    reset_region_tree()
+    yield
+    reset_region_tree()
+    set_flop_weights(weights)
+
+
+def _simulate(n_steps: int):
+    x = CountedFloat(1.0)
+    with flop_region("simulation"):
+        for _ in range(n_steps):
+            with flop_region("assemble"):
+                x = x * 2.0 + 1.0
+            with flop_region("solve"):
+                x = x / 3.0
+        x = x - 1.0
+
+
+def test_flop_region_tree():
+    # --- act ---------------------------------------------
+    _simulate(n_steps=3)
+
+    # --- assert ------------------------------------------
+    tree = get_region_tree()
+    assert list(tree.children) == ["simulation"]
+    simulation = tree.find("simulation")
+    assert simulation.n_calls == 1
+    assert simulation.flop_counts() == FlopCounts(ADD=3, SUB=1, MUL=3, DIV=3)
+    assert simulation.cost == 10
+    assert simulation.exclusive_cost() == 1
+    assemble = tree.find("simulation/assemble")
+    assert assemble.path == "simulation/assemble"
+    assert assemble.n_calls == 3
+    assert assemble.flop_counts() == FlopCounts(ADD=3, MUL=3)
+    assert simulation.wall_time >= assemble.wall_time > 0
+    assert [node.name for _, node in tree.walk()] == ["", "simulation", "assemble", "solve"]
+    with pytest.raises(KeyError):
+        tree.find("simulation/unknown")
+
+
+def test_flop_region_merges_repeated_entries():
+    # --- act ---------------------------------------------
+    _simulate(n_steps=1)
+    _simulate(n_steps=2)
+
+    # --- assert ------------------------------------------
+    tree = get_region_tree()
+    assert tree.find("simulation").n_calls == 2
+    assert tree.find("simulation/solve").n_calls == 3
+    assert tree.find("simulation/solve").cost == 3
+
+
+def test_flop_region_export():
+    # --- arrange -----------------------------------------
+    _simulate(n_steps=2)
+
+    # --- act ---------------------------------------------
+    text = get_region_tree().to_text()
+    data = json.loads(get_region_tree().to_json())
+
+    # --- assert ------------------------------------------
+    assert text.splitlines()[2].startswith("  assemble")
+    simulation = data["children"][0]
+    assert simulation["path"] == "simulation"
+    assert simulation["flop_counts"] == {"ADD": 2, "SUB": 1, "MUL": 2, "DIV": 2}
+    assert [child["name"] for child in simulation["children"]] == ["assemble", "solve"]
+
+
+def test_flop_region_exception_and_invalid_name():
+    # --- act ---------------------------------------------
+    with pytest.raises(ValueError):
+        with flop_region("failing"):
+            _ = CountedFloat(1.0) + 1.0
+            raise ValueError("boom")
+
+    # --- assert ------------------------------------------
+    assert get_region_tree().find("failing").flop_counts() == FlopCounts(ADD=1)
+    with pytest.raises(ValueError):
+        flop_region("a/b")
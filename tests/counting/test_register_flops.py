@@ -0,0 +1,37 @@
+import pytest
+
+from counted_float._core.counting._context_managers import FlopCountingContext, PauseFlopCounting
+from counted_float._core.counting._register_flops import register_flops
+from counted_float._core.counting.models import FlopCounts, FlopType, Precision
+
+
+def test_register_flops_built_in(global_counter, global_counter_fp32):
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc:
+        register_flops(FlopType.SQRT)
+        register_flops(FlopType.ADD, n=5)
+        register_flops(FlopType.MUL, n=2, precision=Precision.FP32)
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(SQRT=1, ADD=5)
+    assert fcc.flop_counts(Precision.FP32) == FlopCounts(MUL=2)
+
+
+def test_register_flops_custom(global_counter, custom_flop_type):
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as fcc:
+        register_flops(custom_flop_type)
+        register_flops("ERF", n=2)
+        with PauseFlopCounting():
+            register_flops("ERF", n=100)
+
+    # --- assert ------------------------------------------
+    assert fcc.flop_counts() == FlopCounts(custom={"ERF": 3})
+    assert fcc.flop_counts().as_dict()[custom_flop_type] == 3
+    assert global_counter.flop_counts() == FlopCounts(custom={"ERF": 3})
+
+
+def test_register_flops_unknown(global_counter):
+    # --- act & assert ------------------------------------
+    with pytest.raises(ValueError):
+        register_flops("UNKNOWN")
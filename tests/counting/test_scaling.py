@@ -0,0 +1,119 @@
+import math
+
+import numpy as np
+import pytest
+
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._scaling import (
+    ScalingModel,
+    _best_fit,
+    analyze_scaling,
+    fit_scaling,
+    geometric_sizes,
+)
+from counted_float._core.counting.models import FlopCounts, FlopType, FlopWeights
+
+
+# =================================================================================================
+#  Functions under test  (module-level, such that they can be pickled for worker processes)
+# =================================================================================================
+def _pairwise_sum(n: int):
+    xs = [CountedFloat(v) for v in range(n)]
+    s = CountedFloat(0.0)
+    for i in range(n):
+        for j in range(n):
+            s += xs[i] * xs[j]
+    return s
+
+
+def _sqrt_each(xs: list[CountedFloat]):
+    return [math.sqrt(x) for x in xs]
+
+
+def _make_inputs(n: int) -> tuple:
+    return ([CountedFloat(v) for v in range(n)],)
+
+
+# =================================================================================================
+#  Fits
+# =================================================================================================
+def test_geometric_sizes():
+    # --- act ---
+    sizes = geometric_sizes(10, 1000, 5)
+
+    # --- assert ---
+    assert sizes == [10, 32, 100, 316, 1000]
+
+
+@pytest.mark.parametrize(
+    "costs_func, expected_model",
+    [
+        (lambda n: 3 * n**2.5, ScalingModel.POWER_LAW),
+        (lambda n: 2 * n * np.log2(n) + 5 * n, ScalingModel.N_LOG_N),
+        (lambda n: 1 + 2 * n + 3 * n**2, ScalingModel.POLYNOMIAL),
+    ],
+)
+def test_fit_scaling_best_fit(costs_func, expected_model: ScalingModel):
+    # --- arrange ---
+    sizes = geometric_sizes(8, 4096, 8)
+    costs = [costs_func(n) for n in sizes]
+
+    # --- act ---
+    fits = fit_scaling(sizes, costs)
+
+    # --- assert ---
+    best_fit = _best_fit(fits)
+    assert best_fit.model == expected_model
+    assert best_fit.r_squared == pytest.approx(1.0)
+    assert best_fit.predict(10_000) == pytest.approx(costs_func(10_000), rel=1e-6)
+
+
+def test_fit_scaling_power_law_exponent():
+    # --- act ---
+    fits = fit_scaling([10, 100, 1000], [7 * n**1.5 for n in [10, 100, 1000]])
+
+    # --- assert ---
+    assert set(fits) == {ScalingModel.POWER_LAW, ScalingModel.POLYNOMIAL}  # too few points for N_LOG_N
+    assert fits[ScalingModel.POWER_LAW].exponent == pytest.approx(1.5)
+    assert fits[ScalingModel.POWER_LAW].coefficients[0] == pytest.approx(7)
+    assert fits[ScalingModel.POLYNOMIAL].exponent is None
+
+
+def test_fit_scaling_zero_costs():
+    # --- act ---
+    fits = fit_scaling([10, 20, 40, 80], [0, 0, 0, 0])
+
+    # --- assert ---
+    assert ScalingModel.POWER_LAW not in fits
+    assert fits[ScalingModel.POLYNOMIAL].max_rel_error == 0.0
+
+
+# =================================================================================================
+#  Scaling analysis
+# =================================================================================================
+def test_analyze_scaling():
+    # --- arrange ---
+    weights = FlopWeights(weights={flop_type: 1 for flop_type in FlopType})
+
+    # --- act ---
+    analysis = analyze_scaling(_pairwise_sum, sizes=[4, 8, 16, 32], weights=weights)
+
+    # --- assert ---
+    assert analysis.flop_counts()[0] == FlopCounts(ADD=16, MUL=16)
+    assert analysis.weighted_costs == [2 * n**2 for n in [4, 8, 16, 32]]
+    assert analysis.flop_types() == [FlopType.ADD, FlopType.MUL]
+    assert analysis.exponent() == pytest.approx(2.0)
+    assert analysis.exponent(FlopType.MUL) == pytest.approx(2.0)
+    assert analysis.best_fit().model == ScalingModel.POWER_LAW
+    assert analysis.extrapolate(1000) == pytest.approx(2_000_000)
+    assert analysis.extrapolate_counts(1000) == FlopCounts(ADD=1_000_000, MUL=1_000_000)
+
+
+def test_analyze_scaling_setup_and_workers():
+    # --- act ---
+    analysis = analyze_scaling(_sqrt_each, sizes=[10, 20, 40, 80], setup=_make_inputs, n_workers=2)
+
+    # --- assert ---
+    assert analysis.costs(FlopType.SQRT) == [10, 20, 40, 80]
+    assert analysis.exponent(FlopType.SQRT) == pytest.approx(1.0)
+    assert analysis.extrapolate(1000, FlopType.SQRT, model=ScalingModel.POLYNOMIAL) == pytest.approx(1000)
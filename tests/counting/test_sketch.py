@@ -0,0 +1,88 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from counted_float._core.counting._sketch import CostSketch
+
+
+def test_cost_sketch_quantiles():
+    # --- arrange -----------------------------------------
+    rng = random.Random(42)
+    values = [rng.lognormvariate(5, 2) for _ in range(20_000)]
+    sketch = CostSketch(relative_accuracy=0.01)
+
+    # --- act ---------------------------------------------
+    for value in values:
+        sketch.add(value)
+
+    # --- assert ------------------------------------------
+    assert sketch.count == 20_000
+    assert sketch.mean == pytest.approx(np.mean(values))
+    assert sketch.min == min(values)
+    assert sketch.max == max(values)
+    for q in [0.0, 0.1, 0.5, 0.9, 0.99, 1.0]:
+        assert sketch.quantile(q) == pytest.approx(np.quantile(values, q, method="lower"), rel=0.02)
+
+
+def test_cost_sketch_zeros_and_empty():
+    # --- arrange -----------------------------------------
+    sketch = CostSketch()
+
+    # --- act ---------------------------------------------
+    p50_empty = sketch.quantile(0.5)
+    sketch.add(0.0, n=3)
+    sketch.add(10.0)
+
+    # --- assert ------------------------------------------
+    assert math.isnan(p50_empty)
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1.0) == 10.0
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+
+
+def test_cost_sketch_merge():
+    # --- arrange -----------------------------------------
+    sketch_1, sketch_2, sketch_all = CostSketch(), CostSketch(), CostSketch()
+    for value in range(1, 1001):
+        (sketch_1 if value % 2 else sketch_2).add(value)
+        sketch_all.add(value)
+
+    # --- act ---------------------------------------------
+    sketch_1.merge(sketch_2)
+
+    # --- assert ------------------------------------------
+    assert sketch_1.count == sketch_all.count
+    assert sketch_1.total == sketch_all.total
+    assert all(sketch_1.quantile(q) == sketch_all.quantile(q) for q in [0.1, 0.5, 0.99])
+    with pytest.raises(ValueError):
+        sketch_1.merge(CostSketch(relative_accuracy=0.05))
+
+
+def test_cost_sketch_constant_memory():
+    # --- arrange -----------------------------------------
+    sketch = CostSketch(max_buckets=100)
+
+    # --- act ---------------------------------------------
+    for k in range(-50, 250):
+        sketch.add(1.1**k)
+
+    # --- assert ------------------------------------------
+    assert len(sketch._buckets) <= 100
+    assert sketch.quantile(0.99) == pytest.approx(1.1 ** (249 - 3), rel=0.02)  # high quantiles remain accurate
+
+
+def test_cost_sketch_histogram():
+    # --- arrange -----------------------------------------
+    sketch = CostSketch()
+    sketch.add(0.0)
+    sketch.add(3.0, n=2)
+    sketch.add(100.0)
+
+    # --- act ---------------------------------------------
+    histogram = sketch.histogram()
+
+    # --- assert ------------------------------------------
+    assert histogram == [(0.0, 0.0, 1), (2.0, 4.0, 2), (64.0, 128.0, 1)]
@@ -0,0 +1,237 @@
+import math
+from fractions import Fraction
+
+import pytest
+
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._static_estimate import (
+    SymbolicCount,
+    _power_sum,
+    estimate_flops,
+)
+from counted_float._core.counting.models import FlopCounts, FlopType
+
+
+# =================================================================================================
+#  Functions under test
+# =================================================================================================
+def _outer_product_sum(a, b, n, m):
+    s = 0.0
+    for i in range(n):
+        for j in range(m):
+            s += a[i] * b[j]
+    return s
+
+
+def _pairwise_distance(a, n):
+    s = 0.0
+    for i in range(n):
+        for j in range(i + 1, n):
+            s += (a[i] - a[j]) ** 2
+    return math.sqrt(s)
+
+
+def _dot(xs, ys):
+    return sum(x * y for x, y in zip(xs, ys))
+
+
+def _branches(xs):
+    c = 0.0
+    for x in xs:
+        if x > 0:
+            c += x
+        else:
+            c -= 2 * x
+    return c
+
+
+def _int_arithmetic(xs, n: int):
+    k = 0
+    for i in range(n):
+        k += i * 2
+        xs[i + 1] = -xs[i] / 3.0
+    return k
+
+
+def _reversed_prefix_sums(a, n):
+    s = 0.0
+    for i in range(n - 1, -1, -1):
+        for j in range(i, -1, -1):
+            s += a[i] * a[j]
+    return s
+
+
+def _strided(a, n, step):
+    s = 0.0
+    for i in range(0, n, step):
+        s += a[i]
+    for i in range(5, 0):
+        s *= a[i]  # empty range
+    return s
+
+
+def _iterate(x):
+    while x > 1.0:
+        x = x / 2
+    return x
+
+
+_WHILE_SYMBOL = f"while_L{_iterate.__code__.co_firstlineno + 1}"
+_RANGE_SYMBOL = f"range_L{_strided.__code__.co_firstlineno + 2}"
+
+
+# =================================================================================================
+#  SymbolicCount
+# =================================================================================================
+def test_symbolic_count_arithmetic():
+    # --- arrange ---
+    n, m = SymbolicCount.symbol("n"), SymbolicCount.symbol("m")
+
+    # --- act ---
+    p = (n + 1) * (m - 1) - n * m
+
+    # --- assert ---
+    assert p == m - n - 1
+    assert p.symbols == {"n", "m"}
+    assert p.evaluate({"n": 3, "m": 5}) == 1
+    assert str(n * m * 2 + n**2) == "2·m·n + n^2"
+
+
+@pytest.mark.parametrize("k", [0, 1, 2, 3, 4])
+def test_power_sum(k: int):
+    # --- arrange ---
+    n = SymbolicCount.symbol("n")
+
+    # --- act ---
+    power_sum = _power_sum(k, n)
+
+    # --- assert ---
+    for n_value in range(6):
+        assert power_sum.evaluate({"n": n_value}) == sum(Fraction(v) ** k for v in range(n_value))
+
+
+# =================================================================================================
+#  estimate_flops
+# =================================================================================================
+def test_estimate_flops_nested_loops():
+    # --- arrange ---
+    n, m = SymbolicCount.symbol("n"), SymbolicCount.symbol("m")
+
+    # --- act ---
+    estimate = estimate_flops(_outer_product_sum)
+
+    # --- assert ---
+    assert estimate.counts == {FlopType.ADD: n * m, FlopType.MUL: n * m}
+    assert estimate.symbols == ["m", "n"]
+    assert estimate.evaluate(n=1000, m=20) == FlopCounts(ADD=20_000, MUL=20_000)
+
+
+def test_estimate_flops_triangular_loops():
+    # --- arrange ---
+    n = SymbolicCount.symbol("n")
+    n_pairs = (n * n - n) * Fraction(1, 2)
+
+    # --- act ---
+    estimate = estimate_flops(_pairwise_distance)
+
+    # --- assert ---
+    assert estimate.counts == {
+        FlopType.ADD: n_pairs,
+        FlopType.SUB: n_pairs,
+        FlopType.MUL: n_pairs,  # x**2 is counted as MUL
+        FlopType.SQRT: SymbolicCount.constant(1),
+    }
+
+
+@pytest.mark.parametrize(
+    "func, expected",
+    [
+        (_dot, {FlopType.ADD: "len(xs)", FlopType.MUL: "len(xs)"}),
+        (
+            _branches,
+            {FlopType.CMP_ZERO: "len(xs)", FlopType.ADD: "len(xs)", FlopType.SUB: "len(xs)", FlopType.MUL: "len(xs)"},
+        ),
+        (_int_arithmetic, {FlopType.MINUS: "n", FlopType.DIV: "n"}),
+        (_iterate, {FlopType.GTE: _WHILE_SYMBOL, FlopType.DIV: _WHILE_SYMBOL}),
+    ],
+)
+def test_estimate_flops_misc(func, expected: dict[FlopType, str]):
+    # --- act ---
+    estimate = estimate_flops(func)
+
+    # --- assert ---
+    assert {flop_type: str(count) for flop_type, count in estimate.counts.items()} == expected
+
+
+def test_estimate_evaluate_for():
+    # --- arrange ---
+    estimate = estimate_flops(_dot)
+
+    # --- act ---
+    counts = estimate.evaluate_for([1.0] * 7, [2.0] * 7)
+
+    # --- assert ---
+    assert counts == FlopCounts(ADD=7, MUL=7)
+
+
+def test_estimate_evaluate_for_unresolvable_symbol():
+    # --- arrange ---
+    estimate = estimate_flops(_iterate)
+
+    # --- act & assert ---
+    with pytest.raises(ValueError):
+        estimate.evaluate_for(10.0)
+    assert estimate.evaluate({_WHILE_SYMBOL: 4}) == FlopCounts(GTE=4, DIV=4)
+
+
+def test_estimate_reversed_range():
+    # --- act ---
+    estimate = estimate_flops(_reversed_prefix_sums)
+
+    # --- assert ---
+    n = SymbolicCount.symbol("n")
+    assert estimate.counts[FlopType.MUL] == (n * n + n) * Fraction(1, 2)  # sum of i+1 for i = n-1, ..., 0
+    assert estimate.evaluate(n=4) == FlopCounts(MUL=10, ADD=10)
+
+
+def test_estimate_non_constant_step():
+    # --- act ---
+    estimate = estimate_flops(_strided)
+
+    # --- assert ---
+    assert estimate.symbols == [_RANGE_SYMBOL]
+    assert estimate.evaluate({_RANGE_SYMBOL: 3}) == FlopCounts(ADD=3)
+
+
+# =================================================================================================
+#  Validation
+# =================================================================================================
+@pytest.mark.parametrize(
+    "func, args",
+    [
+        (_outer_product_sum, ([CountedFloat(v) for v in range(5)], [CountedFloat(v) for v in range(3)], 5, 3)),
+        (_pairwise_distance, ([CountedFloat(v) for v in range(6)], 6)),
+        (_dot, ([CountedFloat(v) for v in range(4)], [CountedFloat(v) for v in range(4)])),
+        (_reversed_prefix_sums, ([CountedFloat(v) for v in range(7)], 7)),
+    ],
+)
+def test_validate_exact(func, args: tuple):
+    # --- act ---
+    validation = estimate_flops(func).validate(*args)
+
+    # --- assert ---
+    assert validation.is_exact()
+    assert validation.relative_error() == 0.0
+
+
+def test_validate_upper_bound():
+    # --- arrange ---
+    xs = [CountedFloat(v) for v in [1.0, 2.0, -3.0, 4.0]]
+
+    # --- act ---
+    validation = estimate_flops(_branches).validate(xs)
+
+    # --- assert ---
+    assert not validation.is_exact()
+    assert validation.differences() == {FlopType.ADD: 1, FlopType.SUB: 3, FlopType.MUL: 3}
+    assert validation.relative_error() > 0
@@ -0,0 +1,112 @@
+import statistics
+import time
+
+import pytest
+
+from counted_float._core.counting._builtin_data import BuiltInData
+from counted_float._core.counting._context_managers import FlopCountingContext
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._counted_float32 import CountedFloat32
+from counted_float._core.counting._timing import (
+    TimedFlopCountingContext,
+    TimingReport,
+    measure_instrumentation_overhead,
+)
+from counted_float._core.counting.models import Precision
+
+
+def _workload(n: int):
+    x = CountedFloat(1.0)
+    for _ in range(n):
+        x = x * 1.0001 + 1.0
+    return x
+
+
+def test_measure_instrumentation_overhead():
+    # --- act ---------------------------------------------
+    with FlopCountingContext() as ctx:
+        overhead_ns = measure_instrumentation_overhead(refresh=True)
+
+    # --- assert ------------------------------------------
+    assert 0 < overhead_ns < 1e5
+    assert measure_instrumentation_overhead() == overhead_ns  # cached
+    assert ctx.flop_counts().total_count() == 0  # measurement is not counted
+
+
+def test_timed_flop_counting_context():
+    # --- act ---------------------------------------------
+    with TimedFlopCountingContext() as ctx:
+        _workload(1000)
+        ctx.pause()
+        time.sleep(0.05)  # not timed
+        ctx.resume()
+
+    report = ctx.timing_report()
+
+    # --- assert ------------------------------------------
+    assert ctx.flop_counts().total_count() == 2000
+    assert 0 < ctx.wall_time() < 0.05
+    assert ctx.cpu_time() >= 0
+    assert report.wall_time_s == ctx.wall_time()
+    assert report.n_flops == 2000
+    assert report.weighted_cost == ctx.total_weighted_cost()
+    assert report.ops_per_second == pytest.approx(2000 / report.wall_time_s)
+    assert 0 <= report.overhead_s <= report.wall_time_s
+    assert report.python_time_s == pytest.approx(report.wall_time_s - report.overhead_s)
+    assert report.predicted_compiled_time_s > 0
+    assert report.compiled_speedup == pytest.approx(report.python_time_s / report.predicted_compiled_time_s)
+
+
+def test_timed_flop_counting_context_single_result():
+    # --- arrange -----------------------------------------
+    name, results = next(iter(BuiltInData.benchmarks().items()))
+
+    # --- act ---------------------------------------------
+    with TimedFlopCountingContext() as ctx:
+        _workload(100)
+
+    report = ctx.timing_report(results)
+
+    # --- assert ------------------------------------------
+    expected_ns = ctx.flop_counts().predicted_runtime(results).ns.q50
+    assert report.predicted_compiled_time_s == pytest.approx(expected_ns / 1e9)
+
+
+def test_timed_flop_counting_context_fp32():
+    # --- act ---------------------------------------------
+    with TimedFlopCountingContext() as ctx:
+        x = CountedFloat32(1.0)
+        for _ in range(10):
+            x = x + 1.0
+
+    report = ctx.timing_report()  # built-in results have no fp32 benchmarks
+
+    # --- assert ------------------------------------------
+    expected_ns = statistics.median(
+        ctx.flop_counts(Precision.FP32).predicted_runtime(results).ns.q50
+        for results in BuiltInData.benchmarks().values()
+    )
+    assert report.n_flops == 10
+    assert report.predicted_compiled_time_s == pytest.approx(expected_ns / 1e9)
+
+
+def test_timing_report_derived_values(capsys):
+    # --- arrange -----------------------------------------
+    report = TimingReport(
+        wall_time_s=2.0,
+        cpu_time_s=1.5,
+        n_flops=1000,
+        weighted_cost=1500.0,
+        overhead_per_op_ns=1e6,
+        predicted_compiled_time_s=0.01,
+    )
+
+    # --- act ---------------------------------------------
+    report.show()
+
+    # --- assert ------------------------------------------
+    assert report.ops_per_second == 500
+    assert report.overhead_s == 1.0
+    assert report.python_time_s == 1.0
+    assert report.compiled_speedup == 100
+    assert "compiled speed-up" in capsys.readouterr().out
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from counted_float._core.counting._context_managers import FlopCountingContext
+from counted_float._core.counting._counted_float import CountedFloat
+from counted_float._core.counting._regions import flop_region, reset_region_tree
+from counted_float._core.counting._trace_export import ChromeTraceExporter
+from counted_float._core.counting.config import get_flop_weights, set_flop_weights
+from counted_float._core.counting.models import FlopType, FlopWeights
+
+
+@pytest.fixture(autouse=True)
+def unit_weights():
+    weights = get_flop_weights()
+    set_flop_weights(FlopWeights(weights={flop_type: 1 for flop_type in FlopType}))
+    reset_region_tree()
+    yield
+    reset_region_tree()
+    set_flop_weights(weights)
+
+
+def _workload():
+    x = CountedFloat(1.0)
+    with flop_region("assemble"):
+        for _ in range(3):
+            x = x * 2.0
+    with FlopCountingContext():
+        with flop_region("solve"):
+            x = x + 1.0
+
+
+def test_chrome_trace_exporter(tmp_path):
+    # --- arrange -----------------------------------------
+    path = tmp_path / "trace.json"
+
+    # --- act ---------------------------------------------
+    with ChromeTraceExporter(path, counter_interval=0.0) as exporter:
+        _workload()
+
+    # --- assert ------------------------------------------
+    events = json.loads(path.read_text())
+    assert len(events) == exporter.n_events
+    spans = [(e["ph"], e["name"]) for e in events if e["ph"] in "BE"]
+    assert spans == [
+        ("B", "assemble"),
+        ("E", "assemble"),
+        ("B", "FlopCountingContext"),
+        ("B", "solve"),
+        ("E", "solve"),
+        ("E", "FlopCountingContext"),
+    ]
+    assemble_end = [e for e in events if e["ph"] == "E" and e["name"] == "assemble"][0]
+    assert assemble_end["args"] == {"weighted cost": 3, "MUL": 3}
+    context_end = [e for e in events if e["ph"] == "E" and e["name"] == "FlopCountingContext"][0]
+    assert context_end["cat"] == "context"
+    assert context_end["args"] == {"weighted cost": 1, "ADD": 1}
+
+    cumulative_costs = [e["args"]["cumulative"] for e in events if e["ph"] == "C" and e["name"] == "weighted cost"]
+    assert cumulative_costs == sorted(cumulative_costs)
+    assert cumulative_costs[-1] == 4
+    rates = [e["args"] for e in events if e["ph"] == "C" and e["name"] == "flops/s"]
+    assert set(rates[-1]) == {"ADD", "MUL"}
+
+
+def test_chrome_trace_exporter_incremental_flush(tmp_path):
+    # --- arrange -----------------------------------------
+    path = tmp_path / "trace.json"
+
+    # --- act ---------------------------------------------
+    with ChromeTraceExporter(path, buffer_size=2) as exporter:
+        _workload()
+        partial = path.read_text()
+
+    # --- assert ------------------------------------------
+    assert not exporter.is_active()
+    written = json.loads(partial + "]")  # unterminated, while active
+    assert 0 < len(written) <= exporter.n_events
+    assert written == json.loads(path.read_text())[: len(written)]